@@ -10,51 +10,31 @@ except:
     pass
 
 
-from pm4py import util, objects, statistics, algo, visualization, evaluation, simulation
-
-if pkgutil.find_loader("scipy"):
-    pass
-else:
+if not pkgutil.find_loader("scipy"):
     logging.error("scipy is not available. This can lead some features of PM4Py to not work correctly!")
 
-if pkgutil.find_loader("sklearn"):
-    pass
-else:
+if not pkgutil.find_loader("sklearn"):
     logging.error("scikit-learn is not available. This can lead some features of PM4Py to not work correctly!")
 
-if pkgutil.find_loader("networkx"):
-    pass
-else:
+if not pkgutil.find_loader("networkx"):
     logging.error("networkx is not available. This can lead some features of PM4Py to not work correctly!")
 
-if pkgutil.find_loader("matplotlib"):
-    import matplotlib
-else:
+if not pkgutil.find_loader("matplotlib"):
     logging.error("matplotlib is not available. This can lead some features of PM4Py to not work correctly!")
 
-if pkgutil.find_loader("lxml"):
-    import lxml
-else:
+if not pkgutil.find_loader("lxml"):
     logging.error("lxml is not available. This can lead some features of PM4Py to not work correctly!")
 
-if pkgutil.find_loader("pandas"):
-    import pandas
-else:
+if not pkgutil.find_loader("pandas"):
     logging.error("pandas is not available. This can lead some features of PM4Py to not work correctly!")
 
-if pkgutil.find_loader("pulp"):
-    import pulp
-else:
+if not pkgutil.find_loader("pulp"):
     logging.error("pulp is not available. This can lead some features of PM4Py to not work correctly!")
 
-if pkgutil.find_loader("graphviz"):
-    import graphviz
-else:
+if not pkgutil.find_loader("graphviz"):
     logging.error("graphviz is not available. This can lead some features of PM4Py to not work correctly!")
 
-if pkgutil.find_loader("intervaltree"):
-    import intervaltree
-else:
+if not pkgutil.find_loader("intervaltree"):
     logging.error("intervaltree is not available. This can lead some features of PM4Py to not work correctly!")
 
 __version__ = VERSION
@@ -64,30 +44,36 @@ __author_email__ = 'pm4py@fit.fraunhofer.de'
 __maintainer__ = 'Fraunhofer Institute for Applied Technology'
 __maintainer_email__ = "pm4py@fit.fraunhofer.de"
 
-from pm4py.read import read_xes, read_csv, read_petri_net, read_process_tree, read_dfg, \
-    read_bpmn
-from pm4py.write import write_xes, write_csv, write_petri_net, write_process_tree, write_dfg, write_bpmn
-from pm4py.discovery import discover_petri_net_alpha, discover_petri_net_alpha_plus, discover_petri_net_heuristics, \
-    discover_petri_net_inductive, discover_tree_inductive, discover_heuristics_net, discover_dfg
-from pm4py.conformance import conformance_tbr, conformance_alignments, evaluate_fitness_tbr, \
-    evaluate_fitness_alignments, evaluate_precision_tbr, \
-    evaluate_precision_alignments, soundness_woflan
-from pm4py.vis import view_petri_net, save_vis_petri_net, view_dfg, save_vis_dfg, view_process_tree, \
-    save_vis_process_tree, \
-    view_heuristics_net, save_vis_heuristics_net, view_bpmn, save_vis_bpmn
-from pm4py.filtering import filter_start_activities, filter_end_activities, filter_attribute_values, filter_variants, \
-    filter_variants_percentage, filter_paths, filter_timestamp, filter_trace_attribute
-from pm4py.stats import get_start_activities, get_end_activities, get_attributes, get_attribute_values, get_variants, \
-    get_trace_attributes
-from pm4py.convert import convert_to_event_log, convert_to_event_stream, convert_to_dataframe, convert_to_bpmn, \
-    convert_to_petri_net, convert_to_process_tree
-from pm4py.utils import format_dataframe
-
-# this package is available only for Python >= 3.5
-if sys.version_info >= (3, 5):
-    from pm4py import streaming
-
-    if pkgutil.find_loader("sympy"):
-        import sympy
-    else:
-        logging.error("sympy is not available. This can lead some features of PM4Py to not work correctly!")
+from pm4py.util.lazy_import import lazy_getattr
+
+# the subpackages and the functions of the simplified interface are imported when they are accessed
+# for the first time, so importing pm4py does not import the algorithms and their (heavy) dependencies
+__subpackages = ["util", "objects", "statistics", "algo", "visualization", "evaluation", "simulation", "streaming"]
+
+__simplified_interface = {
+    "read": ["read_xes", "read_csv", "read_petri_net", "read_process_tree", "read_dfg", "read_bpmn", "read_columnar"],
+    "write": ["write_xes", "write_csv", "write_petri_net", "write_process_tree", "write_dfg", "write_bpmn",
+              "write_columnar"],
+    "discovery": ["discover_petri_net_alpha", "discover_petri_net_alpha_plus", "discover_petri_net_heuristics",
+                  "discover_petri_net_inductive", "discover_tree_inductive", "discover_heuristics_net",
+                  "discover_dfg"],
+    "conformance": ["conformance_tbr", "conformance_alignments", "evaluate_fitness_tbr", "evaluate_fitness_alignments",
+                    "evaluate_precision_tbr", "evaluate_precision_alignments", "soundness_woflan"],
+    "vis": ["view_petri_net", "save_vis_petri_net", "view_dfg", "save_vis_dfg", "view_process_tree",
+            "save_vis_process_tree", "view_heuristics_net", "save_vis_heuristics_net", "view_bpmn", "save_vis_bpmn"],
+    "filtering": ["filter_start_activities", "filter_end_activities", "filter_attribute_values", "filter_variants",
+                  "filter_variants_percentage", "filter_paths", "filter_timestamp", "filter_trace_attribute"],
+    "stats": ["get_start_activities", "get_end_activities", "get_attributes", "get_attribute_values", "get_variants",
+              "get_trace_attributes"],
+    "convert": ["convert_to_event_log", "convert_to_event_stream", "convert_to_dataframe", "convert_to_bpmn",
+                "convert_to_petri_net", "convert_to_process_tree"],
+    "utils": ["format_dataframe"]
+}
+__all__ = __subpackages + [name for names in __simplified_interface.values() for name in names]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __subpackages + list(__simplified_interface),
+                                    attributes={name: module for module, names in __simplified_interface.items()
+                                                for name in names})
+
+if not pkgutil.find_loader("sympy"):
+    logging.error("sympy is not available. This can lead some features of PM4Py to not work correctly!")
@@ -1,4 +1,11 @@
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = []
+
 if pkgutil.find_loader("pandas"):
-    from pm4py.algo.clustering import trace_attribute_driven
+    __all__.append("trace_attribute_driven")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1 +1,6 @@
-from pm4py.algo.clustering.trace_attribute_driven import algorithm, dfg, leven_dist, linkage_method, merge_log, util, variants
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["algorithm", "dfg", "leven_dist", "linkage_method", "merge_log", "util", "variants"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -3,6 +3,7 @@ from pm4py.statistics.attributes.log import get as attributes_filter
 from pm4py.algo.clustering.trace_attribute_driven.merge_log import merge_log
 from pm4py.algo.clustering.trace_attribute_driven.util import evaluation
 from pm4py.objects.conversion.log import converter as log_converter
+from pm4py.objects.log.log import EventLog
 from enum import Enum
 from pm4py.util import exec_utils
 
@@ -12,7 +13,7 @@ class Variants(Enum):
     VARIANT_AVG_LEVEN = evaluation.eval_avg_leven
     VARIANT_DMM_VEC = evaluation.eval_DMM_variant
     VARIANT_AVG_VEC = evaluation.eval_avg_variant
-    DFG = evaluation.dfg_dist
+    DFG = evaluation.dfg_dis
 
 
 VARIANT_DMM_LEVEN = Variants.VARIANT_DMM_LEVEN
@@ -62,6 +63,12 @@ def apply(log, trace_attribute, variant=VARIANT_DMM_LEVEN, parameters=None):
         - Variants.VARIANT_DMM_VEC
         - Variants.VARIANT_AVG_VEC
         - Variants.DFG
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY => activity attribute
+        - Parameters.ENABLE_PARALLEL => computes the distances between the variants using a pool of processes
+        (default: False)
+        - Parameters.NUM_WORKERS => number of processes of the pool (default: number of CPUs)
 
     Returns
     -----------------
@@ -78,19 +85,16 @@ def apply(log, trace_attribute, variant=VARIANT_DMM_LEVEN, parameters=None):
     percent = 1
     alpha = 0.5
 
-    list_of_vals = []
-    list_log = []
-    list_of_vals_dict = attributes_filter.get_trace_attribute_values(log, trace_attribute)
+    list_of_vals = list(attributes_filter.get_trace_attribute_values(log, trace_attribute).keys())
 
-    list_of_vals_keys = list(list_of_vals_dict.keys())
-    for i in range(len(list_of_vals_keys)):
-        list_of_vals.append(list_of_vals_keys[i])
+    # the sublogs are formed in a single pass over the log
+    sublogs = {val: EventLog() for val in list_of_vals}
+    for trace in log:
+        if trace_attribute in trace.attributes and len(trace) > 0:
+            sublogs[trace.attributes[trace_attribute]].append(trace)
+    list_log = [sublogs[val] for val in list_of_vals]
 
-    for i in range(len(list_of_vals)):
-        logsample = merge_log.log2sublog(log, list_of_vals[i], trace_attribute)
-        list_log.append(logsample)
-
-    y = exec_utils.get_variant(variant)(list_log, percent, alpha)
+    y = exec_utils.get_variant(variant)(list_log, percent, alpha, parameters=parameters)
 
     Z = linkage(y, method='average')
 
@@ -1 +1,6 @@
-from pm4py.algo.clustering.trace_attribute_driven.linkage_method import linkage_avg
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["linkage_avg"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
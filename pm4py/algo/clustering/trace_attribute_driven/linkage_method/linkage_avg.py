@@ -1,362 +1,105 @@
 import numpy as np
 from scipy.spatial.distance import squareform
-from pm4py.algo.clustering.trace_attribute_driven.leven_dist import leven_dist_calc
 from pm4py.algo.clustering.trace_attribute_driven.merge_log import merge_log
-from pm4py.algo.clustering.trace_attribute_driven.dfg import dfg_dist
-from pm4py.algo.clustering.trace_attribute_driven.variants import act_dist_calc
-from pm4py.algo.clustering.trace_attribute_driven.variants import suc_dist_calc
-
-
-def linkage_dfg_update(loglist, dist_mat, alpha, percent):
-    index_list = []
-    for i in range(len(dist_mat)):
-        for j in range(i + 1, len(dist_mat)):
-            index_list.append([i, j])
-
-    y = squareform(dist_mat)
+from pm4py.algo.clustering.trace_attribute_driven.util import distance_matrix
+from pm4py.algo.clustering.trace_attribute_driven.util.distance_matrix import LEVEN
+
+
+def __linkage(dist_mat, cluster_size, update):
+    """
+    Agglomerative clustering over a distance matrix.
+
+    The couples of clusters are kept in the slots of the condensed distance matrix: when two clusters are merged,
+    the couple of the new cluster with another cluster takes the slot of the couple of the first merged cluster
+    with the other cluster, so the minimum is found with a single vectorized scan.
+
+    Parameters
+    -------------
+    dist_mat
+        Distance matrix between the observations
+    cluster_size
+        Dictionary associating to each observation its size
+    update
+        Function that, given the two merged clusters, the index of the new cluster, the other clusters and
+        the slots of their couples with the two merged clusters, returns the distances between the new cluster
+        and the other clusters
+
+    Returns
+    -------------
+    Z
+        Linkage matrix (as returned by scipy.cluster.hierarchy.linkage)
+    """
     n = len(dist_mat)  # The number of observations.
+    y = np.array(squareform(dist_mat), dtype=np.float64)
+    first, second = np.triu_indices(n, 1)
+    alive = np.ones(len(y), dtype=bool)
     Z = []
-    cluster_size = dict(zip(range(n), np.ones(n)))  # record merged cluster size every step
-    k = 1
-    logsindex = list(range(len(loglist)))
-    while (k <= n - 2):
-        min_index = np.argmin(y)
-
-        # update Z
-        temp = []
-        temp.extend(index_list[min_index])
-        temp.append(y[min_index])
-        cluster_size[n - 1 + k] = cluster_size[temp[0]] + cluster_size[temp[1]]
-        temp.append(cluster_size[n - 1 + k])
-
-        Z.append(temp)
-
-        # get index of min in y
-        item = index_list[min_index][::]
-        record1 = []
-        record2 = []
-        for ele in index_list:
-            if item[0] in ele:
-                record1.append(index_list.index(ele))
-                inde = ele.index(item[0])
-                ele[inde] = n - 1 + k
-            if item[1] in ele:  # here if/elif both works
-                record2.append(index_list.index(ele))
-                inde = ele.index(item[1])
-                ele[inde] = n - 1 + k
-            ele.sort()
-
-        record = list(set(record1).union(set(record2)))
-
-        merged1 = merge_log.update_merge([loglist[item[0]], loglist[item[1]]])
-        # here the logsindex is changing
-        diff = list(set(logsindex).difference(set(item)))  # diff is the node number need to be updated
-
-        update_dist = dict()
-        for ele in diff:
-            (dist_act, dist_dfg) = dfg_dist.dfg_dist_calc(merged1, loglist[ele])
-            tempdist = dist_act * alpha + dist_dfg * (1 - alpha)
-            # tempdist = leven_dist_calc.leven_dist_avg(merged1, loglist[ele], percent, percent)
-            update_dist[ele] = tempdist
-
-        loglist.append(merged1)
-        diff.append(n - 1 + k)
-        logsindex = diff
-
-        del (record1[record1.index(min_index)])
-        del (record2[record2.index(min_index)])
-
-        # for i in range(len(record1)):
-        #     y[record1[i]] = (y[record1[i]]*cluster_size[item[0]] + y[record2[i]]*cluster_size[item[1]]) / (cluster_size[item[0]]+cluster_size[item[1]])
-        for ele in record1:
-            uindex = index_list[ele][0]  # record1 is the location if nodes in diff in the index_list
-            y[ele] = update_dist[uindex]
-
-        diff1 = list(set(range(len(index_list))).difference(set(record)))
-        newindex = record1 + diff1
-        newindex.sort()
-
-        range_newindex = range(len(newindex))
-        tempy = list(range_newindex)
-        templist = list(range_newindex)
-        for i in range_newindex:
-            tempy[i] = y[newindex[i]]
-            templist[i] = index_list[newindex[i]]
-
-        index_list = templist
-        y = tempy
-        k = k + 1
-
-    temp = []
-    temp.extend(index_list[0])
-    temp.append(y[0])
-
-    cluster_size[n - 1 + k] = cluster_size[temp[0]] + cluster_size[temp[1]]
-    temp.append(cluster_size[n - 1 + k])
-    Z.append(temp)
-    Z = np.array(Z)
-
-    return Z
+    for k in range(1, n):
+        min_index = np.argmin(np.where(alive, y, np.inf))
+        item = (first[min_index], second[min_index])
+        new_cluster = n - 1 + k
+        cluster_size[new_cluster] = cluster_size[item[0]] + cluster_size[item[1]]
+        Z.append([item[0], item[1], y[min_index], cluster_size[new_cluster]])
+        alive[min_index] = False
+
+        slots = []
+        for c in item:
+            slot = np.flatnonzero(alive & ((first == c) | (second == c)))
+            other = np.where(first[slot] == c, second[slot], first[slot])
+            # sorts the slots by the other cluster, so the slots of the two merged clusters correspond
+            order = np.argsort(other)
+            slots.append((slot[order], other[order]))
+        others = slots[0][1]
+        y[slots[0][0]] = update(item, new_cluster, others, slots[0][0], slots[1][0], y)
+        first[slots[0][0]] = others
+        second[slots[0][0]] = new_cluster
+        alive[slots[1][0]] = False
+
+    return np.array(Z)
+
+
+def __engine_update(loglist, engine, distance):
+    """
+    Returns the update function of the linkage, that computes the distance between the new cluster
+    and the other clusters on the (merged) sublogs, reusing the cached distances between the variants
+    """
+
+    def update(item, new_cluster, others, slots1, slots2, y):
+        loglist.append(merge_log.update_merge([loglist[item[0]], loglist[item[1]]]))
+        merged = engine.merge(item[0], item[1])
+        return [distance(merged, other) for other in others]
+
+    return update
+
+
+def linkage_dfg_update(loglist, dist_mat, alpha, percent, parameters=None):
+    n = len(dist_mat)
+    engine = distance_matrix.SublogDistances(loglist, parameters=parameters)
+    return __linkage(dist_mat, dict(zip(range(n), np.ones(n))), __engine_update(
+        loglist, engine, lambda i, j: engine.dfg_distance(i, j, alpha)))
 
 
 def linkage_avg(loglist, dist_mat, alpha, percent):
-    index_list = []
-    cluster_size = []
-    for i in range(len(dist_mat)):
-        cluster_size.append(len(loglist[i]))
-        for j in range(i + 1, len(dist_mat)):
-            index_list.append([i, j])
-
-    y = squareform(dist_mat)
-    n = len(dist_mat)  # The number of observations.
-    Z = []
-    cluster_size = dict(zip(range(n), cluster_size))  # record merged cluster size every step
-    k = 1
-    while (k <= n - 2):
-        min_index = np.argmin(y)
-
-        # update Z
-        temp = []
-        temp.extend(index_list[min_index])
-        temp.append(y[min_index])
-        cluster_size[n - 1 + k] = cluster_size[temp[0]] + cluster_size[temp[1]]
-        temp.append(cluster_size[n - 1 + k])
-
-        Z.append(temp)
-
-        # get index of min in y
-        item = index_list[min_index][::]
-        record1 = []
-        record2 = []
-        for ele in index_list:
-            if item[0] in ele:
-                record1.append(index_list.index(ele))
-                inde = ele.index(item[0])
-                ele[inde] = n - 1 + k
-            if item[1] in ele:  # here if/elif both works
-                record2.append(index_list.index(ele))
-                inde = ele.index(item[1])
-                ele[inde] = n - 1 + k
-            ele.sort()
-
-        record = list(set(record1).union(set(record2)))
-
-        del (record1[record1.index(min_index)])
-        del (record2[record2.index(min_index)])
-
-        for i in range(len(record1)):
-            y[record1[i]] = (y[record1[i]] * cluster_size[item[0]] + y[record2[i]] * cluster_size[item[1]]) / (
-                        cluster_size[item[0]] + cluster_size[item[1]])
-        # for ele in record1:
-        #     uindex = index_list[ele][0]  # record1 is the location if nodes in diff in the index_list
-        #     y[ele] = update_dist[uindex]
-
-        diff1 = list(set(range(len(index_list))).difference(set(record)))
-        newindex = record1 + diff1
-        newindex.sort()
-
-        range_newindex = range(len(newindex))
-        tempy = list(range_newindex)
-        templist = list(range_newindex)
-        for i in range_newindex:
-            tempy[i] = y[newindex[i]]
-            templist[i] = index_list[newindex[i]]
-
-        index_list = templist
-        y = tempy
-        k = k + 1
-
-    temp = []
-    temp.extend(index_list[0])
-    temp.append(y[0])
-
-    cluster_size[n - 1 + k] = cluster_size[temp[0]] + cluster_size[temp[1]]
-    temp.append(cluster_size[n - 1 + k])
-    Z.append(temp)
-    Z = np.array(Z)
-
-    return Z
-
-
-def linkage_DMM_update(loglist, dist_mat, alpha, percent):
-    index_list = []
-    for i in range(len(dist_mat)):
-        for j in range(i + 1, len(dist_mat)):
-            index_list.append([i, j])
-
-    y = squareform(dist_mat)
-    n = len(dist_mat)  # The number of observations.
-    Z = []
-    cluster_size = dict(zip(range(n), np.ones(n)))  # record merged cluster size every step
-    k = 1
-    logsindex = list(range(len(loglist)))
-    while (k <= n - 2):
-        min_index = np.argmin(y)
-
-        # update Z
-        temp = []
-        temp.extend(index_list[min_index])
-        temp.append(y[min_index])
-        cluster_size[n - 1 + k] = cluster_size[temp[0]] + cluster_size[temp[1]]
-        temp.append(cluster_size[n - 1 + k])
-
-        Z.append(temp)
-
-        # get index of min in y
-        item = index_list[min_index][::]
-        record1 = []
-        record2 = []
-        for ele in index_list:
-            if item[0] in ele:
-                record1.append(index_list.index(ele))
-                inde = ele.index(item[0])
-                ele[inde] = n - 1 + k
-            if item[1] in ele:  # here if/elif both works
-                record2.append(index_list.index(ele))
-                inde = ele.index(item[1])
-                ele[inde] = n - 1 + k
-            ele.sort()
-
-        record = list(set(record1).union(set(record2)))
-
-        merged1 = merge_log.update_merge([loglist[item[0]], loglist[item[1]]])
-        # here the logsindex is changing
-        diff = list(set(logsindex).difference(set(item)))  # diff is the node number need to be updated
-
-        update_dist = dict()
-        for ele in diff:
-            dist_act = act_dist_calc.act_sim_percent(merged1, loglist[ele], percent, percent)
-            dist_suc = suc_dist_calc.suc_sim_percent(merged1, loglist[ele], percent, percent)
-            tempdist = dist_act * alpha + dist_suc * (1 - alpha)
-            # tempdist = leven_dist_calc.leven_dist_avg(merged1, loglist[ele], percent, percent)
-            update_dist[ele] = tempdist
-
-        loglist.append(merged1)
-        diff.append(n - 1 + k)
-        logsindex = diff
-
-        del (record1[record1.index(min_index)])
-        del (record2[record2.index(min_index)])
-
-        # for i in range(len(record1)):
-        #     y[record1[i]] = (y[record1[i]]*cluster_size[item[0]] + y[record2[i]]*cluster_size[item[1]]) / (cluster_size[item[0]]+cluster_size[item[1]])
-        for ele in record1:
-            uindex = index_list[ele][0]  # record1 is the location if nodes in diff in the index_list
-            y[ele] = update_dist[uindex]
-
-        diff1 = list(set(range(len(index_list))).difference(set(record)))
-        newindex = record1 + diff1
-        newindex.sort()
-
-        range_newindex = range(len(newindex))
-        tempy = list(range_newindex)
-        templist = list(range_newindex)
-        for i in range_newindex:
-            tempy[i] = y[newindex[i]]
-            templist[i] = index_list[newindex[i]]
-
-        index_list = templist
-        y = tempy
-        k = k + 1
-
-    temp = []
-    temp.extend(index_list[0])
-    temp.append(y[0])
-
-    cluster_size[n - 1 + k] = cluster_size[temp[0]] + cluster_size[temp[1]]
-    temp.append(cluster_size[n - 1 + k])
-    Z.append(temp)
-    Z = np.array(Z)
-
-    return Z
-
-
-def linkage_DMM_update_leven(loglist, dist_mat, alpha, percent):
-    index_list = []
-    for i in range(len(dist_mat)):
-        for j in range(i + 1, len(dist_mat)):
-            index_list.append([i, j])
-
-    y = squareform(dist_mat)
-    n = len(dist_mat)  # The number of observations.
-    Z = []
-    cluster_size = dict(zip(range(n), np.ones(n)))  # record merged cluster size every step
-    k = 1
-    logsindex = list(range(len(loglist)))
-    while (k <= n - 2):
-        min_index = np.argmin(y)
-
-        # update Z
-        temp = []
-        temp.extend(index_list[min_index])
-        temp.append(y[min_index])
-        cluster_size[n - 1 + k] = cluster_size[temp[0]] + cluster_size[temp[1]]
-        temp.append(cluster_size[n - 1 + k])
-
-        Z.append(temp)
-
-        # get index of min in y
-        item = index_list[min_index][::]
-        record1 = []
-        record2 = []
-        for ele in index_list:
-            if item[0] in ele:
-                record1.append(index_list.index(ele))
-                inde = ele.index(item[0])
-                ele[inde] = n - 1 + k
-            if item[1] in ele:  # here if/elif both works
-                record2.append(index_list.index(ele))
-                inde = ele.index(item[1])
-                ele[inde] = n - 1 + k
-            ele.sort()
-
-        record = list(set(record1).union(set(record2)))
-
-        merged1 = merge_log.update_merge([loglist[item[0]], loglist[item[1]]])
-        # here the logsindex is changing
-        diff = list(set(logsindex).difference(set(item)))  # diff is the node number need to be updated
-
-        update_dist = dict()
-        for ele in diff:
-            tempdist = leven_dist_calc.leven_dist(merged1, loglist[ele], percent, percent)
-            # tempdist = leven_dist_calc.leven_dist_avg(merged1, loglist[ele], percent, percent)
-            update_dist[ele] = tempdist
-
-        loglist.append(merged1)
-        diff.append(n - 1 + k)
-        logsindex = diff
-
-        del (record1[record1.index(min_index)])
-        del (record2[record2.index(min_index)])
-
-        # for i in range(len(record1)):
-        #     y[record1[i]] = (y[record1[i]]*cluster_size[item[0]] + y[record2[i]]*cluster_size[item[1]]) / (cluster_size[item[0]]+cluster_size[item[1]])
-        for ele in record1:
-            uindex = index_list[ele][0]  # record1 is the location if nodes in diff in the index_list
-            y[ele] = update_dist[uindex]
+    n = len(dist_mat)
 
-        diff1 = list(set(range(len(index_list))).difference(set(record)))
-        newindex = record1 + diff1
-        newindex.sort()
+    def update(item, new_cluster, others, slots1, slots2, y):
+        size1 = cluster_size[item[0]]
+        size2 = cluster_size[item[1]]
+        return (y[slots1] * size1 + y[slots2] * size2) / (size1 + size2)
 
-        range_newindex = range(len(newindex))
-        tempy = list(range_newindex)
-        templist = list(range_newindex)
-        for i in range_newindex:
-            tempy[i] = y[newindex[i]]
-            templist[i] = index_list[newindex[i]]
+    cluster_size = dict(zip(range(n), [len(loglist[i]) for i in range(n)]))
+    return __linkage(dist_mat, cluster_size, update)
 
-        index_list = templist
-        y = tempy
-        k = k + 1
 
-    temp = []
-    temp.extend(index_list[0])
-    temp.append(y[0])
+def linkage_DMM_update(loglist, dist_mat, alpha, percent, parameters=None):
+    n = len(dist_mat)
+    engine = distance_matrix.SublogDistances(loglist, parameters=parameters)
+    return __linkage(dist_mat, dict(zip(range(n), np.ones(n))), __engine_update(
+        loglist, engine, lambda i, j: engine.variant_distance(i, j, percent, alpha)))
 
-    cluster_size[n - 1 + k] = cluster_size[temp[0]] + cluster_size[temp[1]]
-    temp.append(cluster_size[n - 1 + k])
-    Z.append(temp)
-    Z = np.array(Z)
 
-    return Z
+def linkage_DMM_update_leven(loglist, dist_mat, alpha, percent, parameters=None):
+    n = len(dist_mat)
+    engine = distance_matrix.SublogDistances(loglist, parameters=parameters)
+    return __linkage(dist_mat, dict(zip(range(n), np.ones(n))), __engine_update(
+        loglist, engine, lambda i, j: engine.distance(LEVEN, i, j, percent)))
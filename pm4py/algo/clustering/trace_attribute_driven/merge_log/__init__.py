@@ -1 +1,6 @@
-from pm4py.algo.clustering.trace_attribute_driven.merge_log import merge_log
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["merge_log"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
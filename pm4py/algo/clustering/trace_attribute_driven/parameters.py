@@ -10,3 +10,5 @@ class Parameters(Enum):
     POSITIVE = "positive"
     LOWER_PERCENT = "lower_percent"
 
+    ENABLE_PARALLEL = "enable_parallel"
+    NUM_WORKERS = "num_workers"
@@ -0,0 +1,390 @@
+import os
+from collections import Counter
+
+import numpy as np
+
+from pm4py.algo.clustering.trace_attribute_driven.parameters import Parameters
+from pm4py.util import exec_utils, pool_utils
+from pm4py.util import xes_constants as xes
+
+ACT = "act"
+SUC = "suc"
+LEVEN = "leven"
+
+# number of variants processed together by the batched Levenshtein distance
+LEVEN_BATCH_SIZE = 1024
+
+
+def levenshtein_batch(query, sequences, lengths):
+    """
+    Computes the Levenshtein distance between a sequence and a batch of sequences, with a single dynamic
+    programming over the rows of the query (each row is computed for all the sequences at once)
+
+    Parameters
+    -------------
+    query
+        Sequence of integer codes
+    sequences
+        Matrix containing a sequence per column (padded with -1)
+    lengths
+        Lengths of the sequences
+
+    Returns
+    -------------
+    distances
+        Levenshtein distance between the query and each sequence
+    """
+    max_len, num = sequences.shape
+    cols = np.arange(max_len + 1, dtype=np.int32)[:, np.newaxis]
+    prev = np.repeat(cols, num, axis=1)
+    t = np.empty((max_len + 1, num), dtype=np.int32)
+    for i, code in enumerate(query, start=1):
+        t[0] = i
+        np.minimum(prev[1:] + 1, prev[:-1] + (sequences != code), out=t[1:])
+        # the insertions propagate along the column: D[i][j] = min_k (t[k] + j - k)
+        t -= cols
+        prev = np.minimum.accumulate(t, axis=0)
+        prev += cols
+    return prev[lengths, np.arange(num)]
+
+
+def _compute_rows(data, metric, ids, known):
+    """
+    Computes the distances between the given variants and all the variants
+
+    Parameters
+    -------------
+    data
+        Encoded variants (see SublogDistances)
+    metric
+        Distance (ACT: cosine distance between the activities counts, SUC: cosine distance between the
+        direct successions counts, LEVEN: Levenshtein distance normalized by the length of the longest variant)
+    ids
+        Indexes of the variants (sorted by length)
+    known
+        Boolean mask of the variants whose distances are already known
+
+    Returns
+    -------------
+    rows
+        Matrix having a row per given variant and a column per variant (the Levenshtein distances from the
+        variants of a batch that are all known, or computed before in the same call, are left to NaN, since they can
+        be read from the symmetric position)
+    """
+    if metric == LEVEN:
+        lengths = data["lengths"]
+        rows = np.full((len(ids), len(lengths)), np.nan)
+        done = known.copy()
+        for r, v in enumerate(ids):
+            for positions, sequences, batch_lengths in data["batches"]:
+                if done[positions].all():
+                    continue
+                dist = levenshtein_batch(data["sequences"][v], sequences, batch_lengths)
+                rows[r, positions] = dist / np.maximum(np.maximum(batch_lengths, lengths[v]), 1)
+            done[v] = True
+        return rows
+    matrix = data[metric]
+    # (the rounding errors could make the distance between identical vectors slightly negative)
+    rows = np.maximum(1.0 - (matrix[ids] @ matrix.T).toarray(), 0.0)
+    # the distance from a variant without activities/successions is 1
+    zero = data[metric + "_zero"]
+    rows[:, zero] = 1.0
+    rows[zero[ids], :] = 1.0
+    return rows
+
+
+def _compute_rows_worker(metric, ids, known):
+    """
+    Computes in a worker process the distances between the given variants and all the variants
+    """
+    return ids, _compute_rows(pool_utils.get_worker_state()["data"], metric, ids, known)
+
+
+class SublogDistances(object):
+    """
+    Computes the distances between the sublogs of the trace attribute driven clustering.
+
+    The variants of all the sublogs are encoded once as integer sequences (and as sparse vectors of
+    activities and direct successions counts), and each sublog as the indexes and the counts of its variants.
+    The distances between the variants are computed in batch (one row of the variants distance matrix
+    at a time, for all the variants) and cached, so they are never computed again, also when
+    the distance of a merged sublog (that contains only known variants) is requested.
+    Only the rows of the variants that are requested are stored (not the full matrix of the variants).
+    """
+
+    def __init__(self, loglist, parameters=None):
+        if parameters is None:
+            parameters = {}
+
+        activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes.DEFAULT_NAME_KEY)
+        self.enable_parallel = exec_utils.get_param_value(Parameters.ENABLE_PARALLEL, parameters, False)
+        self.num_workers = exec_utils.get_param_value(Parameters.NUM_WORKERS, parameters, os.cpu_count() or 1)
+
+        activities = {}
+        variants_idx = {}
+        variants = []
+        sublogs = []
+        for log in loglist:
+            counter = Counter()
+            for trace in log:
+                variant = tuple(activities.setdefault(event[activity_key], len(activities)) for event in trace)
+                if variant not in variants_idx:
+                    variants_idx[variant] = len(variants)
+                    variants.append(variant)
+                counter[variants_idx[variant]] += 1
+            sublogs.append((np.array(list(counter.keys()), dtype=np.int64),
+                            np.array(list(counter.values()), dtype=np.int64)))
+
+        # the variants of a sublog are sorted by decreasing count and variant string (as in the variants statistics)
+        labels = [None] * len(activities)
+        for act, code in activities.items():
+            labels[code] = str(act)
+        strings = [",".join(labels[c] for c in var) for var in variants]
+        self.__string_rank = np.empty(len(variants), dtype=np.int64)
+        self.__string_rank[sorted(range(len(variants)), key=strings.__getitem__)] = np.arange(len(variants))
+        self.sublogs = [self.__sort(ids, counts) for ids, counts in sublogs]
+        self.__data, self.__counts = self.__encode(variants, len(activities))
+        # for every metric, the computed rows of the distance matrix, and the row of each variant (-1 if not computed)
+        self.__rows = {}
+        self.__row_index = {}
+
+    @staticmethod
+    def __encode(variants, num_activities):
+        from scipy.sparse import csr_matrix
+
+        lengths = np.array([len(var) for var in variants], dtype=np.int64)
+        sequences = [np.array(var, dtype=np.int64) for var in variants]
+        # sequences of similar length are batched together, to limit the padding
+        order = np.argsort(lengths, kind="stable")
+        rank = np.empty(len(variants), dtype=np.int64)
+        rank[order] = np.arange(len(variants))
+        data = {"lengths": lengths, "sequences": sequences, "rank": rank, "batches": []}
+        for start in range(0, len(order), LEVEN_BATCH_SIZE):
+            positions = order[start:start + LEVEN_BATCH_SIZE]
+            batch = np.full((int(lengths[positions].max()), len(positions)), -1, dtype=np.int32)
+            for c, v in enumerate(positions):
+                batch[:lengths[v], c] = sequences[v]
+            data["batches"].append((positions, batch, lengths[positions]))
+
+        # sparse vectors of the counts of the activities and of the direct successions, normalized
+        rows = np.repeat(np.arange(len(variants)), lengths)
+        codes = np.concatenate(sequences) if sequences else np.zeros(0, dtype=np.int64)
+        data[ACT] = csr_matrix((np.ones(len(codes)), (rows, codes)), shape=(len(variants), num_activities))
+        same_variant = rows[:-1] == rows[1:]
+        suc_codes = codes[:-1][same_variant] * num_activities + codes[1:][same_variant]
+        data[SUC] = csr_matrix((np.ones(len(suc_codes)), (rows[:-1][same_variant], suc_codes)),
+                               shape=(len(variants), num_activities * num_activities))
+        counts = {}
+        for metric in [ACT, SUC]:
+            matrix = data[metric]
+            matrix.sum_duplicates()
+            counts[metric] = matrix
+            norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+            data[metric + "_zero"] = norms == 0
+            norms[norms == 0] = 1.0
+            data[metric] = csr_matrix(matrix.multiply(1.0 / norms[:, np.newaxis]))
+        return data, counts
+
+    def __sort(self, ids, counts):
+        order = np.lexsort((self.__string_rank[ids], counts))[::-1]
+        return ids[order], counts[order]
+
+    def merge(self, index1, index2):
+        """
+        Adds the sublog obtained merging two sublogs
+
+        Parameters
+        -------------
+        index1
+            Index of the first sublog
+        index2
+            Index of the second sublog
+
+        Returns
+        -------------
+        index
+            Index of the merged sublog
+        """
+        ids = np.concatenate([self.sublogs[index1][0], self.sublogs[index2][0]])
+        counts = np.concatenate([self.sublogs[index1][1], self.sublogs[index2][1]])
+        ids, inverse = np.unique(ids, return_inverse=True)
+        self.sublogs.append(self.__sort(ids, np.bincount(inverse, weights=counts).astype(np.int64)))
+        return len(self.sublogs) - 1
+
+    def select(self, index, percent):
+        """
+        Gets the most frequent variants of a sublog, covering the given percentage of the cases
+
+        Parameters
+        -------------
+        index
+            Index of the sublog
+        percent
+            Percentage of the cases
+
+        Returns
+        -------------
+        ids
+            Indexes of the variants
+        counts
+            Counts of the variants
+        """
+        ids, counts = self.sublogs[index]
+        if len(ids) == 0:
+            return ids, counts
+        csum = counts.cumsum()
+        csum = csum / csum[-1]
+        num = np.count_nonzero(csum <= percent)
+        return ids[:num], counts[:num]
+
+    def prepare(self, metric, ids):
+        """
+        Computes (if not done yet) the distances between the given variants and all the variants,
+        using a pool of processes if the parallelism is enabled
+        """
+        if metric not in self.__rows:
+            num_variants = len(self.__data["lengths"])
+            self.__rows[metric] = np.empty((0, num_variants))
+            self.__row_index[metric] = np.full(num_variants, -1, dtype=np.int64)
+        row_index = self.__row_index[metric]
+        computed = row_index >= 0
+        missing = np.unique(ids)
+        missing = missing[~computed[missing]]
+        if len(missing) == 0:
+            return
+        # the variants are processed by increasing length, following the batches of the Levenshtein distance
+        missing = missing[np.argsort(self.__data["rank"][missing])]
+        if self.enable_parallel and self.num_workers > 1 and len(missing) > 1:
+            chunks = np.array_split(missing, min(len(missing), 4 * self.num_workers))
+            with pool_utils.get_pool(self.num_workers, {"data": self.__data}) as executor:
+                futures = [executor.submit(_compute_rows_worker, metric, chunk, computed) for chunk in chunks]
+                # the chunks are consecutive slices of the missing variants
+                block = np.concatenate([future.result()[1] for future in futures])
+        else:
+            block = _compute_rows(self.__data, metric, missing, computed)
+        start = len(self.__rows[metric])
+        matrix = np.concatenate([self.__rows[metric], block])
+        row_index[missing] = np.arange(start, start + len(missing))
+        # fills the distances that were not computed, since known from the symmetric position
+        rows, cols = np.nonzero(np.isnan(block))
+        matrix[start + rows, cols] = matrix[row_index[cols], missing[rows]]
+        self.__rows[metric] = matrix
+
+    def variants_distance(self, metric, ids1, ids2):
+        """
+        Gets the matrix of the distances between two lists of variants
+        """
+        self.prepare(metric, ids1)
+        return self.__rows[metric][np.ix_(self.__row_index[metric][ids1], ids2)]
+
+    def distance(self, metric, index1, index2, percent, dmm=True):
+        """
+        Computes the distance between two sublogs, aggregating the distances between their variants
+
+        Parameters
+        -------------
+        metric
+            Distance between the variants (ACT, SUC or LEVEN)
+        index1
+            Index of the first sublog
+        index2
+            Index of the second sublog
+        percent
+            Percentage of the cases of the sublogs that is considered (most frequent variants)
+        dmm
+            If True, the distance is the dual minimum match of the variants (each variant is matched to the
+            closest variant of the other sublog); otherwise, the distance is the average between all the couples
+            of variants, weighted by their counts
+
+        Returns
+        -------------
+        dist
+            Distance
+        """
+        ids1, counts1 = self.select(index1, percent)
+        ids2, counts2 = self.select(index2, percent)
+        if dmm and np.array_equal(ids1, ids2):
+            return 0
+        if len(ids1) == 0 or len(ids2) == 0:
+            return np.nan
+        # the sublog having more variants is on the rows
+        if len(ids1) < len(ids2):
+            ids1, counts1, ids2, counts2 = ids2, counts2, ids1, counts1
+        block = self.variants_distance(metric, ids1, ids2)
+        counts1 = counts1.astype(np.float64)
+        counts2 = counts2.astype(np.float64)
+        if not dmm:
+            return np.sum(block * np.outer(counts1, counts2)) / (np.sum(counts1) * np.sum(counts2))
+        # each variant of the first sublog is matched to the closest variant of the second one
+        # (the exact matches count twice, and the matched variants of the second sublog are not considered again)
+        cols = np.argmin(block, axis=1)
+        min_dist = block[np.arange(len(ids1)), cols]
+        exact = np.abs(min_dist) <= 1e-8
+        factor = np.where(exact, 2, 1)
+        max_freq = counts1 * counts2[cols] * factor
+        max_per_var = min_dist * max_freq * factor
+        # the remaining variants of the second sublog are matched to the closest variant of the first one
+        remaining = np.ones(len(ids2), dtype=bool)
+        remaining[cols[exact]] = False
+        remaining = np.flatnonzero(remaining)
+        rows = np.argmin(block[:, remaining], axis=0)
+        min_freq = counts1[rows] * counts2[remaining]
+        min_per_var = block[rows, remaining] * min_freq
+        return (np.sum(max_per_var) + np.sum(min_per_var)) / (np.sum(max_freq) + np.sum(min_freq))
+
+    def variant_distance(self, index1, index2, percent, alpha, dmm=True):
+        """
+        Computes the distance between two sublogs, as the weighted sum of the activities distance
+        (with weight alpha) and of the direct successions distance (with weight 1 - alpha)
+        """
+        return self.distance(ACT, index1, index2, percent, dmm=dmm) * alpha + self.distance(
+            SUC, index1, index2, percent, dmm=dmm) * (1 - alpha)
+
+    def dfg_distance(self, index1, index2, alpha):
+        """
+        Computes the distance between two sublogs, as the weighted sum of the cosine distance between the counts
+        of their activities (with weight alpha) and between their DFGs (with weight 1 - alpha)
+        """
+        dist = []
+        for metric in [ACT, SUC]:
+            profile1 = self.__profile(metric, index1)
+            profile2 = self.__profile(metric, index2)
+            norm = np.sqrt(np.dot(profile1, profile1) * np.dot(profile2, profile2))
+            dist.append(max(1.0 - np.dot(profile1, profile2) / norm, 0.0) if norm > 0 else 1.0)
+        return dist[0] * alpha + dist[1] * (1 - alpha)
+
+    def __profile(self, metric, index):
+        ids, counts = self.sublogs[index]
+        return np.asarray(self.__counts[metric][ids].T @ counts, dtype=np.float64).ravel()
+
+    def matrix(self, metric_fn, metrics, percent):
+        """
+        Computes the condensed distance matrix between the (initial) sublogs
+
+        Parameters
+        -------------
+        metric_fn
+            Function computing the distance between two sublogs (given their indexes)
+        metrics
+            Distances between the variants used by the function (computed in advance, for all the variants
+            of the sublogs, using a pool of processes if the parallelism is enabled)
+        percent
+            Percentage of the cases of the sublogs that is considered (most frequent variants)
+
+        Returns
+        -------------
+        y
+            Condensed distance matrix (as returned by scipy.spatial.distance.squareform)
+        """
+        size = len(self.sublogs)
+        if size > 0:
+            ids = np.concatenate([self.select(i, percent)[0] for i in range(size)])
+            for metric in metrics:
+                self.prepare(metric, ids)
+        y = np.zeros(size * (size - 1) // 2)
+        k = 0
+        for i in range(size - 1):
+            for j in range(i + 1, size):
+                y[k] = metric_fn(i, j)
+                k = k + 1
+        return y
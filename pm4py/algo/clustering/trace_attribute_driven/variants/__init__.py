@@ -1 +1,6 @@
-from pm4py.algo.clustering.trace_attribute_driven.variants import act_dist_calc, logslice_dist, sim_calc, suc_dist_calc
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["act_dist_calc", "logslice_dist", "sim_calc", "suc_dist_calc"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
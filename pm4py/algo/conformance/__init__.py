@@ -1,6 +1,12 @@
-from pm4py.algo.conformance import alignments, tokenreplay, log_skeleton, footprints
-
 import sys
+
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["alignments", "tokenreplay", "log_skeleton", "footprints"]
+
 # this package is available only for Python >= 3.6
 if sys.version_info >= (3, 6):
-    from pm4py.algo.conformance import tree_alignments
+    __all__.append("tree_alignments")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1,14 +1,15 @@
+import os
 from copy import copy
 
 from pm4py.algo.conformance.alignments import variants
 from pm4py.objects.petri import align_utils
-from pm4py.statistics.variants.log import get as variants_module
+from pm4py.statistics.variants.log import index as variants_index
 from pm4py.objects.conversion.log import converter as log_converter
 from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TRACEID_KEY
 from pm4py.objects.petri import check_soundness
 from pm4py.objects.log.log import Trace
 import time
-from pm4py.util import exec_utils
+from pm4py.util import exec_utils, pool_utils
 from enum import Enum
 import sys
 from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY, PARAMETER_CONSTANT_CASEID_KEY
@@ -19,6 +20,7 @@ class Variants(Enum):
     VERSION_DIJKSTRA_NO_HEURISTICS = variants.dijkstra_no_heuristics
     VERSION_DIJKSTRA_LESS_MEMORY = variants.dijkstra_less_memory
     VERSION_STATE_EQUATION_LESS_MEMORY = variants.state_equation_less_memory
+    VERSION_DIJKSTRA_PREFIX_TRIE = variants.dijkstra_prefix_trie
 
 
 class Parameters(Enum):
@@ -35,12 +37,16 @@ class Parameters(Enum):
     CASE_ID_KEY = PARAMETER_CONSTANT_CASEID_KEY
     ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
     VARIANTS_IDX = "variants_idx"
+    ENABLE_PARALLEL = "enable_parallel"
+    NUM_WORKERS = "num_workers"
+    MAX_TRIE_NODES = "max_trie_nodes"
 
 
 DEFAULT_VARIANT = Variants.VERSION_STATE_EQUATION_LESS_MEMORY
 VERSION_STATE_EQUATION_A_STAR = Variants.VERSION_STATE_EQUATION_A_STAR
 VERSION_DIJKSTRA_NO_HEURISTICS = Variants.VERSION_DIJKSTRA_NO_HEURISTICS
 VERSION_DIJKSTRA_LESS_MEMORY = Variants.VERSION_DIJKSTRA_LESS_MEMORY
+VERSION_DIJKSTRA_PREFIX_TRIE = Variants.VERSION_DIJKSTRA_PREFIX_TRIE
 
 VERSIONS = {Variants.VERSION_DIJKSTRA_NO_HEURISTICS, Variants.VERSION_DIJKSTRA_NO_HEURISTICS,
             Variants.VERSION_DIJKSTRA_LESS_MEMORY}
@@ -111,7 +117,9 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
     variant
         selected variant of the algorithm, possible values: {\'Variants.VERSION_STATE_EQUATION_A_STAR, Variants.VERSION_DIJKSTRA_NO_HEURISTICS \'}
     parameters
-        :class:`dict` parameters of the algorithm,
+        :class:`dict` parameters of the algorithm, including:
+            - Parameters.ENABLE_PARALLEL => aligns the variants using a pool of processes (default: False)
+            - Parameters.NUM_WORKERS => number of processes of the pool (default: number of CPUs)
 
     Returns
     -----------
@@ -140,31 +148,41 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
 
     variants_idxs = exec_utils.get_param_value(Parameters.VARIANTS_IDX, parameters, None)
     if variants_idxs is None:
-        variants_idxs = variants_module.get_variants_from_log_trace_idx(log, parameters=parameters)
+        variants_idxs = variants_index.apply(log, parameters=parameters)
 
-    one_tr_per_var = []
-    variants_list = []
-    for index_variant, var in enumerate(variants_idxs):
-        variants_list.append(var)
-
-    for var in variants_list:
-        one_tr_per_var.append(log[variants_idxs[var][0]])
-
-    all_alignments = []
-    for trace in one_tr_per_var:
-        this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
-        parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
-        all_alignments.append(apply_trace(trace, petri_net, initial_marking, final_marking, parameters=copy(parameters),
-                                          variant=variant))
-
-    al_idx = {}
-    for index_variant, variant in enumerate(variants_idxs):
-        for trace_idx in variants_idxs[variant]:
-            al_idx[trace_idx] = all_alignments[index_variant]
-
-    alignments = []
-    for i in range(len(log)):
-        alignments.append(al_idx[i])
+    if isinstance(variants_idxs, variants_index.VariantsIndex):
+        one_tr_per_var = [log[int(variants_idxs.get_cases(i)[0])] for i in range(len(variants_idxs))]
+    else:
+        # dictionary associating to every variant the list of the indexes of its traces
+        one_tr_per_var = [log[variants_idxs[var][0]] for var in variants_idxs]
+
+    enable_parallel = exec_utils.get_param_value(Parameters.ENABLE_PARALLEL, parameters, False)
+    num_workers = exec_utils.get_param_value(Parameters.NUM_WORKERS, parameters, os.cpu_count() or 1)
+
+    if exec_utils.get_variant(variant) is variants.dijkstra_prefix_trie:
+        # the variants are aligned together, sharing the search on their common prefixes
+        all_alignments = variants.dijkstra_prefix_trie.apply_traces(one_tr_per_var, petri_net, initial_marking,
+                                                                    final_marking, parameters=parameters)
+    elif enable_parallel and num_workers > 1 and len(one_tr_per_var) > 1:
+        all_alignments = __apply_variants_parallel(one_tr_per_var, petri_net, initial_marking, final_marking,
+                                                   start_time + max_align_time, max_align_time_case, num_workers,
+                                                   parameters, variant)
+    else:
+        all_alignments = []
+        for trace in one_tr_per_var:
+            this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
+            parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
+            all_alignments.append(apply_trace(trace, petri_net, initial_marking, final_marking,
+                                              parameters=copy(parameters), variant=variant))
+
+    if isinstance(variants_idxs, variants_index.VariantsIndex):
+        alignments = [all_alignments[i] for i in variants_idxs.variant_of_trace.tolist()]
+    else:
+        al_idx = {}
+        for index_variant, variant in enumerate(variants_idxs):
+            for trace_idx in variants_idxs[variant]:
+                al_idx[trace_idx] = all_alignments[index_variant]
+        alignments = [al_idx[i] for i in range(len(log))]
 
     # assign fitness to traces
     for index, align in enumerate(alignments):
@@ -180,6 +198,90 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
     return alignments
 
 
+def _align_batch(batch, deadline, max_align_time_case):
+    """
+    Aligns a batch of traces in a worker process
+
+    Parameters
+    -------------
+    batch
+        List of (index, trace) couples
+    deadline
+        Time (as returned by time.time()) after which no more time is available for the alignments
+    max_align_time_case
+        Maximum time for the alignment of a single trace
+
+    Returns
+    -------------
+    results
+        List of (index, alignment) couples
+    """
+    state = pool_utils.get_worker_state()
+    petri_net, initial_marking, final_marking = state["net"]
+    parameters = state["parameters"]
+    variant = state["variant"]
+    results = []
+    for index, trace in batch:
+        this_parameters = copy(parameters)
+        this_parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = min(max_align_time_case,
+                                                                     (deadline - time.time()) * 0.5)
+        results.append((index, apply_trace(trace, petri_net, initial_marking, final_marking,
+                                           parameters=this_parameters, variant=variant)))
+    return results
+
+
+def __apply_variants_parallel(traces, petri_net, initial_marking, final_marking, deadline, max_align_time_case,
+                              num_workers, parameters, variant):
+    """
+    Aligns a list of traces (one per variant) using a pool of processes.
+
+    The net is sent once to each worker (in the initializer). The traces are sorted by decreasing length
+    (as a proxy of the cost of the alignment) and submitted in batches that get smaller towards the end,
+    so that the most expensive alignments are started first and the workers finish at the same time.
+    The time limits are enforced globally, through a common deadline.
+
+    Parameters
+    -------------
+    traces
+        Traces to align
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    deadline
+        Time (as returned by time.time()) after which no more time is available for the alignments
+    max_align_time_case
+        Maximum time for the alignment of a single trace
+    num_workers
+        Number of worker processes
+    parameters
+        Parameters of the algorithm
+    variant
+        Variant of the alignments (one of the Variants, as the modules cannot be pickled)
+
+    Returns
+    -------------
+    alignments
+        List of alignments (in the same order as the traces)
+    """
+    parameters = {k: v for k, v in parameters.items() if
+                  exec_utils.unroll(k) not in [Parameters.VARIANTS_IDX.value, Parameters.ENABLE_PARALLEL.value]}
+    order = sorted(range(len(traces)), key=lambda i: len(traces[i]), reverse=True)
+    batches = pool_utils.get_guided_batches([(j, traces[j]) for j in order], num_workers)
+
+    alignments = [None] * len(traces)
+    state = {"net": (petri_net, initial_marking, final_marking), "parameters": parameters,
+             "variant": Variants(exec_utils.get_variant(variant))}
+    with pool_utils.get_pool(min(num_workers, len(batches)), state) as executor:
+        futures = [executor.submit(_align_batch, batch, deadline, max_align_time_case) for batch in batches]
+        for future in futures:
+            for index, alignment in future.result():
+                alignments[index] = alignment
+    return alignments
+
+
 def get_diagnostics_dataframe(log, align_output, parameters=None):
     """
     Gets the diagnostics results of alignments (of a log) in a dataframe
@@ -1,3 +1,7 @@
-from pm4py.algo.conformance.alignments.variants import state_equation_a_star, dijkstra_no_heuristics, \
-    dijkstra_less_memory, state_equation_less_memory
+from pm4py.util.lazy_import import lazy_getattr
 
+# the submodules are imported when they are accessed for the first time
+__all__ = ["state_equation_a_star", "dijkstra_no_heuristics", "dijkstra_less_memory", "state_equation_less_memory",
+           "dijkstra_prefix_trie"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -0,0 +1,480 @@
+"""
+This module computes the alignments of several traces at once, organizing them in a prefix trie.
+
+The search is performed on the product between the Petri net and the trie (instead of the product
+between the Petri net and a single trace net), so the states reached while aligning a prefix shared by
+several variants are explored only once. A state is a couple (marking of the model, node of the trie),
+and the alignment of a variant is found when the final marking is reached in the node where the variant ends.
+The search is a Dijkstra search, guided by a (consistent) heuristic that counts the events of the remaining
+suffixes that cannot be synchronized with any transition of the model.
+
+To keep the memory bounded, the variants are sorted (so that variants sharing a prefix are contiguous)
+and split in tries having at most Parameters.MAX_TRIE_NODES nodes. Moreover, the states of a branch of the trie
+are evicted as soon as the alignments of all the variants of the branch have been found.
+"""
+import heapq
+import sys
+import time
+from enum import Enum
+
+from pm4py import util as pm4pyutil
+from pm4py.objects.log import log as log_implementation
+from pm4py.objects.petri import align_utils as utils
+from pm4py.objects.petri import compiled
+from pm4py.util import exec_utils
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+
+
+class Parameters(Enum):
+    PARAM_TRACE_COST_FUNCTION = 'trace_cost_function'
+    PARAM_MODEL_COST_FUNCTION = 'model_cost_function'
+    PARAM_SYNC_COST_FUNCTION = 'sync_cost_function'
+    PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE = 'ret_tuple_as_trans_desc'
+    PARAM_MAX_ALIGN_TIME_TRACE = "max_align_time_trace"
+    PARAM_MAX_ALIGN_TIME = "max_align_time"
+    PARAMETER_VARIANT_DELIMITER = "variant_delimiter"
+    ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
+    MAX_TRIE_NODES = "max_trie_nodes"
+
+
+SKIP = utils.SKIP
+
+
+def get_best_worst_cost(petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Gets the best worst cost of an alignment
+
+    Parameters
+    -----------
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+
+    Returns
+    -----------
+    best_worst_cost
+        Best worst cost of alignment
+    """
+    if parameters is None:
+        parameters = {}
+
+    best_worst = apply(log_implementation.Trace(), petri_net, initial_marking, final_marking, parameters=parameters)
+
+    if best_worst['cost'] > 0:
+        return best_worst['cost'] // utils.STD_MODEL_LOG_MOVE_COST
+    return 0
+
+
+def apply(trace, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Aligns a single trace against a Petri net
+
+    Parameters
+    ----------
+    trace
+        Trace
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (see apply_traces)
+
+    Returns
+    -------
+    dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+    """
+    return apply_traces([trace], petri_net, initial_marking, final_marking, parameters=parameters)[0]
+
+
+def apply_from_variant(variant, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a single variant
+
+    Parameters
+    -------------
+    variant
+        Variant (as string delimited by the "variant_delimiter" parameter)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    ------------
+    dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+    """
+    return apply_from_variants_list([(variant,)], petri_net, initial_marking, final_marking,
+                                    parameters=parameters)[variant]
+
+
+def apply_from_variants_dictionary(var_dictio, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a variants dictionary
+
+    Parameters
+    -------------
+    var_dictio
+        Dictionary of variants (along possibly with their count, or the list of indexes, or the list of involved cases)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment
+    """
+    return apply_from_variants_list([(v,) for v in var_dictio], petri_net, initial_marking, final_marking,
+                                    parameters=parameters)
+
+
+def apply_from_variants_list(var_list, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a list of variants in the log
+
+    Parameters
+    -------------
+    var_list
+        List of variants (for each item, the first entry is the variant itself, the second entry may be the number of cases)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment
+    """
+    if parameters is None:
+        parameters = {}
+
+    variant_delimiter = exec_utils.get_param_value(Parameters.PARAMETER_VARIANT_DELIMITER, parameters,
+                                                   pm4pyutil.constants.DEFAULT_VARIANT_SEP)
+    variants = [varitem[0] for varitem in var_list]
+    sequences = [v.split(variant_delimiter) if type(v) is str else list(v) for v in variants]
+    alignments = __align_sequences(sequences, petri_net, initial_marking, final_marking, parameters)
+    return {variants[i]: alignments[i] for i in range(len(variants))}
+
+
+def apply_from_variants_list_petri_string(var_list, petri_net_string, parameters=None):
+    """
+    Apply the alignments from the specification of a list of variants in the log
+
+    Parameters
+    -------------
+    var_list
+        List of variants (for each item, the first entry is the variant itself, the second entry may be the number of cases)
+    petri_net_string
+        String representing the accepting Petri net
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment
+    """
+    if parameters is None:
+        parameters = {}
+
+    from pm4py.objects.petri.importer.variants import pnml as petri_importer
+
+    petri_net, initial_marking, final_marking = petri_importer.import_petri_from_string(petri_net_string)
+
+    return apply_from_variants_list(var_list, petri_net, initial_marking, final_marking, parameters=parameters)
+
+
+def apply_traces(traces, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Aligns a list of traces against a Petri net, sharing the search between the traces having a common prefix
+
+    Parameters
+    -------------
+    traces
+        List of traces
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm, including:
+            - Parameters.ACTIVITY_KEY => activity key
+            - Parameters.PARAM_TRACE_COST_FUNCTION => list associating a cost to the log move of the event
+                                                      at the i-th position (since it is defined for a single
+                                                      trace, when provided the traces are aligned one at a time,
+                                                      without sharing the search)
+            - Parameters.PARAM_MODEL_COST_FUNCTION => dictionary associating a cost to the model move of
+                                                      each transition
+            - Parameters.PARAM_SYNC_COST_FUNCTION => dictionary associating a cost to the sync move of
+                                                     each visible transition
+            - Parameters.PARAM_MAX_ALIGN_TIME => maximum time for the alignment of all the traces
+            - Parameters.PARAM_MAX_ALIGN_TIME_TRACE => maximum time per trace (the search, being shared,
+                                                       is stopped after this time multiplied by the number of traces)
+            - Parameters.MAX_TRIE_NODES => maximum number of nodes of a single trie (default: 100000)
+
+    Returns
+    -------------
+    alignments
+        List of alignments (one per trace; None if the alignment could not be computed in time)
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+    sequences = [[event[activity_key] for event in trace] for trace in traces]
+    return __align_sequences(sequences, petri_net, initial_marking, final_marking, parameters)
+
+
+def __align_sequences(sequences, petri_net, initial_marking, final_marking, parameters):
+    """
+    Aligns a list of sequences of activities, splitting them in tries of bounded size
+    """
+    max_align_time = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME, parameters, sys.maxsize)
+    max_align_time_trace = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
+                                                      sys.maxsize)
+    max_trie_nodes = exec_utils.get_param_value(Parameters.MAX_TRIE_NODES, parameters, 100000)
+    # the costs of the log moves of a trace are not shared with the other traces having the same prefix
+    share_prefixes = exec_utils.get_param_value(Parameters.PARAM_TRACE_COST_FUNCTION, parameters, None) is None
+    deadline = time.time() + min(max_align_time, max_align_time_trace * max(1, len(sequences)))
+
+    model = __build_model_structure(petri_net, initial_marking, final_marking, parameters)
+
+    alignments = [None] * len(sequences)
+    order = sorted(range(len(sequences)), key=lambda i: sequences[i])
+    i = 0
+    while i < len(order):
+        trie = PrefixTrie()
+        j = i
+        while j < len(order) and (j == i or share_prefixes and len(trie.labels) + len(
+                sequences[order[j]]) <= max_trie_nodes):
+            trie.insert(sequences[order[j]], order[j])
+            j = j + 1
+        for index, alignment in __search(model, trie, deadline, parameters).items():
+            alignments[index] = alignment
+        i = j
+    return alignments
+
+
+class PrefixTrie(object):
+    """
+    Prefix trie of the sequences to align (the node 0 is the root)
+    """
+
+    def __init__(self):
+        self.labels = [None]
+        self.parents = [None]
+        self.depths = [0]
+        self.children = [{}]
+        self.ends = [[]]
+
+    def insert(self, sequence, index):
+        node = 0
+        for label in sequence:
+            child = self.children[node].get(label)
+            if child is None:
+                child = len(self.labels)
+                self.labels.append(label)
+                self.parents.append(node)
+                self.depths.append(self.depths[node] + 1)
+                self.children.append({})
+                self.ends.append([])
+                self.children[node][label] = child
+            node = child
+        self.ends[node].append(index)
+
+
+def __build_model_structure(net, im, fm, parameters):
+    """
+    Transforms the accepting Petri net into a structure based on the compiled net (markings are tuples of integers)
+    """
+    model_cost_function = exec_utils.get_param_value(Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None)
+    sync_cost_function = exec_utils.get_param_value(Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None)
+    if model_cost_function is None or sync_cost_function is None:
+        model_cost_function = {}
+        sync_cost_function = {}
+        for t in net.transitions:
+            if t.label is not None:
+                model_cost_function[t] = utils.STD_MODEL_LOG_MOVE_COST
+                sync_cost_function[t] = utils.STD_SYNC_COST
+            else:
+                model_cost_function[t] = utils.STD_TAU_COST
+
+    compiled_net = compiled.construct(net)
+    transitions = compiled_net.transitions
+
+    label_trans = {}
+    for i, t in enumerate(transitions):
+        if t.label is not None:
+            label_trans.setdefault(t.label, []).append(i)
+
+    return {"net": compiled_net, "label_trans": label_trans,
+            "model_cost": [model_cost_function[t] for t in transitions],
+            "sync_cost": [sync_cost_function[t] if t.label is not None else None for t in transitions],
+            "im": compiled_net.encode_marking(im), "fm": compiled_net.encode_marking(fm)}
+
+
+def __get_heuristics(trie, label_trans, log_move_costs):
+    """
+    For each node of the trie, computes a lower bound of the cost to reach the end of one of the variants
+    of the branch (the cost of the log moves for the events that cannot be synchronized with the model)
+    """
+    h = [None] * len(trie.labels)
+    for node in range(len(trie.labels) - 1, -1, -1):
+        best = 0 if trie.ends[node] else sys.maxsize
+        for label, child in trie.children[node].items():
+            this = h[child] + (0 if label in label_trans else log_move_costs(trie.depths[node]))
+            if this < best:
+                best = this
+        h[node] = best
+    return h
+
+
+def __search(model, trie, deadline, parameters):
+    """
+    Dijkstra search (guided by a consistent heuristic) on the product between the model and the trie
+
+    Returns
+    -------------
+    alignments
+        Dictionary associating to the index of each sequence its alignment
+    """
+    trace_cost_function = exec_utils.get_param_value(Parameters.PARAM_TRACE_COST_FUNCTION, parameters, None)
+    ret_tuple_as_trans_desc = exec_utils.get_param_value(Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE,
+                                                         parameters, False)
+    if trace_cost_function is None:
+        log_move_cost = lambda i: utils.STD_MODEL_LOG_MOVE_COST
+    else:
+        log_move_cost = lambda i: trace_cost_function[i]
+
+    compiled_net = model["net"]
+    delta = compiled_net.delta
+    label_trans, model_cost, sync_cost = model["label_trans"], model["model_cost"], model["sync_cost"]
+    fm = model["fm"]
+    children, ends, parents = trie.children, trie.ends, trie.parents
+
+    h = __get_heuristics(trie, label_trans, log_move_cost)
+    # number of variants of the branch that are still to be aligned
+    remaining = [len(e) for e in ends]
+    for node in range(len(remaining) - 1, 0, -1):
+        remaining[parents[node]] += remaining[node]
+
+    # for each node of the trie, associates to each reached marking the couple (cost, parent state, move)
+    best = [{} for n in range(len(trie.labels))]
+    closed = [set() for n in range(len(trie.labels))]
+    alignments = {}
+    visited = 0
+    queued = 1
+    traversed = 0
+    counter = 0
+
+    best[0][model["im"]] = (0, None, None)
+    open_set = [(h[0], counter, 0, 0, model["im"])]
+
+    while open_set:
+        if time.time() > deadline:
+            break
+        f, c, g, node, m = heapq.heappop(open_set)
+        if remaining[node] == 0 or m in closed[node] or best[node][m][0] < g:
+            continue
+        closed[node].add(m)
+        visited += 1
+
+        if ends[node] and m == fm and (remaining[node] - sum(remaining[ch] for ch in children[node].values())) > 0:
+            alignment = __reconstruct_alignment(trie, model, best, node, m, ret_tuple_as_trans_desc)
+            for index in ends[node]:
+                alignments[index] = {"alignment": alignment, "cost": g, "visited_states": visited,
+                                     "queued_states": queued, "traversed_arcs": traversed}
+            n = node
+            while n is not None:
+                remaining[n] -= len(ends[node])
+                if remaining[n] == 0:
+                    # the branch is completed: evicts its states
+                    best[n] = None
+                    closed[n] = None
+                n = parents[n]
+            if remaining[0] == 0:
+                break
+            if remaining[node] == 0:
+                continue
+
+        enabled = set(compiled_net.enabled_transitions(m))
+
+        successors = []
+        for t in enabled:
+            new_m = list(m)
+            for p, w in delta[t]:
+                new_m[p] += w
+            new_m = tuple(new_m)
+            # model move
+            successors.append((g + model_cost[t], node, new_m, (None, t)))
+        for label, child in children[node].items():
+            if remaining[child] == 0:
+                continue
+            # log move
+            successors.append((g + log_move_cost(trie.depths[node]), child, m, (child, None)))
+            # sync moves
+            for t in label_trans.get(label, []):
+                if t in enabled:
+                    new_m = list(m)
+                    for p, w in delta[t]:
+                        new_m[p] += w
+                    successors.append((g + sync_cost[t], child, tuple(new_m), (child, t)))
+
+        for new_g, new_node, new_m, move in successors:
+            traversed += 1
+            if new_m in closed[new_node]:
+                continue
+            prev = best[new_node].get(new_m)
+            if prev is None or new_g < prev[0]:
+                best[new_node][new_m] = (new_g, (node, m), move)
+                counter += 1
+                queued += 1
+                heapq.heappush(open_set, (new_g + h[new_node], counter, new_g, new_node, new_m))
+
+    return alignments
+
+
+def __reconstruct_alignment(trie, model, best, node, m, ret_tuple_as_trans_desc):
+    """
+    Reconstructs the alignment leading to the given state, following the parent states
+    """
+    transitions = model["net"].transitions
+    alignment = []
+    g, parent, move = best[node][m]
+    while parent is not None:
+        child, t = move
+        t_name, t_label, m_name, m_label = SKIP, SKIP, SKIP, SKIP
+        if child is not None:
+            t_label = trie.labels[child]
+            t_name = "t_" + str(t_label) + "_" + str(trie.depths[child] - 1)
+        if t is not None:
+            m_name, m_label = transitions[t].name, transitions[t].label
+        if ret_tuple_as_trans_desc:
+            alignment.append(((t_name, m_name), (t_label, m_label)))
+        else:
+            alignment.append((t_label, m_label))
+        node, m = parent
+        g, parent, move = best[node][m]
+    alignment.reverse()
+    return alignment
@@ -1 +1,6 @@
-from pm4py.algo.conformance.footprints.variants import log_model, log_extensive, trace_extensive
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["log_model", "log_extensive", "trace_extensive"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
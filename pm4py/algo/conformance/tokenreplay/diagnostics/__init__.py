@@ -1 +1,6 @@
-from pm4py.algo.conformance.tokenreplay.diagnostics import root_cause_analysis, duration_diagnostics
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["root_cause_analysis", "duration_diagnostics"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1,4 +1,4 @@
-from pm4py.statistics.variants.log import get as variants_filter
+from pm4py.statistics.variants.log import index as variants_index
 from pm4py.objects.petri.semantics import is_enabled, weak_execute
 from pm4py.objects.petri.align_utils import get_visible_transitions_eventually_enabled_by_marking
 from copy import copy
@@ -283,7 +283,7 @@ def apply(log, net, initial_marking, final_marking, parameters=None):
             ma[p] = a.weight
         t.in_marking = ma
 
-    variants_idxs = variants_filter.get_variants_from_log_trace_idx(log, parameters=parameters)
+    index = variants_index.apply(log, parameters=parameters)
     results = []
 
     tmap = {}
@@ -294,21 +294,12 @@ def apply(log, net, initial_marking, final_marking, parameters=None):
                 tmap[t.label] = []
             tmap[t.label].append(t)
 
-    for variant in variants_idxs:
-        vlist = variant.split(",")
+    for variant_id in range(len(index)):
+        vlist = list(index.get_variant(variant_id))
         result = tr_vlist(vlist, net, initial_marking, final_marking, tmap, bmap, parameters=parameters)
         results.append(result)
 
-    al_idx = {}
-    for index_variant, variant in enumerate(variants_idxs):
-        for trace_idx in variants_idxs[variant]:
-            al_idx[trace_idx] = results[index_variant]
-
-    ret = []
-    for i in range(len(log)):
-        ret.append(al_idx[i])
-
-    return ret
+    return [results[variant_id] for variant_id in index.variant_of_trace.tolist()]
 
 
 def get_diagnostics_dataframe(log, tbr_output, parameters=None):
@@ -5,9 +5,10 @@ from pm4py.objects.petri.petrinet import Marking
 from pm4py.objects.petri.utils import get_places_shortest_path_by_hidden, get_s_components_from_petri
 from pm4py.objects.log import log as log_implementation
 from pm4py.objects.petri import align_utils
+import os
 from copy import copy
 from enum import Enum
-from pm4py.util import exec_utils, constants
+from pm4py.util import exec_utils, constants, pool_utils
 
 
 class Parameters(Enum):
@@ -26,6 +27,8 @@ class Parameters(Enum):
     TRY_TO_REACH_FINAL_MARKING_THROUGH_HIDDEN = "try_to_reach_final_marking_through_hidden"
     CONSIDER_REMAINING_IN_FITNESS = "consider_remaining_in_fitness"
     ENABLE_PLTR_FITNESS = "enable_pltr_fitness"
+    ENABLE_PARALLEL = "enable_parallel"
+    NUM_WORKERS = "num_workers"
 
 
 class TechnicalParameters(Enum):
@@ -912,7 +915,8 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
               activity_key="concept:name", reach_mark_through_hidden=True, stop_immediately_unfit=False,
               walk_through_hidden_trans=True, places_shortest_path_by_hidden=None,
               variants=None, is_reduction=False, thread_maximum_ex_time=TechnicalParameters.MAX_DEF_THR_EX_TIME.value,
-              cleaning_token_flood=False, disable_variants=False, return_object_names=False):
+              cleaning_token_flood=False, disable_variants=False, return_object_names=False, enable_parallel=False,
+              num_workers=None):
     """
     Apply token-based replay to a log
 
@@ -952,6 +956,10 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
         Disable variants grouping
     return_object_names
         Decides whether names instead of object pointers shall be returned
+    enable_parallel
+        Replays the variants using a pool of processes
+    num_workers
+        Number of processes of the pool (default: number of CPUs)
     """
     post_fix_cache = PostFixCaching()
     marking_to_activity_cache = MarkingToActivityCaching()
@@ -992,58 +1000,63 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
                 threads_results = {}
                 all_activated_transitions = set()
 
-                for i in range(len(vc)):
-                    variant = vc[i][0]
-                    threads[variant] = ApplyTraceTokenReplay(variants[variant][0], net, initial_marking, final_marking,
-                                                             trans_map, enable_pltr_fitness, place_fitness_per_trace,
-                                                             transition_fitness_per_trace,
-                                                             notexisting_activities_in_model,
-                                                             places_shortest_path_by_hidden,
-                                                             consider_remaining_in_fitness,
-                                                             activity_key=activity_key,
-                                                             reach_mark_through_hidden=reach_mark_through_hidden,
-                                                             stop_immediately_when_unfit=stop_immediately_unfit,
-                                                             walk_through_hidden_trans=walk_through_hidden_trans,
-                                                             post_fix_caching=post_fix_cache,
-                                                             marking_to_activity_caching=marking_to_activity_cache,
-                                                             is_reduction=is_reduction,
-                                                             thread_maximum_ex_time=thread_maximum_ex_time,
-                                                             cleaning_token_flood=cleaning_token_flood,
-                                                             s_components=s_components, trace_occurrences=vc[i][1])
-                    threads[variant].run()
-                    t = threads[variant]
-                    threads_results[variant] = {"trace_is_fit": copy(t.t_fit),
-                                                "trace_fitness": float(copy(t.t_value)),
-                                                "activated_transitions": copy(t.act_trans),
-                                                "reached_marking": copy(t.reached_marking),
-                                                "enabled_transitions_in_marking": copy(
-                                                    t.enabled_trans_in_mark),
-                                                "transitions_with_problems": copy(
-                                                    t.trans_probl),
-                                                "missing_tokens": int(t.missing),
-                                                "consumed_tokens": int(t.consumed),
-                                                "remaining_tokens": int(t.remaining),
-                                                "produced_tokens": int(t.produced)}
-
+                if num_workers is None:
+                    num_workers = os.cpu_count() or 1
+
+                if enable_parallel and num_workers > 1 and len(vc) > 1:
+                    settings = {"consider_remaining_in_fitness": consider_remaining_in_fitness,
+                                "activity_key": activity_key, "reach_mark_through_hidden": reach_mark_through_hidden,
+                                "stop_immediately_when_unfit": stop_immediately_unfit,
+                                "walk_through_hidden_trans": walk_through_hidden_trans, "is_reduction": is_reduction,
+                                "thread_maximum_ex_time": thread_maximum_ex_time,
+                                "cleaning_token_flood": cleaning_token_flood}
+                    threads_results = __apply_variants_parallel(vc, variants, net, initial_marking, final_marking,
+                                                                enable_pltr_fitness, place_fitness_per_trace,
+                                                                transition_fitness_per_trace,
+                                                                notexisting_activities_in_model,
+                                                                places_shortest_path_by_hidden, s_components,
+                                                                num_workers, settings)
                     if return_object_names:
-                        threads_results[variant]["activated_transitions_labels"] = [x.label for x in
-                                                                                    threads_results[variant][
-                                                                                        "activated_transitions"]]
-                        threads_results[variant]["activated_transitions"] = [x.name for x in threads_results[variant][
-                            "activated_transitions"]]
-                        threads_results[variant]["enabled_transitions_in_marking_labels"] = [x.label for x in
-                                                                                             threads_results[variant][
-                                                                                                 "enabled_transitions_in_marking"]]
-                        threads_results[variant]["enabled_transitions_in_marking"] = [x.name for x in
-                                                                                      threads_results[variant][
-                                                                                          "enabled_transitions_in_marking"]]
-                        threads_results[variant]["transitions_with_problems"] = [x.name for x in
-                                                                                 threads_results[variant][
-                                                                                     "transitions_with_problems"]]
-                        threads_results[variant]["reached_marking"] = {x.name: y for x, y in
-                                                                       threads_results[variant][
-                                                                           "reached_marking"].items()}
-                    del threads[variant]
+                        for variant in threads_results:
+                            __transform_result_to_names(threads_results[variant])
+                else:
+                    for i in range(len(vc)):
+                        variant = vc[i][0]
+                        threads[variant] = ApplyTraceTokenReplay(variants[variant][0], net, initial_marking,
+                                                                 final_marking, trans_map, enable_pltr_fitness,
+                                                                 place_fitness_per_trace,
+                                                                 transition_fitness_per_trace,
+                                                                 notexisting_activities_in_model,
+                                                                 places_shortest_path_by_hidden,
+                                                                 consider_remaining_in_fitness,
+                                                                 activity_key=activity_key,
+                                                                 reach_mark_through_hidden=reach_mark_through_hidden,
+                                                                 stop_immediately_when_unfit=stop_immediately_unfit,
+                                                                 walk_through_hidden_trans=walk_through_hidden_trans,
+                                                                 post_fix_caching=post_fix_cache,
+                                                                 marking_to_activity_caching=marking_to_activity_cache,
+                                                                 is_reduction=is_reduction,
+                                                                 thread_maximum_ex_time=thread_maximum_ex_time,
+                                                                 cleaning_token_flood=cleaning_token_flood,
+                                                                 s_components=s_components, trace_occurrences=vc[i][1])
+                        threads[variant].run()
+                        t = threads[variant]
+                        threads_results[variant] = {"trace_is_fit": copy(t.t_fit),
+                                                    "trace_fitness": float(copy(t.t_value)),
+                                                    "activated_transitions": copy(t.act_trans),
+                                                    "reached_marking": copy(t.reached_marking),
+                                                    "enabled_transitions_in_marking": copy(
+                                                        t.enabled_trans_in_mark),
+                                                    "transitions_with_problems": copy(
+                                                        t.trans_probl),
+                                                    "missing_tokens": int(t.missing),
+                                                    "consumed_tokens": int(t.consumed),
+                                                    "remaining_tokens": int(t.remaining),
+                                                    "produced_tokens": int(t.produced)}
+
+                        if return_object_names:
+                            __transform_result_to_names(threads_results[variant])
+                        del threads[variant]
                 for trace in log:
                     trace_variant = get_variant_from_trace(trace, activity_key, disable_variants=disable_variants)
                     if trace_variant in threads_results:
@@ -1058,6 +1071,195 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
         return aligned_traces
 
 
+def __transform_result_to_names(result):
+    """
+    Replaces (in-place) the objects of the Petri net contained in the result of the replay of a trace
+    by their names (and labels)
+
+    Parameters
+    -------------
+    result
+        Result of the replay of a trace
+    """
+    result["activated_transitions_labels"] = [x.label for x in result["activated_transitions"]]
+    result["activated_transitions"] = [x.name for x in result["activated_transitions"]]
+    result["enabled_transitions_in_marking_labels"] = [x.label for x in result["enabled_transitions_in_marking"]]
+    result["enabled_transitions_in_marking"] = [x.name for x in result["enabled_transitions_in_marking"]]
+    result["transitions_with_problems"] = [x.name for x in result["transitions_with_problems"]]
+    result["reached_marking"] = {x.name: y for x, y in result["reached_marking"].items()}
+
+
+def _replay_batch(batch):
+    """
+    Replays a batch of variants in a worker process
+
+    Parameters
+    -------------
+    batch
+        List of (index, trace, occurrences) tuples
+
+    Returns
+    -------------
+    results
+        Dictionary associating to the index of each variant the result of the replay (places and transitions
+        are expressed by their position)
+    place_fitness
+        Place fitness statistics of the batch (traces are expressed by the index of the variant)
+    transition_fitness
+        Transition fitness statistics of the batch (traces are expressed by the index of the variant)
+    notexisting_activities_in_model
+        Activities of the batch not contained in the model (traces are expressed by the index of the variant)
+    """
+    state = pool_utils.get_worker_state()
+    net, initial_marking, final_marking = state["net"]
+    places_idx = state["places_idx"]
+    transitions_idx = state["transitions_idx"]
+    enable_pltr_fitness = state["enable_pltr_fitness"]
+    settings = state["settings"]
+
+    trans_map = {}
+    for t in state["transitions"]:
+        trans_map[t.label] = t
+    place_fitness = {}
+    transition_fitness = {}
+    if enable_pltr_fitness:
+        for place in state["places"]:
+            place_fitness[place] = {"underfed_traces": set(), "overfed_traces": set(), "m": 0, "r": 0, "c": 0, "p": 0}
+        for transition in state["transitions"]:
+            if transition.label:
+                transition_fitness[transition] = {"underfed_traces": {}, "fit_traces": {}}
+    notexisting_activities_in_model = {}
+
+    results = {}
+    trace_index = {}
+    for index, trace, occurrences in batch:
+        trace_index[id(trace)] = index
+        t = ApplyTraceTokenReplay(trace, net, initial_marking, final_marking, trans_map, enable_pltr_fitness,
+                                  place_fitness, transition_fitness, notexisting_activities_in_model,
+                                  state["places_shortest_path_by_hidden"],
+                                  settings["consider_remaining_in_fitness"], activity_key=settings["activity_key"],
+                                  reach_mark_through_hidden=settings["reach_mark_through_hidden"],
+                                  stop_immediately_when_unfit=settings["stop_immediately_when_unfit"],
+                                  walk_through_hidden_trans=settings["walk_through_hidden_trans"],
+                                  post_fix_caching=state["post_fix_cache"],
+                                  marking_to_activity_caching=state["marking_to_activity_cache"],
+                                  is_reduction=settings["is_reduction"],
+                                  thread_maximum_ex_time=settings["thread_maximum_ex_time"],
+                                  cleaning_token_flood=settings["cleaning_token_flood"],
+                                  s_components=state["s_components"], trace_occurrences=occurrences)
+        t.run()
+        results[index] = {"trace_is_fit": t.t_fit, "trace_fitness": float(t.t_value),
+                          "activated_transitions": [transitions_idx[x] for x in t.act_trans],
+                          "reached_marking": {places_idx[x]: y for x, y in t.reached_marking.items()},
+                          "enabled_transitions_in_marking": [transitions_idx[x] for x in t.enabled_trans_in_mark],
+                          "transitions_with_problems": [transitions_idx[x] for x in t.trans_probl],
+                          "missing_tokens": int(t.missing), "consumed_tokens": int(t.consumed),
+                          "remaining_tokens": int(t.remaining), "produced_tokens": int(t.produced)}
+
+    place_fitness = {places_idx[p]: {"underfed_traces": set(trace_index[id(x)] for x in v["underfed_traces"]),
+                                     "overfed_traces": set(trace_index[id(x)] for x in v["overfed_traces"]),
+                                     "m": v["m"], "r": v["r"], "c": v["c"], "p": v["p"]}
+                     for p, v in place_fitness.items()}
+    transition_fitness = {transitions_idx[t]: {"underfed_traces": {trace_index[id(x)]: y for x, y in
+                                                                   v["underfed_traces"].items()},
+                                               "fit_traces": {trace_index[id(x)]: y for x, y in
+                                                              v["fit_traces"].items()}}
+                          for t, v in transition_fitness.items()}
+    notexisting_activities_in_model = {act: {trace_index[id(x)]: y for x, y in v.items()}
+                                       for act, v in notexisting_activities_in_model.items()}
+    return results, place_fitness, transition_fitness, notexisting_activities_in_model
+
+
+def __apply_variants_parallel(vc, variants, net, initial_marking, final_marking, enable_pltr_fitness,
+                              place_fitness_per_trace, transition_fitness_per_trace, notexisting_activities_in_model,
+                              places_shortest_path_by_hidden, s_components, num_workers, settings):
+    """
+    Replays the variants of the log using a pool of processes, and merges the place/transition level statistics
+    into the provided dictionaries.
+
+    The Petri net is sent once to each worker (in the initializer). The variants are submitted in batches
+    that get smaller towards the end, so that the workers finish at the same time.
+
+    Parameters
+    -------------
+    vc
+        Variants of the log, along with their count (sorted by count)
+    variants
+        Dictionary associating to each variant its traces
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    enable_pltr_fitness
+        Enable fitness retrieval at place/transition level
+    place_fitness_per_trace
+        Dictionary of places associated with unfit traces (updated)
+    transition_fitness_per_trace
+        Dictionary of transitions associated with unfit traces (updated)
+    notexisting_activities_in_model
+        Map that stores the notexisting activities in the model (updated)
+    places_shortest_path_by_hidden
+        Shortest paths between places by hidden transitions
+    s_components
+        S-components of the Petri net
+    num_workers
+        Number of worker processes
+    settings
+        Other settings of the replay
+
+    Returns
+    -------------
+    threads_results
+        Dictionary associating to each variant the result of the replay
+    """
+    places = list(net.places)
+    transitions = list(net.transitions)
+    representatives = [variants[vc[i][0]][0] for i in range(len(vc))]
+
+    # longest variants first (proxy of the cost of the replay)
+    order = sorted(range(len(vc)), key=lambda i: len(representatives[i]), reverse=True)
+    batches = pool_utils.get_guided_batches([(j, representatives[j], vc[j][1]) for j in order], num_workers)
+
+    threads_results = {}
+    # places and transitions are pickled along with the net, so their positions identify the same objects
+    # in the workers and in the main process
+    state = {"net": (net, initial_marking, final_marking), "places": places, "transitions": transitions,
+             "places_idx": {p: i for i, p in enumerate(places)},
+             "transitions_idx": {t: i for i, t in enumerate(transitions)},
+             "places_shortest_path_by_hidden": places_shortest_path_by_hidden, "s_components": s_components,
+             "enable_pltr_fitness": enable_pltr_fitness, "settings": settings, "post_fix_cache": PostFixCaching(),
+             "marking_to_activity_cache": MarkingToActivityCaching()}
+    with pool_utils.get_pool(min(num_workers, len(batches)), state) as executor:
+        futures = [executor.submit(_replay_batch, batch) for batch in batches]
+        for future in futures:
+            results, place_fitness, transition_fitness, notexisting = future.result()
+            for index, res in results.items():
+                res["activated_transitions"] = [transitions[x] for x in res["activated_transitions"]]
+                res["reached_marking"] = Marking({places[x]: y for x, y in res["reached_marking"].items()})
+                res["enabled_transitions_in_marking"] = set(
+                    transitions[x] for x in res["enabled_transitions_in_marking"])
+                res["transitions_with_problems"] = [transitions[x] for x in res["transitions_with_problems"]]
+                threads_results[vc[index][0]] = res
+            for p, v in place_fitness.items():
+                target = place_fitness_per_trace[places[p]]
+                target["underfed_traces"].update(representatives[x] for x in v["underfed_traces"])
+                target["overfed_traces"].update(representatives[x] for x in v["overfed_traces"])
+                for key in ["m", "r", "c", "p"]:
+                    target[key] += v[key]
+            for t, v in transition_fitness.items():
+                target = transition_fitness_per_trace[transitions[t]]
+                target["underfed_traces"].update({representatives[x]: y for x, y in v["underfed_traces"].items()})
+                target["fit_traces"].update({representatives[x]: y for x, y in v["fit_traces"].items()})
+            for act, v in notexisting.items():
+                if act not in notexisting_activities_in_model:
+                    notexisting_activities_in_model[act] = {}
+                notexisting_activities_in_model[act].update({representatives[x]: y for x, y in v.items()})
+
+    return threads_results
+
+
 def apply(log, net, initial_marking, final_marking, parameters=None):
     """
     Method to apply token-based replay
@@ -1096,6 +1298,8 @@ def apply(log, net, initial_marking, final_marking, parameters=None):
                                                                 None)
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_util.DEFAULT_NAME_KEY)
     variants = exec_utils.get_param_value(Parameters.VARIANTS, parameters, None)
+    enable_parallel = exec_utils.get_param_value(Parameters.ENABLE_PARALLEL, parameters, False)
+    num_workers = exec_utils.get_param_value(Parameters.NUM_WORKERS, parameters, None)
 
     return apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=enable_pltr_fitness,
                      consider_remaining_in_fitness=consider_remaining_in_fitness,
@@ -1105,7 +1309,7 @@ def apply(log, net, initial_marking, final_marking, parameters=None):
                      places_shortest_path_by_hidden=places_shortest_path_by_hidden, activity_key=activity_key,
                      variants=variants, is_reduction=is_reduction, thread_maximum_ex_time=thread_maximum_ex_time,
                      cleaning_token_flood=cleaning_token_flood, disable_variants=disable_variants,
-                     return_object_names=return_names)
+                     return_object_names=return_names, enable_parallel=enable_parallel, num_workers=num_workers)
 
 
 def apply_variants_list(variants_list, net, initial_marking, final_marking, parameters=None):
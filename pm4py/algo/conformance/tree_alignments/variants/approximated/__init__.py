@@ -1,2 +1,6 @@
-from pm4py.algo.conformance.tree_alignments.variants.approximated import matrix_lp, original, calculate_a_sa_ea_sets, \
-    utilities
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["matrix_lp", "original", "calculate_a_sa_ea_sets", "utilities"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
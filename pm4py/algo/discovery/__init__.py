@@ -1,5 +1,11 @@
-from pm4py.algo.discovery import alpha, dfg, heuristics, inductive, transition_system, log_skeleton, footprints
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["alpha", "dfg", "heuristics", "inductive", "transition_system", "log_skeleton", "footprints"]
+
 if pkgutil.find_loader("pandas"):
-    from pm4py.algo.discovery import correlation_mining
+    __all__.append("correlation_mining")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
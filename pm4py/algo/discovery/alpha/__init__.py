@@ -1 +1,6 @@
-from pm4py.algo.discovery.alpha import algorithm, data_structures, utils, variants
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["algorithm", "data_structures", "utils", "variants"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
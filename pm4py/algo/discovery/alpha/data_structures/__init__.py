@@ -1 +1,6 @@
-from pm4py.algo.discovery.alpha.data_structures import alpha_classic_abstraction
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["alpha_classic_abstraction"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1 +1,6 @@
-from pm4py.algo.discovery.alpha.variants import classic, plus
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["classic", "plus"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
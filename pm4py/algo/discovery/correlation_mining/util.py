@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 from pm4py.util.lp import solver
 from statistics import mean
@@ -23,15 +25,12 @@ def get_c_matrix(PS_matrix, duration_matrix, activities, activities_counter):
     c_matrix
         C matrix
     """
-    C_matrix = np.zeros((len(activities), len(activities)))
-    for i in range(len(activities)):
-        for j in range(len(activities)):
-            val = duration_matrix[i, j] / PS_matrix[i, j] * 1 / (
-                min(activities_counter[activities[i]], activities_counter[activities[j]])) if PS_matrix[
-                                                                                                  i, j] > 0 else 0
-            if val == 0:
-                val = 100000000000
-            C_matrix[i, j] = val
+    counts = np.array([activities_counter[act] for act in activities], dtype=np.float64)
+    PS_matrix = np.asarray(PS_matrix, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        C_matrix = np.where(PS_matrix > 0, np.asarray(duration_matrix, dtype=np.float64) / PS_matrix * 1 /
+                            np.minimum.outer(counts, counts), 0)
+    C_matrix[C_matrix == 0] = 100000000000
     return C_matrix
 
 
@@ -39,6 +38,9 @@ def resolve_LP(C_matrix, duration_matrix, activities, activities_counter):
     """
     Formulates and solve the LP problem
 
+    The constraint matrices are built as sparse matrices (every variable, i.e., every couple of activities,
+    appears only in the constraints of its source and its target activity)
+
     Parameters
     --------------
     C_matrix
@@ -57,49 +59,30 @@ def resolve_LP(C_matrix, duration_matrix, activities, activities_counter):
     performance_dfg
         Performance DFG (containing the estimated performance for the arcs)
     """
-    edges = [(i, j) for i in range(len(activities)) for j in range(len(activities))]
-    c = [C_matrix[i, j] for i in range(len(activities)) for j in range(len(activities))]
-    edges_sources = {i: [z for z in range(len(edges)) if edges[z][0] == i] for i in range(len(activities))}
-    edges_targets = {j: [z for z in range(len(edges)) if edges[z][1] == j] for j in range(len(activities))}
-    activities_occurrences = {i: activities_counter[activities[i]] for i in range(len(activities))}
-    Aeq = []
-    beq = []
-    for i in range(len(activities)):
-        rec = [0] * len(edges)
-        for e in edges_sources[i]:
-            rec[e] = 1
-        Aeq.append(rec)
-        beq.append(activities_occurrences[i])
-    for j in range(len(activities)):
-        rec = [0] * len(edges)
-        for e in edges_targets[j]:
-            rec[e] = 1
-        Aeq.append(rec)
-        beq.append(activities_occurrences[j])
-    Aeq = np.asmatrix(Aeq).astype(np.float64)
-    beq = np.asmatrix(beq).transpose().astype(np.float64)
-    Aub = []
-    bub = []
-    for i in range(len(activities)):
-        for e in edges_sources[i]:
-            rec = [0] * len(edges)
-            rec[e] = 1
-            Aub.append(rec)
-            bub.append(activities_occurrences[i])
-            rec = [-x for x in rec]
-            Aub.append(rec)
-            bub.append(0)
-    for j in range(len(activities)):
-        for e in edges_targets[j]:
-            rec = [0] * len(edges)
-            rec[e] = 1
-            Aub.append(rec)
-            bub.append(activities_occurrences[j])
-            rec = [-x for x in rec]
-            Aub.append(rec)
-            bub.append(0)
-    Aub = np.asmatrix(Aub).astype(np.float64)
-    bub = np.asmatrix(bub).transpose().astype(np.float64)
+    from scipy.sparse import coo_matrix
+
+    n = len(activities)
+    # the edge (i, j) is the variable i * n + j
+    edges = [(i, j) for i in range(n) for j in range(n)]
+    c = np.asarray(C_matrix, dtype=np.float64).ravel().tolist()
+    activities_occurrences = np.array([activities_counter[act] for act in activities], dtype=np.float64)
+    edges_idx = np.arange(n * n)
+    # edges grouped by source activity, then grouped by target activity
+    edges_sources = edges_idx
+    edges_targets = edges_idx.reshape(n, n).T.ravel()
+
+    Aeq = coo_matrix((np.ones(2 * n * n), (np.concatenate([edges_sources // n, n + edges_targets % n]),
+                                           np.concatenate([edges_sources, edges_targets]))),
+                     shape=(2 * n, n * n)).tocsr()
+    beq = np.concatenate([activities_occurrences, activities_occurrences]).reshape(-1, 1)
+
+    # for every edge of a source (and then of a target) activity, the constraints x <= occ and -x <= 0
+    ub_edges = np.concatenate([edges_sources, edges_targets])
+    Aub = coo_matrix((np.tile([1.0, -1.0], 2 * n * n), (np.arange(4 * n * n), np.repeat(ub_edges, 2))),
+                     shape=(4 * n * n, n * n)).tocsr()
+    bub = np.zeros(4 * n * n)
+    bub[0::2] = activities_occurrences[np.concatenate([edges_sources // n, edges_targets % n])]
+    bub = bub.reshape(-1, 1)
 
     use_cvxopt = False
     if solver.DEFAULT_LP_SOLVER_VARIANT == solver.CVXOPT_SOLVER_CUSTOM_ALIGN or solver.DEFAULT_LP_SOLVER_VARIANT == solver.CVXOPT_SOLVER_CUSTOM_ALIGN_ILP:
@@ -109,9 +92,9 @@ def resolve_LP(C_matrix, duration_matrix, activities, activities_counter):
         from cvxopt import matrix
 
         c = matrix(c)
-        Aub = matrix(Aub)
+        Aub = matrix(Aub.toarray())
         bub = matrix(bub)
-        Aeq = matrix(Aeq)
+        Aeq = matrix(Aeq.toarray())
         beq = matrix(beq)
 
     res = solver.apply(c, Aub, bub, Aeq, beq, variant=solver.DEFAULT_LP_SOLVER_VARIANT)
@@ -129,6 +112,60 @@ def resolve_LP(C_matrix, duration_matrix, activities, activities_counter):
     return dfg, performance_dfg
 
 
+def resolve_min_cost_flow(C_matrix, duration_matrix, activities, activities_counter, scale=1000000):
+    """
+    Solves the same problem of resolve_LP as a min-cost flow (transportation) problem,
+    where every activity supplies its occurrences to the activities that follow it.
+    The network simplex does not require a LP solver and scales to larger sets of activities.
+
+    Parameters
+    --------------
+    C_matrix
+        C_matrix
+    duration_matrix
+        Duration matrix
+    activities
+        Ordered list of activities of the log
+    activities_counter
+        Counter of activities
+    scale
+        The costs are multiplied by this factor and rounded to integers
+        (the network simplex is exact only on integer costs)
+
+    Returns
+    -------------
+    dfg
+        Directly-Follows Graph
+    performance_dfg
+        Performance DFG (containing the estimated performance for the arcs)
+    """
+    import networkx as nx
+
+    n = len(activities)
+    G = nx.DiGraph()
+    for i in range(n):
+        occ = int(activities_counter[activities[i]])
+        G.add_node(("s", i), demand=-occ)
+        G.add_node(("t", i), demand=occ)
+    costs = np.rint(np.asarray(C_matrix, dtype=np.float64) * scale)
+    for i in range(n):
+        for j in range(n):
+            G.add_edge(("s", i), ("t", j), weight=int(costs[i, j]))
+
+    flow_cost, flow = nx.network_simplex(G)
+
+    dfg = {}
+    performance_dfg = {}
+
+    for i in range(n):
+        for j in range(n):
+            p = flow[("s", i)][("t", j)]
+            if p > 0:
+                dfg[(activities[i], activities[j])] = p
+                performance_dfg[(activities[i], activities[j])] = duration_matrix[i, j]
+    return dfg, performance_dfg
+
+
 def match_return_avg_time(ai, aj, exact=False):
     """
     Matches two list of times (exact or greedy)
@@ -175,13 +212,90 @@ def greedy_match_return_avg_time(ai, aj):
     times_mean
         Mean of times
     """
-    tm0 = calculate_time_match_fifo(ai, aj)
-    td0 = mean([x[1] - x[0] for x in tm0]) if tm0 else 0
-    tm1 = calculate_time_match_rlifo(ai, aj)
-    td1 = mean([x[1] - x[0] for x in tm1]) if tm1 else 0
+    td0 = mean_times_diff(get_times_diff_fifo(ai, aj))
+    td1 = mean_times_diff(get_times_diff_rlifo(ai, aj))
     return min(td0, td1)
 
 
+def mean_times_diff(diff):
+    """
+    Gets the mean of the differences between the matched times (0 if nothing is matched)
+
+    Parameters
+    --------------
+    diff
+        Differences between the matched times
+
+    Returns
+    --------------
+    times_mean
+        Mean of times
+    """
+    return math.fsum(diff) / len(diff) if len(diff) else 0
+
+
+def get_times_diff_fifo(ai, aj):
+    """
+    Vectorized version of calculate_time_match_fifo
+    (every time of the first list is matched to the first greater time of the second list
+    that follows the previously matched one), returning the differences between the matched times
+
+    Parameters
+    --------------
+    ai
+        First list of timestamps
+    aj
+        Second list of timestamps (if they are not sorted, the non-vectorized version is used)
+
+    Returns
+    --------------
+    diff
+        Differences between the matched times
+    """
+    ai = np.asarray(ai, dtype=np.float64)
+    aj = np.asarray(aj, dtype=np.float64)
+    if np.any(aj[1:] < aj[:-1]):
+        return np.array([x[1] - x[0] for x in calculate_time_match_fifo(ai.tolist(), aj.tolist())])
+    k = np.arange(len(ai))
+    # the position in the second list is the greatest between the first position that can be matched
+    # and the position following the previously matched one
+    z = np.maximum(np.maximum.accumulate(np.searchsorted(aj, ai, side="right") - k), 0) + k if len(ai) else k
+    mask = z < len(aj)
+    return aj[z[mask]] - ai[k[mask]]
+
+
+def get_times_diff_rlifo(ai, aj):
+    """
+    Vectorized version of calculate_time_match_rlifo
+    (starting from the end, every time of the second list is matched to the last smaller time of the first list
+    that precedes the previously matched one), returning the differences between the matched times
+
+    Parameters
+    --------------
+    ai
+        First list of timestamps (if they are not sorted, the non-vectorized version is used)
+    aj
+        Second list of timestamps
+
+    Returns
+    --------------
+    diff
+        Differences between the matched times
+    """
+    ai = np.asarray(ai, dtype=np.float64)
+    aj = np.asarray(aj, dtype=np.float64)
+    if np.any(ai[1:] < ai[:-1]):
+        return np.array([x[1] - x[0] for x in calculate_time_match_rlifo(ai.tolist(), aj.tolist())])
+    u = np.arange(len(aj))
+    z = len(aj) - 1 - u
+    # the position in the first list is the smallest between the last position that can be matched
+    # and the position preceding the previously matched one
+    k = np.minimum(np.minimum.accumulate(np.searchsorted(ai, aj[z], side="left") - 1 + u),
+                   len(ai) - 1) - u if len(aj) else u
+    mask = k >= 0
+    return aj[z[mask]] - ai[k[mask]]
+
+
 def calculate_time_match_fifo(ai, aj, times0=None):
     """
     Associate the times between
@@ -14,6 +14,7 @@ class Parameters(Enum):
     START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
     EXACT_TIME_MATCHING = "exact_time_matching"
     INDEX_KEY = "index_key"
+    MIN_COST_FLOW = "min_cost_flow"
 
 
 DEFAULT_INDEX_KEY = "@@@index"
@@ -51,10 +52,10 @@ def apply(log, parameters=None):
     PS_matrix, duration_matrix = get_PS_dur_matrix(activities_grouped, activities, parameters=parameters)
     activities_counter = {x: len(y) for x, y in activities_grouped.items()}
 
-    return resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter)
+    return resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter, parameters=parameters)
 
 
-def resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter):
+def resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter, parameters=None):
     """
     Resolves a LP problem to get a DFG
 
@@ -68,6 +69,10 @@ def resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counte
         List of activities of the log
     activities_counter
         Counter of the activities
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.MIN_COST_FLOW => solves the problem as a min-cost flow problem (network simplex)
+        instead of using the LP solver (default: False)
 
     Returns
     --------------
@@ -76,8 +81,17 @@ def resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counte
     performance_dfg
         Performance DFG (containing the estimated performance for the arcs)
     """
+    if parameters is None:
+        parameters = {}
+
+    min_cost_flow = exec_utils.get_param_value(Parameters.MIN_COST_FLOW, parameters, False)
+
     C_matrix = cm_util.get_c_matrix(PS_matrix, duration_matrix, activities, activities_counter)
-    dfg, performance_dfg = cm_util.resolve_LP(C_matrix, duration_matrix, activities, activities_counter)
+    if min_cost_flow:
+        dfg, performance_dfg = cm_util.resolve_min_cost_flow(C_matrix, duration_matrix, activities,
+                                                             activities_counter)
+    else:
+        dfg, performance_dfg = cm_util.resolve_LP(C_matrix, duration_matrix, activities, activities_counter)
     return dfg, performance_dfg
 
 
@@ -164,7 +178,10 @@ def preprocess_log(log, activities=None, parameters=None):
     if activities is None:
         activities = sorted(list(set(x[activity_key] for x in transf_stream)))
 
-    activities_grouped = {x: [y for y in transf_stream if y[activity_key] == x] for x in activities}
+    activities_grouped = {x: [] for x in activities}
+    for ev in transf_stream:
+        if ev[activity_key] in activities_grouped:
+            activities_grouped[ev[activity_key]].append(ev)
 
     return transf_stream, activities_grouped, activities
 
@@ -173,6 +190,9 @@ def get_precede_succeed_matrix(activities, activities_grouped, timestamp_key, st
     """
     Calculates the precede succeed matrix
 
+    For every activity, the (cumulative maximum of the) completion times are merged with the start times
+    of all the events of the log, so a single sorted search per activity is needed
+
     Parameters
     ---------------
     activities
@@ -189,25 +209,23 @@ def get_precede_succeed_matrix(activities, activities_grouped, timestamp_key, st
     precede_succeed_matrix
         Precede succeed matrix
     """
+    ends = __get_times(activities, activities_grouped, timestamp_key)
+    starts = __get_times(activities, activities_grouped, start_timestamp_key)
+    counts = np.array([len(x) for x in starts], dtype=np.float64)
+    all_starts = np.concatenate(starts) if starts else np.zeros(0)
+    codes = np.repeat(np.arange(len(activities)), [len(x) for x in starts])
+
     ret = np.zeros((len(activities), len(activities)))
     for i in range(len(activities)):
-        ai = [x[timestamp_key] for x in activities_grouped[activities[i]]]
-        if ai:
-            for j in range(len(activities)):
-                if not i == j:
-                    aj = [x[start_timestamp_key] for x in activities_grouped[activities[j]]]
-                    if aj:
-                        k = 0
-                        z = 0
-                        count = 0
-                        while k < len(ai):
-                            while z < len(aj):
-                                if ai[k] < aj[z]:
-                                    break
-                                z = z + 1
-                            count = count + (len(aj) - z)
-                            k = k + 1
-                        ret[i, j] = count / float(len(ai) * len(aj))
+        if len(ends[i]):
+            # for every start time, number of completion times of the activity that do not precede it
+            # (the completion times are visited with a non-decreasing pointer on the start times)
+            t = np.maximum.accumulate(ends[i])
+            not_preceding = len(t) - np.searchsorted(t, all_starts, side="left")
+            not_preceding = np.bincount(codes, weights=not_preceding, minlength=len(activities))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ret[i] = np.where(counts > 0, (len(t) * counts - not_preceding) / (len(t) * counts), 0)
+            ret[i, i] = 0
 
     return ret
 
@@ -234,14 +252,23 @@ def get_duration_matrix(activities, activities_grouped, timestamp_key, start_tim
     duration_matrix
         Duration matrix
     """
+    ends = __get_times(activities, activities_grouped, timestamp_key)
+    starts = __get_times(activities, activities_grouped, start_timestamp_key)
     # greedy algorithm
     ret = np.zeros((len(activities), len(activities)))
     for i in range(len(activities)):
-        ai = [x[timestamp_key] for x in activities_grouped[activities[i]]]
-        if ai:
+        if len(ends[i]):
             for j in range(len(activities)):
-                if not i == j:
-                    aj = [x[start_timestamp_key] for x in activities_grouped[activities[j]]]
-                    if aj:
-                        ret[i, j] = cm_util.match_return_avg_time(ai, aj, exact=exact)
+                if not i == j and len(starts[j]):
+                    if exact:
+                        ret[i, j] = cm_util.match_return_avg_time(ends[i].tolist(), starts[j].tolist(), exact=True)
+                    else:
+                        ret[i, j] = cm_util.greedy_match_return_avg_time(ends[i], starts[j])
     return ret
+
+
+def __get_times(activities, activities_grouped, key):
+    """
+    Gets, for every activity, the array of the values of the given timestamp key
+    """
+    return [np.array([x[key] for x in activities_grouped[act]], dtype=np.float64) for act in activities]
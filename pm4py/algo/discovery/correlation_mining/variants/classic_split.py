@@ -13,6 +13,7 @@ class Parameters(Enum):
     TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
     START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
     SAMPLE_SIZE = "sample_size"
+    MIN_COST_FLOW = "min_cost_flow"
 
 
 def apply(log, parameters=None):
@@ -78,4 +79,5 @@ def apply(log, parameters=None):
         z = z + 1
     PS_matrix = PS_matrix / float(len(PS_matrixes))
 
-    return classic.resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter)
+    return classic.resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter,
+                                      parameters=parameters)
@@ -3,7 +3,6 @@ from enum import Enum
 from pm4py.util import constants, xes_constants
 from pm4py.objects.conversion.log import converter
 from pm4py.algo.discovery.correlation_mining import util as cm_util
-from statistics import mean
 import numpy as np
 from collections import Counter
 import pandas as pd
@@ -15,6 +14,7 @@ class Parameters(Enum):
     START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
     INDEX_KEY = "index_key"
+    MIN_COST_FLOW = "min_cost_flow"
 
 
 DEFAULT_INDEX_KEY = "@@@index"
@@ -44,10 +44,10 @@ def apply(log, parameters=None):
 
     PS_matrix, duration_matrix = get_PS_duration_matrix(activities, trace_grouped_list, parameters=parameters)
 
-    return resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter)
+    return resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter, parameters=parameters)
 
 
-def resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter):
+def resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counter, parameters=None):
     """
     Resolves a LP problem to get a DFG
 
@@ -61,6 +61,10 @@ def resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counte
         List of activities of the log
     activities_counter
         Counter for the activities of the log
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.MIN_COST_FLOW => solves the problem as a min-cost flow problem (network simplex)
+        instead of using the LP solver (default: False)
 
     Returns
     ---------------
@@ -69,8 +73,17 @@ def resolve_lp_get_dfg(PS_matrix, duration_matrix, activities, activities_counte
     performance_dfg
         Performance DFG
     """
+    if parameters is None:
+        parameters = {}
+
+    min_cost_flow = exec_utils.get_param_value(Parameters.MIN_COST_FLOW, parameters, False)
+
     C_matrix = cm_util.get_c_matrix(PS_matrix, duration_matrix, activities, activities_counter)
-    dfg, performance_dfg = cm_util.resolve_LP(C_matrix, duration_matrix, activities, activities_counter)
+    if min_cost_flow:
+        dfg, performance_dfg = cm_util.resolve_min_cost_flow(C_matrix, duration_matrix, activities,
+                                                             activities_counter)
+    else:
+        dfg, performance_dfg = cm_util.resolve_LP(C_matrix, duration_matrix, activities, activities_counter)
     return dfg, performance_dfg
 
 
@@ -252,9 +265,9 @@ def get_duration_matrix(activities, trace_grouped_list, timestamp_key, start_tim
                     ai = [x[timestamp_key] for x in tr[i]]
                     aj = [x[start_timestamp_key] for x in tr[j]]
                     if ai and aj:
-                        tm0 = cm_util.calculate_time_match_fifo(ai, aj, times0=tm0)
-                        tm1 = cm_util.calculate_time_match_rlifo(ai, aj, times1=tm1)
-                td0 = mean([x[1] - x[0] for x in tm0]) if tm0 else 0
-                td1 = mean([x[1] - x[0] for x in tm1]) if tm1 else 0
+                        tm0.append(cm_util.get_times_diff_fifo(ai, aj))
+                        tm1.append(cm_util.get_times_diff_rlifo(ai, aj))
+                td0 = cm_util.mean_times_diff(np.concatenate(tm0)) if tm0 else 0
+                td1 = cm_util.mean_times_diff(np.concatenate(tm1)) if tm1 else 0
                 ret[i, j] = min(td0, td1)
     return ret
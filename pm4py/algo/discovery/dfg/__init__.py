@@ -1,6 +1,11 @@
-from pm4py.algo.discovery.dfg import algorithm, replacement, variants, utils
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["algorithm", "replacement", "variants", "utils"]
+
 if pkgutil.find_loader("pandas"):
-    from pm4py.algo.discovery.dfg import adapters
+    __all__.append("adapters")
 
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
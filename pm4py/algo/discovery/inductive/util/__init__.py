@@ -1,2 +1,7 @@
-from pm4py.algo.discovery.inductive.util import petri_cleaning, shared_constants, petri_el_count, parallel_cut_utils, \
-    detection_utils, cut_detection, tree_consistency
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["petri_cleaning", "shared_constants", "petri_el_count", "parallel_cut_utils", "detection_utils",
+           "cut_detection", "tree_consistency"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
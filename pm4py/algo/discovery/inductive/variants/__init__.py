@@ -1 +1,6 @@
-from pm4py.algo.discovery.inductive.variants import im, im_d, im_f
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["im", "im_d", "im_f"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
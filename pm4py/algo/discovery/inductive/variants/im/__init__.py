@@ -1 +1,6 @@
-from pm4py.algo.discovery.inductive.variants.im import algorithm, data_structures, util
\ No newline at end of file
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["algorithm", "data_structures", "util"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
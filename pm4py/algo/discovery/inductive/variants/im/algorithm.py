@@ -167,7 +167,7 @@ def apply_tree_variants(variants, parameters=None):
     var_keys = list(variants.keys())
     for var in var_keys:
         trace = Trace()
-        activities = var.split(constants.DEFAULT_VARIANT_SEP)
+        activities = var if type(var) is tuple else var.split(constants.DEFAULT_VARIANT_SEP)
         for act in activities:
             trace.append(Event({activity_key: act}))
         log.append(trace)
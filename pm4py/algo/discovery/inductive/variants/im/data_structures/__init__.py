@@ -1 +1,6 @@
-from pm4py.algo.discovery.inductive.variants.im.data_structures import subtree_plain
\ No newline at end of file
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["subtree_plain"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
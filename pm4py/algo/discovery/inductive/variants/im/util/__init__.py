@@ -1 +1,6 @@
-from pm4py.algo.discovery.inductive.variants.im.util import base_case, fall_through, get_tree_repr_implain, splitting, constants
\ No newline at end of file
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["base_case", "fall_through", "get_tree_repr_implain", "splitting", "constants"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1 +1,6 @@
-from pm4py.algo.discovery.inductive.variants.im_d import data_structures, util, dfg_based
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["data_structures", "util", "dfg_based"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
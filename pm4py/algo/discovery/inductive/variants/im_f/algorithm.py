@@ -181,7 +181,7 @@ def apply_tree_variants(variants, parameters=None):
             val = len(val)
         for i in range(val):
             trace = Trace()
-            activities = var.split(constants.DEFAULT_VARIANT_SEP)
+            activities = var if type(var) is tuple else var.split(constants.DEFAULT_VARIANT_SEP)
             for act in activities:
                 trace.append(Event({activity_key: act}))
             log.append(trace)
@@ -1,5 +1,12 @@
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = []
+
 if pkgutil.find_loader("matplotlib"):
     # comparison required Matplotlib
-    from pm4py.algo.enhancement.comparison import petrinet
+    __all__.append("petrinet")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
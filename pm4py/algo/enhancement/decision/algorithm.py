@@ -13,6 +13,7 @@ from pm4py.util import exec_utils
 
 class Parameters(Enum):
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    SPARSE = "sparse"
 
 
 def get_decision_tree(log, net, initial_marking, final_marking, decision_point=None, attributes=None, parameters=None):
@@ -37,7 +38,9 @@ def get_decision_tree(log, net, initial_marking, final_marking, decision_point=N
         Attributes of the log. If not specified, then an automatic attribute selection
         is performed.
     parameters
-        Parameters of the algorithm
+        Parameters of the algorithm, including:
+        - Parameters.SPARSE: the one-hot encoded features are stored (and provided to the classifier)
+        as a sparse matrix (default: False)
 
     Returns
     ---------------
@@ -53,10 +56,15 @@ def get_decision_tree(log, net, initial_marking, final_marking, decision_point=N
     if parameters is None:
         parameters = {}
     log = log_converter.apply(log, parameters=parameters)
+    sparse = exec_utils.get_param_value(Parameters.SPARSE, parameters, False)
     X, y, targets = apply(log, net, initial_marking, final_marking, decision_point=decision_point,
                           attributes=attributes, parameters=parameters)
     dt = tree.DecisionTreeClassifier()
-    dt = dt.fit(X, y)
+    if sparse:
+        import pandas as pd
+        dt = dt.fit(X.astype(pd.SparseDtype("float", 0)).sparse.to_coo().tocsr(), y)
+    else:
+        dt = dt.fit(X, y)
     return dt, list(X.columns.values.tolist()), targets
 
 
@@ -83,7 +91,8 @@ def apply(log, net, initial_marking, final_marking, decision_point=None, attribu
         Attributes of the log. If not specified, then an automatic attribute selection
         is performed.
     parameters
-        Parameters of the algorithm
+        Parameters of the algorithm, including:
+        - Parameters.SPARSE: the one-hot encoded features are stored in sparse columns (default: False)
 
     Returns
     ---------------
@@ -101,6 +110,7 @@ def apply(log, net, initial_marking, final_marking, decision_point=None, attribu
 
     log = log_converter.apply(log, parameters=parameters)
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    sparse = exec_utils.get_param_value(Parameters.SPARSE, parameters, False)
     if decision_point is None:
         decision_points_names = get_decision_points(net, labels=True, parameters=parameters)
         raise Exception("please provide decision_point as argument of the method. Possible decision points: ",
@@ -117,7 +127,7 @@ def apply(log, net, initial_marking, final_marking, decision_point=None, attribu
         x.append({a: v for a, v in el[0].items() if a in x_attributes})
         y.append(el[1])
     X = pd.DataFrame(x)
-    X = pd.get_dummies(data=X, columns=x_attributes)
+    X = pd.get_dummies(data=X, columns=x_attributes, sparse=sparse)
     Y = pd.DataFrame(y, columns=["Name"])
     Y, targets = encode_target(Y, "Name")
     y = Y['Target']
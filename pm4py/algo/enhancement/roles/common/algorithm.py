@@ -230,6 +230,111 @@ def aggregate_roles_algorithm(roles, parameters=None):
     return roles
 
 
+def __get_similarities(matrix, vector, candidates):
+    """
+    Computes the similarity between a (normalized) role and a set of (normalized) roles, as the ratio between
+    the sizes of the multiset intersection and of the multiset union (equal to m / (2 - m), where m is the
+    size of the intersection, since the roles are normalized)
+
+    Parameters
+    --------------
+    matrix
+        Sparse (CSR) matrix containing the normalized roles (a row per role, a column per resource)
+    vector
+        Normalized role (sparse row)
+    candidates
+        Indexes of the rows of the matrix to compare with the role
+
+    Returns
+    --------------
+    similarities
+        Similarity of the role with every candidate
+    """
+    if len(candidates) == 0:
+        return np.zeros(0)
+    # only the resources of the role contribute to the intersection
+    sub = matrix[candidates][:, vector.indices].toarray()
+    m = np.minimum(sub, vector.data).sum(axis=1)
+    return m / (2.0 - m)
+
+
+def aggregate_roles_matrix(roles, parameters=None):
+    """
+    Algorithm to aggregate similar roles, producing the same result of aggregate_roles_algorithm.
+    The roles are stored as rows of a sparse resource matrix, the similarities between the initial roles
+    are computed in a vectorized way, and the merges are done in order of similarity using a priority queue
+    (the couples involving already merged roles are discarded when they are popped), so only the similarities
+    of the new roles need to be computed
+
+    Parameters
+    --------------
+    roles
+        Roles
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    --------------
+    agg_roles
+        (Aggregated) roles
+    """
+    import heapq
+    from scipy.sparse import csr_matrix, vstack
+
+    if parameters is None:
+        parameters = {}
+
+    threshold = exec_utils.get_param_value(Parameters.ROLES_THRESHOLD_PARAMETER, parameters, 0.65)
+
+    resources_index = {}
+    rows, cols, counts = [], [], []
+    for i, role in enumerate(roles):
+        for res, count in role[1].items():
+            rows.append(i)
+            cols.append(resources_index.setdefault(res, len(resources_index)))
+            counts.append(count)
+    counts_matrix = csr_matrix((np.asarray(counts, dtype=np.float64), (rows, cols)),
+                               shape=(len(roles), len(resources_index)))
+
+    def normalize(counts_row):
+        return counts_row / counts_row.sum()
+
+    matrix = csr_matrix(counts_matrix.multiply(1.0 / np.asarray(counts_matrix.sum(axis=1))))
+    activities = [list(role[0]) for role in roles]
+    resources = [Counter(role[1]) for role in roles]
+    names = [",".join(acts) for acts in activities]
+    alive = set(range(len(roles)))
+
+    def push_similarities(heap, i, candidates):
+        similarities = __get_similarities(matrix, matrix[i], candidates)
+        for j, sim in zip(candidates, similarities):
+            if sim > threshold:
+                # ties are broken as in aggregate_roles_iteration, by the names of the roles
+                a, b = (i, j) if names[i] <= names[j] else (j, i)
+                heapq.heappush(heap, (-sim, names[a], names[b], a, b))
+
+    heap = []
+    for i in range(len(roles)):
+        push_similarities(heap, i, list(range(i + 1, len(roles))))
+
+    while heap:
+        neg_sim, name_a, name_b, a, b = heapq.heappop(heap)
+        if a not in alive or b not in alive:
+            continue
+        alive.remove(a)
+        alive.remove(b)
+        new_index = len(activities)
+        activities.append(sorted(list(set(activities[a]).union(set(activities[b])))))
+        resources.append(resources[a] + resources[b])
+        names.append(",".join(activities[new_index]))
+        counts_matrix = vstack([counts_matrix, counts_matrix[a] + counts_matrix[b]], format="csr")
+        matrix = vstack([matrix, normalize(counts_matrix[new_index])], format="csr")
+        push_similarities(heap, new_index, sorted(alive))
+        alive.add(new_index)
+
+    return sorted([[activities[i], resources[i]] for i in alive], key=lambda x: ",".join(x[0]))
+
+
 def get_initial_roles(res_act_couples, parameters=None):
     """
     Get the initial list of roles (each activity is a stand-alone role)
@@ -267,7 +372,7 @@ def get_initial_roles(res_act_couples, parameters=None):
 
     roles = sorted(roles, key=lambda x: ",".join(x[0]))
 
-    roles = aggregate_roles_algorithm(roles, parameters=parameters)
+    roles = aggregate_roles_matrix(roles, parameters=parameters)
 
     return roles
 
@@ -6,7 +6,6 @@ from pm4py.objects.conversion.log import converter as log_conversion
 from pm4py.algo.enhancement.sna.parameters import Parameters
 from pm4py.util import exec_utils
 from enum import Enum
-import numpy as np
 
 
 class Variants(Enum):
@@ -29,7 +28,9 @@ def apply(log, parameters=None, variant=Variants.HANDOVER_LOG):
     log
         Log
     parameters
-        Possible parameters of the algorithm
+        Possible parameters of the algorithm, including:
+            - Parameters.METRIC_NORMALIZATION => divides the metric by its maximum absolute value
+            - Parameters.SPARSE => returns the metric as a sparse (CSR) matrix
     variant
         Variant of the algorithm to apply. Possible values:
             - Variants.HANDOVER_LOG
@@ -55,7 +56,8 @@ def apply(log, parameters=None, variant=Variants.HANDOVER_LOG):
                    Variants.SUBCONTRACTING_LOG]:
         log = log_conversion.apply(log, parameters=parameters)
     sna = exec_utils.get_variant(variant).apply(log, parameters=parameters)
-    abs_max = np.max(np.abs(sna[0]))
+    # works both on dense and on sparse matrices
+    abs_max = abs(sna[0]).max() if sna[0].shape[0] > 0 else 0
     if enable_metric_normalization and abs_max > 0:
         sna[0] = sna[0] / abs_max
     return sna
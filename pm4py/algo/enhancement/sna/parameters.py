@@ -5,4 +5,6 @@ from pm4py.util import constants
 class Parameters(Enum):
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     RESOURCE_KEY = constants.PARAMETER_CONSTANT_RESOURCE_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
     METRIC_NORMALIZATION = "metric_normalization"
+    SPARSE = "sparse"
@@ -0,0 +1,318 @@
+import numpy as np
+
+from pm4py.objects.log.util import arrays
+from pm4py.util import xes_constants as xes
+from pm4py.util.constants import CASE_CONCEPT_NAME
+
+
+def __sort_labels(codes, labels):
+    """
+    Re-codes the values so that the codes follow the sorted order of the labels
+    """
+    labels = [str(x) for x in labels]
+    order = sorted(range(len(labels)), key=labels.__getitem__)
+    rank = np.empty(len(labels), dtype=np.int64)
+    rank[order] = np.arange(len(labels), dtype=np.int64)
+    return rank[codes], [labels[i] for i in order]
+
+
+def get_resource_sequences_log(log, resource_key=xes.DEFAULT_RESOURCE_KEY):
+    """
+    Encodes the resources of the events of an event log as integers
+    (the events without the resource are skipped)
+
+    Parameters
+    -------------
+    log
+        Event log
+    resource_key
+        Attribute containing the resource
+
+    Returns
+    -------------
+    codes
+        Code of the resource of every event (the events of a case are contiguous)
+    case_index
+        Index of the case of every event
+    labels
+        Resources (sorted; the i-th resource has code i)
+    """
+    codes, labels, offsets = arrays.encode_attribute(log, attribute_key=resource_key, allow_missing=True)
+    case_index = arrays.get_case_index(offsets)
+    mask = codes >= 0
+    codes, labels = __sort_labels(codes[mask], labels)
+    return codes, case_index[mask], labels
+
+
+def get_resource_sequences_df(df, resource_key=xes.DEFAULT_RESOURCE_KEY, case_id_key=CASE_CONCEPT_NAME):
+    """
+    Encodes the resources of the events of a dataframe as integers
+    (the events without the resource are skipped; the events of a case keep the order of the dataframe)
+
+    Parameters
+    -------------
+    df
+        Dataframe
+    resource_key
+        Column containing the resource
+    case_id_key
+        Column containing the case identifier
+
+    Returns
+    -------------
+    codes
+        Code of the resource of every event (the events of a case are contiguous)
+    case_index
+        Index of the case of every event
+    labels
+        Resources (sorted; the i-th resource has code i)
+    """
+    import pandas as pd
+
+    codes, labels = pd.factorize(df[resource_key].values)
+    case_index = pd.factorize(df[case_id_key].values)[0]
+    mask = codes >= 0
+    codes = codes[mask]
+    case_index = case_index[mask]
+    order = np.argsort(case_index, kind="stable")
+    codes, labels = __sort_labels(codes[order], list(labels))
+    return codes, case_index[order], labels
+
+
+def get_resource_activity_codes_log(log, resource_key=xes.DEFAULT_RESOURCE_KEY, activity_key=xes.DEFAULT_NAME_KEY):
+    """
+    Encodes the resources and the activities of the events of an event log as integers
+    (the events without the resource or the activity are skipped)
+
+    Parameters
+    -------------
+    log
+        Event log
+    resource_key
+        Attribute containing the resource
+    activity_key
+        Attribute containing the activity
+
+    Returns
+    -------------
+    resource_codes
+        Code of the resource of every event
+    resource_labels
+        Resources (sorted; the i-th resource has code i)
+    activity_codes
+        Code of the activity of every event
+    activity_labels
+        Activities (sorted; the i-th activity has code i)
+    """
+    resource_codes, resource_labels, offsets = arrays.encode_attribute(log, attribute_key=resource_key,
+                                                                       allow_missing=True)
+    activity_codes, activity_labels, offsets = arrays.encode_attribute(log, attribute_key=activity_key,
+                                                                       allow_missing=True)
+    mask = (resource_codes >= 0) & (activity_codes >= 0)
+    resource_codes, resource_labels = __sort_labels(resource_codes[mask], resource_labels)
+    activity_codes, activity_labels = __sort_labels(activity_codes[mask], activity_labels)
+    return resource_codes, resource_labels, activity_codes, activity_labels
+
+
+def get_resource_activity_codes_df(df, resource_key=xes.DEFAULT_RESOURCE_KEY, activity_key=xes.DEFAULT_NAME_KEY):
+    """
+    Encodes the resources and the activities of the events of a dataframe as integers
+    (the events without the resource or the activity are skipped)
+
+    Parameters
+    -------------
+    df
+        Dataframe
+    resource_key
+        Column containing the resource
+    activity_key
+        Column containing the activity
+
+    Returns
+    -------------
+    resource_codes
+        Code of the resource of every event
+    resource_labels
+        Resources (sorted; the i-th resource has code i)
+    activity_codes
+        Code of the activity of every event
+    activity_labels
+        Activities (sorted; the i-th activity has code i)
+    """
+    import pandas as pd
+
+    resource_codes, resource_labels = pd.factorize(df[resource_key].values)
+    activity_codes, activity_labels = pd.factorize(df[activity_key].values)
+    mask = (resource_codes >= 0) & (activity_codes >= 0)
+    resource_codes, resource_labels = __sort_labels(resource_codes[mask], list(resource_labels))
+    activity_codes, activity_labels = __sort_labels(activity_codes[mask], list(activity_labels))
+    return resource_codes, resource_labels, activity_codes, activity_labels
+
+
+def handover(codes, case_index, num_resources, beta=0):
+    """
+    Computes the handover of work metric: the number of times the work passes from a resource to another
+    (if beta > 0, also the indirect successions are counted, with weight beta^(distance - 1)),
+    divided by the number of direct successions
+
+    Parameters
+    -------------
+    codes
+        Code of the resource of every event
+    case_index
+        Index of the case of every event
+    num_resources
+        Number of resources
+    beta
+        Beta value as described in the Wil SNA paper
+
+    Returns
+    -------------
+    matrix
+        Sparse (CSR) matrix of the metric
+    """
+    rows = []
+    cols = []
+    weights = []
+    max_distance = 1 if beta == 0 else len(codes) - 1
+    for d in range(1, max_distance + 1):
+        same_case = case_index[:-d] == case_index[d:]
+        if not same_case.any():
+            break
+        rows.append(codes[:-d][same_case])
+        cols.append(codes[d:][same_case])
+        weights.append(np.full(len(rows[-1]), float(beta ** (d - 1))))
+    dividend = len(codes) - len(np.unique(case_index))
+    return __to_csr(rows, cols, weights, num_resources, dividend)
+
+
+def subcontracting(codes, case_index, num_resources, n=2):
+    """
+    Computes the subcontracting metric: the number of times a resource executes an event
+    between two events of another resource at distance n, divided by the number of direct successions
+
+    Parameters
+    -------------
+    codes
+        Code of the resource of every event
+    case_index
+        Index of the case of every event
+    num_resources
+        Number of resources
+    n
+        n of the algorithm proposed in the Wil SNA paper
+
+    Returns
+    -------------
+    matrix
+        Sparse (CSR) matrix of the metric
+    """
+    rows = []
+    cols = []
+    weights = []
+    if len(codes) > n:
+        starts = np.flatnonzero((case_index[:-n] == case_index[n:]) & (codes[:-n] == codes[n:]))
+        for d in range(1, n):
+            rows.append(codes[starts])
+            cols.append(codes[starts + d])
+            weights.append(np.ones(len(starts)))
+    dividend = len(codes) - len(np.unique(case_index))
+    return __to_csr(rows, cols, weights, num_resources, dividend)
+
+
+def working_together(codes, case_index, num_resources, num_cases):
+    """
+    Computes the working together metric: the fraction of the cases in which two resources both work
+
+    Parameters
+    -------------
+    codes
+        Code of the resource of every event
+    case_index
+        Index of the case of every event
+    num_resources
+        Number of resources
+    num_cases
+        Number of cases
+
+    Returns
+    -------------
+    matrix
+        Sparse (CSR) matrix of the metric (symmetric)
+    """
+    from scipy.sparse import csr_matrix
+
+    incidence = csr_matrix((np.ones(len(codes)), (case_index, codes)), shape=(num_cases, num_resources))
+    incidence.data[:] = 1.0
+    matrix = (incidence.T @ incidence).tocsr()
+    matrix.setdiag(0)
+    matrix.eliminate_zeros()
+    if num_cases > 0:
+        matrix = matrix / float(num_cases)
+    return matrix.tocsr()
+
+
+def joint_activities(resource_codes, activity_codes, num_resources, num_activities):
+    """
+    Computes the joint activities (similar task) metric: the Pearson correlation between the profiles
+    (number of executions of every activity) of two resources
+
+    Parameters
+    -------------
+    resource_codes
+        Code of the resource of every event
+    activity_codes
+        Code of the activity of every event
+    num_resources
+        Number of resources
+    num_activities
+        Number of activities
+
+    Returns
+    -------------
+    matrix
+        Matrix of the metric (dense, since the correlations are generally different from zero)
+    """
+    from scipy.sparse import csr_matrix
+
+    profiles = csr_matrix((np.ones(len(resource_codes)), (resource_codes, activity_codes)),
+                          shape=(num_resources, num_activities))
+    # correlations computed from the sparse profiles: cov(i, j) = (p_i . p_j) / m - mean_i * mean_j
+    means = np.asarray(profiles.mean(axis=1)).ravel()
+    cov = (profiles @ profiles.T).toarray() / num_activities - np.outer(means, means)
+    std = np.sqrt(np.clip(np.diag(cov), 0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        matrix = cov / np.outer(std, std)
+    np.clip(matrix, -1.0, 1.0, out=matrix)
+    np.fill_diagonal(matrix, 0)
+    return matrix
+
+
+def __to_csr(rows, cols, weights, num_resources, dividend):
+    """
+    Sums the weights of the given couples of resources in a CSR matrix, dividing them by the dividend
+    """
+    from scipy.sparse import coo_matrix
+
+    if rows:
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        weights = np.concatenate(weights)
+    else:
+        rows = cols = np.zeros(0, dtype=np.int64)
+        weights = np.zeros(0)
+    matrix = coo_matrix((weights, (rows, cols)), shape=(num_resources, num_resources)).tocsr()
+    if dividend > 0:
+        matrix = matrix / float(dividend)
+    return matrix.tocsr()
+
+
+def format_matrix(matrix, sparse):
+    """
+    Returns the matrix of the metric as a sparse matrix (if sparse is True) or as a dense NumPy array
+    """
+    from scipy.sparse import issparse, csr_matrix
+
+    if sparse:
+        return matrix if issparse(matrix) else csr_matrix(matrix)
+    return matrix.toarray() if issparse(matrix) else matrix
@@ -1,8 +1,7 @@
-import numpy
+from enum import Enum
 
-from pm4py.statistics.variants.log import get as variants_filter
+from pm4py.algo.enhancement.sna import util as sna_util
 from pm4py.util import xes_constants as xes
-from enum import Enum
 from pm4py.util import constants, exec_utils
 
 
@@ -10,6 +9,7 @@ class Parameters(Enum):
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     RESOURCE_KEY = constants.PARAMETER_CONSTANT_RESOURCE_KEY
     BETA = "beta"
+    SPARSE = "sparse"
 
 
 BETA = Parameters.BETA
@@ -26,6 +26,7 @@ def apply(log, parameters=None):
     parameters
         Possible parameters of the algorithm:
             Parameters.BETA -> beta value as described in the Wil SNA paper
+            Parameters.SPARSE -> returns the metric as a sparse (CSR) matrix (default: False)
 
     Returns
     -----------
@@ -38,42 +39,9 @@ def apply(log, parameters=None):
 
     resource_key = exec_utils.get_param_value(Parameters.RESOURCE_KEY, parameters, xes.DEFAULT_RESOURCE_KEY)
     beta = exec_utils.get_param_value(Parameters.BETA, parameters, 0)
+    sparse = exec_utils.get_param_value(Parameters.SPARSE, parameters, False)
 
-    parameters_variants = {variants_filter.Parameters.ACTIVITY_KEY: resource_key,
-                           variants_filter.Parameters.ATTRIBUTE_KEY: resource_key}
-    variants_occ = {x: len(y) for x, y in variants_filter.get_variants(log, parameters=parameters_variants).items()}
-    variants_resources = list(variants_occ.keys())
-    resources = [x.split(",") for x in variants_resources]
-    flat_list = sorted(list(set([item for sublist in resources for item in sublist])))
-
-    metric_matrix = numpy.zeros((len(flat_list), len(flat_list)))
-
-    sum_i_to_j = {}
-
-    for rv in resources:
-        for i in range(len(rv) - 1):
-            res_i = flat_list.index(rv[i])
-            if not res_i in sum_i_to_j:
-                sum_i_to_j[res_i] = {}
-            for j in range(i + 1, len(rv)):
-                res_j = flat_list.index(rv[j])
-                if not res_j in sum_i_to_j[res_i]:
-                    sum_i_to_j[res_i][res_j] = 0
-                if beta == 0:
-                    sum_i_to_j[res_i][res_j] += variants_occ[",".join(rv)]
-                    break
-                else:
-                    sum_i_to_j[res_i][res_j] += variants_occ[",".join(rv)] * (beta ** (j - i - 1))
-
-    dividend = 0
-    for rv in resources:
-        if beta == 0:
-            dividend = dividend + variants_occ[",".join(rv)] * (len(rv) - 1)
-        else:
-            dividend = dividend + variants_occ[",".join(rv)] * (len(rv) - 1)
-
-    for key1 in sum_i_to_j:
-        for key2 in sum_i_to_j[key1]:
-            metric_matrix[key1][key2] = sum_i_to_j[key1][key2] / dividend
+    codes, case_index, resources = sna_util.get_resource_sequences_log(log, resource_key=resource_key)
+    metric_matrix = sna_util.handover(codes, case_index, len(resources), beta=beta)
 
-    return [metric_matrix, flat_list, True]
+    return [sna_util.format_matrix(metric_matrix, sparse), resources, True]
@@ -1,6 +1,4 @@
-import numpy
-
-from pm4py.statistics.variants.log import get as variants_filter
+from pm4py.algo.enhancement.sna import util as sna_util
 from pm4py.util import xes_constants as xes
 from pm4py.util import exec_utils
 from pm4py.algo.enhancement.sna.parameters import Parameters
@@ -15,7 +13,8 @@ def apply(log, parameters=None):
     log
         Log
     parameters
-        Possible parameters of the algorithm
+        Possible parameters of the algorithm:
+            Parameters.SPARSE -> returns the metric as a sparse (CSR) matrix (default: False)
 
     Returns
     -----------
@@ -28,24 +27,9 @@ def apply(log, parameters=None):
         parameters = {}
 
     resource_key = exec_utils.get_param_value(Parameters.RESOURCE_KEY, parameters, xes.DEFAULT_RESOURCE_KEY)
+    sparse = exec_utils.get_param_value(Parameters.SPARSE, parameters, False)
 
-    parameters_variants = {variants_filter.Parameters.ACTIVITY_KEY: resource_key,
-                           variants_filter.Parameters.ATTRIBUTE_KEY: resource_key}
-    variants_occ = {x: len(y) for x, y in variants_filter.get_variants(log, parameters=parameters_variants).items()}
-    variants_resources = list(variants_occ.keys())
-    resources = [x.split(",") for x in variants_resources]
-    flat_list = sorted(list(set([item for sublist in resources for item in sublist])))
-
-    metric_matrix = numpy.zeros((len(flat_list), len(flat_list)))
-
-    for rv in resources:
-        ord_res_list = sorted(list(set(rv)))
-
-        for i in range(len(ord_res_list) - 1):
-            res_i = flat_list.index(ord_res_list[i])
-            for j in range(i + 1, len(ord_res_list)):
-                res_j = flat_list.index(ord_res_list[j])
-                metric_matrix[res_i, res_j] += float(variants_occ[",".join(rv)]) / float(len(log))
-                metric_matrix[res_j, res_i] += float(variants_occ[",".join(rv)]) / float(len(log))
+    codes, case_index, resources = sna_util.get_resource_sequences_log(log, resource_key=resource_key)
+    metric_matrix = sna_util.working_together(codes, case_index, len(resources), len(log))
 
-    return [metric_matrix, flat_list, False]
+    return [sna_util.format_matrix(metric_matrix, sparse), resources, False]
@@ -1,12 +1,16 @@
-from pm4py.util import xes_constants as xes
 from enum import Enum
+
+from pm4py.algo.enhancement.sna import util as sna_util
+from pm4py.util import xes_constants as xes
 from pm4py.util import constants, exec_utils
 
 
 class Parameters(Enum):
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     RESOURCE_KEY = constants.PARAMETER_CONSTANT_RESOURCE_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
     N = "n"
+    SPARSE = "sparse"
 
 
 N = Parameters.N
@@ -23,52 +27,24 @@ def apply(log, parameters=None):
     parameters
         Possible parameters of the algorithm:
             Parameters.N -> n of the algorithm proposed in the Wil SNA paper
+            Parameters.SPARSE -> returns the metric as a sparse (CSR) matrix (default: False)
 
     Returns
     -----------
     tuple
-        Tuple containing the metric matrix and the resources list
+        Tuple containing the metric matrix and the resources list. Moreover, last boolean indicates that the metric is
+        directed.
     """
     if parameters is None:
         parameters = {}
 
-    import numpy
-    from pm4py.statistics.traces.pandas import case_statistics
-
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
     resource_key = exec_utils.get_param_value(Parameters.RESOURCE_KEY, parameters, xes.DEFAULT_RESOURCE_KEY)
     n = exec_utils.get_param_value(Parameters.N, parameters, 2)
+    sparse = exec_utils.get_param_value(Parameters.SPARSE, parameters, False)
 
-    parameters_variants = {case_statistics.Parameters.ACTIVITY_KEY: resource_key,
-                           case_statistics.Parameters.ATTRIBUTE_KEY: resource_key}
-    variants_occ = {x["variant"]: x["case:concept:name"] for x in
-                    case_statistics.get_variant_statistics(log, parameters=parameters_variants)}
-    variants_resources = list(variants_occ.keys())
-    resources = [x.split(",") for x in variants_resources]
-    flat_list = sorted(list(set([item for sublist in resources for item in sublist])))
-
-    metric_matrix = numpy.zeros((len(flat_list), len(flat_list)))
-
-    sum_i_to_j = {}
-
-    for rv in resources:
-        for i in range(len(rv) - n):
-            res_i = flat_list.index(rv[i])
-            res_i_n = flat_list.index(rv[i + n])
-            if res_i == res_i_n:
-                if res_i not in sum_i_to_j:
-                    sum_i_to_j[res_i] = {}
-                    for j in range(i + 1, i + n):
-                        res_j = flat_list.index(rv[j])
-                        if res_j not in sum_i_to_j[res_i]:
-                            sum_i_to_j[res_i][res_j] = 0
-                        sum_i_to_j[res_i][res_j] += variants_occ[",".join(rv)]
-
-    dividend = 0
-    for rv in resources:
-        dividend = dividend + variants_occ[",".join(rv)] * (len(rv) - 1)
-
-    for key1 in sum_i_to_j:
-        for key2 in sum_i_to_j[key1]:
-            metric_matrix[key1][key2] = sum_i_to_j[key1][key2] / dividend
+    codes, case_index, resources = sna_util.get_resource_sequences_df(log, resource_key=resource_key,
+                                                                      case_id_key=case_id_key)
+    metric_matrix = sna_util.subcontracting(codes, case_index, len(resources), n=n)
 
-    return [metric_matrix, flat_list, True]
+    return [sna_util.format_matrix(metric_matrix, sparse), resources, True]
@@ -1 +1,6 @@
-from pm4py.algo.filtering.common.end_activities import end_activities_common
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["end_activities_common"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
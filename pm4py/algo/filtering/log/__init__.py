@@ -1,2 +1,7 @@
-from pm4py.algo.filtering.log import attributes, auto_filter, end_activities, paths, \
-    cases, start_activities, timestamp, variants, ltl
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["attributes", "auto_filter", "end_activities", "paths", "cases", "start_activities", "timestamp", "variants",
+           "ltl"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1 +1,6 @@
-from pm4py.algo.filtering.log.attributes import attributes_filter
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["attributes_filter"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1 +1,6 @@
-from pm4py.algo.filtering.log.ltl import ltl_checker
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["ltl_checker"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1,5 +1,6 @@
 from pm4py.statistics.variants.log.get import get_variants_from_log_trace_idx, get_variants, \
     get_variants_along_with_case_durations, get_variants_sorted_by_count, convert_variants_trace_idx_to_trace_obj
+from pm4py.statistics.variants.log import index as variants_index
 from pm4py.algo.filtering.common import filtering_constants
 from pm4py.objects.log.log import EventLog
 from pm4py.util.xes_constants import DEFAULT_NAME_KEY
@@ -23,7 +24,7 @@ def apply(log, admitted_variants, parameters=None):
     log
         Log object
     admitted_variants
-        Admitted variants
+        Admitted variants (as strings or as tuples of activities)
     parameters
         Parameters of the algorithm, including:
             Parameters.ACTIVITY_KEY -> Attribute identifying the activity in the log
@@ -33,13 +34,15 @@ def apply(log, admitted_variants, parameters=None):
     if parameters is None:
         parameters = {}
     positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
-    variants = get_variants(log, parameters=parameters)
-    log = EventLog()
-    for variant in variants:
-        if (positive and variant in admitted_variants) or (not positive and variant not in admitted_variants):
-            for trace in variants[variant]:
-                log.append(trace)
-    return log
+    index = variants_index.apply(log, parameters=parameters)
+    filtered_log = EventLog()
+    for variant_id in range(len(index)):
+        admitted = index.get_variant_string(variant_id) in admitted_variants or index.get_variant(
+            variant_id) in admitted_variants
+        if admitted == positive:
+            for trace_idx in index.get_cases(variant_id):
+                filtered_log.append(log[int(trace_idx)])
+    return filtered_log
 
 
 def filter_log_variants_percentage(log, percentage=0.8, parameters=None):
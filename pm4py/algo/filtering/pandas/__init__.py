@@ -1,2 +1,7 @@
-from pm4py.algo.filtering.pandas import start_activities, end_activities, attributes, cases, \
-    pd_filtering_constants, variants, paths, timestamp, ltl
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["start_activities", "end_activities", "attributes", "cases", "pd_filtering_constants", "variants", "paths",
+           "timestamp", "ltl"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1,10 +1,16 @@
-from pm4py.evaluation import generalization, precision, replay_fitness, simplicity, evaluator, wf_net
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["generalization", "precision", "replay_fitness", "simplicity", "evaluator", "wf_net"]
+
 if pkgutil.find_loader("pyemd"):
-    # import the EMD only if the pyemd package is installed
-    from pm4py.evaluation import earth_mover_distance
+    # the EMD is available only if the pyemd package is installed
+    __all__.append("earth_mover_distance")
 
 if pkgutil.find_loader("networkx") and pkgutil.find_loader("sympy"):
-    # import the Woflan package only if NetworkX and sympy are installed
-    from pm4py.evaluation import soundness
+    # the Woflan package is available only if NetworkX and sympy are installed
+    __all__.append("soundness")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
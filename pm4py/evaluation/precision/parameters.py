@@ -7,3 +7,5 @@ class Parameters(Enum):
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     TOKEN_REPLAY_VARIANT = "token_replay_variant"
     CLEANING_TOKEN_FLOOD = "cleaning_token_flood"
+    ENABLE_PARALLEL = "enable_parallel"
+    NUM_WORKERS = "num_workers"
@@ -44,6 +44,8 @@ def apply(log, net, marking, final_marking, parameters=None):
     parameters
         Parameters of the algorithm, including:
             Parameters.ACTIVITY_KEY -> Activity key
+            Parameters.ENABLE_PARALLEL -> Replays the prefixes using a pool of processes
+            Parameters.NUM_WORKERS -> Number of processes of the pool
     """
 
     if parameters is None:
@@ -53,6 +55,8 @@ def apply(log, net, marking, final_marking, parameters=None):
     token_replay_variant = exec_utils.get_param_value(Parameters.TOKEN_REPLAY_VARIANT, parameters,
                                                       executor.Variants.TOKEN_REPLAY)
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, log_lib.util.xes.DEFAULT_NAME_KEY)
+    enable_parallel = exec_utils.get_param_value(Parameters.ENABLE_PARALLEL, parameters, False)
+    num_workers = exec_utils.get_param_value(Parameters.NUM_WORKERS, parameters, None)
     # default value for precision, when no activated transitions (not even by looking at the initial marking) are found
     precision = 1.0
     sum_ee = 0
@@ -64,7 +68,9 @@ def apply(log, net, marking, final_marking, parameters=None):
         token_replay.Parameters.STOP_IMMEDIATELY_UNFIT: True,
         token_replay.Parameters.WALK_THROUGH_HIDDEN_TRANS: True,
         token_replay.Parameters.CLEANING_TOKEN_FLOOD: cleaning_token_flood,
-        token_replay.Parameters.ACTIVITY_KEY: activity_key
+        token_replay.Parameters.ACTIVITY_KEY: activity_key,
+        token_replay.Parameters.ENABLE_PARALLEL: enable_parallel,
+        token_replay.Parameters.NUM_WORKERS: num_workers
     }
 
     prefixes, prefix_count = precision_utils.get_log_prefixes(log, activity_key=activity_key)
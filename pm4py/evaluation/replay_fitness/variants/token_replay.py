@@ -70,10 +70,14 @@ def apply(log, petri_net, initial_marking, final_marking, parameters=None):
     token_replay_variant = exec_utils.get_param_value(Parameters.TOKEN_REPLAY_VARIANT, parameters,
                                                       executor.Variants.TOKEN_REPLAY)
     cleaning_token_flood = exec_utils.get_param_value(Parameters.CLEANING_TOKEN_FLOOD, parameters, False)
+    enable_parallel = exec_utils.get_param_value(Parameters.ENABLE_PARALLEL, parameters, False)
+    num_workers = exec_utils.get_param_value(Parameters.NUM_WORKERS, parameters, None)
 
     parameters_tr = {token_replay.Parameters.ACTIVITY_KEY: activity_key,
                      token_replay.Parameters.CONSIDER_REMAINING_IN_FITNESS: True,
-                     token_replay.Parameters.CLEANING_TOKEN_FLOOD: cleaning_token_flood}
+                     token_replay.Parameters.CLEANING_TOKEN_FLOOD: cleaning_token_flood,
+                     token_replay.Parameters.ENABLE_PARALLEL: enable_parallel,
+                     token_replay.Parameters.NUM_WORKERS: num_workers}
 
     aligned_traces = executor.apply(log, petri_net, initial_marking, final_marking, variant=token_replay_variant,
                                         parameters=parameters_tr)
@@ -1 +1,6 @@
-from pm4py.evaluation.soundness.woflan import algorithm, graphs, not_well_handled_pairs, place_invariants
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["algorithm", "graphs", "not_well_handled_pairs", "place_invariants"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
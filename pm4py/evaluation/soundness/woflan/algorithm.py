@@ -544,10 +544,10 @@ def compute_non_live_sequences(woflan_object):
             sucessfull_terminate_state = node
             break
     # red nodes are those from which the final marking is not reachable
-    red_nodes = []
-    for node in woflan_object.get_r_g().nodes:
-        if not nx.has_path(woflan_object.get_r_g(), node, sucessfull_terminate_state):
-            red_nodes.append(node)
+    # (computed with a single backward visit from the final marking)
+    green_nodes = nx.ancestors(woflan_object.get_r_g(), sucessfull_terminate_state)
+    green_nodes.add(sucessfull_terminate_state)
+    red_nodes = set(node for node in woflan_object.get_r_g().nodes if node not in green_nodes)
     # Compute directed spanning tree
     spanning_tree = nx.algorithms.tree.Edmonds(woflan_object.get_r_g()).find_optimum()
     queue = set()
@@ -1,6 +1,8 @@
 import networkx as nx
 import numpy as np
 from pm4py.evaluation.soundness.woflan.graphs import utility as helper
+from pm4py.objects.petri import state_space
+from pm4py.objects.petri.petrinet import Marking
 
 
 def apply(net, initial_marking, original_net=None):
@@ -11,30 +13,13 @@ def apply(net, initial_marking, original_net=None):
     :param original_net: Petri Net without short-circuited transition
     :return: Networkx Graph that represents the reachability graph of the Petri Net
     """
+    place_list = list(net.places)
     initial_marking = helper.convert_marking(net, initial_marking, original_net)
-    firing_dict = helper.split_incidence_matrix(helper.compute_incidence_matrix(net), net)
-    req_dict = helper.compute_firing_requirement(net)
-    look_up_indices = {}
-    j = 0
+    space = state_space.explore(net, Marking({p: int(n) for p, n in zip(place_list, initial_marking) if n > 0}))
+    # the markings of the nodes follow the order of the places of the net
+    place_order = [space.compiled_net.place_indices[p] for p in place_list]
+    markings = np.array(space.markings, dtype=float).reshape(len(space), len(place_list))[:, place_order]
     reachability_graph = nx.MultiDiGraph()
-    reachability_graph.add_node(j, marking=initial_marking)
-
-    working_set = set()
-    working_set.add(j)
-
-    look_up_indices[np.array2string(initial_marking)] = j
-
-    j += 1
-    while len(working_set) > 0:
-        m = working_set.pop()
-        possible_markings = helper.enabled_markings(firing_dict, req_dict, reachability_graph.nodes[m]['marking'])
-        for marking in possible_markings:
-            if np.array2string(marking[0]) not in look_up_indices:
-                look_up_indices[np.array2string(marking[0])] = j
-                reachability_graph.add_node(j, marking=marking[0])
-                working_set.add(j)
-                reachability_graph.add_edge(m, j, transition=marking[1])
-                j += 1
-            else:
-                reachability_graph.add_edge(m, look_up_indices[np.array2string(marking[0])], transition=marking[1])
+    reachability_graph.add_nodes_from((j, {"marking": markings[j]}) for j in range(len(space)))
+    reachability_graph.add_edges_from((m, j, {"transition": t}) for m, t, j in space.get_arcs())
     return reachability_graph
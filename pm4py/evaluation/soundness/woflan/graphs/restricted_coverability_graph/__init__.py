@@ -1 +1,6 @@
-from pm4py.evaluation.soundness.woflan.graphs.restricted_coverability_graph import restricted_coverability_graph
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["restricted_coverability_graph"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
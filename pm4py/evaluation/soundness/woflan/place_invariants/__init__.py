@@ -1 +1,6 @@
-from pm4py.evaluation.soundness.woflan.place_invariants import place_invariants, s_component, uniform_invariant, utility
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["place_invariants", "s_component", "uniform_invariant", "utility"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1,6 +1,12 @@
-from pm4py.objects import log, petri, transition_system, conversion, process_tree, heuristics_net, random_variables, \
-    stochastic_petri, dfg
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["log", "petri", "transition_system", "conversion", "process_tree", "heuristics_net", "random_variables",
+           "stochastic_petri", "dfg"]
+
 if pkgutil.find_loader("networkx"):
-    from pm4py.objects import bpmn
+    __all__.append("bpmn")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
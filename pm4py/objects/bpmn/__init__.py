@@ -1,5 +1,11 @@
-from pm4py.objects.bpmn import bpmn_graph, exporter, layout, util
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["bpmn_graph", "exporter", "layout", "util"]
+
 if pkgutil.find_loader("lxml"):
-    from pm4py.objects.bpmn import importer
+    __all__.append("importer")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1 +1,6 @@
-from pm4py.objects.conversion import process_tree, log, heuristics_net, dfg, wf_net, bpmn
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["process_tree", "log", "heuristics_net", "dfg", "wf_net", "bpmn"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -2,6 +2,7 @@ TO_TRACE_LOG = 'to_event_log'
 TO_EVENT_LOG = 'to_event_log'
 TO_EVENT_STREAM = 'to_event_stream'
 TO_DATAFRAME = 'to_dataframe'
+TO_COLUMNAR = 'to_columnar'
 FROM_DATAFRAME = 'from_dataframe'
 
 DF_TO_EVENT_LOG_1V = 'df_to_event_log_1v'
@@ -1 +1,7 @@
-from pm4py.objects.conversion.log.variants import to_data_frame, to_event_stream, to_event_log, df_to_event_log_1v, df_to_event_log_nv
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["to_data_frame", "to_event_stream", "to_event_log", "df_to_event_log_1v", "df_to_event_log_nv",
+           "to_columnar"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
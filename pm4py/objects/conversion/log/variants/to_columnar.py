@@ -0,0 +1,214 @@
+import pkgutil
+from datetime import datetime
+from enum import Enum
+
+import numpy as np
+
+from pm4py.objects.conversion.log import constants
+from pm4py.objects.conversion.log.variants import to_event_log
+from pm4py.objects.log import log as log_instance
+from pm4py.objects.log.columnar import ColumnarEventLog, CategoricalColumn, TimestampColumn, NumericColumn, \
+    ObjectColumn, MISSING, datetime_to_ns
+from pm4py.util import exec_utils, constants as pmconstants
+from pm4py.util import xes_constants as xes
+
+
+class Parameters(Enum):
+    DEEP_COPY = constants.DEEPCOPY
+    STREAM_POST_PROCESSING = constants.STREAM_POSTPROCESSING
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+    CASE_ID_KEY = pmconstants.PARAMETER_CONSTANT_CASEID_KEY
+
+
+def apply(log, parameters=None):
+    """
+    Converts a log object (event log, event stream or dataframe) into a columnar event log
+
+    Parameters
+    -------------
+    log
+        Log object
+    parameters
+        Parameters of the algorithm, including:
+            - Parameters.CASE_ID_KEY => case identifier column (dataframe only)
+            - Parameters.CASE_ATTRIBUTE_PREFIX => prefix of the case attributes (dataframe and event stream)
+
+    Returns
+    -------------
+    columnar_log
+        Columnar event log (:class:`pm4py.objects.log.columnar.ColumnarEventLog`)
+    """
+    if parameters is None:
+        parameters = {}
+
+    if isinstance(log, ColumnarEventLog):
+        return log
+
+    if pkgutil.find_loader("pandas"):
+        import pandas
+        if isinstance(log, pandas.core.frame.DataFrame):
+            return __transform_dataframe_to_columnar(log, parameters)
+
+    if not isinstance(log, log_instance.EventLog):
+        log = to_event_log.apply(log, parameters=parameters)
+
+    return __transform_event_log_to_columnar(log)
+
+
+def build_column(values, present):
+    """
+    Builds the most compact column able to store the provided values
+
+    Parameters
+    -------------
+    values
+        NumPy object array containing the values of the attribute
+    present
+        Boolean NumPy array telling for which events the attribute is set
+
+    Returns
+    -------------
+    column
+        Column
+    """
+    types = set(type(v) for v in values[present])
+    all_present = bool(present.all())
+    if types == {str}:
+        label_index = {}
+        labels = []
+        codes = np.full(len(values), -1, dtype=np.int32)
+        for i in np.nonzero(present)[0]:
+            v = values[i]
+            c = label_index.get(v)
+            if c is None:
+                c = len(labels)
+                label_index[v] = c
+                labels.append(v)
+            codes[i] = c
+        return CategoricalColumn(codes, labels, label_index)
+    if types and all(issubclass(t, datetime) for t in types):
+        ts = np.full(len(values), np.datetime64("NaT", "ns"), dtype="datetime64[ns]")
+        tz_aware = False
+        for i in np.nonzero(present)[0]:
+            v = values[i]
+            if v.tzinfo is not None:
+                tz_aware = True
+            ts[i] = np.datetime64(datetime_to_ns(v), "ns")
+        return TimestampColumn(ts, tz_aware=tz_aware)
+    for t, dtype in ((bool, np.bool_), (int, np.int64), (float, np.float64)):
+        if types == {t}:
+            typed = np.zeros(len(values), dtype=dtype)
+            typed[present] = values[present].tolist()
+            return NumericColumn(typed, None if all_present else present.copy())
+    obj = values.copy()
+    obj[~present] = MISSING
+    return ObjectColumn(obj)
+
+
+def __transform_event_log_to_columnar(log):
+    """
+    Converts an event log into a columnar event log (single pass over the events)
+
+    Parameters
+    -------------
+    log
+        Event log
+
+    Returns
+    -------------
+    columnar_log
+        Columnar event log
+    """
+    offsets = np.zeros(len(log) + 1, dtype=np.int64)
+    for i, trace in enumerate(log):
+        offsets[i + 1] = offsets[i] + len(trace)
+    num_events = int(offsets[-1])
+
+    values = {}
+    present = {}
+    i = 0
+    for trace in log:
+        for event in trace:
+            for k, v in event.items():
+                if k not in values:
+                    values[k] = np.empty(num_events, dtype=object)
+                    present[k] = np.zeros(num_events, dtype=bool)
+                values[k][i] = v
+                present[k][i] = True
+            i += 1
+
+    columns = {k: build_column(values[k], present[k]) for k in values}
+    trace_attributes = [dict(trace.attributes) for trace in log]
+
+    return ColumnarEventLog(offsets, columns, trace_attributes, attributes=log.attributes,
+                            extensions=log.extensions, omni_present=log.omni_present, classifiers=log.classifiers)
+
+
+def __transform_dataframe_to_columnar(df, parameters):
+    """
+    Converts a dataframe into a columnar event log, grouping the events by case identifier
+    (the cases are sorted by first appearance, the events of each case keep the order of the dataframe)
+
+    Parameters
+    -------------
+    df
+        Dataframe
+    parameters
+        Parameters of the conversion
+
+    Returns
+    -------------
+    columnar_log
+        Columnar event log
+    """
+    import pandas as pd
+
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, pmconstants.CASE_CONCEPT_NAME)
+    case_pref = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters, "case:")
+
+    case_codes, case_uniques = pd.factorize(df[case_id_key], sort=False)
+    order = np.argsort(case_codes, kind="stable")
+    counts = np.bincount(case_codes[case_codes >= 0], minlength=len(case_uniques))
+    offsets = np.zeros(len(case_uniques) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    order = order[len(order) - int(offsets[-1]):]
+    first_rows = order[offsets[:-1]]
+
+    trace_attributes = [{} for i in range(len(case_uniques))]
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if col.startswith(case_pref):
+            key = col[len(case_pref):]
+            first_values = series.values[first_rows]
+            notna = pd.notna(first_values)
+            for i in np.nonzero(notna)[0]:
+                v = first_values[i]
+                trace_attributes[i][key] = v.to_pydatetime() if isinstance(v, pd.Timestamp) else (
+                    v.item() if isinstance(v, np.generic) else v)
+            continue
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            tz_aware = getattr(series.dtype, "tz", None) is not None
+            if tz_aware:
+                series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+            columns[col] = TimestampColumn(series.values.astype("datetime64[ns]")[order], tz_aware=tz_aware)
+            continue
+        present = pd.notna(series.values)[order]
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            if present.all():
+                columns[col] = NumericColumn(series.values[order])
+            else:
+                columns[col] = NumericColumn(series.values[order].astype(np.float64), present)
+            continue
+        codes, uniques = pd.factorize(series, sort=False)
+        uniques = list(uniques)
+        if all(type(u) is str for u in uniques):
+            columns[col] = CategoricalColumn(codes[order].astype(np.int32), uniques)
+        else:
+            columns[col] = build_column(series.values[order], present)
+
+    for i in range(len(case_uniques)):
+        if xes.DEFAULT_TRACEID_KEY not in trace_attributes[i]:
+            trace_attributes[i][xes.DEFAULT_TRACEID_KEY] = case_uniques[i]
+
+    return ColumnarEventLog(offsets, columns, trace_attributes, attributes={'origin': 'csv'})
@@ -1,8 +1,13 @@
 from enum import Enum
 
+import numpy as np
+
 from pm4py.objects.conversion.log.variants import to_event_stream
 from pm4py.objects.log import log as log_instance
 from pm4py.objects.conversion.log import constants
+from pm4py.util import exec_utils
+from pm4py.objects.log.columnar import ColumnarEventLog, TimestampColumn
+from pm4py.util import constants as pmutil
 
 
 class Parameters(Enum):
@@ -37,8 +42,53 @@ def apply(log, parameters=None):
         parameters = dict()
     if isinstance(log, pd.core.frame.DataFrame):
         return log
+    if isinstance(log, ColumnarEventLog):
+        case_pref = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters, 'case:')
+        return __transform_columnar_to_data_frame(log, case_attribute_prefix=case_pref)
     if type(log) is log_instance.EventLog:
         log = to_event_stream.apply(log, parameters=parameters)
     transf_log = [dict(x) for x in log]
     df = pd.DataFrame.from_dict(transf_log)
     return df
+
+
+def __transform_columnar_to_data_frame(log, case_attribute_prefix=pmutil.CASE_ATTRIBUTE_PREFIX):
+    """
+    Converts a columnar event log into a Pandas dataframe, column by column
+
+    Parameters
+    -----------
+    log
+        Columnar event log
+    case_attribute_prefix
+        Prefix of the case attributes
+
+    Returns
+    -----------
+    df
+        Pandas dataframe
+    """
+    import pandas as pd
+
+    data = {}
+    for key, column in log.columns.items():
+        if isinstance(column, TimestampColumn):
+            data[key] = pd.to_datetime(column.values, utc=column.tz_aware)
+        else:
+            data[key] = column.to_numpy()
+    case_index = log.case_index
+    trace_keys = []
+    for attributes in log.trace_attributes:
+        for k in attributes:
+            if k not in trace_keys:
+                trace_keys.append(k)
+    for k in trace_keys:
+        trace_values = np.empty(len(log), dtype=object)
+        trace_values[:] = [attributes.get(k) for attributes in log.trace_attributes]
+        data[case_attribute_prefix + k] = trace_values[case_index]
+    if pmutil.CASE_ATTRIBUTE_GLUE not in data:
+        data[pmutil.CASE_ATTRIBUTE_GLUE] = case_index.astype(str)
+    df = pd.DataFrame(data)
+    for k in trace_keys:
+        df[case_attribute_prefix + k] = df[case_attribute_prefix + k].infer_objects()
+    return df
@@ -5,6 +5,7 @@ from enum import Enum
 from pm4py.objects.conversion.log import constants
 from pm4py.objects.conversion.log.variants import to_event_stream
 from pm4py.objects.log import log as log_instance
+from pm4py.objects.log.columnar import ColumnarEventLog
 from pm4py.util import xes_constants as xes
 from pm4py.util import exec_utils, constants as pmconstants
 import pkgutil
@@ -15,15 +16,37 @@ class Parameters(Enum):
     STREAM_POST_PROCESSING = constants.STREAM_POSTPROCESSING
     CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
     CASE_ID_KEY = pmconstants.PARAMETER_CONSTANT_CASEID_KEY
+    MATERIALIZE = "materialize"
 
 
 def apply(log, parameters=None):
+    """
+    Converts a log object to an event log
+
+    Parameters
+    ----------
+    log
+        Log object (event stream, dataframe or event log)
+    parameters
+        Parameters of the algorithm, including:
+            - Parameters.DEEP_COPY => enables deepcopy (avoid references between input and output objects)
+            - Parameters.CASE_ID_KEY => case identifier
+            - Parameters.CASE_ATTRIBUTE_PREFIX => prefix of the case attributes
+            - Parameters.MATERIALIZE => when a columnar event log is provided, materializes it into
+            Trace and Event objects (by default, it is returned as is, since it is already an event log)
+
+    Returns
+    -------
+    log : :class:`pm4py.log.log.EventLog`
+        An event log
+    """
     if parameters is None:
         parameters = {}
     enable_deepcopy = exec_utils.get_param_value(Parameters.DEEP_COPY, parameters, False)
     glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, pmconstants.CASE_CONCEPT_NAME)
     case_pref = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters,
                                            "case:")
+    materialize = exec_utils.get_param_value(Parameters.MATERIALIZE, parameters, False)
 
     if pkgutil.find_loader("pandas"):
         import pandas
@@ -32,9 +55,34 @@ def apply(log, parameters=None):
     if isinstance(log, log_instance.EventStream) and (not isinstance(log, log_instance.EventLog)):
         return __transform_event_stream_to_event_log(log, case_glue=glue, include_case_attributes=True,
                                                      case_attribute_prefix=case_pref, enable_deepcopy=enable_deepcopy)
+    if materialize and isinstance(log, ColumnarEventLog):
+        return __transform_columnar_to_event_log(log, enable_deepcopy=enable_deepcopy)
     return log
 
 
+def __transform_columnar_to_event_log(log, enable_deepcopy=False):
+    """
+    Materializes a columnar event log into an event log made of Trace and Event objects
+
+    Parameters
+    ----------
+    log
+        Columnar event log
+    enable_deepcopy
+        Enables deepcopy of the attribute values
+
+    Returns
+    -------
+    log : :class:`pm4py.log.log.EventLog`
+        An event log
+    """
+    if enable_deepcopy:
+        return deepcopy(log)
+    return log_instance.EventLog([copy(trace) for trace in log], attributes=copy(log.attributes),
+                                 classifiers=copy(log.classifiers), omni_present=copy(log.omni_present),
+                                 extensions=copy(log.extensions))
+
+
 def __transform_event_stream_to_event_log(log, case_glue=Parameters.CASE_ID_KEY.value,
                                           include_case_attributes=True,
                                           case_attribute_prefix=Parameters.CASE_ATTRIBUTE_PREFIX.value,
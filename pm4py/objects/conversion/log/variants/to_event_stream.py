@@ -6,6 +6,7 @@ from enum import Enum
 from pm4py.objects.conversion.log import constants
 from pm4py.objects.log import log as log_instance
 from pm4py.objects.log.log import EventLog, Event, XESExtension
+from pm4py.objects.log.columnar import ColumnarEventLog
 from pm4py.util import constants as pmutil
 from pm4py.util import exec_utils, pandas_utils, xes_constants
 
@@ -90,6 +91,9 @@ def apply(log, parameters=None):
                 log.extensions[ex.name] = {
                     xes_constants.KEY_PREFIX: ex.prefix,
                     xes_constants.KEY_URI: ex.uri}
+    if isinstance(log, ColumnarEventLog):
+        return __transform_columnar_to_event_stream(log, case_attribute_prefix=case_pref,
+                                                    enable_deepcopy=enable_deepcopy)
     if isinstance(log, EventLog):
         return __transform_event_log_to_event_stream(log, include_case_attributes=True,
                                                      case_attribute_prefix=case_pref, enable_deepcopy=enable_deepcopy)
@@ -106,6 +110,38 @@ def __detect_extensions(df):
     return extensions
 
 
+def __transform_columnar_to_event_stream(log, case_attribute_prefix=pmutil.CASE_ATTRIBUTE_PREFIX,
+                                         enable_deepcopy=False):
+    """
+    Converts a columnar event log to an event stream (without modifying the columnar log)
+
+    Parameters
+    ----------
+    log
+        Columnar event log
+    case_attribute_prefix
+        Default is 'case:'
+    enable_deepcopy
+        Enables deepcopy of the attribute values
+
+    Returns
+    -------
+    stream
+        Event stream
+    """
+    events = []
+    for index, trace in enumerate(log):
+        case_attributes = {case_attribute_prefix + key: value for key, value in trace.attributes.items()}
+        if pmutil.CASE_ATTRIBUTE_GLUE not in case_attributes:
+            case_attributes[pmutil.CASE_ATTRIBUTE_GLUE] = str(index)
+        for event in trace:
+            new_event = Event(deepcopy(event._dict) if enable_deepcopy else event._dict)
+            new_event._dict.update(case_attributes)
+            events.append(new_event)
+    return log_instance.EventStream(events, attributes=log.attributes, classifiers=log.classifiers,
+                                    omni_present=log.omni_present, extensions=log.extensions)
+
+
 def __transform_event_log_to_event_stream(log, include_case_attributes=True,
                                           case_attribute_prefix=pmutil.CASE_ATTRIBUTE_PREFIX, enable_deepcopy=False):
     """
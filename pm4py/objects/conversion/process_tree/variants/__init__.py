@@ -1 +1,6 @@
-from pm4py.objects.conversion.process_tree.variants import to_petri_net, to_petri_net_transition_bordered, to_bpmn
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["to_petri_net", "to_petri_net_transition_bordered", "to_bpmn"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
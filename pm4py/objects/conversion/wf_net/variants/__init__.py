@@ -1 +1,6 @@
-from pm4py.objects.conversion.wf_net.variants import to_process_tree, to_bpmn
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["to_process_tree", "to_bpmn"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
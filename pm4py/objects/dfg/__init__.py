@@ -1,2 +1,6 @@
-from pm4py.objects.dfg import filtering, utils, retrieval, importer, exporter
+from pm4py.util.lazy_import import lazy_getattr
 
+# the submodules are imported when they are accessed for the first time
+__all__ = ["filtering", "utils", "retrieval", "importer", "exporter"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
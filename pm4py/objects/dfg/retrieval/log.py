@@ -1,7 +1,9 @@
 from collections import Counter
 from enum import Enum
-from statistics import mean, median, stdev
 
+import numpy as np
+
+from pm4py.objects.log.util import arrays
 from pm4py.util import constants, exec_utils
 from pm4py.util import xes_constants as xes_util
 
@@ -42,10 +44,56 @@ def freq_triples(log, parameters=None):
     return Counter([dfg for lista in dfgs for dfg in lista])
 
 
+def __get_pairs(offsets, window):
+    """
+    Gets the positions of the directly-follows pairs (at the given distance) in the event arrays
+
+    Parameters
+    ----------
+    offsets
+        Offsets of the traces
+    window
+        Distance between the events of the pair
+
+    Returns
+    -------
+    targets
+        Positions of the second events of the pairs (the first events are at targets - window)
+    case_index
+        Trace of each pair
+    """
+    case_index = arrays.get_case_index(offsets)
+    positions = np.arange(len(case_index), dtype=np.int64)
+    mask = positions - offsets[:-1][case_index] >= window
+    return positions[mask], case_index[mask]
+
+
+def __get_pair_keys(codes, positions, window, n, activity_key):
+    """
+    Encodes each directly-follows pair as a single integer (source code * n + target code)
+    """
+    sources = codes[positions - window]
+    targets = codes[positions]
+    if len(positions) > 0 and min(sources.min(), targets.min()) < 0:
+        raise KeyError(activity_key)
+    return sources * n + targets
+
+
+def __count_keys(keys):
+    """
+    Counts the occurrences of integer keys, returning them by order of first appearance
+    """
+    uniques, first_index, counts = np.unique(keys, return_index=True, return_counts=True)
+    order = np.argsort(first_index, kind="stable")
+    return uniques[order], counts[order]
+
+
 def native(log, parameters=None):
     """
     Counts the number of directly follows occurrences, i.e. of the form <...a,b...>, in an event log.
 
+    The activities are integer-encoded once, and the pairs are counted on the code arrays.
+
     Parameters
     ----------
     log
@@ -53,6 +101,8 @@ def native(log, parameters=None):
     parameters
         Possible parameters passed to the algorithms:
             activity_key -> Attribute to use as activity
+            window -> Distance between the events of the pair (default: 1)
+            keep_once_per_case -> Counts each pair at most once per case
 
     Returns
     -------
@@ -64,18 +114,24 @@ def native(log, parameters=None):
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_util.DEFAULT_NAME_KEY)
     window = exec_utils.get_param_value(Parameters.WINDOW, parameters, 1)
     keep_once_per_case = exec_utils.get_param_value(Parameters.KEEP_ONCE_PER_CASE, parameters, False)
+
+    codes, labels, offsets = arrays.encode_attribute(log, activity_key, allow_missing=True)
+    n = max(len(labels), 1)
+    positions, case_index = __get_pairs(offsets, window)
+    keys = __get_pair_keys(codes, positions, window, n, activity_key)
     if keep_once_per_case:
-        dfgs = map((lambda t: set((t[i - window][activity_key], t[i][activity_key]) for i in range(window, len(t)))),
-                   log)
-    else:
-        dfgs = map((lambda t: [(t[i - window][activity_key], t[i][activity_key]) for i in range(window, len(t))]), log)
-    return Counter([dfg for lista in dfgs for dfg in lista])
+        keys = np.unique(case_index * (n * n) + keys) % (n * n)
+    keys, counts = __count_keys(keys)
+    return Counter({(labels[k // n], labels[k % n]): int(c) for k, c in zip(keys.tolist(), counts.tolist())})
 
 
 def performance(log, parameters=None):
     """
     Measure performance between couples of attributes in the DFG graph
 
+    The durations of the directly-follows pairs are computed on the timestamp arrays and aggregated
+    per pair after a single sort.
+
     Parameters
     ----------
     log
@@ -101,29 +157,43 @@ def performance(log, parameters=None):
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_util.DEFAULT_TIMESTAMP_KEY)
     aggregation_measure = exec_utils.get_param_value(Parameters.AGGREGATION_MEASURE, parameters, "mean")
 
-    dfgs0 = map((lambda t: [
-        ((t[i - 1][activity_key], t[i][activity_key]),
-         max(0, (t[i][start_timestamp_key] - t[i - 1][timestamp_key]).total_seconds()))
-        for i in range(1, len(t))]), log)
-    ret0 = {}
-    for el in dfgs0:
-        for couple in el:
-            if not couple[0] in ret0:
-                ret0[couple[0]] = []
-            ret0[couple[0]].append(couple[1])
+    codes, labels, offsets = arrays.encode_attribute(log, activity_key, allow_missing=True)
+    timestamps = arrays.get_timestamps(log, timestamp_key)
+    start_timestamps = timestamps if start_timestamp_key == timestamp_key else arrays.get_timestamps(log,
+                                                                                                  start_timestamp_key)
+    n = max(len(labels), 1)
+    targets, case_index = __get_pairs(offsets, 1)
+    keys = __get_pair_keys(codes, targets, 1, n, activity_key)
+    durations = np.maximum(0, start_timestamps[targets] - timestamps[targets - 1]) / 10 ** 6
+
+    uniques, first_index = np.unique(keys, return_index=True)
+    order = np.lexsort((durations, keys))
+    keys = keys[order]
+    durations = durations[order]
+    starts = np.searchsorted(keys, uniques)
+    counts = np.diff(np.append(starts, len(keys)))
+
+    if aggregation_measure == "median":
+        lower = durations[starts + (counts - 1) // 2]
+        upper = durations[starts + counts // 2]
+        values = (lower + upper) / 2
+    elif aggregation_measure == "min":
+        values = durations[starts] if len(keys) > 0 else durations
+    elif aggregation_measure == "max":
+        values = durations[starts + counts - 1] if len(keys) > 0 else durations
+    elif aggregation_measure == "sum":
+        values = np.add.reduceat(durations, starts) if len(keys) > 0 else durations
+    else:
+        sums = np.add.reduceat(durations, starts) if len(keys) > 0 else durations
+        values = sums / counts
+        if aggregation_measure == "stdev":
+            deviations = (durations - np.repeat(values, counts)) ** 2
+            squares = np.add.reduceat(deviations, starts) if len(keys) > 0 else deviations
+            values = np.sqrt(squares / np.maximum(counts - 1, 1))
+
     ret = Counter()
-    for key in ret0:
-        if aggregation_measure == "median":
-            ret[key] = median(ret0[key])
-        elif aggregation_measure == "min":
-            ret[key] = min(ret0[key])
-        elif aggregation_measure == "max":
-            ret[key] = max(ret0[key])
-        elif aggregation_measure == "stdev":
-            ret[key] = stdev(ret0[key])
-        elif aggregation_measure == "sum":
-            ret[key] = sum(ret0[key])
-        else:
-            ret[key] = mean(ret0[key])
+    for i in np.argsort(first_index, kind="stable").tolist():
+        k = int(uniques[i])
+        ret[(labels[k // n], labels[k % n])] = float(values[i])
 
     return ret
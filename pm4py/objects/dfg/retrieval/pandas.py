@@ -8,6 +8,9 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
     """
     Get DFG graph from Pandas dataframe
 
+    Case IDs and activities are replaced by their integer codes, successive rows are compared on the code
+    arrays and the paths are aggregated on a single integer key, without modifying or copying the dataframe.
+
     Parameters
     -----------
     df
@@ -38,67 +41,74 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
     dfg
         DFG in the chosen measure (may be only the frequency, only the performance, or both)
     """
+    import numpy as np
     import pandas as pd
 
-    # if not differently specified, set the start timestamp key to the timestamp key
-    # to avoid retro-compatibility problems
+    # if not differently specified, the start timestamp is the timestamp
+    # (the dataframe is never modified nor copied: only the needed columns are read as arrays)
     if start_timestamp_key is None:
-        start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
-        df[start_timestamp_key] = df[timestamp_key]
+        start_timestamp_key = timestamp_key
+
+    # integer codes for the case IDs (sorted, as in a sort on the case ID) and the activities (sorted by label)
+    case_codes, case_uniques = pd.factorize(df[case_id_glue], sort=True)
+    act_codes, act_uniques = pd.factorize(df[activity_key], sort=True)
+    act_uniques = act_uniques.tolist()
+    n = max(len(act_uniques), 1)
+    need_timestamps = measure != "frequency"
+
+    if need_timestamps or (sort_caseid_required and sort_timestamp_along_case_id):
+        timestamps = df[timestamp_key].values.astype("datetime64[ns]").view(np.int64)
+        start_timestamps = timestamps if start_timestamp_key == timestamp_key else df[
+            start_timestamp_key].values.astype("datetime64[ns]").view(np.int64)
 
     # to get rows belonging to same case ID together, we need to sort on case ID
     if sort_caseid_required:
         if sort_timestamp_along_case_id:
-            df = df.sort_values([case_id_glue, start_timestamp_key, timestamp_key])
+            order = np.lexsort((timestamps, start_timestamps, case_codes))
         else:
-            df = df.sort_values(case_id_glue)
+            order = np.argsort(case_codes, kind="stable")
+        case_codes = case_codes[order]
+        act_codes = act_codes[order]
+        if need_timestamps:
+            timestamps = timestamps[order]
+            start_timestamps = start_timestamps[order]
+
+    # couple each row with the row at distance window, keeping only the couples belonging to the same case
+    sources = np.arange(max(len(case_codes) - window, 0))
+    targets = sources + window
+    mask = (case_codes[sources] == case_codes[targets]) & (case_codes[sources] >= 0) & (act_codes[sources] >= 0) & (
+            act_codes[targets] >= 0)
+    sources = sources[mask]
+    targets = targets[mask]
+    keys = act_codes[sources].astype(np.int64) * n + act_codes[targets]
 
-    # to increase the speed of the approaches reduce dataframe to case, activity (and possibly complete timestamp)
-    # columns
-    if measure == "frequency":
-        df_reduced = df[[case_id_glue, activity_key]]
-    else:
-        df_reduced = df[[case_id_glue, activity_key, start_timestamp_key, timestamp_key]]
-    # shift the dataframe by 1, in order to couple successive rows
-    df_reduced_shifted = df_reduced.shift(-window)
-    # change column names to shifted dataframe
-    df_reduced_shifted.columns = [str(col) + '_2' for col in df_reduced_shifted.columns]
-    # concate the two dataframe to get a unique dataframe
-    df_successive_rows = pd.concat([df_reduced, df_reduced_shifted], axis=1)
-    # as successive rows in the sorted dataframe may belong to different case IDs we have to restrict ourselves to
-    # successive rows belonging to same case ID
-    df_successive_rows = df_successive_rows[df_successive_rows[case_id_glue] == df_successive_rows[case_id_glue + '_2']]
     if keep_once_per_case:
-        df_successive_rows = df_successive_rows.groupby(
-            [case_id_glue, activity_key, activity_key + "_2"]).first().reset_index()
-
-    all_columns = set(df_successive_rows.columns)
-    all_columns = list(all_columns - set([activity_key, activity_key + '_2']))
-
-    if measure == "performance" or measure == "both":
-        # calculate the difference between the timestamps of two successive events
-        df_successive_rows[constants.DEFAULT_FLOW_TIME] = (
-                df_successive_rows[start_timestamp_key + '_2'] - df_successive_rows[timestamp_key]).astype(
-            'timedelta64[s]')
-        # in the arc performance calculation, make sure to consider positive or null values
-        df_successive_rows[constants.DEFAULT_FLOW_TIME] = df_successive_rows[constants.DEFAULT_FLOW_TIME].apply(
-            lambda x: max(x, 0))
-        # groups couple of attributes (directly follows relation, we can measure the frequency and the performance)
-        directly_follows_grouping = df_successive_rows.groupby([activity_key, activity_key + '_2'])[
-            constants.DEFAULT_FLOW_TIME]
-    else:
-        directly_follows_grouping = df_successive_rows.groupby([activity_key, activity_key + '_2'])
-        if all_columns:
-            directly_follows_grouping = directly_follows_grouping[all_columns[0]]
+        # keep only the first occurrence of the path in each case
+        cases = case_codes[sources]
+        pos = np.lexsort((sources, keys, cases))
+        first = np.ones(len(pos), dtype=bool)
+        first[1:] = (cases[pos][1:] != cases[pos][:-1]) | (keys[pos][1:] != keys[pos][:-1])
+        pos = np.sort(pos[first])
+        sources = sources[pos]
+        targets = targets[pos]
+        keys = keys[pos]
 
     dfg_frequency = {}
     dfg_performance = {}
 
     if measure == "frequency" or measure == "both":
-        dfg_frequency = directly_follows_grouping.size().to_dict()
+        uniques, counts = np.unique(keys, return_counts=True)
+        dfg_frequency = {(act_uniques[k // n], act_uniques[k % n]): int(c) for k, c in
+                         zip(uniques.tolist(), counts.tolist())}
 
     if measure == "performance" or measure == "both":
-        dfg_performance = directly_follows_grouping.agg(perf_aggregation_key).to_dict()
+        # difference (in seconds) between the timestamps of two successive events,
+        # considering only positive or null values
+        flow_times = np.maximum(np.floor_divide(start_timestamps[targets] - timestamps[sources], 10 ** 9), 0).astype(
+            np.float64)
+        aggregated = pd.Series(flow_times).groupby(keys).agg(perf_aggregation_key)
+        dfg_performance = {(act_uniques[k // n], act_uniques[k % n]): v for k, v in
+                           zip(aggregated.index.tolist(), aggregated.tolist())}
 
     if measure == "frequency":
         return dfg_frequency
@@ -1,5 +1,11 @@
-from pm4py.objects.log import importer, util, log
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["importer", "util", "log", "columnar"]
+
 if pkgutil.find_loader("lxml"):
-    from pm4py.objects.log import exporter
+    __all__.append("exporter")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -0,0 +1,741 @@
+import copy
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from pm4py.objects.log.log import Event, Trace, EventLog
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAT = np.datetime64("NaT", "ns")
+
+
+class _Missing(object):
+    """
+    Sentinel marking an attribute that is not set for an event
+    """
+
+    def __repr__(self):
+        return "<missing>"
+
+    def __reduce__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+def datetime_to_ns(value):
+    """
+    Converts a datetime object to nanoseconds since the epoch (UTC)
+
+    Parameters
+    --------------
+    value
+        Datetime (naive datetimes are considered to be UTC)
+
+    Returns
+    --------------
+    ns
+        Nanoseconds since the epoch
+    """
+    if value.tzinfo is not None and value.utcoffset() is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    else:
+        value = value.replace(tzinfo=None)
+    delta = value - _EPOCH
+    return ((delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds) * 1000 + getattr(value, "nanosecond",
+                                                                                                    0)
+
+
+def ns_to_datetime(ns, tz_aware):
+    """
+    Converts nanoseconds since the epoch to a datetime object
+
+    Parameters
+    --------------
+    ns
+        Nanoseconds since the epoch
+    tz_aware
+        Return a timezone-aware (UTC) datetime
+
+    Returns
+    --------------
+    value
+        Datetime (microsecond precision)
+    """
+    return (_EPOCH_UTC if tz_aware else _EPOCH) + timedelta(microseconds=int(ns) // 1000)
+
+
+class CategoricalColumn(object):
+    """
+    Dictionary-encoded column: an integer code per event plus the list of labels.
+    Events for which the attribute is not set have code -1.
+    """
+
+    def __init__(self, codes, labels, label_index=None):
+        self.codes = codes
+        self.labels = labels
+        self.label_index = label_index if label_index is not None else {l: i for i, l in enumerate(labels)}
+
+    def get(self, i):
+        c = self.codes[i]
+        if c < 0:
+            raise KeyError(i)
+        return self.labels[c]
+
+    def contains(self, i):
+        return self.codes[i] >= 0
+
+    def set(self, i, value):
+        if type(value) is not str:
+            return False
+        if value not in self.label_index:
+            self.label_index[value] = len(self.labels)
+            self.labels.append(value)
+        self.codes[i] = self.label_index[value]
+        return True
+
+    def delete(self, i):
+        self.codes[i] = -1
+
+    def slice(self, start, stop):
+        return CategoricalColumn(self.codes[start:stop], self.labels, self.label_index)
+
+    def take(self, idx):
+        return CategoricalColumn(self.codes[idx], self.labels, self.label_index)
+
+    def to_numpy(self):
+        values = np.empty(len(self.labels) + 1, dtype=object)
+        values[:-1] = self.labels
+        values[-1] = None
+        return values[self.codes]
+
+    def to_object(self):
+        values = self.to_numpy()
+        values[self.codes < 0] = MISSING
+        return ObjectColumn(values)
+
+
+class TimestampColumn(object):
+    """
+    Column of timestamps stored as datetime64[ns] (UTC); NaT marks a missing attribute
+    """
+
+    def __init__(self, values, tz_aware=True):
+        self.values = values
+        self.tz_aware = tz_aware
+
+    def get(self, i):
+        v = self.values[i]
+        if np.isnat(v):
+            raise KeyError(i)
+        return ns_to_datetime(v.astype(np.int64), self.tz_aware)
+
+    def contains(self, i):
+        return not np.isnat(self.values[i])
+
+    def set(self, i, value):
+        if not isinstance(value, datetime):
+            return False
+        self.values[i] = np.datetime64(datetime_to_ns(value), "ns")
+        return True
+
+    def delete(self, i):
+        self.values[i] = _NAT
+
+    def slice(self, start, stop):
+        return TimestampColumn(self.values[start:stop], self.tz_aware)
+
+    def take(self, idx):
+        return TimestampColumn(self.values[idx], self.tz_aware)
+
+    def to_numpy(self):
+        return self.values
+
+    def to_object(self):
+        values = np.empty(len(self.values), dtype=object)
+        for i in range(len(self.values)):
+            values[i] = self.get(i) if self.contains(i) else MISSING
+        return ObjectColumn(values)
+
+
+class NumericColumn(object):
+    """
+    Column of integers, floats or booleans stored in a typed array, with an optional mask of present values
+    """
+
+    def __init__(self, values, present=None):
+        self.values = values
+        self.present = present
+
+    def get(self, i):
+        if self.present is not None and not self.present[i]:
+            raise KeyError(i)
+        return self.values[i].item()
+
+    def contains(self, i):
+        return self.present is None or bool(self.present[i])
+
+    def set(self, i, value):
+        if type(value) is not type(self.values[i].item()):
+            return False
+        self.values[i] = value
+        if self.present is not None:
+            self.present[i] = True
+        return True
+
+    def delete(self, i):
+        if self.present is None:
+            self.present = np.ones(len(self.values), dtype=bool)
+        self.present[i] = False
+
+    def slice(self, start, stop):
+        return NumericColumn(self.values[start:stop], self.present[start:stop] if self.present is not None else None)
+
+    def take(self, idx):
+        return NumericColumn(self.values[idx], self.present[idx] if self.present is not None else None)
+
+    def to_numpy(self):
+        if self.present is None:
+            return self.values
+        values = self.values.astype(np.float64)
+        values[~self.present] = np.nan
+        return values
+
+    def to_object(self):
+        values = self.values.astype(object)
+        if self.present is not None:
+            values[~self.present] = MISSING
+        return ObjectColumn(values)
+
+
+class ObjectColumn(object):
+    """
+    Generic column holding arbitrary Python objects; MISSING marks a missing attribute
+    """
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, i):
+        v = self.values[i]
+        if v is MISSING:
+            raise KeyError(i)
+        return v
+
+    def contains(self, i):
+        return self.values[i] is not MISSING
+
+    def set(self, i, value):
+        self.values[i] = value
+        return True
+
+    def delete(self, i):
+        self.values[i] = MISSING
+
+    def slice(self, start, stop):
+        return ObjectColumn(self.values[start:stop])
+
+    def take(self, idx):
+        return ObjectColumn(self.values[idx])
+
+    def missing_mask(self):
+        return np.fromiter((v is MISSING for v in self.values), dtype=bool, count=len(self.values))
+
+    def to_numpy(self):
+        values = self.values.copy()
+        values[self.missing_mask()] = None
+        return values
+
+    def to_object(self):
+        return self
+
+
+def empty_column(value, length):
+    """
+    Creates a column, suited for the type of the provided value, in which no event has the attribute set
+
+    Parameters
+    --------------
+    value
+        Value that will be stored first in the column
+    length
+        Number of events
+
+    Returns
+    --------------
+    column
+        Empty column
+    """
+    if type(value) is str:
+        return CategoricalColumn(np.full(length, -1, dtype=np.int32), [])
+    if isinstance(value, datetime):
+        return TimestampColumn(np.full(length, _NAT, dtype="datetime64[ns]"),
+                               tz_aware=value.tzinfo is not None)
+    values = np.empty(length, dtype=object)
+    values.fill(MISSING)
+    return ObjectColumn(values)
+
+
+class ColumnarEvent(Event):
+    """
+    Lazy view on a single event of a columnar event log
+    """
+
+    def __init__(self, log, index):
+        self._log = log
+        self._index = index
+
+    def _get_dict(self):
+        return {k: c.get(self._index) for k, c in self._log.columns.items() if c.contains(self._index)}
+
+    _dict = property(_get_dict)
+
+    def __getitem__(self, key):
+        column = self._log.columns.get(key)
+        if column is None:
+            raise KeyError(key)
+        try:
+            return column.get(self._index)
+        except KeyError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._log.set_value(self._index, key, value)
+
+    def __delitem__(self, key):
+        column = self._log.columns.get(key)
+        if column is None or not column.contains(self._index):
+            raise KeyError(key)
+        column.delete(self._index)
+
+    def __contains__(self, key):
+        column = self._log.columns.get(key)
+        return column is not None and column.contains(self._index)
+
+    def __iter__(self):
+        return iter([k for k, c in self._log.columns.items() if c.contains(self._index)])
+
+    def __len__(self):
+        return sum(1 for c in self._log.columns.values() if c.contains(self._index))
+
+    def __copy__(self):
+        return Event(self._get_dict())
+
+    def __deepcopy__(self, memo):
+        return Event(copy.deepcopy(self._get_dict(), memo))
+
+    def __reduce__(self):
+        return Event, (self._get_dict(),)
+
+
+class ColumnarTrace(Trace):
+    """
+    Lazy view on a single trace (a range of events) of a columnar event log
+    """
+
+    def __init__(self, log, index):
+        self._log = log
+        self._index = index
+        self._start = int(log.case_offsets[index])
+        self._stop = int(log.case_offsets[index + 1])
+        self._attributes = log.trace_attributes[index]
+
+    def _get_list(self):
+        return [ColumnarEvent(self._log, i) for i in range(self._start, self._stop)]
+
+    _list = property(_get_list)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [ColumnarEvent(self._log, self._start + i) for i in range(*key.indices(len(self)))]
+        n = self._stop - self._start
+        if key < 0:
+            key += n
+        if key < 0 or key >= n:
+            raise IndexError("trace index out of range")
+        return ColumnarEvent(self._log, self._start + key)
+
+    def __iter__(self):
+        log = self._log
+        for i in range(self._start, self._stop):
+            yield ColumnarEvent(log, i)
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnarTrace):
+            return other._log is self._log and other._index == self._index
+        return self is other
+
+    __hash__ = Trace.__hash__
+
+    def __reversed__(self):
+        log = self._log
+        for i in range(self._stop - 1, self._start - 1, -1):
+            yield ColumnarEvent(log, i)
+
+    def __contains__(self, item):
+        return Sequence.__contains__(self, item)
+
+    def index(self, x, start=0, end=None):
+        return Sequence.index(self, x, start, end)
+
+    def count(self, x):
+        return Sequence.count(self, x)
+
+    def __setitem__(self, key, value):
+        raise TypeError("columnar traces do not support structural changes, convert the log to an EventLog first")
+
+    def insert(self, i, x):
+        raise TypeError("columnar traces do not support structural changes, convert the log to an EventLog first")
+
+    def append(self, x):
+        raise TypeError("columnar traces do not support structural changes, convert the log to an EventLog first")
+
+    def __repr__(self, ret_list=False):
+        n = len(self)
+        if n == 0:
+            ret = {"attributes": self._attributes, "events": []}
+        elif n == 1:
+            ret = {"attributes": self._attributes, "events": [self[0]]}
+        else:
+            ret = {"attributes": self._attributes, "events": [self[0], "..", self[-1]]}
+        if ret_list:
+            return ret
+        return str(ret)
+
+    def __copy__(self):
+        return Trace([Event(e._get_dict()) for e in self], attributes=copy.copy(self._attributes))
+
+    def __deepcopy__(self, memo):
+        return Trace([Event(copy.deepcopy(e._get_dict(), memo)) for e in self],
+                     attributes=copy.deepcopy(self._attributes, memo))
+
+    def __reduce__(self):
+        return Trace, (self.__copy__()._list,), {"_attributes": self._attributes}
+
+
+class ColumnarEventLog(EventLog):
+    """
+    Event log storing its events column by column in NumPy arrays.
+
+    The traces are delimited by CSR-style offsets (the events of the i-th trace are the ones
+    in the range case_offsets[i]:case_offsets[i+1]), while every event attribute is kept
+    in a column (dictionary-encoded for strings, datetime64 for timestamps, typed arrays for numbers).
+    Traces and events are exposed as lazy views implementing the same protocols as
+    :class:`pm4py.objects.log.log.Trace` and :class:`pm4py.objects.log.log.Event`, so the existing
+    algorithms work unchanged, while fast paths can read the arrays through get_codes/get_timestamps.
+
+    Slicing the log returns a ColumnarEventLog sharing the underlying arrays.
+    A deep copy returns a plain (materialized) EventLog.
+    """
+
+    def __init__(self, case_offsets=None, columns=None, trace_attributes=None, **kwargs):
+        self._attributes = kwargs['attributes'] if 'attributes' in kwargs else {}
+        self._extensions = kwargs['extensions'] if 'extensions' in kwargs else {}
+        self._omni = kwargs['omni_present'] if 'omni_present' in kwargs else kwargs[
+            'globals'] if 'globals' in kwargs else {}
+        self._classifiers = kwargs['classifiers'] if 'classifiers' in kwargs else {}
+        self._case_offsets = np.asarray(case_offsets if case_offsets is not None else [0], dtype=np.int64)
+        self._columns = columns if columns is not None else {}
+        self._trace_attributes = trace_attributes if trace_attributes is not None else [{} for i in range(
+            len(self._case_offsets) - 1)]
+        self._case_index = None
+
+    def _get_case_offsets(self):
+        return self._case_offsets
+
+    def _get_columns(self):
+        return self._columns
+
+    def _get_trace_attributes(self):
+        return self._trace_attributes
+
+    def _get_list(self):
+        return [ColumnarTrace(self, i) for i in range(len(self))]
+
+    case_offsets = property(_get_case_offsets)
+    columns = property(_get_columns)
+    trace_attributes = property(_get_trace_attributes)
+    _list = property(_get_list)
+
+    @property
+    def num_events(self):
+        return int(self._case_offsets[-1] - self._case_offsets[0])
+
+    @property
+    def case_index(self):
+        """
+        Index of the trace to which each event belongs (cached)
+        """
+        if self._case_index is None:
+            self._case_index = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self._case_offsets))
+        return self._case_index
+
+    def get_codes(self, key):
+        """
+        Gets the integer codes of the values of an event attribute
+
+        Parameters
+        --------------
+        key
+            Attribute key
+
+        Returns
+        --------------
+        codes
+            NumPy array containing the code of the value for each event (-1 if the attribute is missing)
+        labels
+            List of values (the i-th value has code i)
+        """
+        column = self._columns.get(key)
+        if column is None:
+            return np.full(self.num_events, -1, dtype=np.int32), []
+        if isinstance(column, CategoricalColumn):
+            return column.codes, column.labels
+        label_index = {}
+        labels = []
+        codes = np.full(self.num_events, -1, dtype=np.int32)
+        for i in range(self.num_events):
+            if column.contains(i):
+                v = column.get(i)
+                if v not in label_index:
+                    label_index[v] = len(labels)
+                    labels.append(v)
+                codes[i] = label_index[v]
+        return codes, labels
+
+    def get_timestamps(self, key):
+        """
+        Gets the values of a timestamp attribute
+
+        Parameters
+        --------------
+        key
+            Attribute key
+
+        Returns
+        --------------
+        timestamps
+            NumPy datetime64[ns] array (UTC), NaT if the attribute is missing
+        """
+        column = self._columns.get(key)
+        if column is None:
+            return np.full(self.num_events, _NAT, dtype="datetime64[ns]")
+        if isinstance(column, TimestampColumn):
+            return column.values
+        values = np.full(self.num_events, _NAT, dtype="datetime64[ns]")
+        for i in range(self.num_events):
+            if column.contains(i):
+                values[i] = np.datetime64(datetime_to_ns(column.get(i)), "ns")
+        return values
+
+    def set_value(self, i, key, value):
+        """
+        Sets the value of an attribute for the i-th event of the log
+
+        Parameters
+        --------------
+        i
+            Event index (in the event arrays)
+        key
+            Attribute key
+        value
+            Value
+        """
+        column = self._columns.get(key)
+        if column is None:
+            column = empty_column(value, self.num_events)
+            self._columns[key] = column
+        if not column.set(i, value):
+            column = column.to_object()
+            self._columns[key] = column
+            column.set(i, value)
+
+    def take(self, indices):
+        """
+        Gets a columnar event log containing only the given traces (in the given order)
+
+        Parameters
+        --------------
+        indices
+            Indices of the traces
+
+        Returns
+        --------------
+        log
+            Columnar event log
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self._case_offsets[indices]
+        lengths = self._case_offsets[indices + 1] - starts
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        event_idx = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1], dtype=np.int64)
+        return ColumnarEventLog(offsets, {k: c.take(event_idx) for k, c in self._columns.items()},
+                                [self._trace_attributes[i] for i in indices], attributes=self._attributes,
+                                extensions=self._extensions, omni_present=self._omni,
+                                classifiers=self._classifiers)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return self.take(np.arange(start, stop, step))
+            stop = max(start, stop)
+            offsets = self._case_offsets[start:stop + 1]
+            ev_start, ev_stop = int(offsets[0]), int(offsets[-1])
+            return ColumnarEventLog(offsets - ev_start,
+                                    {k: c.slice(ev_start, ev_stop) for k, c in self._columns.items()},
+                                    self._trace_attributes[start:stop], attributes=self._attributes,
+                                    extensions=self._extensions, omni_present=self._omni,
+                                    classifiers=self._classifiers)
+        n = len(self)
+        if key < 0:
+            key += n
+        if key < 0 or key >= n:
+            raise IndexError("log index out of range")
+        return ColumnarTrace(self, key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield ColumnarTrace(self, i)
+
+    def __len__(self):
+        return len(self._case_offsets) - 1
+
+    def __reversed__(self):
+        for i in range(len(self) - 1, -1, -1):
+            yield ColumnarTrace(self, i)
+
+    def __contains__(self, item):
+        if isinstance(item, ColumnarTrace):
+            return item._log is self
+        return False
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def index(self, x, start=0, end=None):
+        return Sequence.index(self, x, start, end)
+
+    def count(self, x):
+        return Sequence.count(self, x)
+
+    def __setitem__(self, key, value):
+        raise TypeError("columnar logs do not support structural changes, convert the log to an EventLog first")
+
+    def append(self, x):
+        raise TypeError("columnar logs do not support structural changes, convert the log to an EventLog first")
+
+    def __repr__(self):
+        n = len(self)
+        if n == 0:
+            ret = []
+        elif n == 1:
+            ret = [self[0].__repr__(ret_list=True)]
+        else:
+            ret = [self[0].__repr__(ret_list=True), "....", self[-1].__repr__(ret_list=True)]
+        return str(ret)
+
+    def __copy__(self):
+        return ColumnarEventLog(self._case_offsets, copy.copy(self._columns), self._trace_attributes,
+                                attributes=copy.copy(self._attributes), extensions=copy.copy(self._extensions),
+                                omni_present=copy.copy(self._omni), classifiers=copy.copy(self._classifiers))
+
+    def __deepcopy__(self, memo):
+        return EventLog([trace.__deepcopy__(memo) for trace in self],
+                        attributes=copy.deepcopy(self._attributes, memo),
+                        extensions=copy.deepcopy(self._extensions, memo),
+                        omni_present=copy.deepcopy(self._omni, memo),
+                        classifiers=copy.deepcopy(self._classifiers, memo))
+
+
+def __missing_like(column, length):
+    """
+    Creates a column of the same kind of the provided one, in which no event has the attribute set
+    """
+    if isinstance(column, CategoricalColumn):
+        return CategoricalColumn(np.full(length, -1, dtype=np.int32), [])
+    if isinstance(column, TimestampColumn):
+        return TimestampColumn(np.full(length, _NAT, dtype="datetime64[ns]"), tz_aware=column.tz_aware)
+    if isinstance(column, NumericColumn):
+        return NumericColumn(np.zeros(length, dtype=column.values.dtype), np.zeros(length, dtype=bool))
+    values = np.empty(length, dtype=object)
+    values.fill(MISSING)
+    return ObjectColumn(values)
+
+
+def __concat_columns(columns):
+    """
+    Concatenates a list of columns, choosing the most compact kind able to store all of them
+    """
+    kinds = set(type(c) for c in columns)
+    if kinds == {CategoricalColumn}:
+        labels = []
+        label_index = {}
+        codes = []
+        for c in columns:
+            remap = np.empty(len(c.labels) + 1, dtype=np.int32)
+            remap[-1] = -1
+            for i, l in enumerate(c.labels):
+                if l not in label_index:
+                    label_index[l] = len(labels)
+                    labels.append(l)
+                remap[i] = label_index[l]
+            codes.append(remap[c.codes])
+        return CategoricalColumn(np.concatenate(codes), labels, label_index)
+    if kinds == {TimestampColumn}:
+        return TimestampColumn(np.concatenate([c.values for c in columns]),
+                               tz_aware=any(c.tz_aware for c in columns))
+    if kinds == {NumericColumn} and len(set(c.values.dtype for c in columns)) == 1:
+        if all(c.present is None for c in columns):
+            return NumericColumn(np.concatenate([c.values for c in columns]))
+        return NumericColumn(np.concatenate([c.values for c in columns]), np.concatenate(
+            [c.present if c.present is not None else np.ones(len(c.values), dtype=bool) for c in columns]))
+    return ObjectColumn(np.concatenate([c.to_object().values for c in columns]))
+
+
+def concat(logs):
+    """
+    Concatenates the traces of several columnar event logs into a single columnar event log
+    (log-level attributes, extensions, globals and classifiers are taken from the first log)
+
+    Parameters
+    --------------
+    logs
+        List of columnar event logs
+
+    Returns
+    --------------
+    log
+        Columnar event log
+    """
+    if not logs:
+        return ColumnarEventLog()
+    offsets = [np.zeros(1, dtype=np.int64)]
+    shift = 0
+    for log in logs:
+        offsets.append(log.case_offsets[1:] - log.case_offsets[0] + shift)
+        shift += log.num_events
+    keys = []
+    for log in logs:
+        for k in log.columns:
+            if k not in keys:
+                keys.append(k)
+    columns = {}
+    for k in keys:
+        reference = next(log.columns[k] for log in logs if k in log.columns)
+        columns[k] = __concat_columns(
+            [log.columns[k] if k in log.columns else __missing_like(reference, log.num_events) for log in logs])
+    trace_attributes = []
+    for log in logs:
+        trace_attributes.extend(log.trace_attributes)
+    first = logs[0]
+    return ColumnarEventLog(np.concatenate(offsets), columns, trace_attributes, attributes=first.attributes,
+                            extensions=first.extensions, omni_present=first.omni_present,
+                            classifiers=first.classifiers)
@@ -0,0 +1,83 @@
+import os
+import pickle
+import shutil
+import uuid
+from enum import Enum
+
+import numpy as np
+
+from pm4py.objects.conversion.log.variants import to_columnar
+from pm4py.objects.log.columnar import CategoricalColumn, TimestampColumn, NumericColumn
+from pm4py.util import exec_utils
+
+FORMAT_VERSION = 1
+METADATA_FILE = "metadata.pickle"
+
+
+class Parameters(Enum):
+    METADATA = "metadata"
+
+
+def apply(log, output_path, parameters=None):
+    """
+    Exports a log object into a columnar bundle, i.e., a folder containing:
+    - a NumPy .npy file for the case offsets and for every array of the columns of the log
+    (that can be memory-mapped when the bundle is imported)
+    - a metadata file (pickle) containing the labels of the categorical columns, the columns
+    of generic Python objects, the trace attributes and the log-level attributes
+
+    The bundle is written in a temporary folder that is then renamed, so a reader never sees a partial bundle.
+
+    Parameters
+    -------------
+    log
+        Log object (event log, event stream, dataframe or columnar event log)
+    output_path
+        Path of the folder of the bundle (replaced if it exists)
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.METADATA => dictionary of additional information to store in the bundle (default: empty)
+    """
+    if parameters is None:
+        parameters = {}
+
+    metadata = exec_utils.get_param_value(Parameters.METADATA, parameters, {})
+
+    log = to_columnar.apply(log, parameters=parameters)
+
+    output_path = os.path.abspath(output_path)
+    tmp_path = output_path + "." + uuid.uuid4().hex + ".tmp"
+    os.makedirs(tmp_path)
+
+    try:
+        np.save(os.path.join(tmp_path, "case_offsets.npy"), log.case_offsets - log.case_offsets[0])
+        columns = []
+        for i, (key, column) in enumerate(log.columns.items()):
+            prefix = os.path.join(tmp_path, "col" + str(i))
+            if isinstance(column, CategoricalColumn):
+                np.save(prefix + "_codes.npy", column.codes)
+                columns.append({"key": key, "kind": "categorical", "labels": list(column.labels)})
+            elif isinstance(column, TimestampColumn):
+                np.save(prefix + "_values.npy", column.values)
+                columns.append({"key": key, "kind": "timestamp", "tz_aware": column.tz_aware})
+            elif isinstance(column, NumericColumn):
+                np.save(prefix + "_values.npy", column.values)
+                if column.present is not None:
+                    np.save(prefix + "_present.npy", column.present)
+                columns.append({"key": key, "kind": "numeric", "has_present": column.present is not None})
+            else:
+                columns.append({"key": key, "kind": "object", "values": column.to_object().values})
+
+        with open(os.path.join(tmp_path, METADATA_FILE), "wb") as f:
+            pickle.dump({"version": FORMAT_VERSION, "columns": columns,
+                         "trace_attributes": list(log.trace_attributes),
+                         "attributes": log.attributes, "extensions": log.extensions,
+                         "omni_present": log.omni_present, "classifiers": log.classifiers,
+                         "metadata": metadata}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if os.path.isdir(output_path):
+            shutil.rmtree(output_path, ignore_errors=True)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.isdir(tmp_path):
+            shutil.rmtree(tmp_path, ignore_errors=True)
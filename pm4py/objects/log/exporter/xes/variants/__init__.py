@@ -1 +1,6 @@
-from pm4py.objects.log.exporter.xes.variants import etree_xes_exp, line_by_line
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["etree_xes_exp", "line_by_line"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -0,0 +1,82 @@
+import os
+import pickle
+from enum import Enum
+
+import numpy as np
+
+from pm4py.objects.log.columnar import ColumnarEventLog, CategoricalColumn, TimestampColumn, NumericColumn, \
+    ObjectColumn
+from pm4py.objects.log.exporter.columnar.exporter import FORMAT_VERSION, METADATA_FILE
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    MEMORY_MAP = "memory_map"
+
+
+def apply(path, parameters=None):
+    """
+    Imports a columnar bundle (written by pm4py.objects.log.exporter.columnar) into a columnar event log
+
+    Parameters
+    -------------
+    path
+        Path of the folder of the bundle
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.MEMORY_MAP => memory-maps the arrays of the bundle instead of reading them (default: True).
+            The arrays are mapped copy-on-write, so changes to the log are never written back to the bundle.
+
+    Returns
+    -------------
+    log
+        Columnar event log (:class:`pm4py.objects.log.columnar.ColumnarEventLog`)
+    """
+    if parameters is None:
+        parameters = {}
+
+    memory_map = exec_utils.get_param_value(Parameters.MEMORY_MAP, parameters, True)
+    mmap_mode = "c" if memory_map else None
+
+    metadata = get_metadata(path)
+    if metadata["version"] > FORMAT_VERSION:
+        raise Exception("unsupported version of the columnar format: " + str(metadata["version"]))
+
+    case_offsets = np.load(os.path.join(path, "case_offsets.npy"), mmap_mode=mmap_mode)
+    columns = {}
+    for i, column in enumerate(metadata["columns"]):
+        prefix = os.path.join(path, "col" + str(i))
+        if column["kind"] == "categorical":
+            columns[column["key"]] = CategoricalColumn(np.load(prefix + "_codes.npy", mmap_mode=mmap_mode),
+                                                       column["labels"])
+        elif column["kind"] == "timestamp":
+            columns[column["key"]] = TimestampColumn(np.load(prefix + "_values.npy", mmap_mode=mmap_mode),
+                                                     tz_aware=column["tz_aware"])
+        elif column["kind"] == "numeric":
+            present = np.load(prefix + "_present.npy", mmap_mode=mmap_mode) if column["has_present"] else None
+            columns[column["key"]] = NumericColumn(np.load(prefix + "_values.npy", mmap_mode=mmap_mode), present)
+        else:
+            columns[column["key"]] = ObjectColumn(column["values"])
+
+    return ColumnarEventLog(case_offsets, columns, metadata["trace_attributes"], attributes=metadata["attributes"],
+                            extensions=metadata["extensions"], omni_present=metadata["omni_present"],
+                            classifiers=metadata["classifiers"])
+
+
+def get_metadata(path):
+    """
+    Reads the metadata of a columnar bundle
+
+    Parameters
+    -------------
+    path
+        Path of the folder of the bundle
+
+    Returns
+    -------------
+    metadata
+        Dictionary containing the description of the columns, the trace attributes, the log-level attributes,
+        and (under the key "metadata") the additional information provided at export time
+    """
+    with open(os.path.join(path, METADATA_FILE), "rb") as f:
+        return pickle.load(f)
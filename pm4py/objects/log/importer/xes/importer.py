@@ -1,14 +1,20 @@
+import hashlib
+import os
 import pkgutil
+import shutil
 from enum import Enum
 
-from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed
+from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, \
+    iterparse_parallel
 from pm4py.objects.log.util import compression
+from pm4py.util import exec_utils
 
 
 class Variants(Enum):
     ITERPARSE = iterparse
     LINE_BY_LINE = line_by_line
     ITERPARSE_MEM_COMPRESSED = iterparse_mem_compressed
+    ITERPARSE_PARALLEL = iterparse_parallel
 
 
 if pkgutil.find_loader("lxml"):
@@ -16,6 +22,13 @@ if pkgutil.find_loader("lxml"):
 else:
     DEFAULT_VARIANT = Variants.LINE_BY_LINE
 
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pm4py", "log_cache")
+
+
+class Parameters(Enum):
+    ENABLE_CACHE = "enable_cache"
+    CACHE_DIR = "cache_dir"
+
 
 def apply(path, parameters=None, variant=DEFAULT_VARIANT):
     """
@@ -32,16 +45,35 @@ def apply(path, parameters=None, variant=DEFAULT_VARIANT):
             Parameters.REVERSE_SORT -> Specify in which direction the log should be sorted
             Parameters.INSERT_TRACE_INDICES -> Specify if trace indexes should be added as event attribute for each event
             Parameters.MAX_TRACES -> Specify the maximum number of traces to import from the log (read in order in the XML file)
+            Parameters.ENABLE_CACHE -> Keeps the parsed log in an on-disk cache (columnar format), keyed by the path,
+            the modification time and the size of the file (and by the variant and the parameters of the import).
+            When enabled, a columnar event log is returned (default: False)
+            Parameters.CACHE_DIR -> Folder of the cache (default: ~/.pm4py/log_cache)
     variant
         Variant of the algorithm to use, including:
             - Variants.ITERPARSE
             - Variants.LINE_BY_LINE
+            - Variants.ITERPARSE_MEM_COMPRESSED
+            - Variants.ITERPARSE_PARALLEL (single read of the file, traces parsed by a process pool)
 
     Returns
     -----------
     log
         Trace log object
     """
+    if parameters is None:
+        parameters = {}
+
+    if exec_utils.get_param_value(Parameters.ENABLE_CACHE, parameters, False):
+        return __apply_cached(path, parameters, variant)
+
+    return __apply(path, parameters, variant)
+
+
+def __apply(path, parameters, variant):
+    """
+    Imports a XES log (without using the cache)
+    """
     # supporting .xes.gz file types
     if path.endswith("gz"):
         path = compression.decompress(path)
@@ -55,6 +87,66 @@ def apply(path, parameters=None, variant=DEFAULT_VARIANT):
     return variant.value.apply(path, parameters=parameters)
 
 
+def __get_cache_entry(path, parameters, variant):
+    """
+    Gets the name of the cache entry of a XES file.
+    The first part of the name depends on the file and on the import settings, the second part on the current
+    version of the file (modification time and size)
+    """
+    stat = os.stat(path)
+    variant_name = variant.name if isinstance(variant, Enum) else str(variant)
+    settings = sorted((str(k.value if isinstance(k, Enum) else k), repr(v)) for k, v in parameters.items()
+                      if k not in [Parameters.ENABLE_CACHE, Parameters.ENABLE_CACHE.value, Parameters.CACHE_DIR,
+                                   Parameters.CACHE_DIR.value])
+    key = hashlib.sha1(repr((os.path.abspath(path), variant_name, settings)).encode("utf-8")).hexdigest()
+    version = hashlib.sha1(repr((stat.st_mtime_ns, stat.st_size)).encode("utf-8")).hexdigest()
+    return key[:20], version[:20]
+
+
+def __apply_cached(path, parameters, variant):
+    """
+    Imports a XES log through the on-disk cache.
+    If the cache contains the current version of the file, the columnar bundle is memory-mapped;
+    otherwise, the file is parsed, and the log is stored in the cache (replacing the older versions of the file)
+    """
+    from pm4py.objects.log.exporter.columnar import exporter as columnar_exporter
+    from pm4py.objects.log.importer.columnar import importer as columnar_importer
+    from pm4py.objects.conversion.log.variants import to_columnar
+
+    cache_dir = exec_utils.get_param_value(Parameters.CACHE_DIR, parameters, DEFAULT_CACHE_DIR)
+    key, version = __get_cache_entry(path, parameters, variant)
+    entry = os.path.join(cache_dir, key + "_" + version)
+
+    if os.path.isdir(entry):
+        return columnar_importer.apply(entry)
+
+    log = to_columnar.apply(__apply(path, parameters, variant))
+    os.makedirs(cache_dir, exist_ok=True)
+    for name in os.listdir(cache_dir):
+        if name.startswith(key + "_") and name != key + "_" + version and not name.endswith(".tmp"):
+            shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+    columnar_exporter.apply(log, entry)
+    return columnar_importer.apply(entry)
+
+
+def clear_cache(parameters=None):
+    """
+    Removes all the entries of the on-disk cache of the XES importer
+
+    Parameters
+    -----------
+    parameters
+        Parameters, including:
+            Parameters.CACHE_DIR -> Folder of the cache (default: ~/.pm4py/log_cache)
+    """
+    if parameters is None:
+        parameters = {}
+
+    cache_dir = exec_utils.get_param_value(Parameters.CACHE_DIR, parameters, DEFAULT_CACHE_DIR)
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
 def deserialize(log_string, parameters=None, variant=DEFAULT_VARIANT):
     """
     Deserialize a text/binary string representing a XES log
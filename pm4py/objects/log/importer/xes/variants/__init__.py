@@ -1 +1,6 @@
-from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["iterparse", "line_by_line", "iterparse_mem_compressed", "iterparse_parallel"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
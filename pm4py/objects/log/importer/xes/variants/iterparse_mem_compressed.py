@@ -16,6 +16,7 @@ class Parameters(Enum):
     TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
     REVERSE_SORT = "reverse_sort"
     MAX_TRACES = "max_traces"
+    SHOW_PROGRESS_BAR = "show_progress_bar"
 
 
 # ITERPARSE EVENTS
@@ -75,10 +76,11 @@ def import_from_context(context, num_traces, parameters=None):
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
                                                xes_constants.DEFAULT_TIMESTAMP_KEY)
     reverse_sort = exec_utils.get_param_value(Parameters.REVERSE_SORT, parameters, False)
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
 
     date_parser = dt_parser.get()
     progress = None
-    if pkgutil.find_loader("tqdm"):
+    if pkgutil.find_loader("tqdm") and show_progress_bar:
         from tqdm.auto import tqdm
         progress = tqdm(total=num_traces, desc="parsing log, completed traces :: ")
 
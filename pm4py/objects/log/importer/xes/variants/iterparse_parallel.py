@@ -0,0 +1,345 @@
+import mmap
+import os
+import pkgutil
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from io import BytesIO
+
+import numpy as np
+
+from pm4py.objects.log.importer.xes.variants import iterparse_mem_compressed
+from pm4py.objects.log.log import EventLog
+from pm4py.objects.log.util import sorting
+from pm4py.util import exec_utils, constants
+from pm4py.util import xes_constants
+
+
+class Parameters(Enum):
+    TIMESTAMP_SORT = "timestamp_sort"
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    REVERSE_SORT = "reverse_sort"
+    MAX_TRACES = "max_traces"
+    NUM_WORKERS = "num_workers"
+    CHUNKS_PER_WORKER = "chunks_per_worker"
+    MIN_CHUNK_SIZE = "min_chunk_size"
+    RETURN_COLUMNAR = "return_columnar"
+    SHOW_PROGRESS_BAR = "show_progress_bar"
+
+
+# ITERPARSE EVENTS
+_EVENT_END = 'end'
+_EVENT_START = 'start'
+
+_TRACE_OPEN = b"<" + xes_constants.TAG_TRACE.encode(constants.DEFAULT_ENCODING)
+_TRACE_CLOSE = b"</" + xes_constants.TAG_TRACE.encode(constants.DEFAULT_ENCODING) + b">"
+_LOG_TAG = re.compile(rb"<log[\s>][^>]*>")
+
+
+def __find_trace_start(mm, position, end):
+    """
+    Finds the first <trace> opening tag starting from the given position
+    (reading only the bytes that are needed to find it)
+
+    Parameters
+    -------------
+    mm
+        Memory-mapped file
+    position
+        Starting position
+    end
+        End of the region in which the search is done
+
+    Returns
+    -------------
+    position
+        Position of the opening tag (-1 if not found)
+    """
+    while True:
+        position = mm.find(_TRACE_OPEN, position, end)
+        if position < 0 or position + len(_TRACE_OPEN) >= len(mm):
+            return -1
+        following = mm[position + len(_TRACE_OPEN):position + len(_TRACE_OPEN) + 1]
+        if following.isspace() or following == b">":
+            return position
+        position = position + len(_TRACE_OPEN)
+
+
+def __find_nth_trace_start(mm, n, start, end):
+    """
+    Finds the position of the n-th <trace> opening tag (if any) of the given region
+    """
+    position = start
+    for i in range(n):
+        position = __find_trace_start(mm, position + 1, end)
+        if position < 0:
+            return -1
+    return position
+
+
+def get_chunks(filename, num_chunks, min_chunk_size=1 << 20, max_traces=sys.maxsize):
+    """
+    Splits a XES file at trace boundaries, seeking to evenly spaced positions and looking for the
+    next <trace> tag (so, only a small window around each boundary is read)
+
+    Parameters
+    -------------
+    filename
+        Path to the XES file
+    num_chunks
+        Desired number of chunks
+    min_chunk_size
+        Minimum size (in bytes) of a chunk
+    max_traces
+        Maximum number of traces to import (read in order in the XML file)
+
+    Returns
+    -------------
+    header
+        Bytes of the file preceding the first trace
+    footer
+        Bytes of the file following the last trace
+    chunks
+        List of (start, end) byte ranges, each one containing only complete traces
+    """
+    with open(filename, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return b"", b"", []
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            first = __find_trace_start(mm, 0, size)
+            if first < 0:
+                return mm[:], b"", []
+            last = mm.rfind(_TRACE_CLOSE)
+            end = last + len(_TRACE_CLOSE) if last > first else size
+            footer = mm[end:] if end < size else b"</log>"
+            if max_traces < sys.maxsize:
+                cut = __find_nth_trace_start(mm, max_traces, first, end) if max_traces > 0 else first
+                if cut >= 0:
+                    end = cut
+                    footer = b"</log>"
+            header = mm[:first]
+            num_chunks = max(1, min(num_chunks, (end - first) // max(min_chunk_size, 1)))
+            boundaries = [first]
+            for i in range(1, num_chunks):
+                target = first + (end - first) * i // num_chunks
+                if target <= boundaries[-1]:
+                    continue
+                position = __find_trace_start(mm, target, end)
+                if position < 0:
+                    break
+                if position > boundaries[-1]:
+                    boundaries.append(position)
+            boundaries.append(end)
+            chunks = [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1) if
+                      boundaries[i + 1] > boundaries[i]]
+            return header, footer, chunks
+        finally:
+            mm.close()
+
+
+def __parse_bytes(content, parameters):
+    """
+    Parses a XES document contained in a bytes string
+    """
+    from lxml import etree
+
+    context = etree.iterparse(BytesIO(content), events=[_EVENT_START, _EVENT_END])
+    parameters = dict(parameters)
+    parameters[iterparse_mem_compressed.Parameters.SHOW_PROGRESS_BAR] = False
+    parameters[iterparse_mem_compressed.Parameters.TIMESTAMP_SORT] = False
+    return iterparse_mem_compressed.import_from_context(context, None, parameters=parameters)
+
+
+def parse_chunk(filename, start, end, prefix, return_columnar, parameters):
+    """
+    Parses the traces contained in a byte range of a XES file
+    (executed in the worker processes)
+
+    Parameters
+    -------------
+    filename
+        Path to the XES file
+    start
+        Start of the byte range
+    end
+        End of the byte range
+    prefix
+        Bytes of the file up to the opening <log> tag, included (wrapping the traces, keeping the XML
+        declaration with the encoding of the file and the namespace declarations)
+    return_columnar
+        Returns a columnar event log (compact to transfer between processes)
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -------------
+    log
+        Event log containing the traces of the chunk
+    """
+    with open(filename, "rb") as f:
+        f.seek(start)
+        content = f.read(end - start)
+    log = __parse_bytes(prefix + content + b"</log>", parameters)
+    if return_columnar:
+        from pm4py.objects.conversion.log.variants import to_columnar
+        log = to_columnar.apply(log)
+    return log
+
+
+def import_log(filename, parameters=None):
+    """
+    Imports an XES file into a log object, reading it once and parsing the traces in parallel.
+
+    The file is split at trace boundaries into byte ranges, that are parsed by a pool of processes;
+    the header of the log (attributes, extensions, globals, classifiers) is parsed separately.
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename
+    parameters
+        Parameters of the algorithm, including
+            Parameters.TIMESTAMP_SORT -> Specify if we should sort log by timestamp
+            Parameters.TIMESTAMP_KEY -> If sort is enabled, then sort the log by using this key
+            Parameters.REVERSE_SORT -> Specify in which direction the log should be sorted
+            Parameters.MAX_TRACES -> Specify the maximum number of traces to import from the log (read in order in the XML file)
+            Parameters.NUM_WORKERS -> Number of worker processes (default: number of CPUs)
+            Parameters.CHUNKS_PER_WORKER -> Number of chunks assigned on average to each worker (default: 4)
+            Parameters.MIN_CHUNK_SIZE -> Minimum size of a chunk in bytes (default: 1 MB)
+            Parameters.RETURN_COLUMNAR -> Returns a columnar event log (default: False)
+            Parameters.SHOW_PROGRESS_BAR -> Shows a progress bar over the parsed chunks (default: True)
+
+    Returns
+    -------
+    log : :class:`pm4py.log.log.EventLog`
+        A log
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_no_traces_to_import = exec_utils.get_param_value(Parameters.MAX_TRACES, parameters, sys.maxsize)
+    timestamp_sort = exec_utils.get_param_value(Parameters.TIMESTAMP_SORT, parameters, False)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    reverse_sort = exec_utils.get_param_value(Parameters.REVERSE_SORT, parameters, False)
+    num_workers = exec_utils.get_param_value(Parameters.NUM_WORKERS, parameters, os.cpu_count() or 1)
+    chunks_per_worker = exec_utils.get_param_value(Parameters.CHUNKS_PER_WORKER, parameters, 4)
+    min_chunk_size = exec_utils.get_param_value(Parameters.MIN_CHUNK_SIZE, parameters, 1 << 20)
+    return_columnar = exec_utils.get_param_value(Parameters.RETURN_COLUMNAR, parameters, False)
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
+
+    worker_parameters = {iterparse_mem_compressed.Parameters.TIMESTAMP_KEY: timestamp_key}
+
+    header, footer, chunks = get_chunks(filename, num_workers * chunks_per_worker, min_chunk_size=min_chunk_size,
+                                        max_traces=max_no_traces_to_import)
+    log_header = __parse_bytes(header + footer, worker_parameters)
+    match = _LOG_TAG.search(header)
+    prefix = header[:match.end()] if match is not None else b"<log>"
+
+    if len(chunks) <= 1 or num_workers <= 1:
+        parts = [parse_chunk(filename, start, end, prefix, return_columnar, worker_parameters) for (start, end) in
+                 chunks]
+    else:
+        progress = None
+        if pkgutil.find_loader("tqdm") and show_progress_bar:
+            from tqdm.auto import tqdm
+            progress = tqdm(total=len(chunks), desc="parsing log, completed chunks :: ")
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(chunks))) as executor:
+            futures = [executor.submit(parse_chunk, filename, start, end, prefix, return_columnar,
+                                       worker_parameters) for (start, end) in chunks]
+            parts = []
+            for future in futures:
+                parts.append(future.result())
+                if progress is not None:
+                    progress.update()
+        # gracefully close progress bar
+        if progress is not None:
+            progress.close()
+        del progress
+
+    if return_columnar:
+        from pm4py.objects.log import columnar
+        from pm4py.objects.conversion.log.variants import to_columnar
+        log = columnar.concat([to_columnar.apply(log_header)] + parts)
+        log._attributes = log_header.attributes
+        log._extensions = log_header.extensions
+        log._omni = log_header.omni_present
+        log._classifiers = log_header.classifiers
+        if timestamp_sort:
+            log = __sort_columnar(log, timestamp_key, reverse_sort)
+        return log
+
+    log = EventLog(list(log_header) + [trace for part in parts for trace in part], attributes=log_header.attributes,
+                   extensions=log_header.extensions, omni_present=log_header.omni_present,
+                   classifiers=log_header.classifiers)
+    if timestamp_sort:
+        log = sorting.sort_timestamp(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort)
+    return log
+
+
+def __sort_columnar(log, timestamp_key, reverse_sort):
+    """
+    Sorts a columnar event log by timestamp: the events inside each trace, and then the traces
+    by the timestamp of their first event (empty traces are removed)
+    """
+    timestamps = log.get_timestamps(timestamp_key).astype(np.int64)
+    case_index = log.case_index
+    keys = -timestamps if reverse_sort else timestamps
+    event_order = np.lexsort((keys, case_index))
+    non_empty = np.nonzero(np.diff(log.case_offsets) > 0)[0]
+    first_keys = keys[event_order[log.case_offsets[non_empty]]]
+    trace_order = non_empty[np.argsort(first_keys, kind="stable")]
+    sorted_events = type(log)(log.case_offsets, {k: c.take(event_order) for k, c in log.columns.items()},
+                              log.trace_attributes, attributes=log.attributes, extensions=log.extensions,
+                              omni_present=log.omni_present, classifiers=log.classifiers)
+    return sorted_events.take(trace_order)
+
+
+def apply(filename, parameters=None):
+    """
+    Imports an XES file into a log object, parsing the traces in parallel
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename
+    parameters
+        Parameters of the algorithm (see import_log)
+
+    Returns
+    -------
+    log : :class:`pm4py.log.log.EventLog`
+        A log
+    """
+    return import_log(filename, parameters)
+
+
+def import_from_string(log_string, parameters=None):
+    """
+    Deserialize a text/binary string representing a XES log
+    (the string is parsed in the current process)
+
+    Parameters
+    -----------
+    log_string
+        String that contains the XES
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------
+    log
+        Trace log object
+    """
+    if parameters is None:
+        parameters = {}
+
+    return_columnar = exec_utils.get_param_value(Parameters.RETURN_COLUMNAR, parameters, False)
+    log = iterparse_mem_compressed.import_from_string(log_string, parameters=parameters)
+    if return_columnar:
+        from pm4py.objects.conversion.log.variants import to_columnar
+        log = to_columnar.apply(log)
+    return log
@@ -1,7 +1,13 @@
-from pm4py.objects.log.util import compression, insert_classifier, log, sampling, \
-    sorting, index_attribute, get_class_representation, get_log_representation, get_prefixes, \
-    get_log_encoded, interval_lifecycle, log_regex, basic_filter, func
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["compression", "insert_classifier", "log", "sampling", "sorting", "index_attribute",
+           "get_class_representation", "get_log_representation", "get_prefixes", "get_log_encoded",
+           "interval_lifecycle", "log_regex", "basic_filter", "func", "arrays"]
+
 if pkgutil.find_loader("pandas"):
-    from pm4py.objects.log.util import prefix_matrix, dataframe_utils
+    __all__.extend(["prefix_matrix", "dataframe_utils"])
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
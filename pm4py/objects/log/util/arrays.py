@@ -0,0 +1,126 @@
+from datetime import timezone
+
+import numpy as np
+
+from pm4py.objects.log.columnar import ColumnarEventLog
+from pm4py.util import xes_constants as xes
+
+
+def get_case_offsets(log):
+    """
+    Gets the CSR-style offsets of the traces of an event log
+    (the events of the i-th trace are the ones in the range offsets[i]:offsets[i+1])
+
+    Parameters
+    -------------
+    log
+        Event log
+
+    Returns
+    -------------
+    offsets
+        NumPy int64 array of length len(log) + 1
+    """
+    if isinstance(log, ColumnarEventLog):
+        return log.case_offsets
+    offsets = np.zeros(len(log) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(trace) for trace in log), dtype=np.int64, count=len(log)), out=offsets[1:])
+    return offsets
+
+
+def get_case_index(offsets):
+    """
+    Gets, for each event, the index of the trace to which it belongs
+
+    Parameters
+    -------------
+    offsets
+        Offsets of the traces
+
+    Returns
+    -------------
+    case_index
+        NumPy int64 array with an entry per event
+    """
+    return np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))
+
+
+def encode_attribute(log, attribute_key=xes.DEFAULT_NAME_KEY, allow_missing=False):
+    """
+    Integer-encodes the values of an event attribute, in a single pass over the events
+    (the codes are assigned by order of first appearance)
+
+    Parameters
+    -------------
+    log
+        Event log (or columnar event log, for which the stored codes are returned without copying)
+    attribute_key
+        Attribute to encode (default: concept:name)
+    allow_missing
+        If True, the events without the attribute get the code -1 (otherwise, a KeyError is raised)
+
+    Returns
+    -------------
+    codes
+        NumPy int64 array containing the code of every event (in trace order)
+    labels
+        List of values (the i-th value has code i)
+    offsets
+        Offsets of the traces
+
+    Raises
+    -------------
+    KeyError
+        If the attribute is missing for some event (and allow_missing is False)
+    """
+    if isinstance(log, ColumnarEventLog):
+        codes, labels = log.get_codes(attribute_key)
+        if not allow_missing and len(codes) > 0 and codes.min() < 0:
+            raise KeyError(attribute_key)
+        return codes.astype(np.int64, copy=False), labels, log.case_offsets
+    offsets = get_case_offsets(log)
+    label_index = {}
+    if allow_missing:
+        values = (event[attribute_key] if attribute_key in event else None for trace in log for event in trace)
+        codes = np.fromiter((label_index.setdefault(v, len(label_index)) if v is not None else -1 for v in values),
+                            dtype=np.int64, count=int(offsets[-1]))
+    else:
+        codes = np.fromiter((label_index.setdefault(event[attribute_key], len(label_index)) for trace in log
+                             for event in trace), dtype=np.int64, count=int(offsets[-1]))
+    labels = list(label_index)
+    return codes, labels, offsets
+
+
+def get_timestamps(log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY):
+    """
+    Gets the values of a timestamp attribute, as integer microseconds since the epoch (UTC)
+
+    Parameters
+    -------------
+    log
+        Event log (or columnar event log)
+    timestamp_key
+        Timestamp attribute
+
+    Returns
+    -------------
+    timestamps
+        NumPy int64 array containing the timestamp of every event (in trace order)
+
+    Raises
+    -------------
+    KeyError
+        If the attribute is missing for some event
+    """
+    if isinstance(log, ColumnarEventLog):
+        values = log.get_timestamps(timestamp_key)
+        if np.isnat(values).any():
+            raise KeyError(timestamp_key)
+        return values.astype("datetime64[us]").astype(np.int64)
+    num_events = sum(len(trace) for trace in log)
+    # naive datetimes are considered to be UTC; the float seconds returned by timestamp() are exact
+    # at the microsecond level for the dates in the range 1685-2255
+    seconds = np.fromiter((timestamp.timestamp() if timestamp.tzinfo is not None else timestamp.replace(
+        tzinfo=timezone.utc).timestamp() for timestamp in (event[timestamp_key] for trace in log for event in trace)),
+                          dtype=np.float64, count=num_events)
+    return np.round(seconds * 10 ** 6).astype(np.int64)
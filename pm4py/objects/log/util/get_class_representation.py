@@ -1,5 +1,5 @@
 import numpy as np
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util import business_hours as bh_utils
 
 
 def get_class_representation_by_str_ev_attr_value_presence(log, str_attr_name, str_attr_value):
@@ -109,21 +109,30 @@ def get_class_representation_by_trace_duration(log, target_trace_duration, times
     business_hours = parameters["business_hours"] if "business_hours" in parameters else False
     worktiming = parameters["worktiming"] if "worktiming" in parameters else [7, 17]
     weekends = parameters["weekends"] if "weekends" in parameters else [6, 7]
+    holidays = parameters["holidays"] if "holidays" in parameters else None
 
     count = 0
     dictionary = {}
     target = []
     classes = []
 
-    for trace in log:
+    bh_durations = {}
+    if business_hours:
+        # computes at once the business hours durations of all the traces
+        idxs = [i for i, trace in enumerate(log) if
+                len(trace) > 0 and timestamp_key in trace[0] and timestamp_key in trace[-1]]
+        bh_durations = dict(zip(idxs, bh_utils.get_seconds([log[i][0][timestamp_key] for i in idxs],
+                                                           [log[i][-1][timestamp_key] for i in idxs],
+                                                           worktiming=worktiming, weekends=weekends,
+                                                           holidays=holidays).tolist()))
+
+    for index, trace in enumerate(log):
         value = "LESSEQUAL"
         if len(trace) > 0 and timestamp_key in trace[0] and timestamp_key in trace[-1]:
             timestamp_st = trace[0][timestamp_key]
             timestamp_et = trace[-1][timestamp_key]
             if business_hours:
-                bh = BusinessHours(timestamp_st.replace(tzinfo=None), timestamp_et.replace(tzinfo=None),
-                                   worktiming=worktiming, weekends=weekends)
-                diff = bh.getseconds()
+                diff = bh_durations[index]
             else:
                 diff = (timestamp_et - timestamp_st).total_seconds()
             if diff > target_trace_duration:
@@ -5,6 +5,7 @@ from pm4py.util import constants
 
 ENABLE_ACTIVITY_DEF_REPRESENTATION = "enable_activity_def_representation"
 ENABLE_SUCC_DEF_REPRESENTATION = "enable_succ_def_representation"
+SPARSE = "sparse"
 
 
 def get_string_trace_attribute_rep(trace, trace_attribute):
@@ -112,7 +113,7 @@ def get_all_string_event_attribute_values(log, event_attribute):
     """
     values = set()
     for trace in log:
-        values = values.union(get_values_event_attribute_for_trace(trace, event_attribute))
+        values.update(get_values_event_attribute_for_trace(trace, event_attribute))
     return list(sorted(values))
 
 
@@ -183,7 +184,7 @@ def get_all_string_event_succession_attribute_values(log, event_attribute):
     """
     values = set()
     for trace in log:
-        values = values.union(get_values_event_attribute_succession_for_trace(trace, event_attribute))
+        values.update(get_values_event_attribute_succession_for_trace(trace, event_attribute))
     return list(sorted(values))
 
 
@@ -293,7 +294,7 @@ def get_default_representation_with_attribute_names(log, parameters=None, featur
     log
         Trace log
     parameters
-        Possible parameters of the algorithm
+        Possible parameters of the algorithm (including SPARSE: returns the data as a CSR matrix)
     feature_names
         (If provided) Feature to use in the representation of the log
 
@@ -316,6 +317,7 @@ def get_default_representation_with_attribute_names(log, parameters=None, featur
     activity_key = parameters[
         constants.PARAMETER_CONSTANT_ACTIVITY_KEY] if constants.PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else xes.DEFAULT_NAME_KEY
     blacklist = parameters["blacklist"] if "blacklist" in parameters else []
+    sparse = parameters[SPARSE] if SPARSE in parameters else False
 
     str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr = select_attributes_from_log_for_tree(log)
     str_evsucc_attr = None
@@ -334,7 +336,7 @@ def get_default_representation_with_attribute_names(log, parameters=None, featur
 
     data, feature_names = get_representation(log, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr,
                                              str_evsucc_attr=str_evsucc_attr,
-                                             feature_names=feature_names)
+                                             feature_names=feature_names, sparse=sparse)
 
     return data, feature_names, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr
 
@@ -348,7 +350,7 @@ def get_default_representation(log, parameters=None, feature_names=None):
     log
         Trace log
     parameters
-        Possible parameters of the algorithm
+        Possible parameters of the algorithm (including SPARSE: returns the data as a CSR matrix)
     feature_names
         (If provided) Feature to use in the representation of the log
 
@@ -371,6 +373,7 @@ def get_default_representation(log, parameters=None, feature_names=None):
     activity_key = parameters[
         constants.PARAMETER_CONSTANT_ACTIVITY_KEY] if constants.PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else xes.DEFAULT_NAME_KEY
     blacklist = parameters["blacklist"] if "blacklist" in parameters else []
+    sparse = parameters[SPARSE] if SPARSE in parameters else False
 
     str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr = select_attributes_from_log_for_tree(log)
     str_evsucc_attr = None
@@ -388,11 +391,149 @@ def get_default_representation(log, parameters=None, feature_names=None):
         str_evsucc_attr = [x for x in str_evsucc_attr if x not in blacklist]
 
     return get_representation(log, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr, str_evsucc_attr=str_evsucc_attr,
-                              feature_names=feature_names)
+                              feature_names=feature_names, sparse=sparse)
+
+
+def get_feature_names(log, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr, str_evsucc_attr=None):
+    """
+    Gets the names of the features of the representation of the event log (in order)
+
+    Parameters
+    -------------
+    log
+        Trace log
+    str_tr_attr
+        List of string trace attributes to consider in data vector creation
+    str_ev_attr
+        List of string event attributes to consider in data vector creation
+    num_tr_attr
+        List of numeric trace attributes to consider in data vector creation
+    num_ev_attr
+        List of numeric event attributes to consider in data vector creation
+    str_evsucc_attr
+        List of attributes succession of values to consider in data vector creation
+
+    Returns
+    -------------
+    feature_names
+        Names of the features, in order
+    """
+    feature_names = []
+    for trace_attribute in str_tr_attr:
+        feature_names.extend(get_all_string_trace_attribute_values(log, trace_attribute))
+    for event_attribute in str_ev_attr:
+        feature_names.extend(get_all_string_event_attribute_values(log, event_attribute))
+    for trace_attribute in num_tr_attr:
+        feature_names.append(get_numeric_trace_attribute_rep(trace_attribute))
+    for event_attribute in num_ev_attr:
+        feature_names.append(get_numeric_event_attribute_rep(event_attribute))
+    if str_evsucc_attr:
+        for event_attribute in str_evsucc_attr:
+            feature_names.extend(get_all_string_event_succession_attribute_values(log, event_attribute))
+    return feature_names
+
+
+def __encode_trace(trace, dictionary, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr, str_evsucc_attr):
+    """
+    Gets the non-zero entries of the representation of a trace, as a dictionary associating
+    to the index of each feature its value
+    """
+    trace_rep = {}
+    for trace_attribute in str_tr_attr:
+        trace_attr_rep = get_string_trace_attribute_rep(trace, trace_attribute)
+        if trace_attr_rep in dictionary:
+            trace_rep[dictionary[trace_attr_rep]] = 1
+    for event_attribute in str_ev_attr:
+        values = get_values_event_attribute_for_trace(trace, event_attribute)
+        for value in values:
+            if value in dictionary:
+                trace_rep[dictionary[value]] = 1
+    for trace_attribute in num_tr_attr:
+        this_value = get_numeric_trace_attribute_rep(trace_attribute)
+        if this_value in dictionary:
+            trace_rep[dictionary[this_value]] = get_numeric_trace_attribute_value(
+                trace, trace_attribute)
+    for event_attribute in num_ev_attr:
+        this_value = get_numeric_event_attribute_rep(event_attribute)
+        if this_value in dictionary:
+            trace_rep[dictionary[this_value]] = get_numeric_event_attribute_value_trace(
+                trace, event_attribute)
+    if str_evsucc_attr:
+        for event_attribute in str_evsucc_attr:
+            values = get_values_event_attribute_succession_for_trace(trace, event_attribute)
+            for value in values:
+                if value in dictionary:
+                    trace_rep[dictionary[value]] = 1
+    return trace_rep
+
+
+def __to_csr(traces_rep, count):
+    """
+    Builds a CSR matrix from the non-zero entries of the representations of a list of traces
+    """
+    from scipy.sparse import csr_matrix
+
+    indptr = np.zeros(len(traces_rep) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(trace_rep) for trace_rep in traces_rep])
+    indices = np.fromiter((col for trace_rep in traces_rep for col in trace_rep), dtype=np.int64,
+                          count=int(indptr[-1]))
+    data = np.asarray([value for trace_rep in traces_rep for value in trace_rep.values()])
+    if len(data) == 0:
+        data = np.zeros(0, dtype=np.int64)
+    matrix = csr_matrix((data, indices, indptr), shape=(len(traces_rep), count))
+    matrix.sort_indices()
+    return matrix
+
+
+def get_representation_chunks(log, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr, str_evsucc_attr=None,
+                              feature_names=None, chunk_size=10000):
+    """
+    Iterates over the representation of the event log, returning for each chunk of traces a CSR matrix
+    (so only the representation of a chunk is kept in memory). The columns of the matrices are the
+    features returned by get_feature_names, unless feature_names is provided
+
+    Parameters
+    -------------
+    log
+        Trace log
+    str_tr_attr
+        List of string trace attributes to consider in data vector creation
+    str_ev_attr
+        List of string event attributes to consider in data vector creation
+    num_tr_attr
+        List of numeric trace attributes to consider in data vector creation
+    num_ev_attr
+        List of numeric event attributes to consider in data vector creation
+    str_evsucc_attr
+        List of attributes succession of values to consider in data vector creation
+    feature_names
+        (If provided) Feature to use in the representation of the log
+    chunk_size
+        Number of traces of each chunk
+
+    Returns
+    -------------
+    chunks
+        Generator of CSR matrices, each one containing the representation of (at most) chunk_size traces
+    """
+    if feature_names is None:
+        feature_names = get_feature_names(log, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr,
+                                          str_evsucc_attr=str_evsucc_attr)
+    dictionary = {value: index for index, value in enumerate(feature_names)}
+    count = len(feature_names)
+    traces_rep = []
+    for trace in log:
+        traces_rep.append(__encode_trace(trace, dictionary, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr,
+                                         str_evsucc_attr))
+        if len(traces_rep) >= chunk_size:
+            yield __to_csr(traces_rep, count)
+            traces_rep = []
+    if traces_rep:
+        yield __to_csr(traces_rep, count)
 
 
 def get_representation(log, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr, str_evsucc_attr=None,
-                       feature_names=None):
+                       feature_names=None, sparse=False):
     """
     Get a representation of the event log that is suited for the data part of the decision tree learning
 
@@ -414,6 +555,9 @@ def get_representation(log, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr,
         List of attributes succession of values to consider in data vector creation
     feature_names
         (If provided) Feature to use in the representation of the log
+    sparse
+        Returns the data as a CSR matrix (scipy.sparse), storing only the non-zero entries,
+        instead of a dense matrix
 
     Returns
     -------------
@@ -422,69 +566,20 @@ def get_representation(log, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr,
     feature_names
         Names of the features, in order
     """
-    data = []
-    dictionary = {}
-    count = 0
     if feature_names is None:
-        feature_names = []
-        for trace_attribute in str_tr_attr:
-            values = get_all_string_trace_attribute_values(log, trace_attribute)
-            for value in values:
-                dictionary[value] = count
-                feature_names.append(value)
-                count = count + 1
-        for event_attribute in str_ev_attr:
-            values = get_all_string_event_attribute_values(log, event_attribute)
-            for value in values:
-                dictionary[value] = count
-                feature_names.append(value)
-                count = count + 1
-        for trace_attribute in num_tr_attr:
-            dictionary[get_numeric_trace_attribute_rep(trace_attribute)] = count
-            feature_names.append(get_numeric_trace_attribute_rep(trace_attribute))
-            count = count + 1
-        for event_attribute in num_ev_attr:
-            dictionary[get_numeric_event_attribute_rep(event_attribute)] = count
-            feature_names.append(get_numeric_event_attribute_rep(event_attribute))
-            count = count + 1
-        if str_evsucc_attr:
-            for event_attribute in str_evsucc_attr:
-                values = get_all_string_event_succession_attribute_values(log, event_attribute)
-                for value in values:
-                    dictionary[value] = count
-                    feature_names.append(value)
-                    count = count + 1
-    else:
-        count = len(feature_names)
-        for index, value in enumerate(feature_names):
-            dictionary[value] = index
-    for trace in log:
-        trace_rep = [0] * count
-        for trace_attribute in str_tr_attr:
-            trace_attr_rep = get_string_trace_attribute_rep(trace, trace_attribute)
-            if trace_attr_rep in dictionary:
-                trace_rep[dictionary[trace_attr_rep]] = 1
-        for event_attribute in str_ev_attr:
-            values = get_values_event_attribute_for_trace(trace, event_attribute)
-            for value in values:
-                if value in dictionary:
-                    trace_rep[dictionary[value]] = 1
-        for trace_attribute in num_tr_attr:
-            this_value = get_numeric_trace_attribute_rep(trace_attribute)
-            if this_value in dictionary:
-                trace_rep[dictionary[this_value]] = get_numeric_trace_attribute_value(
-                    trace, trace_attribute)
-        for event_attribute in num_ev_attr:
-            this_value = get_numeric_event_attribute_rep(event_attribute)
-            if this_value in dictionary:
-                trace_rep[dictionary[this_value]] = get_numeric_event_attribute_value_trace(
-                    trace, event_attribute)
-        if str_evsucc_attr:
-            for event_attribute in str_evsucc_attr:
-                values = get_values_event_attribute_succession_for_trace(trace, event_attribute)
-                for value in values:
-                    if value in dictionary:
-                        trace_rep[dictionary[value]] = 1
-        data.append(trace_rep)
+        feature_names = get_feature_names(log, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr,
+                                          str_evsucc_attr=str_evsucc_attr)
+    dictionary = {value: index for index, value in enumerate(feature_names)}
+    count = len(feature_names)
+    traces_rep = [__encode_trace(trace, dictionary, str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr,
+                                 str_evsucc_attr) for trace in log]
+    if sparse:
+        return __to_csr(traces_rep, count), feature_names
+    data = []
+    for trace_rep in traces_rep:
+        row = [0] * count
+        for index, value in trace_rep.items():
+            row[index] = value
+        data.append(row)
     data = np.asarray(data)
     return data, feature_names
@@ -1,4 +1,4 @@
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util import business_hours as bh_utils
 from pm4py.objects.log.util import sorting
 from pm4py.util import constants
 from pm4py.util import xes_constants as xes
@@ -36,6 +36,7 @@ def to_interval(log, parameters=None):
     business_hours = parameters["business_hours"] if "business_hours" in parameters else False
     worktiming = parameters["worktiming"] if "worktiming" in parameters else [7, 17]
     weekends = parameters["weekends"] if "weekends" in parameters else [6, 7]
+    holidays = parameters["holidays"] if "holidays" in parameters else None
 
     if log is not None and len(log) > 0:
         if "PM4PY_TYPE" in log.attributes and log.attributes["PM4PY_TYPE"] == "interval":
@@ -48,6 +49,12 @@ def to_interval(log, parameters=None):
         new_log = EventLog()
         new_log.attributes["PM4PY_TYPE"] = "interval"
 
+        # the business hours durations are computed at once after visiting the log
+        new_traces = []
+        bh_events = []
+        bh_start_timestamps = []
+        bh_timestamps = []
+
         for trace in log:
             new_trace = Trace()
             for attr in trace.attributes:
@@ -74,14 +81,21 @@ def to_interval(log, parameters=None):
                     new_event["@@duration"] = (timestamp - start_timestamp).total_seconds()
 
                     if business_hours:
-                        bh = BusinessHours(start_timestamp.replace(tzinfo=None), timestamp.replace(tzinfo=None),
-                                           worktiming=worktiming,
-                                           weekends=weekends)
-                        new_event["@@approx_bh_duration"] = bh.getseconds()
+                        bh_events.append(new_event)
+                        bh_start_timestamps.append(start_timestamp)
+                        bh_timestamps.append(timestamp)
 
                     new_trace.append(new_event)
-            new_trace = sorting.sort_timestamp_trace(new_trace, start_timestamp_key)
-            new_log.append(new_trace)
+            new_traces.append(new_trace)
+
+        if bh_events:
+            bh_durations = bh_utils.get_seconds(bh_start_timestamps, bh_timestamps, worktiming=worktiming,
+                                                weekends=weekends, holidays=holidays).tolist()
+            for new_event, duration in zip(bh_events, bh_durations):
+                new_event["@@approx_bh_duration"] = duration
+
+        for new_trace in new_traces:
+            new_log.append(sorting.sort_timestamp_trace(new_trace, start_timestamp_key))
         return new_log
 
     return log
@@ -165,7 +179,7 @@ def assign_lead_cycle_time(log, parameters=None):
     log
         Interval log
     parameters
-        Parameters of the algorithm, including: start_timestamp_key, timestamp_key, worktiming, weekends
+        Parameters of the algorithm, including: start_timestamp_key, timestamp_key, worktiming, weekends, holidays
     """
     if parameters is None:
         parameters = {}
@@ -176,49 +190,71 @@ def assign_lead_cycle_time(log, parameters=None):
         constants.PARAMETER_CONSTANT_TIMESTAMP_KEY] if constants.PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else xes.DEFAULT_TIMESTAMP_KEY
     worktiming = parameters["worktiming"] if "worktiming" in parameters else [7, 17]
     weekends = parameters["weekends"] if "weekends" in parameters else [6, 7]
+    holidays = parameters["holidays"] if "holidays" in parameters else None
 
     interval_log = to_interval(log, parameters=parameters)
 
+    # first pass: collects the couples of timestamps for which the business hours are needed
+    # (the business hours of all the couples are then computed at once)
+    bh_starts = []
+    bh_ends = []
+    log_couples = []
     for trace in interval_log:
-        approx_partial_lead_time = 0
-        approx_partial_cycle_time = 0
-        approx_wasted_time = 0
+        trace_couples = []
         max_et = None
         max_et_seconds = 0
         for i in range(len(trace)):
-            this_wasted_time = 0
+            unworked_idx = None
+            duration_idx = None
             st = trace[i][start_timestamp_key]
             st_seconds = st.timestamp()
             et = trace[i][timestamp_key]
             et_seconds = et.timestamp()
 
             if max_et_seconds > 0 and st_seconds > max_et_seconds:
-                bh_unworked = BusinessHours(max_et.replace(tzinfo=None), st.replace(tzinfo=None),
-                                                           worktiming=worktiming, weekends=weekends)
-                unworked_sec = bh_unworked.getseconds()
-                approx_partial_lead_time = approx_partial_lead_time + unworked_sec
-                approx_wasted_time = approx_wasted_time + unworked_sec
-                this_wasted_time = unworked_sec
+                unworked_idx = len(bh_starts)
+                bh_starts.append(max_et)
+                bh_ends.append(st)
 
             if st_seconds > max_et_seconds:
-                bh = BusinessHours(st.replace(tzinfo=None), et.replace(tzinfo=None),
-                                                  worktiming=worktiming, weekends=weekends)
-                approx_bh_duration = bh.getseconds()
-
-                approx_partial_cycle_time = approx_partial_cycle_time + approx_bh_duration
-                approx_partial_lead_time = approx_partial_lead_time + approx_bh_duration
+                duration_idx = len(bh_starts)
+                bh_starts.append(st)
+                bh_ends.append(et)
             elif st_seconds < max_et_seconds and et_seconds > max_et_seconds:
-                bh = BusinessHours(max_et.replace(tzinfo=None), et.replace(tzinfo=None),
-                                                  worktiming=worktiming, weekends=weekends)
-                approx_bh_duration = bh.getseconds()
-
-                approx_partial_cycle_time = approx_partial_cycle_time + approx_bh_duration
-                approx_partial_lead_time = approx_partial_lead_time + approx_bh_duration
+                duration_idx = len(bh_starts)
+                bh_starts.append(max_et)
+                bh_ends.append(et)
 
             if et_seconds > max_et_seconds:
                 max_et_seconds = et_seconds
                 max_et = et
 
+            trace_couples.append((unworked_idx, duration_idx))
+        log_couples.append(trace_couples)
+
+    bh_seconds = bh_utils.get_seconds(bh_starts, bh_ends, worktiming=worktiming, weekends=weekends,
+                                      holidays=holidays).tolist()
+
+    for trace, trace_couples in zip(interval_log, log_couples):
+        approx_partial_lead_time = 0
+        approx_partial_cycle_time = 0
+        approx_wasted_time = 0
+        for i in range(len(trace)):
+            this_wasted_time = 0
+            unworked_idx, duration_idx = trace_couples[i]
+
+            if unworked_idx is not None:
+                unworked_sec = bh_seconds[unworked_idx]
+                approx_partial_lead_time = approx_partial_lead_time + unworked_sec
+                approx_wasted_time = approx_wasted_time + unworked_sec
+                this_wasted_time = unworked_sec
+
+            if duration_idx is not None:
+                approx_bh_duration = bh_seconds[duration_idx]
+
+                approx_partial_cycle_time = approx_partial_cycle_time + approx_bh_duration
+                approx_partial_lead_time = approx_partial_lead_time + approx_bh_duration
+
             ratio_cycle_lead_time = 1
             if approx_partial_lead_time > 0:
                 ratio_cycle_lead_time = approx_partial_cycle_time / approx_partial_lead_time
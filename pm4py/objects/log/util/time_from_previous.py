@@ -3,7 +3,7 @@ from pm4py.util import xes_constants as xes
 from pm4py.objects.log.log import EventLog
 from pm4py.objects.conversion.log import converter as log_converter
 from pm4py.objects.log.util import sorting
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util import business_hours
 
 
 def insert_time_from_previous(log, parameters=None):
@@ -29,12 +29,18 @@ def insert_time_from_previous(log, parameters=None):
         constants.PARAMETER_CONSTANT_TIMESTAMP_KEY] if constants.PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else xes.DEFAULT_TIMESTAMP_KEY
     worktiming = parameters["worktiming"] if "worktiming" in parameters else [7, 17]
     weekends = parameters["weekends"] if "weekends" in parameters else [6, 7]
+    holidays = parameters["holidays"] if "holidays" in parameters else None
 
     if not type(log) is EventLog:
         log = log_converter.apply(log)
 
     log = sorting.sort_timestamp_log(log, timestamp_key)
 
+    # the business hours are computed at once for all the couples of consecutive events
+    events = []
+    previous_timestamps = []
+    timestamps = []
+
     for trace in log:
         if trace:
             trace[0]["@@passed_time_from_previous"] = 0
@@ -43,11 +49,14 @@ def insert_time_from_previous(log, parameters=None):
             i = 1
             while i < len(trace):
                 trace[i]["@@passed_time_from_previous"] = (trace[i][timestamp_key] - trace[i - 1][timestamp_key]).total_seconds()
-                bh = BusinessHours(trace[i - 1][timestamp_key].replace(tzinfo=None),
-                                   trace[i][timestamp_key].replace(tzinfo=None),
-                                   worktiming=worktiming,
-                                   weekends=weekends)
-                trace[i]["@@approx_bh_passed_time_from_previous"] = bh.getseconds()
+                events.append(trace[i])
+                previous_timestamps.append(trace[i - 1][timestamp_key])
+                timestamps.append(trace[i][timestamp_key])
                 i = i + 1
 
+    bh_seconds = business_hours.get_seconds(previous_timestamps, timestamps, worktiming=worktiming, weekends=weekends,
+                                            holidays=holidays).tolist()
+    for event, seconds in zip(events, bh_seconds):
+        event["@@approx_bh_passed_time_from_previous"] = seconds
+
     return log
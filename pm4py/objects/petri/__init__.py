@@ -1,8 +1,13 @@
 import pkgutil
 
-from pm4py.objects.petri import common, incidence_matrix, petrinet, \
-    reachability_graph, semantics, synchronous_product, utils, check_soundness, networkx_graph, align_utils, \
-    explore_path, performance_map, embed_stochastic_map, reduction
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["common", "incidence_matrix", "petrinet", "reachability_graph", "semantics", "synchronous_product", "utils",
+           "check_soundness", "networkx_graph", "align_utils", "explore_path", "performance_map",
+           "embed_stochastic_map", "reduction", "compiled", "state_space"]
 
 if pkgutil.find_loader("lxml"):
-    from pm4py.objects.petri import exporter, importer
+    __all__.extend(["exporter", "importer"])
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
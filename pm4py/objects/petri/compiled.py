@@ -0,0 +1,155 @@
+from pm4py.objects.petri.petrinet import Marking
+
+
+class CompiledPetriNet(object):
+    """
+    Compact representation of a Petri net, meant for the algorithms that fire transitions in a loop.
+
+    Places and transitions are identified by dense indices (their position in the places/transitions lists),
+    and a marking is a tuple of integers containing the number of tokens of each place. Hence, markings
+    are immutable, hashable and compared/hashed without any Python-level loop.
+    """
+
+    def __init__(self, net):
+        self.__net = net
+        self.__places = list(net.places)
+        self.__place_indices = {p: i for i, p in enumerate(self.__places)}
+        self.__transitions = list(net.transitions)
+        self.__transition_indices = {t: i for i, t in enumerate(self.__transitions)}
+        self.__pre, self.__post, self.__delta = [], [], []
+        for t in self.__transitions:
+            pre, post = {}, {}
+            for a in t.in_arcs:
+                pre[self.__place_indices[a.source]] = pre.get(self.__place_indices[a.source], 0) + a.weight
+            for a in t.out_arcs:
+                post[self.__place_indices[a.target]] = post.get(self.__place_indices[a.target], 0) + a.weight
+            delta = {p: post.get(p, 0) - pre.get(p, 0) for p in set(pre).union(post)}
+            self.__pre.append(tuple(pre.items()))
+            self.__post.append(tuple(post.items()))
+            self.__delta.append(tuple((p, w) for p, w in delta.items() if w != 0))
+        consumers = [[] for p in self.__places]
+        producers = [[] for p in self.__places]
+        no_preset = []
+        for i in range(len(self.__transitions)):
+            if self.__pre[i]:
+                for p, w in self.__pre[i]:
+                    consumers[p].append(i)
+            else:
+                no_preset.append(i)
+            for p, w in self.__post[i]:
+                producers[p].append(i)
+        self.__consumers = [tuple(c) for c in consumers]
+        self.__producers = [tuple(c) for c in producers]
+        self.__no_preset = tuple(no_preset)
+
+    def __get_net(self):
+        return self.__net
+
+    def __get_places(self):
+        return self.__places
+
+    def __get_place_indices(self):
+        return self.__place_indices
+
+    def __get_transitions(self):
+        return self.__transitions
+
+    def __get_transition_indices(self):
+        return self.__transition_indices
+
+    def __get_pre(self):
+        return self.__pre
+
+    def __get_post(self):
+        return self.__post
+
+    def __get_delta(self):
+        return self.__delta
+
+    def __get_consumers(self):
+        return self.__consumers
+
+    def __get_producers(self):
+        return self.__producers
+
+    def __get_no_preset(self):
+        return self.__no_preset
+
+    def encode_marking(self, marking):
+        """
+        Encodes a marking of the Petri net as a tuple of integers
+        """
+        x = [0] * len(self.__places)
+        for p, n in marking.items():
+            x[self.__place_indices[p]] = n
+        return tuple(x)
+
+    def decode_marking(self, m):
+        """
+        Decodes a tuple of integers into a marking of the Petri net
+        """
+        marking = Marking()
+        for i, n in enumerate(m):
+            if n > 0:
+                marking[self.__places[i]] = n
+        return marking
+
+    def is_enabled(self, t, m):
+        """
+        Checks if the transition (index) is enabled in the marking (tuple)
+        """
+        for p, w in self.__pre[t]:
+            if m[p] < w:
+                return False
+        return True
+
+    def enabled_transitions(self, m):
+        """
+        Gets the (sorted) indices of the transitions that are enabled in the marking (tuple)
+        """
+        consumers = self.__consumers
+        candidates = set(self.__no_preset)
+        for p, n in enumerate(m):
+            if n > 0:
+                candidates.update(consumers[p])
+        pre = self.__pre
+        return [t for t in sorted(candidates) if all(m[p] >= w for p, w in pre[t])]
+
+    def weak_execute(self, t, m):
+        """
+        Fires the transition (index) in the marking (tuple), without checking if it is enabled
+        (the number of tokens of a place does not go below zero)
+        """
+        x = list(m)
+        for p, w in self.__pre[t]:
+            x[p] = max(0, x[p] - w)
+        for p, w in self.__post[t]:
+            x[p] += w
+        return tuple(x)
+
+    def execute(self, t, m):
+        """
+        Fires the transition (index) in the marking (tuple), returning None if it is not enabled
+        """
+        if not self.is_enabled(t, m):
+            return None
+        x = list(m)
+        for p, w in self.__delta[t]:
+            x[p] += w
+        return tuple(x)
+
+    net = property(__get_net)
+    places = property(__get_places)
+    place_indices = property(__get_place_indices)
+    transitions = property(__get_transitions)
+    transition_indices = property(__get_transition_indices)
+    pre = property(__get_pre)
+    post = property(__get_post)
+    delta = property(__get_delta)
+    consumers = property(__get_consumers)
+    producers = property(__get_producers)
+    no_preset = property(__get_no_preset)
+
+
+def construct(net):
+    return CompiledPetriNet(net)
@@ -6,7 +6,7 @@ from pm4py.objects.petri.petrinet import PetriNet
 from pm4py.util.vis_utils import human_readable_stat, get_arc_penwidth, get_trans_freq_color
 from statistics import median, mean
 from pm4py.objects.log.log import EventLog
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util import business_hours as bh_utils
 
 MAX_NO_THREADS = 1000
 
@@ -172,6 +172,7 @@ def single_element_statistics(log, net, initial_marking, aligned_traces, variant
     business_hours = parameters["business_hours"] if "business_hours" in parameters else False
     worktiming = parameters["worktiming"] if "worktiming" in parameters else [7, 17]
     weekends = parameters["weekends"] if "weekends" in parameters else [6, 7]
+    holidays = parameters["holidays"] if "holidays" in parameters else None
 
     statistics = {}
 
@@ -194,46 +195,56 @@ def single_element_statistics(log, net, initial_marking, aligned_traces, variant
                     variants_idx[variant])
 
             if "performance" in annotations_places_trans[el]:
+                perf_couples = annotations_places_trans[el]["performance"]
+                statistics[el]["performance"].extend(
+                    __get_performance(log, variants_idx[variant], perf_couples, timestamp_key, business_hours,
+                                      worktiming, weekends, holidays))
                 for trace_idx in variants_idx[variant]:
-                    trace = log[trace_idx]
-                    for perf_couple in annotations_places_trans[el]["performance"]:
-                        if timestamp_key in trace[perf_couple[0]] and timestamp_key in trace[perf_couple[1]]:
-                            if business_hours:
-                                bh = BusinessHours(trace[perf_couple[1]][timestamp_key].replace(tzinfo=None),
-                                                   trace[perf_couple[0]][timestamp_key].replace(tzinfo=None),
-                                                   worktiming=worktiming,
-                                                   weekends=weekends)
-                                perf = bh.getseconds()
-                            else:
-                                perf = (trace[perf_couple[0]][timestamp_key] - trace[perf_couple[1]][
-                                    timestamp_key]).total_seconds()
-                        else:
-                            perf = 0.0
-                        statistics[el]["performance"].append(perf)
-                        statistics[el]["log_idx"].append(trace_idx)
+                    statistics[el]["log_idx"].extend([trace_idx] * len(perf_couples))
         for el in annotations_arcs:
             if el not in statistics:
                 statistics[el] = {"count": 0, "performance": []}
             statistics[el]["count"] += annotations_arcs[el]["count"] * len(variants_idx[variant])
-            for trace_idx in variants_idx[variant]:
-                trace = log[trace_idx]
-                for perf_couple in annotations_arcs[el]["performance"]:
-                    if timestamp_key in trace[perf_couple[0]] and timestamp_key in trace[perf_couple[1]]:
-                        if business_hours:
-                            bh = BusinessHours(trace[perf_couple[1]][timestamp_key].replace(tzinfo=None),
-                                               trace[perf_couple[0]][timestamp_key].replace(tzinfo=None), worktiming=worktiming,
-                                               weekends=weekends)
-                            perf = bh.getseconds()
-                        else:
-                            perf = (trace[perf_couple[0]][timestamp_key] - trace[perf_couple[1]][
-                                timestamp_key]).total_seconds()
-                    else:
-                        perf = 0.0
-                    statistics[el]["performance"].append(perf)
+            statistics[el]["performance"].extend(
+                __get_performance(log, variants_idx[variant], annotations_arcs[el]["performance"], timestamp_key,
+                                  business_hours, worktiming, weekends, holidays))
 
     return statistics
 
 
+def __get_performance(log, trace_idxs, perf_couples, timestamp_key, business_hours, worktiming, weekends, holidays):
+    """
+    Gets the performance values of the given couples of events (index of the target event, index of the source event)
+    in each one of the given traces (0 if an event has no timestamp). With business hours, the durations of all the
+    couples are computed at once
+    """
+    performance = []
+    bh_positions = []
+    bh_starts = []
+    bh_ends = []
+    for trace_idx in trace_idxs:
+        trace = log[trace_idx]
+        for perf_couple in perf_couples:
+            if timestamp_key in trace[perf_couple[0]] and timestamp_key in trace[perf_couple[1]]:
+                if business_hours:
+                    bh_positions.append(len(performance))
+                    bh_starts.append(trace[perf_couple[1]][timestamp_key])
+                    bh_ends.append(trace[perf_couple[0]][timestamp_key])
+                    perf = 0
+                else:
+                    perf = (trace[perf_couple[0]][timestamp_key] - trace[perf_couple[1]][
+                        timestamp_key]).total_seconds()
+            else:
+                perf = 0.0
+            performance.append(perf)
+    if bh_positions:
+        bh_seconds = bh_utils.get_seconds(bh_starts, bh_ends, worktiming=worktiming, weekends=weekends,
+                                          holidays=holidays).tolist()
+        for position, seconds in zip(bh_positions, bh_seconds):
+            performance[position] = seconds
+    return performance
+
+
 def find_min_max_trans_frequency(statistics):
     """
     Find minimum and maximum transition frequency
@@ -5,18 +5,14 @@ class Marking(Counter):
     pass
 
     def __hash__(self):
-        r = 0
-        for p in self.items():
-            r += 31 * hash(p[0]) * p[1]
-        return r
+        return 31 * sum(hash(p) * n for p, n in self.items())
 
     def __eq__(self, other):
-        if not self.keys() == other.keys():
-            return False
-        for p in self.keys():
-            if other.get(p) != self.get(p):
-                return False
-        return True
+        # same keys and same number of tokens (compared without Python-level loops)
+        return dict.__eq__(self, other) is True
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
 
     def __le__(self, other):
         if not self.keys() <= other.keys():
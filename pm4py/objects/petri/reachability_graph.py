@@ -1,15 +1,19 @@
 import re
+import time
 
-from pm4py.objects.petri import semantics, align_utils
+from pm4py.objects.petri import align_utils, state_space
 from pm4py.objects.transition_system import transition_system as ts
 from pm4py.objects.transition_system import utils
 from pm4py.util import exec_utils
 from enum import Enum
-import time
 
 
 class Parameters(Enum):
     MAX_ELAB_TIME = "max_elab_time"
+    MAX_CONSTRUCTION_TIME = "max_construction_time"
+    MAX_STATES = state_space.Parameters.MAX_STATES.value
+    STUBBORN_SETS = state_space.Parameters.STUBBORN_SETS.value
+    SYMMETRIES = state_space.Parameters.SYMMETRIES.value
 
 
 def staterep(name):
@@ -41,41 +45,63 @@ def marking_flow_petri(net, im, return_eventually_enabled=False, parameters=None
         Initial marking
     return_eventually_enabled
         Return the eventually enabled (visible) transitions
+    parameters
+        Parameters of the algorithm (see state_space.explore), including:
+            - Parameters.MAX_ELAB_TIME => maximum time of the exploration (default: 1 day)
+            - Parameters.MAX_CONSTRUCTION_TIME => maximum time of the construction of the flow, after the exploration
+            (default: Parameters.MAX_ELAB_TIME); when it is reached, the flow contains the markings processed so far
     """
     if parameters is None:
         parameters = {}
 
-    # set a maximum execution time of 1 day (it can be changed by providing the parameter)
-    max_exec_time = exec_utils.get_param_value(Parameters.MAX_ELAB_TIME, parameters, 86400)
-
-    start_time = time.time()
-
-    incoming_transitions = {im: set()}
-    outgoing_transitions = {}
+    space, deadline = __explore(net, im, parameters)
+    cnet = space.compiled_net
+    transitions = cnet.transitions
+
+    markings = []
+    for m in space.markings:
+        if time.time() >= deadline:
+            break
+        markings.append(cnet.decode_marking(m))
+    if markings and markings[0] == im:
+        markings[0] = im
+    n = len(markings)
+
+    # the arcs are collected by state ID, so every marking is hashed only once
+    incoming = [set() for m in markings]
+    outgoing = [{} for m in markings]
+    for s1, t, s2 in zip(space.sources, space.transitions, space.targets):
+        if s1 < n and s2 < n:
+            outgoing[s1][transitions[t]] = markings[s2]
+            incoming[s2].add(transitions[t])
+
+    incoming_transitions = dict(zip(markings, incoming))
+    outgoing_transitions = {markings[i]: outgoing[i] for i in range(n) if space.is_expanded(i)}
     eventually_enabled = {}
 
-    active = [im]
-    while active:
-        if (time.time() - start_time) >= max_exec_time:
-            # interrupt the execution
-            return incoming_transitions, outgoing_transitions, eventually_enabled
-        m = active.pop()
-        enabled_transitions = semantics.enabled_transitions(net, m)
-        if return_eventually_enabled:
+    if return_eventually_enabled:
+        for m in outgoing_transitions:
+            if time.time() >= deadline:
+                break
             eventually_enabled[m] = align_utils.get_visible_transitions_eventually_enabled_by_marking(net, m)
-        outgoing_transitions[m] = {}
-        for t in enabled_transitions:
-            nm = semantics.weak_execute(t, m)
-            outgoing_transitions[m][t] = nm
-            if nm not in incoming_transitions:
-                incoming_transitions[nm] = set()
-                if nm not in active:
-                    active.append(nm)
-            incoming_transitions[nm].add(t)
 
     return incoming_transitions, outgoing_transitions, eventually_enabled
 
 
+def __explore(net, im, parameters):
+    """
+    Explores the state space of the Petri net (for at most MAX_ELAB_TIME), returning it along with the deadline
+    of the construction of the result (MAX_CONSTRUCTION_TIME after the end of the exploration)
+    """
+    # set a maximum execution time of 1 day (it can be changed by providing the parameter)
+    max_exec_time = exec_utils.get_param_value(Parameters.MAX_ELAB_TIME, parameters, 86400)
+    max_construction_time = exec_utils.get_param_value(Parameters.MAX_CONSTRUCTION_TIME, parameters, max_exec_time)
+    parameters = dict(parameters)
+    parameters[state_space.Parameters.MAX_ELAB_TIME] = max_exec_time
+    space = state_space.explore(net, im, parameters=parameters)
+    return space, time.time() + max_construction_time
+
+
 def construct_reachability_graph_from_flow(incoming_transitions, outgoing_transitions,
                                            use_trans_name=False, parameters=None):
     """
@@ -125,13 +151,37 @@ def construct_reachability_graph(net, initial_marking, use_trans_name=False, par
     ----------
     net: Petri net
     initial_marking: initial marking of the Petri net.
+    use_trans_name: use the name of the transitions (instead of their representation) to name the arcs
+    parameters: parameters of the algorithm (see state_space.explore); Parameters.MAX_ELAB_TIME bounds the
+    exploration (default: 1 day) and Parameters.MAX_CONSTRUCTION_TIME the construction of the transition system
+    (default: Parameters.MAX_ELAB_TIME), and when it is reached the transition system contains the states and arcs
+    built so far
 
     Returns
     -------
     re_gr: Transition system that represents the reachability graph of the input Petri net.
     """
-    incoming_transitions, outgoing_transitions, eventually_enabled = marking_flow_petri(net, initial_marking,
-                                                                                        parameters=parameters)
+    if parameters is None:
+        parameters = {}
+
+    space, deadline = __explore(net, initial_marking, parameters)
+    transitions = space.compiled_net.transitions
 
-    return construct_reachability_graph_from_flow(incoming_transitions, outgoing_transitions,
-                                                  use_trans_name=use_trans_name, parameters=parameters)
+    re_gr = ts.TransitionSystem()
+
+    states = []
+    for i in range(len(space)):
+        if time.time() >= deadline:
+            break
+        states.append(ts.TransitionSystem.State(staterep(repr(space.get_marking(i)))))
+    re_gr.states.update(states)
+    n = len(states)
+
+    for s1, t, s2 in zip(space.sources, space.transitions, space.targets):
+        if s1 < n and s2 < n:
+            if time.time() >= deadline:
+                break
+            t = transitions[t]
+            utils.add_arc_from_to(t.name if use_trans_name else repr(t), states[s1], states[s2], re_gr)
+
+    return re_gr
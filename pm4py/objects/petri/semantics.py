@@ -1,6 +1,3 @@
-import copy
-
-
 def is_enabled(t, pn, m):
     """
     Verifies whether a given transition is enabled in a given Petri net and marking
@@ -43,7 +40,7 @@ def execute(t, pn, m):
     if not is_enabled(t, pn, m):
         return None
 
-    m_out = copy.copy(m)
+    m_out = m.copy()
     for a in t.in_arcs:
         m_out[a.source] -= a.weight
         if m_out[a.source] == 0:
@@ -69,7 +66,7 @@ def weak_execute(t, m):
     :return: newly reached marking if :param t: is enabled, None otherwise
     """
 
-    m_out = copy.copy(m)
+    m_out = m.copy()
     for a in t.in_arcs:
         m_out[a.source] -= a.weight
         if m_out[a.source] <= 0:
@@ -0,0 +1,245 @@
+import sys
+import time
+from array import array
+from enum import Enum
+
+from pm4py.objects.petri import compiled
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    MAX_ELAB_TIME = "max_elab_time"
+    MAX_STATES = "max_states"
+    STUBBORN_SETS = "stubborn_sets"
+    SYMMETRIES = "symmetries"
+
+
+class StateSpace(object):
+    """
+    State space of a Petri net, explored from an initial marking.
+
+    Every state has an integer ID (the initial state has ID 0) and a marking, that is stored as a tuple of integers
+    (in the places order of the compiled net). The arcs are stored in three parallel integer arrays
+    (source state, index of the fired transition, target state).
+    """
+
+    def __init__(self, compiled_net, markings, sources, transitions, targets, expanded, complete):
+        self.__compiled_net = compiled_net
+        self.__markings = markings
+        self.__sources = sources
+        self.__transitions = transitions
+        self.__targets = targets
+        self.__expanded = expanded
+        self.__complete = complete
+
+    def __get_compiled_net(self):
+        return self.__compiled_net
+
+    def __get_markings(self):
+        return self.__markings
+
+    def __get_sources(self):
+        return self.__sources
+
+    def __get_transitions(self):
+        return self.__transitions
+
+    def __get_targets(self):
+        return self.__targets
+
+    def __get_complete(self):
+        return self.__complete
+
+    def __len__(self):
+        return len(self.__markings)
+
+    def is_expanded(self, state):
+        """
+        Checks if the successors of the state have been computed (always true if the exploration is complete)
+        """
+        return self.__expanded[state] == 1
+
+    def get_marking(self, state):
+        """
+        Gets the marking (Marking object) of the state with the given ID
+        """
+        return self.__compiled_net.decode_marking(self.__markings[state])
+
+    def get_arcs(self):
+        """
+        Gets the arcs of the state space as (source state, transition, target state) triples
+        """
+        transitions = self.__compiled_net.transitions
+        return [(s, transitions[t], d) for s, t, d in zip(self.__sources, self.__transitions, self.__targets)]
+
+    def get_deadlocks(self):
+        """
+        Gets the IDs of the (expanded) states without any outgoing arc
+        """
+        has_successors = bytearray(len(self.__markings))
+        for s in self.__sources:
+            has_successors[s] = 1
+        return [s for s in range(len(self.__markings)) if self.__expanded[s] and not has_successors[s]]
+
+    compiled_net = property(__get_compiled_net)
+    markings = property(__get_markings)
+    sources = property(__get_sources)
+    transitions = property(__get_transitions)
+    targets = property(__get_targets)
+    complete = property(__get_complete)
+
+
+def explore(net, im, parameters=None):
+    """
+    Explores the state space of a Petri net (DO NOT ATTEMPT WITH AN UNBOUNDED PETRI NET, unless a maximum number
+    of states is provided).
+
+    The markings are tuples of integers, kept in a hash map that associates them to the ID of their state,
+    and the enabled transitions of a new marking are derived incrementally from the ones of its predecessor
+    (only the transitions consuming from a place that changed its number of tokens are checked again).
+
+    Optionally, the exploration can be reduced:
+    - with stubborn sets (only a subset of the enabled transitions is fired in every marking), that preserve
+    the reachable deadlocks of the net but not the full interleaving of the concurrent transitions
+    - with symmetries of the places: every marking is replaced by the (lexicographically) smallest of its images,
+    so that a state represents a whole class of symmetric markings
+
+    Parameters
+    -------------
+    net
+        Petri net (or compiled Petri net)
+    im
+        Initial marking
+    parameters
+        Parameters of the algorithm, including:
+            - Parameters.MAX_ELAB_TIME => maximum time (in seconds) of the exploration (default: no limit)
+            - Parameters.MAX_STATES => maximum number of states of the state space (default: no limit)
+            - Parameters.STUBBORN_SETS => enables the stubborn sets reduction (default: False)
+            - Parameters.SYMMETRIES => list of symmetries of the net, each one expressed as a dictionary mapping
+            a place to its image (they should form a group; the identity can be omitted)
+
+    Returns
+    -------------
+    state_space
+        State space (flagged as not complete if the exploration has been interrupted)
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_exec_time = exec_utils.get_param_value(Parameters.MAX_ELAB_TIME, parameters, sys.maxsize)
+    max_states = exec_utils.get_param_value(Parameters.MAX_STATES, parameters, sys.maxsize)
+    stubborn_sets = exec_utils.get_param_value(Parameters.STUBBORN_SETS, parameters, False)
+    symmetries = exec_utils.get_param_value(Parameters.SYMMETRIES, parameters, None)
+
+    cnet = net if isinstance(net, compiled.CompiledPetriNet) else compiled.construct(net)
+    pre = cnet.pre
+    delta = cnet.delta
+    affected = __get_affected_transitions(cnet)
+    conflicting = __get_conflicting_transitions(cnet) if stubborn_sets else None
+    permutations = [[cnet.place_indices[s[p]] for p in cnet.places] for s in symmetries] if symmetries else None
+
+    start_time = time.time()
+
+    m0 = cnet.encode_marking(im)
+    if permutations:
+        m0 = __canonical(m0, permutations)
+    states = {m0: 0}
+    markings = [m0]
+    expanded = bytearray(1)
+    sources, transitions, targets = array("q"), array("q"), array("q")
+    complete = True
+
+    stack = [(m0, 0, set(cnet.enabled_transitions(m0)))]
+    while stack:
+        if (time.time() - start_time) >= max_exec_time:
+            complete = False
+            break
+        m, i, enabled = stack.pop()
+        expanded[i] = 1
+        to_fire = __stubborn_set(cnet, m, enabled, conflicting) if stubborn_sets else enabled
+        for t in to_fire:
+            x = list(m)
+            for p, w in delta[t]:
+                x[p] += w
+            nm = tuple(x)
+            if permutations:
+                nm = __canonical(nm, permutations)
+            j = states.get(nm)
+            if j is None:
+                if len(markings) >= max_states:
+                    complete = False
+                    continue
+                j = len(markings)
+                states[nm] = j
+                markings.append(nm)
+                expanded.append(0)
+                if permutations:
+                    # the canonical marking is not necessarily reached by firing t
+                    new_enabled = set(cnet.enabled_transitions(nm))
+                else:
+                    new_enabled = enabled.difference(affected[t])
+                    new_enabled.update(u for u in affected[t] if all(nm[p] >= w for p, w in pre[u]))
+                stack.append((nm, j, new_enabled))
+            sources.append(i)
+            transitions.append(t)
+            targets.append(j)
+
+    return StateSpace(cnet, markings, sources, transitions, targets, expanded, complete)
+
+
+def __get_affected_transitions(cnet):
+    """
+    Gets, for every transition, the transitions whose enabling can change after firing it
+    (the ones consuming from a place whose number of tokens is changed by the firing)
+    """
+    consumers = cnet.consumers
+    return [frozenset(u for p, w in delta for u in consumers[p]) for delta in cnet.delta]
+
+
+def __get_conflicting_transitions(cnet):
+    """
+    Gets, for every transition, the transitions sharing an input place with it (the transition itself included)
+    """
+    consumers = cnet.consumers
+    return [frozenset(u for p, w in pre for u in consumers[p]).union({t}) for t, pre in enumerate(cnet.pre)]
+
+
+def __stubborn_set(cnet, m, enabled, conflicting):
+    """
+    Gets the enabled transitions of a (deadlock-preserving) stubborn set of the marking:
+    - for every enabled transition of the set, the transitions sharing an input place with it are added
+    - for every disabled transition of the set, the producers of one of its insufficiently marked input places are added
+    """
+    if len(enabled) < 2:
+        return enabled
+    pre = cnet.pre
+    producers = cnet.producers
+    start = min(enabled)
+    stubborn = {start}
+    to_visit = [start]
+    while to_visit:
+        t = to_visit.pop()
+        if t in enabled:
+            new = conflicting[t]
+        else:
+            new = producers[next(p for p, w in pre[t] if m[p] < w)]
+        for u in new:
+            if u not in stubborn:
+                stubborn.add(u)
+                to_visit.append(u)
+    return stubborn.intersection(enabled)
+
+
+def __canonical(m, permutations):
+    """
+    Gets the canonical representative (lexicographically smallest image) of a marking under the given symmetries
+    """
+    best = m
+    for perm in permutations:
+        x = [0] * len(m)
+        for p, n in enumerate(m):
+            x[perm[p]] = n
+        x = tuple(x)
+        if x < best:
+            best = x
+    return best
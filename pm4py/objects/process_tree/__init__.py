@@ -1,5 +1,11 @@
-from pm4py.objects.process_tree import process_tree, semantics, state, util as pt_util, regex, bottomup
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["process_tree", "semantics", "state", "util", "regex", "bottomup"]
+
 if pkgutil.find_loader("lxml"):
-    from pm4py.objects.process_tree import importer, exporter
+    __all__.extend(["importer", "exporter"])
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
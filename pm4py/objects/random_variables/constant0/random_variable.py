@@ -64,10 +64,16 @@ class Constant0(Uniform):
         """
         return "UNDEFINED"
 
-    def get_value(self):
+    def get_value(self, random_state=None):
         """
         Get a random value following the distribution
 
+        Parameters
+        -----------
+        random_state
+            Random number generator (numpy.random.RandomState) used to draw the value
+            (default: None, the global one of NumPy)
+
         Returns
         -----------
         value
@@ -99,10 +99,16 @@ class Exponential(BasicStructureRandomVariable):
         if len(values) > 1:
             self.loc, self.scale = expon.fit(values, floc=0)
 
-    def get_value(self):
+    def get_value(self, random_state=None):
         """
         Get a random value following the distribution
 
+        Parameters
+        -----------
+        random_state
+            Random number generator (numpy.random.RandomState) used to draw the value
+            (default: None, the global one of NumPy)
+
         Returns
         -----------
         value
@@ -110,4 +116,4 @@ class Exponential(BasicStructureRandomVariable):
         """
         from scipy.stats import expon
 
-        return expon.rvs(self.loc, self.scale)
+        return expon.rvs(self.loc, self.scale, random_state=random_state)
@@ -1 +1,6 @@
-from pm4py.objects.random_variables.normal import random_variable
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["random_variable"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
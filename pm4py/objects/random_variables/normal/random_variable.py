@@ -97,10 +97,16 @@ class Normal(BasicStructureRandomVariable):
         if len(values) > 1:
             self.mu, self.sigma = norm.fit(values)
 
-    def get_value(self):
+    def get_value(self, random_state=None):
         """
         Get a random value following the distribution
 
+        Parameters
+        -----------
+        random_state
+            Random number generator (numpy.random.RandomState) used to draw the value
+            (default: None, the global one of NumPy)
+
         Returns
         -----------
         value
@@ -108,4 +114,4 @@ class Normal(BasicStructureRandomVariable):
         """
         from scipy.stats import norm
 
-        return norm.rvs(self.mu, self.sigma)
+        return norm.rvs(self.mu, self.sigma, random_state=random_state)
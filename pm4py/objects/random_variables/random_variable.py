@@ -141,17 +141,23 @@ class RandomVariable(object):
                 else:
                     self.random_variable = constant
 
-    def get_value(self):
+    def get_value(self, random_state=None):
         """
         Get a random value following the distribution
 
+        Parameters
+        -----------
+        random_state
+            Random number generator (numpy.random.RandomState) used to draw the value
+            (default: None, the global one of NumPy)
+
         Returns
         -----------
         value
             Value obtained following the distribution
         """
         if self.random_variable is not None:
-            return self.random_variable.get_value()
+            return self.random_variable.get_value(random_state=random_state)
 
     def get_values(self, no_values=400):
         """
@@ -97,10 +97,16 @@ class Uniform(BasicStructureRandomVariable):
         if len(values) > 0:
             self.loc, self.scale = uniform.fit(values)
 
-    def get_value(self):
+    def get_value(self, random_state=None):
         """
         Get a random value following the distribution
 
+        Parameters
+        -----------
+        random_state
+            Random number generator (numpy.random.RandomState) used to draw the value
+            (default: None, the global one of NumPy)
+
         Returns
         -----------
         value
@@ -108,4 +114,4 @@ class Uniform(BasicStructureRandomVariable):
         """
         from scipy.stats import uniform
 
-        return uniform.rvs(self.loc, self.scale)
+        return uniform.rvs(self.loc, self.scale, random_state=random_state)
@@ -1,4 +1,5 @@
 from collections import Counter
+from enum import Enum
 
 import numpy as np
 
@@ -6,6 +7,35 @@ from pm4py.objects.petri.reachability_graph import construct_reachability_graph
 from pm4py.objects.stochastic_petri import tangible_reachability
 from pm4py.objects.conversion.dfg import converter as dfg_converter
 from pm4py.objects.random_variables import exponential, random_variable
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    SPARSE = "sparse"
+    TRANSIENT_SOLVER = "transient_solver"
+    STEADYSTATE_SOLVER = "steadystate_solver"
+    TOLERANCE = "tolerance"
+    MAX_ITERATIONS = "max_iterations"
+
+
+class TransientSolvers(Enum):
+    # matrix exponential of the (dense) Q matrix
+    DENSE = "dense"
+    # action of the matrix exponential of the (sparse) Q matrix on the vector of probabilities
+    EXPM_MULTIPLY = "expm_multiply"
+    # uniformization of the CTMC into a DTMC, weighting its steps by a Poisson distribution
+    UNIFORMIZATION = "uniformization"
+
+
+class SteadyStateSolvers(Enum):
+    # sparse LU factorization
+    DIRECT = "direct"
+    # GMRES (falling back to the direct solver if it does not converge)
+    ITERATIVE = "iterative"
+
+
+# maximum number of states for which the transient analysis uses (by default) the dense matrix exponential
+DENSE_MAX_STATES = 500
 
 
 def get_corr_hex(num):
@@ -117,7 +147,7 @@ def get_tangible_reachability_and_q_matrix_from_dfg_performance(dfg_performance,
             rv.random_variable = exp
             stochastic_map[tr] = rv
     tang_reach_graph = construct_reachability_graph(net, im, use_trans_name=True)
-    q_matrix = get_q_matrix_from_tangible_exponential(tang_reach_graph, stochastic_map)
+    q_matrix = get_q_matrix_from_tangible_exponential(tang_reach_graph, stochastic_map, parameters=parameters)
     return tang_reach_graph, tang_reach_graph, stochastic_map, q_matrix
 
 
@@ -152,7 +182,8 @@ def get_tangible_reachability_and_q_matrix_from_log_net(log, net, im, fm, parame
     reachability_graph, tangible_reachability_graph, stochastic_info = tangible_reachability.get_tangible_reachability_from_log_net_im_fm(
         log, net, im, fm, parameters=parameters)
     # gets the Q matrix assuming exponential distributions
-    q_matrix = get_q_matrix_from_tangible_exponential(tangible_reachability_graph, stochastic_info)
+    q_matrix = get_q_matrix_from_tangible_exponential(tangible_reachability_graph, stochastic_info,
+                                                      parameters=parameters)
     return reachability_graph, tangible_reachability_graph, stochastic_info, q_matrix
 
 
@@ -185,7 +216,7 @@ def transient_analysis_from_petri_net_and_smap(net, im, s_map, delay, parameters
     # get the tangible reachability graph from the reachability graph and the stochastic map
     tang_reach_graph = tangible_reachability.get_tangible_reachability_from_reachability(reachab_graph, s_map)
     # gets the Q matrix assuming exponential distributions
-    q_matrix = get_q_matrix_from_tangible_exponential(tang_reach_graph, s_map)
+    q_matrix = get_q_matrix_from_tangible_exponential(tang_reach_graph, s_map, parameters=parameters)
     states = sorted(list(tang_reach_graph.states), key=lambda x: x.name)
     states_vector = np.zeros((1, len(states)))
 
@@ -193,14 +224,15 @@ def transient_analysis_from_petri_net_and_smap(net, im, s_map, delay, parameters
         states_vector[0, states.index(state)] = 1.0 / len(states_reachable_from_start)
 
     probabilities = transient_analysis_from_tangible_q_matrix_and_states_vector(tang_reach_graph, q_matrix,
-                                                                                states_vector, delay)
+                                                                                states_vector, delay,
+                                                                                parameters=parameters)
 
     color_dictionary = get_color_from_probabilities(probabilities)
 
     return tang_reach_graph, probabilities, color_dictionary
 
 
-def get_q_matrix_from_tangible_exponential(tangible_reach_graph, stochastic_info):
+def get_q_matrix_from_tangible_exponential(tangible_reach_graph, stochastic_info, parameters=None):
     """
     Gets Q matrix from tangible reachability graph and stochastic map where the
     distribution type has been forced to be exponential
@@ -211,36 +243,56 @@ def get_q_matrix_from_tangible_exponential(tangible_reach_graph, stochastic_info
         Tangible reachability graph
     stochastic_info
         Stochastic map for each transition
+    parameters
+        Parameters of the algorithm, including:
+            - Parameters.SPARSE => returns the Q matrix as a (CSR) sparse matrix (default: False)
 
     Returns
     -----------
     q_matrix
-        Q-matrix from the tangible reachability graph
+        Q-matrix from the tangible reachability graph (the states are sorted by name)
     """
+    if parameters is None:
+        parameters = {}
+
+    sparse_matrix = exec_utils.get_param_value(Parameters.SPARSE, parameters, False)
+
+    from scipy import sparse
+
     stochastic_info_name = {}
     for s in stochastic_info:
         stochastic_info_name[s.name] = stochastic_info[s]
 
     states = sorted(list(tangible_reach_graph.states), key=lambda x: x.name)
+    states_index = {state: i for i, state in enumerate(states)}
     no_states = len(states)
-    q_matrix = np.zeros((no_states, no_states))
 
+    rows, cols, values = [], [], []
+    exit_rates = np.zeros(no_states)
     for i in range(no_states):
-        sum_lambda = 0.0
         for trans in states[i].outgoing:
-            target_state = trans.to_state
-            target_state_index = states.index(target_state)
+            target_state_index = states_index[trans.to_state]
             if not target_state_index == i:
                 sinfo = stochastic_info_name[trans.name]
                 lambda_value = 1.0 / float(sinfo.random_variable.scale)
-                sum_lambda = sum_lambda + lambda_value
-                q_matrix[i, target_state_index] = q_matrix[i, target_state_index] + lambda_value
-        q_matrix[i, i] = -sum_lambda
+                exit_rates[i] += lambda_value
+                rows.append(i)
+                cols.append(target_state_index)
+                values.append(lambda_value)
+    rows.extend(range(no_states))
+    cols.extend(range(no_states))
+    values.extend(-exit_rates)
+
+    # the rates of parallel arcs are summed
+    q_matrix = sparse.csr_matrix((values, (rows, cols)), shape=(no_states, no_states))
 
-    return q_matrix
+    if sparse_matrix:
+        return q_matrix
+    return q_matrix.toarray()
 
 
-def transient_analysis_from_tangible_q_matrix_and_single_state(tangible_reach_graph, q_matrix, source_state, time_diff):
+def transient_analysis_from_tangible_q_matrix_and_single_state(tangible_reach_graph, q_matrix, source_state, time_diff,
+                                                               parameters=None):
     """
     Do transient analysis from tangible reachability graph, Q matrix and a single state to start from
 
@@ -249,11 +301,13 @@ def transient_analysis_from_tangible_q_matrix_and_single_state(tangible_reach_gr
     tangible_reach_graph
         Tangible reachability graph
     q_matrix
-        Q matrix
+        Q matrix (dense or sparse)
     source_state
         Source state to consider
     time_diff
         Time interval we want to investigate
+    parameters
+        Parameters of the algorithm (see get_transient_probabilities)
 
     Returns
     -----------
@@ -267,11 +321,11 @@ def transient_analysis_from_tangible_q_matrix_and_single_state(tangible_reach_gr
     states_vector[0, state_index] = 1
 
     return transient_analysis_from_tangible_q_matrix_and_states_vector(tangible_reach_graph, q_matrix, states_vector,
-                                                                       time_diff)
+                                                                       time_diff, parameters=parameters)
 
 
 def transient_analysis_from_tangible_q_matrix_and_states_vector(tangible_reach_graph, q_matrix, states_vector,
-                                                                time_diff):
+                                                                time_diff, parameters=None):
     """
     Do transient analysis from tangible reachability graph, Q matrix and a vector of probability of states
 
@@ -280,27 +334,23 @@ def transient_analysis_from_tangible_q_matrix_and_states_vector(tangible_reach_g
     tangible_reach_graph
         Tangible reachability graph
     q_matrix
-        Q matrix
+        Q matrix (dense or sparse)
     states_vector
         Vector of states probabilities to start from
     time_diff
         Time interval we want to investigate
+    parameters
+        Parameters of the algorithm (see get_transient_probabilities)
 
     Returns
     -----------
     transient_result
         Transient analysis result
     """
-    from scipy.linalg import expm
-
     transient_result = Counter()
     states = sorted(list(tangible_reach_graph.states), key=lambda x: x.name)
 
-    ht_matrix = expm(q_matrix * time_diff)
-
-    res = np.matmul(states_vector, ht_matrix)
-    # normalize to 1 the vector of probabilities
-    res = res / np.sum(res)
+    res = get_transient_probabilities(q_matrix, states_vector, [time_diff], parameters=parameters)
 
     for i in range(len(states)):
         transient_result[states[i]] = res[0, i]
@@ -308,6 +358,122 @@ def transient_analysis_from_tangible_q_matrix_and_states_vector(tangible_reach_g
     return transient_result
 
 
+def get_transient_probabilities(q_matrix, states_vector, times, parameters=None):
+    """
+    Gets the probabilities of the states of the CTMC after each one of the given time intervals
+    (all the time intervals are evaluated together, reusing the computations done for the shorter ones)
+
+    Parameters
+    ------------
+    q_matrix
+        Q matrix (dense or sparse)
+    states_vector
+        Vector of states probabilities to start from
+    times
+        Time intervals we want to investigate
+    parameters
+        Parameters of the algorithm, including:
+            - Parameters.TRANSIENT_SOLVER => solver (TransientSolvers) to use (default: DENSE up to DENSE_MAX_STATES
+            states, EXPM_MULTIPLY otherwise)
+            - Parameters.TOLERANCE => truncation error of the uniformization (default: 1e-10)
+            - Parameters.MAX_ITERATIONS => maximum number of steps of the uniformization (default: 10^6)
+
+    Returns
+    ------------
+    probabilities
+        Matrix having a row (normalized to 1) for every time interval and a column for every state
+    """
+    if parameters is None:
+        parameters = {}
+
+    from scipy import sparse
+
+    p0 = np.asarray(states_vector, dtype=float).reshape(-1)
+    times = np.asarray(times, dtype=float).reshape(-1)
+
+    solver = exec_utils.get_param_value(Parameters.TRANSIENT_SOLVER, parameters,
+                                        TransientSolvers.DENSE if len(p0) <= DENSE_MAX_STATES
+                                        else TransientSolvers.EXPM_MULTIPLY)
+
+    if solver == TransientSolvers.DENSE.value:
+        from scipy.linalg import expm
+        q_matrix = q_matrix.toarray() if sparse.issparse(q_matrix) else np.asarray(q_matrix)
+        res = np.vstack([np.matmul(p0, expm(q_matrix * t)) for t in times]) if len(times) > 0 else np.zeros((0, len(p0)))
+    elif solver == TransientSolvers.EXPM_MULTIPLY.value:
+        res = __transient_expm_multiply(sparse.csr_matrix(q_matrix), p0, times)
+    elif solver == TransientSolvers.UNIFORMIZATION.value:
+        tolerance = exec_utils.get_param_value(Parameters.TOLERANCE, parameters, 1e-10)
+        max_iterations = exec_utils.get_param_value(Parameters.MAX_ITERATIONS, parameters, 10 ** 6)
+        res = __transient_uniformization(sparse.csr_matrix(q_matrix), p0, times, tolerance, max_iterations)
+    else:
+        raise Exception("unsupported transient solver: " + str(solver))
+
+    # normalize to 1 the vectors of probabilities
+    return res / np.sum(res, axis=1, keepdims=True)
+
+
+def __transient_expm_multiply(q_matrix, p0, times):
+    """
+    Transient analysis through the action of the matrix exponential on the vector of probabilities:
+    the time intervals are visited in increasing order, starting each one from the result of the previous
+    """
+    from scipy.sparse.linalg import expm_multiply
+
+    q_trans = q_matrix.T.tocsr()
+    res = np.zeros((len(times), len(p0)))
+    current, current_time = p0, 0.0
+    for i in np.argsort(times, kind="stable"):
+        if times[i] > current_time:
+            current = expm_multiply(q_trans * (times[i] - current_time), current)
+            current_time = times[i]
+        res[i] = current
+    return res
+
+
+def __transient_uniformization(q_matrix, p0, times, tolerance, max_iterations):
+    """
+    Transient analysis through uniformization: the CTMC is turned into a DTMC with transition matrix
+    P = I + Q / rate (where rate is the maximum exit rate), and the probabilities after a time t are the average
+    of the probabilities after k steps of the DTMC, weighted by a Poisson distribution of mean rate * t.
+    The steps of the DTMC are shared by all the time intervals, and they are interrupted when the right tail
+    of every Poisson distribution is negligible, or when the DTMC reaches its steady state.
+    """
+    from scipy import sparse
+    from scipy.stats import poisson
+
+    rate = float(max(-q_matrix.diagonal().min(), 0.0)) if q_matrix.shape[0] > 0 else 0.0
+    if rate == 0.0:
+        # no transitions between states
+        return np.tile(p0, (len(times), 1))
+    p_trans = (sparse.identity(q_matrix.shape[0], format="csr") + q_matrix / rate).T.tocsr()
+    means = rate * times
+    last_step = int(np.max(poisson.isf(tolerance, means))) if len(times) > 0 else 0
+
+    res = np.zeros((len(times), len(p0)))
+    cumulative = np.zeros(len(times))
+    # logarithms of the Poisson weights, updated at every step (log(w_k) = log(w_{k-1}) + log(rate * t) - log(k))
+    log_weights = -means
+    log_means = np.log(np.maximum(means, np.finfo(float).tiny))
+    current = p0
+    for k in range(last_step + 1):
+        if k > 0:
+            log_weights = log_weights + log_means - np.log(k)
+        weights = np.exp(log_weights)
+        res += np.outer(weights, current)
+        cumulative += weights
+        if k == last_step:
+            break
+        if k == max_iterations:
+            raise Exception("the uniformization did not converge in " + str(max_iterations) + " steps")
+        following = p_trans.dot(current)
+        if np.abs(following - current).sum() < tolerance:
+            # steady state of the DTMC: the remaining steps have the same probabilities
+            res += np.outer(np.maximum(1.0 - cumulative, 0.0), following)
+            break
+        current = following
+    return res
+
+
 def nullspace(a_matrix, atol=1e-13, rtol=0):
     """Compute an approximate basis for the nullspace of A.
 
@@ -349,24 +515,80 @@ def nullspace(a_matrix, atol=1e-13, rtol=0):
     return ns
 
 
-def perform_steadystate(q_matrix, tangible_reach_graph):
+def perform_steadystate(q_matrix, tangible_reach_graph, parameters=None):
+    """
+    Performs steady state analysis given the Q matrix (dense or sparse) and the tangible reachability graph
+
+    Parameters
+    -------------
+    q_matrix
+        Q matrix
+    tangible_reach_graph
+        Tangible reachability graph
+    parameters
+        Parameters of the algorithm (see get_steady_state_probabilities)
+
+    Returns
+    -------------
+    vec
+        Vector of the steady state probabilities (the states are sorted by name)
+    """
+    return get_steady_state_probabilities(q_matrix, parameters=parameters)
+
+
+def get_steady_state_probabilities(q_matrix, parameters=None):
     """
-    Performs steady state analysis given the
-    :param q_matrix:
-    :return:
+    Gets the steady state probabilities of the CTMC, solving the (sparse) linear system pi Q = 0
+    where one of the equations is replaced by the normalization sum(pi) = 1
+
+    Parameters
+    -------------
+    q_matrix
+        Q matrix (dense or sparse)
+    parameters
+        Parameters of the algorithm, including:
+            - Parameters.STEADYSTATE_SOLVER => solver (SteadyStateSolvers) to use (default: ITERATIVE)
+            - Parameters.TOLERANCE => tolerance of the iterative solver (default: 1e-10)
+            - Parameters.MAX_ITERATIONS => maximum number of iterations of the iterative solver (default: 10^6)
+
+    Returns
+    -------------
+    vec
+        Vector of the steady state probabilities
     """
-    transient_result = Counter()
-    states = sorted(list(tangible_reach_graph.states), key=lambda x: x.name)
-    q_matrix_trans = np.matrix.transpose(q_matrix)
-    if nullspace(q_matrix_trans).shape[1] > 0:
-        M = np.matrix.transpose(nullspace(q_matrix_trans))
-        vec = np.zeros(M.shape[1])
-        for i in range(M.shape[0]):
-            v = np.matmul(M[i], q_matrix_trans)
-            val = np.sum(v) / np.sum(M[i])
-            vec = vec + val * M[i]
-        vec = vec / np.sum(vec)
-        for i in range(len(states)):
-            transient_result[states[i]] = vec[i]
-        return vec
-    return transient_result
+    if parameters is None:
+        parameters = {}
+
+    solver = exec_utils.get_param_value(Parameters.STEADYSTATE_SOLVER, parameters, SteadyStateSolvers.ITERATIVE)
+    tolerance = exec_utils.get_param_value(Parameters.TOLERANCE, parameters, 1e-10)
+    max_iterations = exec_utils.get_param_value(Parameters.MAX_ITERATIONS, parameters, 10 ** 6)
+
+    from scipy import sparse
+    from scipy.sparse.linalg import spsolve, gmres
+
+    no_states = q_matrix.shape[0]
+    if no_states == 0:
+        return np.zeros(0)
+
+    q_trans = sparse.csr_matrix(q_matrix).T.tocsr()
+    a_matrix = sparse.vstack([q_trans[:-1], sparse.csr_matrix(np.ones((1, no_states)))], format="csc")
+    b_vector = np.zeros(no_states)
+    b_vector[-1] = 1.0
+
+    vec = None
+    if solver == SteadyStateSolvers.ITERATIVE.value:
+        x0 = np.full(no_states, 1.0 / no_states)
+        try:
+            vec, info = gmres(a_matrix, b_vector, x0=x0, rtol=tolerance, atol=tolerance, maxiter=max_iterations)
+        except TypeError:
+            # older versions of SciPy
+            vec, info = gmres(a_matrix, b_vector, x0=x0, tol=tolerance, atol=tolerance, maxiter=max_iterations)
+        if info != 0:
+            vec = None
+    elif solver != SteadyStateSolvers.DIRECT.value:
+        raise Exception("unsupported steady state solver: " + str(solver))
+    if vec is None:
+        vec = spsolve(a_matrix, b_vector)
+
+    vec = np.maximum(vec, 0.0)
+    return vec / np.sum(vec)
@@ -86,12 +86,12 @@ def get_tangible_reachability_from_reachability(reach_graph, stochastic_info):
     tangible_reach_graph
         Tangible reachability graph
     """
-    timed_transitions = []
+    timed_transitions = set()
     for trans in stochastic_info.keys():
         random_variable = stochastic_info[trans]
         transition_type = random_variable.get_transition_type()
         if transition_type == "TIMED":
-            timed_transitions.append(trans.name)
+            timed_transitions.add(trans.name)
     states_reach = list(reach_graph.states)
     for s in states_reach:
         state_outgoing_trans = list(s.outgoing)
@@ -1,7 +1,7 @@
-from numpy.random import choice
+import numpy as np
 
 
-def pick_transition(et, smap):
+def pick_transition(et, smap, random_state=None):
     """
     Pick a transition in a set of transitions based on the weights
     specified by the stochastic map
@@ -12,6 +12,9 @@ def pick_transition(et, smap):
         Enabled transitions
     smap
         Stochastic map
+    random_state
+        Random number generator (numpy.random.RandomState) used to pick the transition
+        (default: None, the global one of NumPy)
 
     Returns
     --------------
@@ -28,5 +31,7 @@ def pick_transition(et, smap):
             probability_distribution.append(1.0/float(len(wmap)))
         else:
             probability_distribution.append(wmap[ct] / wmap_sv)
-    ct = list(choice(et, 1, p=probability_distribution))[0]
+    if random_state is None:
+        random_state = np.random
+    ct = list(random_state.choice(et, 1, p=probability_distribution))[0]
     return ct
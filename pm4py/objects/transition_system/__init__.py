@@ -1,2 +1,6 @@
-from pm4py.objects.transition_system import transition_system, utils, constants
+from pm4py.util.lazy_import import lazy_getattr
 
+# the submodules are imported when they are accessed for the first time
+__all__ = ["transition_system", "utils", "constants"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
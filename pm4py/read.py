@@ -8,7 +8,7 @@ from pm4py.util import constants
 INDEX_COLUMN = "@@index"
 
 
-def read_xes(file_path):
+def read_xes(file_path, enable_cache=False):
     """
     Reads an event log in the XES standard
 
@@ -16,6 +16,9 @@ def read_xes(file_path):
     ---------------
     file_path
         File path
+    enable_cache
+        Keeps the parsed log in an on-disk cache, so the next reads of the same (unchanged) file
+        do not parse it again. When enabled, a columnar event log is returned (default: False)
 
     Returns
     ---------------
@@ -23,10 +26,30 @@ def read_xes(file_path):
         Event log
     """
     from pm4py.objects.log.importer.xes import importer as xes_importer
+    if enable_cache:
+        return xes_importer.apply(file_path, parameters={xes_importer.Parameters.ENABLE_CACHE: True})
     log = xes_importer.apply(file_path)
     return log
 
 
+def read_columnar(file_path):
+    """
+    Reads an event log stored in the columnar format (the arrays are memory-mapped)
+
+    Parameters
+    ---------------
+    file_path
+        Path of the folder containing the log
+
+    Returns
+    ---------------
+    log
+        Columnar event log
+    """
+    from pm4py.objects.log.importer.columnar import importer as columnar_importer
+    return columnar_importer.apply(file_path)
+
+
 @deprecation.deprecated(deprecated_in="2.0.1.3", removed_in="3.0",
                         current_version=VERSION,
                         details="Use pandas to import CSV files")
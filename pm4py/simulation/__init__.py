@@ -1,6 +1,12 @@
-from pm4py.simulation import playout, montecarlo, tree_playout
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["playout", "montecarlo", "tree_playout"]
+
 # tree generation is possible only with scipy installed
 if pkgutil.find_loader("scipy"):
-    from pm4py.simulation import tree_generator
+    __all__.append("tree_generator")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1,2 +1,6 @@
-from pm4py.simulation.montecarlo import utils, variants, simulator, outputs
+from pm4py.util.lazy_import import lazy_getattr
 
+# the submodules are imported when they are accessed for the first time
+__all__ = ["utils", "variants", "simulator", "outputs"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1 +1,6 @@
-from pm4py.simulation.montecarlo.variants import petri_semaph_fifo
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["petri_semaph_fifo", "petri_discrete_event"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
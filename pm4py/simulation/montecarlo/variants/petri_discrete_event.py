@@ -0,0 +1,405 @@
+import datetime
+import heapq
+import logging
+import os
+from collections import deque
+from statistics import median
+from time import time
+
+import numpy as np
+
+from pm4py.objects.log.log import EventLog, Trace, Event
+from pm4py.objects.petri import compiled
+from pm4py.objects.stochastic_petri import utils as stochastic_utils
+from pm4py.simulation.montecarlo.outputs import Outputs
+from pm4py.simulation.montecarlo.parameters import Parameters
+from pm4py.simulation.montecarlo.utils import replay
+from pm4py.statistics.traces.log import case_arrival
+from pm4py.util import exec_utils, pool_utils, xes_constants
+
+# commands that a case process yields to the simulation engine
+REQUEST = 0
+RELEASE = 1
+TIMEOUT = 2
+
+
+def __case_process(cnet, smap, initial_marking, final_marking, source, arcs, held, places_intervals,
+                   transitions_intervals, trace, random_state):
+    """
+    Process (generator) describing the life of a case in the simulation.
+
+    The process yields commands to the engine (request/release of the resource of a place, wait up to a
+    virtual time) and receives back the virtual time at which the command is satisfied.
+    Returns True if the case reaches the final marking, False if it gets stuck in a marking without enabled transitions
+    """
+    transitions = cnet.transitions
+    current_time = yield REQUEST, source
+    held[source] = deque([current_time])
+    marking = initial_marking
+    while not all(marking[p] >= n for p, n in final_marking):
+        et = cnet.enabled_transitions(marking)
+        if not et:
+            return False
+        ct = stochastic_utils.pick_transition([transitions[t] for t in et], smap, random_state=random_state)
+        t = cnet.transition_indices[ct]
+        simulated_execution_plus_waiting_time = -1
+        while simulated_execution_plus_waiting_time < 0:
+            simulated_execution_plus_waiting_time = smap[ct].get_value(random_state=random_state) if ct in smap else 0.0
+
+        # the resources of the output places are requested in order; the waiting time
+        # is the time needed to get all of them
+        waiting_time = 0
+        for p in arcs[t][1]:
+            granted_time = yield REQUEST, p
+            waiting_time = max(waiting_time, granted_time - current_time)
+        if waiting_time > 0:
+            transitions_intervals[t].append((current_time, current_time + waiting_time))
+
+        execution_time = max(simulated_execution_plus_waiting_time - waiting_time, 0)
+        current_time = yield TIMEOUT, current_time + waiting_time + execution_time
+
+        marking = cnet.weak_execute(t, marking)
+        for p in arcs[t][1]:
+            held.setdefault(p, deque()).append(current_time)
+        if ct.label is not None:
+            trace.append((ct.label, current_time))
+        for p in arcs[t][0]:
+            p_ex_time = held[p].popleft()
+            if current_time - p_ex_time > 0:
+                places_intervals[p].append((p_ex_time, current_time))
+            yield RELEASE, p
+    return True
+
+
+def __simulate(cnet, smap, im, fm, start_time, case_arrival_ratio, no_simulations, resources, max_execution_time,
+               random_state):
+    """
+    Runs a replication of the simulation on a single thread, advancing a virtual clock from an event to the next one.
+
+    Every place has a FIFO queue of the cases waiting for its resources: when a resource is released,
+    it is passed to the first case in the queue at the same virtual time.
+
+    Returns
+    -------------
+    cases
+        For each case that terminated correctly, list of (activity, virtual time) pairs
+    cases_ex_time
+        Throughput time of the cases that terminated correctly
+    places_intervals
+        For each place (index), the intervals of time in which it was occupied
+    transitions_intervals
+        For each transition (index), the intervals of time in which it could not fire
+    """
+    places_intervals = [[] for p in cnet.places]
+    transitions_intervals = [[] for t in cnet.transitions]
+    arcs = [(tuple(cnet.place_indices[a.source] for a in t.in_arcs),
+             tuple(cnet.place_indices[a.target] for a in t.out_arcs)) for t in cnet.transitions]
+    initial_marking = cnet.encode_marking(im)
+    final_marking = tuple((cnet.place_indices[p], n) for p, n in fm.items())
+    source = cnet.place_indices[list(im)[0]]
+
+    available = list(resources)
+    waiting = [deque() for p in cnet.places]
+    processes = {}
+    held = {}
+    traces = {}
+    terminated = {}
+
+    events = []
+    counter = 0
+    for i in range(no_simulations):
+        events.append((start_time + i * case_arrival_ratio, counter, i))
+        counter += 1
+    heapq.heapify(events)
+
+    internal_start_time = time()
+    while events:
+        if time() - internal_start_time > max_execution_time:
+            break
+        now, _, case = heapq.heappop(events)
+        if case not in processes:
+            held[case] = {}
+            traces[case] = []
+            processes[case] = __case_process(cnet, smap, initial_marking, final_marking, source, arcs, held[case],
+                                             places_intervals, transitions_intervals, traces[case], random_state)
+            value = None
+        else:
+            value = now
+        process = processes[case]
+        while True:
+            try:
+                command, arg = process.send(value)
+            except StopIteration as e:
+                terminated[case] = e.value
+                # the tokens still owned by the case (e.g. the one in the sink) free their resources
+                for p, times in held[case].items():
+                    for _ in range(len(times)):
+                        if waiting[p]:
+                            heapq.heappush(events, (now, counter, waiting[p].popleft()))
+                            counter += 1
+                        else:
+                            available[p] += 1
+                del processes[case]
+                del held[case]
+                break
+            if command == REQUEST:
+                if available[arg] > 0:
+                    available[arg] -= 1
+                    value = now
+                    continue
+                waiting[arg].append(case)
+                break
+            elif command == RELEASE:
+                if waiting[arg]:
+                    # the resource passes directly to the first waiting case
+                    heapq.heappush(events, (now, counter, waiting[arg].popleft()))
+                    counter += 1
+                else:
+                    available[arg] += 1
+                value = now
+            else:
+                heapq.heappush(events, (arg, counter, case))
+                counter += 1
+                break
+
+    cases = []
+    cases_ex_time = []
+    for i in range(no_simulations):
+        if terminated.get(i, False):
+            trace = traces[i]
+            cases.append(trace)
+            cases_ex_time.append(trace[-1][1] - trace[0][1] if trace else 0)
+
+    return cases, cases_ex_time, places_intervals, transitions_intervals
+
+
+def __get_resources(cnet, parameters):
+    """
+    Gets the number of resources available for each place (index) of the net
+    """
+    resources_per_places = exec_utils.get_param_value(Parameters.PARAM_MAP_RESOURCES_PER_PLACE, parameters,
+                                                      None)
+    default_num_resources_per_places = exec_utils.get_param_value(Parameters.PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE,
+                                                                  parameters, 1)
+    if resources_per_places is None:
+        resources_per_places = {}
+    return [resources_per_places[p] if p in resources_per_places else default_num_resources_per_places
+            for p in cnet.places]
+
+
+def __get_smap(log, net, im, fm, parameters):
+    """
+    Gets the stochastic map used in the simulation (provided by the user, or obtained by replaying the log)
+    """
+    smap = exec_utils.get_param_value(Parameters.PARAM_PROVIDED_SMAP, parameters, None)
+    force_distribution = exec_utils.get_param_value(Parameters.PARAM_FORCE_DISTRIBUTION, parameters, None)
+    enable_diagnostics = exec_utils.get_param_value(Parameters.PARAM_ENABLE_DIAGNOSTICS, parameters, True)
+
+    # when the user does not specify any map from transitions to random variables,
+    # a replay operation is performed
+    if smap is None:
+        logging.basicConfig()
+        logger = logging.getLogger(__name__)
+        logger.setLevel(logging.DEBUG)
+        if enable_diagnostics:
+            logger.info(str(time()) + " started the replay operation.")
+        if force_distribution is not None:
+            smap = replay.get_map_from_log_and_net(log, net, im, fm, force_distribution=force_distribution,
+                                                   parameters=parameters)
+        else:
+            smap = replay.get_map_from_log_and_net(log, net, im, fm, parameters=parameters)
+        if enable_diagnostics:
+            logger.info(str(time()) + " ended the replay operation.")
+    return smap
+
+
+def __get_settings(log, cnet, parameters):
+    """
+    Gets the settings of a replication of the simulation
+    """
+    case_arrival_ratio = exec_utils.get_param_value(Parameters.PARAM_CASE_ARRIVAL_RATIO, parameters, None)
+    if case_arrival_ratio is None:
+        case_arrival_ratio = case_arrival.get_case_arrival_avg(log, parameters=parameters)
+    # the start timestamp is set to 1000000 instead of 0 to avoid problems with 32 bit machines
+    return {"start_time": 1000000, "case_arrival_ratio": case_arrival_ratio,
+            "no_simulations": exec_utils.get_param_value(Parameters.PARAM_NUM_SIMULATIONS, parameters, 100),
+            "resources": __get_resources(cnet, parameters),
+            "max_execution_time": exec_utils.get_param_value(Parameters.PARAM_MAX_THREAD_EXECUTION_TIME,
+                                                             parameters, 60.0)}
+
+
+def __run_replication(cnet, smap, im, fm, settings, seed):
+    """
+    Runs a replication of the simulation, with its own random number generator if a seed is provided
+    (otherwise, the global one of NumPy is used)
+    """
+    random_state = np.random.RandomState(seed) if seed is not None else None
+    return __simulate(cnet, smap, im, fm, settings["start_time"], settings["case_arrival_ratio"],
+                      settings["no_simulations"], settings["resources"], settings["max_execution_time"],
+                      random_state)
+
+
+def __build_output(cnet, replication, case_arrival_ratio):
+    """
+    Builds the simulated log and the result of the simulation from the (index-based) output of a replication
+    """
+    from intervaltree import IntervalTree, Interval
+
+    cases, cases_ex_time, places_intervals, transitions_intervals = replication
+
+    log = EventLog()
+    for case in cases:
+        trace = Trace()
+        for activity, timestamp in case:
+            trace.append(Event({xes_constants.DEFAULT_NAME_KEY: activity,
+                                xes_constants.DEFAULT_TIMESTAMP_KEY: datetime.datetime.fromtimestamp(timestamp)}))
+        log.append(trace)
+
+    places_interval_trees = {}
+    for i, p in enumerate(cnet.places):
+        places_interval_trees[p] = IntervalTree(Interval(b, e) for b, e in places_intervals[i])
+    transitions_interval_trees = {}
+    for i, t in enumerate(cnet.transitions):
+        transitions_interval_trees[t.name] = IntervalTree(Interval(b, e) for b, e in transitions_intervals[i])
+
+    timestamps = [timestamp for case in cases for activity, timestamp in case]
+    total_cases_time = max(timestamps) - min(timestamps) if timestamps else 0
+
+    return log, {Outputs.OUTPUT_PLACES_INTERVAL_TREES.value: places_interval_trees,
+                 Outputs.OUTPUT_TRANSITIONS_INTERVAL_TREES.value: transitions_interval_trees,
+                 Outputs.OUTPUT_CASES_EX_TIME.value: cases_ex_time,
+                 Outputs.OUTPUT_MEDIAN_CASES_EX_TIME.value: median(cases_ex_time) if cases_ex_time else 0,
+                 Outputs.OUTPUT_CASE_ARRIVAL_RATIO.value: case_arrival_ratio,
+                 Outputs.OUTPUT_TOTAL_CASES_TIME.value: total_cases_time}
+
+
+def _simulate_replication(seed):
+    """
+    Runs a replication of the simulation in a worker process
+    """
+    state = pool_utils.get_worker_state()
+    im, fm = state["markings"]
+    return __run_replication(state["cnet"], state["smap"], im, fm, state["settings"], seed)
+
+
+def apply(log, net, im, fm, parameters=None):
+    """
+    Performs a Monte Carlo simulation of an accepting Petri net without duplicate transitions and where the preset is always
+    distinct from the postset (discrete-event variant).
+
+    The cases are simulated on a single thread, on a virtual clock that jumps from an event to the next one
+    (no sleeping is involved). Each place has a number of resources, and the cases waiting for them
+    are served in FIFO order.
+
+    Parameters
+    -------------
+    log
+        Event log
+    net
+        Accepting Petri net without duplicate transitions and where the preset is always distinct from the postset
+    im
+        Initial marking
+    fm
+        Final marking
+    parameters
+        Parameters of the algorithm:
+            PARAM_NUM_SIMULATIONS => (default: 100)
+            PARAM_FORCE_DISTRIBUTION => Force a particular stochastic distribution (e.g. normal) when the stochastic map
+            is discovered from the log (default: None; no distribution is forced)
+            PARAM_ENABLE_DIAGNOSTICS => Enable the printing of diagnostics (default: True)
+            PARAM_CASE_ARRIVAL_RATIO => Case arrival of new cases (default: None; inferred from the log)
+            PARAM_PROVIDED_SMAP => Stochastic map that is used in the simulation (default: None; inferred from the log)
+            PARAM_MAP_RESOURCES_PER_PLACE => Specification of the number of resources available per place
+            (default: None; each place gets the default number of resources)
+            PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE => Default number of resources per place when not specified
+            (default: 1; each place gets 1 resource and has to wait for the resource to finish)
+            PARAM_MAX_THREAD_EXECUTION_TIME => Maximum execution time of the simulation (default: 60.0, 1 minute);
+            the cases that are not completed are discarded
+            PARAM_RANDOM_SEED => Seed of the random number generator (default: None)
+
+    Returns
+    ------------
+    simulated_log
+        Simulated event log
+    simulation_result
+        Result of the simulation:
+            Outputs.OUTPUT_PLACES_INTERVAL_TREES => inteval trees that associate to each place the times in which it was occupied.
+            Outputs.OUTPUT_TRANSITIONS_INTERVAL_TREES => interval trees that associate to each transition the intervals of time
+            in which it could not fire because some token was in the output.
+            Outputs.OUTPUT_CASES_EX_TIME => Throughput time of the cases included in the simulated log
+            Outputs.OUTPUT_MEDIAN_CASES_EX_TIME => Median of the throughput times
+            Outputs.OUTPUT_CASE_ARRIVAL_RATIO => Case arrival ratio that was specified in the simulation
+            Outputs.OUTPUT_TOTAL_CASES_TIME => Total time occupied by cases of the simulated log
+    """
+    if parameters is None:
+        parameters = {}
+
+    seed = exec_utils.get_param_value(Parameters.PARAM_RANDOM_SEED, parameters, None)
+
+    cnet = compiled.construct(net)
+    smap = __get_smap(log, net, im, fm, parameters)
+    settings = __get_settings(log, cnet, parameters)
+
+    replication = __run_replication(cnet, smap, im, fm, settings, seed)
+
+    return __build_output(cnet, replication, settings["case_arrival_ratio"])
+
+
+def apply_replications(log, net, im, fm, parameters=None):
+    """
+    Performs independent replications of the Monte Carlo simulation (discrete-event variant),
+    possibly in parallel on a pool of processes.
+
+    The stochastic map is computed once and shared by all the replications; each replication
+    gets its own seed for the random number generator.
+
+    Parameters
+    -------------
+    log
+        Event log
+    net
+        Accepting Petri net without duplicate transitions and where the preset is always distinct from the postset
+    im
+        Initial marking
+    fm
+        Final marking
+    parameters
+        Parameters of the algorithm (see apply), including:
+            PARAM_NUM_REPLICATIONS => Number of replications (default: 10)
+            PARAM_RANDOM_SEED => Seed of the first replication (the i-th replication gets seed + i);
+            if not provided, the seeds are drawn from the random number generator
+            ENABLE_PARALLEL => Runs the replications on a pool of processes (default: False)
+            NUM_WORKERS => Number of processes (default: the number of CPUs)
+
+    Returns
+    ------------
+    replications
+        List containing, for each replication, a couple (simulated_log, simulation_result)
+    """
+    if parameters is None:
+        parameters = {}
+
+    no_replications = exec_utils.get_param_value(Parameters.PARAM_NUM_REPLICATIONS, parameters, 10)
+    seed = exec_utils.get_param_value(Parameters.PARAM_RANDOM_SEED, parameters, None)
+    enable_parallel = exec_utils.get_param_value(Parameters.ENABLE_PARALLEL, parameters, False)
+    num_workers = exec_utils.get_param_value(Parameters.NUM_WORKERS, parameters, os.cpu_count())
+
+    cnet = compiled.construct(net)
+    smap = __get_smap(log, net, im, fm, parameters)
+    settings = __get_settings(log, cnet, parameters)
+
+    if seed is not None:
+        seeds = [seed + i for i in range(no_replications)]
+    else:
+        seeds = [int(x) for x in np.random.randint(0, 2 ** 31 - 1, size=no_replications)]
+
+    if enable_parallel and num_workers is not None and num_workers > 1 and no_replications > 1:
+        # the stochastic map is pickled along with the compiled net, so its keys are the transitions of the net
+        # in the workers, and the places/transitions keep the positions that they have in the main process
+        state = {"cnet": cnet, "markings": (im, fm), "smap": smap, "settings": settings}
+        with pool_utils.get_pool(min(num_workers, no_replications), state) as executor:
+            replications = list(executor.map(_simulate_replication, seeds))
+    else:
+        replications = [__run_replication(cnet, smap, im, fm, settings, s) for s in seeds]
+
+    return [__build_output(cnet, replication, settings["case_arrival_ratio"]) for replication in replications]
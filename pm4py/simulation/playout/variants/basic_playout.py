@@ -1,9 +1,8 @@
 import datetime
-from copy import copy
 from random import choice
 
 from pm4py.objects.log import log as log_instance
-from pm4py.objects.petri import semantics
+from pm4py.objects.petri import compiled
 from pm4py.util import exec_utils
 from pm4py.util import xes_constants
 from enum import Enum
@@ -44,31 +43,35 @@ def apply_playout(net, initial_marking, no_traces=100, max_trace_length=100,
     final_marking
         If provided, the final marking of the Petri net
     """
+    # the playout is done on the compiled net (markings are tuples of integers)
+    compiled_net = compiled.construct(net)
+    transitions = compiled_net.transitions
+    fin = compiled_net.encode_marking(final_marking) if final_marking is not None else None
     # assigns to each event an increased timestamp from 1970
     curr_timestamp = 10000000
     log = log_instance.EventLog()
     for i in range(no_traces):
         trace = log_instance.Trace()
         trace.attributes[case_id_key] = str(i)
-        marking = copy(initial_marking)
+        marking = compiled_net.encode_marking(initial_marking)
         while len(trace) < max_trace_length:
-            if not semantics.enabled_transitions(net, marking):  # supports nets with possible deadlocks
+            all_enabled_trans = compiled_net.enabled_transitions(marking)
+            if not all_enabled_trans:  # supports nets with possible deadlocks
                 break
-            all_enabled_trans = semantics.enabled_transitions(net, marking)
-            if final_marking is not None and marking == final_marking:
-                trans = choice(list(all_enabled_trans.union({None})))
+            if fin is not None and marking == fin:
+                trans = choice(all_enabled_trans + [None])
             else:
-                trans = choice(list(all_enabled_trans))
+                trans = choice(all_enabled_trans)
             if trans is None:
                 break
-            if trans.label is not None:
+            if transitions[trans].label is not None:
                 event = log_instance.Event()
-                event[activity_key] = trans.label
+                event[activity_key] = transitions[trans].label
                 event[timestamp_key] = datetime.datetime.fromtimestamp(curr_timestamp)
                 trace.append(event)
                 # increases by 1 second
                 curr_timestamp += 1
-            marking = semantics.execute(trans, net, marking)
+            marking = compiled_net.execute(trans, marking)
         log.append(trace)
     return log
 
@@ -1,7 +1,8 @@
 import datetime
+from collections import deque
 
 from pm4py.objects.log import log as log_instance
-from pm4py.objects.petri import semantics
+from pm4py.objects.petri import compiled
 from pm4py.util import exec_utils
 from pm4py.util import xes_constants
 from enum import Enum
@@ -49,20 +50,25 @@ def apply(net, initial_marking, final_marking=None, parameters=None):
 
     log = log_instance.EventLog()
 
-    to_visit = [(initial_marking, ())]
+    # the search is done on the compiled net (markings are tuples of integers)
+    compiled_net = compiled.construct(net)
+    transitions = compiled_net.transitions
+    fin = compiled_net.encode_marking(final_marking) if final_marking is not None else None
+
+    to_visit = deque([(compiled_net.encode_marking(initial_marking), ())])
     visited = set()
 
     while len(to_visit) > 0:
-        state = to_visit.pop(0)
+        state = to_visit.popleft()
         if state in visited:
             continue
         visited.add(state)
 
         m = state[POSITION_MARKING]
         trace = state[POSITION_TRACE]
-        en_t = semantics.enabled_transitions(net, m)
+        en_t = compiled_net.enabled_transitions(m)
 
-        if (final_marking is not None and m == final_marking) or len(en_t) == 0:
+        if (fin is not None and m == fin) or len(en_t) == 0:
             if len(trace) <= max_trace_length:
                 log_trace = log_instance.Trace()
                 log_trace.attributes[case_id_key] = str(len(log))
@@ -72,9 +78,9 @@ def apply(net, initial_marking, final_marking=None, parameters=None):
                 log.append(log_trace)
 
         for t in en_t:
-            new_m = semantics.weak_execute(t, m)
-            if t.label is not None:
-                new_trace = trace + (t.label,)
+            new_m = compiled_net.weak_execute(t, m)
+            if transitions[t].label is not None:
+                new_trace = trace + (transitions[t].label,)
             else:
                 new_trace = trace
             new_state = (new_m, new_trace)
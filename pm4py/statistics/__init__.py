@@ -1,3 +1,7 @@
-from pm4py.statistics import traces, performance_spectrum, attributes, variants, start_activities, end_activities, util, \
-    sojourn_time, concurrent_activities
+from pm4py.util.lazy_import import lazy_getattr
 
+# the submodules are imported when they are accessed for the first time
+__all__ = ["traces", "performance_spectrum", "attributes", "variants", "start_activities", "end_activities", "util",
+           "sojourn_time", "concurrent_activities"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
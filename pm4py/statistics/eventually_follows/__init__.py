@@ -1,5 +1,11 @@
-from pm4py.statistics.eventually_follows import log
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["log"]
+
 if pkgutil.find_loader("pandas"):
-    from pm4py.statistics.eventually_follows import pandas
+    __all__.append("pandas")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
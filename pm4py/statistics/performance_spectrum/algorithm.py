@@ -3,7 +3,9 @@ from enum import Enum
 from pm4py.util import exec_utils
 from pm4py.statistics.performance_spectrum.parameters import Parameters
 from pm4py.statistics.performance_spectrum.outputs import Outputs
+from pm4py.util import points_subset
 import pkgutil
+import sys
 
 
 class Variants(Enum):
@@ -29,6 +31,9 @@ def apply(log, list_activities, parameters=None):
         Parameters of the algorithm, including:
             - Parameters.ACTIVITY_KEY
             - Parameters.TIMESTAMP_KEY
+            - Parameters.PARAMETER_SAMPLE_SIZE => maximum number of points returned (default: 10000)
+            - Parameters.NUM_BINS => if provided, the spectrum is also aggregated (over all the occurrences
+            of the pattern, not only the sampled ones) in the given number of time bins
 
     Returns
     -------------
@@ -41,20 +46,82 @@ def apply(log, list_activities, parameters=None):
         parameters = {}
 
     sample_size = exec_utils.get_param_value(Parameters.PARAMETER_SAMPLE_SIZE, parameters, 10000)
+    num_bins = exec_utils.get_param_value(Parameters.NUM_BINS, parameters, None)
 
     if len(list_activities) < 2:
         raise Exception("performance spectrum can be applied providing at least two activities!")
 
     points = None
+    # when aggregating, all the points are needed
+    variant_sample_size = sys.maxsize if num_bins is not None else sample_size
 
     if pkgutil.find_loader("pandas"):
         import pandas as pd
         if type(log) is pd.DataFrame:
-            points = exec_utils.get_variant(Variants.DATAFRAME).apply(log, list_activities, sample_size, parameters)
+            points = exec_utils.get_variant(Variants.DATAFRAME).apply(log, list_activities, variant_sample_size,
+                                                                      parameters)
 
-    points = exec_utils.get_variant(Variants.LOG).apply(log_conversion.apply(log), list_activities, sample_size,
-                                                        parameters)
+    if points is None:
+        points = exec_utils.get_variant(Variants.LOG).apply(log_conversion.apply(log), list_activities,
+                                                            variant_sample_size, parameters)
 
-    ps = {Outputs.LIST_ACTIVITIES.value: list_activities, Outputs.POINTS.value: points}
+    ps = {Outputs.LIST_ACTIVITIES.value: list_activities}
+
+    if num_bins is not None:
+        ps.update(aggregate(points, len(list_activities), num_bins))
+        if len(points) > sample_size:
+            # sample as the variants do, keeping the type of the points (array for dataframes, list for logs)
+            if type(points) is list:
+                points = points_subset.pick_chosen_points_list(sample_size, points)
+            else:
+                import numpy as np
+                points = points[np.asarray(points_subset.pick_chosen_points(sample_size, len(points)))]
+
+    ps[Outputs.POINTS.value] = points
 
     return ps
+
+
+def aggregate(points, num_activities, num_bins):
+    """
+    Aggregates the points of the performance spectrum: the time range is divided in bins of equal width,
+    and for every segment of the pattern (couple of consecutive activities) the occurrences starting
+    in every bin are counted, along with their mean duration
+
+    Parameters
+    -------------
+    points
+        Points of the performance spectrum
+    num_activities
+        Number of activities of the pattern
+    num_bins
+        Number of bins
+
+    Returns
+    -------------
+    aggregation
+        Dictionary containing:
+            - Outputs.BIN_EDGES => edges of the bins (in seconds)
+            - Outputs.BIN_COUNTS => array (bins x segments) containing the number of occurrences
+            - Outputs.BIN_MEAN_DURATIONS => array (bins x segments) containing the mean duration (in seconds)
+            of the occurrences (NaN if there is no occurrence)
+    """
+    import numpy as np
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, num_activities)
+    num_segments = num_activities - 1
+    counts = np.zeros((num_bins, num_segments), dtype=np.int64)
+    sums = np.zeros((num_bins, num_segments), dtype=np.float64)
+    if len(points) > 0:
+        edges = np.linspace(points[:, :-1].min(), points[:, :-1].max(), num_bins + 1)
+        for j in range(num_segments):
+            bins = np.clip(np.searchsorted(edges, points[:, j], side="right") - 1, 0, num_bins - 1)
+            counts[:, j] = np.bincount(bins, minlength=num_bins)
+            sums[:, j] = np.bincount(bins, weights=points[:, j + 1] - points[:, j], minlength=num_bins)
+    else:
+        edges = np.zeros(num_bins + 1, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_durations = np.where(counts > 0, sums / counts, np.nan)
+
+    return {Outputs.BIN_EDGES.value: edges, Outputs.BIN_COUNTS.value: counts,
+            Outputs.BIN_MEAN_DURATIONS.value: mean_durations}
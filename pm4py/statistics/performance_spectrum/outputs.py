@@ -3,3 +3,6 @@ from enum import Enum
 class Outputs(Enum):
     LIST_ACTIVITIES = "list_activities"
     POINTS = "points"
+    BIN_EDGES = "bin_edges"
+    BIN_COUNTS = "bin_counts"
+    BIN_MEAN_DURATIONS = "bin_mean_durations"
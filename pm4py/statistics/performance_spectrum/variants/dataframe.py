@@ -1,7 +1,39 @@
 from pm4py.util import xes_constants as xes
 from pm4py.util.constants import CASE_CONCEPT_NAME
 from pm4py.statistics.performance_spectrum.parameters import Parameters
-from pm4py.util import exec_utils, pandas_utils, constants
+from pm4py.util import exec_utils, points_subset
+
+
+def find_matches(case_codes, activity_codes, pattern):
+    """
+    Finds the occurrences of a pattern of activities, as consecutive events of the same case
+
+    Parameters
+    -------------
+    case_codes
+        Integer code of the case of every event (the events of a case are contiguous and sorted by timestamp)
+    activity_codes
+        Integer code of the activity of every event
+    pattern
+        Integer codes of the activities of the pattern
+
+    Returns
+    -------------
+    starts
+        Positions of the first event of every occurrence of the pattern
+    """
+    import numpy as np
+
+    n = len(pattern)
+    m = len(activity_codes) - n + 1
+    if m <= 0:
+        return np.zeros(0, dtype=np.int64)
+    # the events of a case are contiguous, so the first and the last event of a window belong
+    # to the same case only if the entire window does
+    mask = case_codes[:m] == case_codes[n - 1:]
+    for k in range(n):
+        mask &= activity_codes[k:k + m] == pattern[k]
+    return np.flatnonzero(mask)
 
 
 def apply(dataframe, list_activities, sample_size, parameters):
@@ -26,7 +58,8 @@ def apply(dataframe, list_activities, sample_size, parameters):
     Returns
     -------------
     points
-        Points of the performance spectrum
+        Points of the performance spectrum (NumPy array having a row per occurrence of the pattern,
+        containing the timestamps, in seconds, of its events), sorted by the first timestamp
     """
     if parameters is None:
         parameters = {}
@@ -38,38 +71,27 @@ def apply(dataframe, list_activities, sample_size, parameters):
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes.DEFAULT_NAME_KEY)
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes.DEFAULT_TIMESTAMP_KEY)
 
-    dataframe = dataframe[[case_id_glue, activity_key, timestamp_key]]
-    dataframe = dataframe[dataframe[activity_key].isin(list_activities)]
-    dataframe = pandas_utils.insert_index(dataframe, constants.DEFAULT_EVENT_INDEX_KEY)
-    dataframe = dataframe.sort_values([case_id_glue, timestamp_key, constants.DEFAULT_EVENT_INDEX_KEY])
-    dataframe[timestamp_key] = dataframe[timestamp_key].astype(np.int64) / 10**9
-    list_replicas = []
-    activity_names = []
-    filt_col_names = []
-    for i in range(len(list_activities)):
-        if i > 0:
-            dataframe = dataframe.shift(-1)
-            activity_names.append("+'@@'+")
-        ren = {x: x+"_"+str(i) for x in dataframe.columns}
-        list_replicas.append(dataframe.rename(columns=ren))
-        filt_col_names.append(timestamp_key+"_"+str(i))
-
-        activity_names.append("dataframe[activity_key+'_"+str(i)+"']")
-
-    dataframe = pd.concat(list_replicas, axis=1)
-    for i in range(len(list_activities)-1):
-        dataframe = dataframe[dataframe[case_id_glue+"_"+str(i)] == dataframe[case_id_glue+"_"+str(i+1)]]
-    dataframe["@@merged_activity"] = eval("".join(activity_names))
-    desidered_act = "@@".join(list_activities)
-    dataframe = dataframe[dataframe["@@merged_activity"] == desidered_act]
-    dataframe = dataframe[filt_col_names]
-
-    if len(dataframe) > sample_size:
-        dataframe = dataframe.sample(n=sample_size)
-
-    points = pandas_utils.to_dict_records(dataframe)
-    points = [[p[tk] for tk in filt_col_names] for p in points]
-    points = sorted(points, key=lambda x: x[0])
+    # the activities of the pattern are integer-coded (-1 for the other activities), and only the events
+    # having one of them are kept
+    unique_activities = list(dict.fromkeys(list_activities))
+    pattern = np.array([unique_activities.index(act) for act in list_activities], dtype=np.int64)
+    activity_codes = pd.Categorical(dataframe[activity_key], categories=unique_activities).codes
+    filt = np.flatnonzero(activity_codes >= 0)
+    activity_codes = activity_codes[filt].astype(np.int64)
+    case_codes = pd.factorize(dataframe[case_id_glue].values[filt])[0]
+    timestamps = dataframe[timestamp_key].values[filt].astype("datetime64[ns]").view(np.int64)
 
-    return points
+    # sorts the events by case and timestamp (keeping the order of the events of the dataframe in the ties)
+    order = np.lexsort((filt, timestamps, case_codes))
+    case_codes = case_codes[order]
+    activity_codes = activity_codes[order]
+    timestamps = timestamps[order]
+
+    starts = find_matches(case_codes, activity_codes, pattern)
+    points = timestamps[starts[:, np.newaxis] + np.arange(len(pattern))] / 10**9
+    points = points[np.argsort(points[:, 0], kind="stable")]
 
+    if len(points) > sample_size:
+        points = points[points_subset.pick_chosen_points(sample_size, len(points))]
+
+    return points
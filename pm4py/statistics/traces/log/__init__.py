@@ -1 +1,6 @@
-from pm4py.statistics.traces.log import case_statistics, case_arrival
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["case_statistics", "case_arrival"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -2,7 +2,7 @@ from pm4py.statistics.variants.log import get as variants_get
 from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
 from pm4py.util.xes_constants import DEFAULT_TRACEID_KEY
 from pm4py.statistics.traces.common import case_duration as case_duration_commons
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util import business_hours as bh_utils
 import numpy as np
 from enum import Enum
 from pm4py.util import exec_utils
@@ -26,6 +26,7 @@ class Parameters(Enum):
     BUSINESS_HOURS = "business_hours"
     WORKTIMING = "worktiming"
     WEEKENDS = "weekends"
+    HOLIDAYS = "holidays"
 
     INDEXED_LOG = "indexed_log"
 
@@ -112,18 +113,25 @@ def get_cases_description(log, parameters=None):
     business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
     worktiming = exec_utils.get_param_value(Parameters.WORKTIMING, parameters, [7, 17])
     weekends = exec_utils.get_param_value(Parameters.WEEKENDS, parameters, [6, 7])
+    holidays = exec_utils.get_param_value(Parameters.HOLIDAYS, parameters, None)
 
     statistics_list = []
 
+    bh_durations = None
+    if business_hours:
+        # computes at once the business hours durations of all the (non-empty) traces
+        bh_durations = iter(bh_utils.get_seconds([trace[0][timestamp_key] for trace in log if trace],
+                                                 [trace[-1][timestamp_key] for trace in log if trace],
+                                                 worktiming=worktiming, weekends=weekends,
+                                                 holidays=holidays).tolist())
+
     for index, trace in enumerate(log):
         if trace:
             ci = trace.attributes[case_id_key] if case_id_key in trace.attributes else "EMPTY" + str(index)
             st = trace[0][timestamp_key]
             et = trace[-1][timestamp_key]
             if business_hours:
-                bh = BusinessHours(st.replace(tzinfo=None), et.replace(tzinfo=None), worktiming=worktiming,
-                                   weekends=weekends)
-                diff = bh.getseconds()
+                diff = next(bh_durations)
             else:
                 diff = et.timestamp() - st.timestamp()
             st = st.timestamp()
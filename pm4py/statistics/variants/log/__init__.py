@@ -1 +1,6 @@
-from pm4py.statistics.variants.log import get
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["get", "index"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1,7 +1,7 @@
-from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TIMESTAMP_KEY
+from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
 from pm4py.statistics.parameters import Parameters
 from pm4py.util import exec_utils
-from pm4py.util.constants import DEFAULT_VARIANT_SEP
+from pm4py.statistics.variants.log import index as variants_index
 
 import numpy as np
 
@@ -23,12 +23,7 @@ def get_language(log, parameters=None):
         Dictionary containing the stochastic language of the log
         (variant associated to a number between 0 and 1; the sum is 1)
     """
-    vars = get_variants(log, parameters=parameters)
-    vars = {tuple(x.split(DEFAULT_VARIANT_SEP)): len(y) for x,y in vars.items()}
-    all_values_sum = sum(vars.values())
-    for x in vars:
-        vars[x] = vars[x] / all_values_sum
-    return vars
+    return variants_index.apply(log, parameters=parameters).get_language()
 
 
 def get_variants(log, parameters=None):
@@ -115,19 +110,7 @@ def get_variants_from_log_trace_idx(log, parameters=None):
     variant
         Dictionary with variant as the key and the list of traces indexes as the value
     """
-    if parameters is None:
-        parameters = {}
-
-    attribute_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
-
-    variants = {}
-    for trace_idx, trace in enumerate(log):
-        variant = DEFAULT_VARIANT_SEP.join([x[attribute_key] for x in trace if attribute_key in x])
-        if variant not in variants:
-            variants[variant] = []
-        variants[variant].append(trace_idx)
-
-    return variants
+    return variants_index.apply(log, parameters=parameters).get_variants_trace_idx()
 
 
 def get_variants_sorted_by_count(variants):
@@ -0,0 +1,191 @@
+from enum import Enum
+
+import numpy as np
+
+from pm4py.objects.log.columnar import ColumnarEventLog
+from pm4py.objects.log.util import arrays
+from pm4py.util import exec_utils
+from pm4py.util.constants import DEFAULT_VARIANT_SEP, PARAMETER_CONSTANT_ACTIVITY_KEY
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
+    VARIANTS_INDEX = "variants_index"
+
+
+class VariantsIndex(object):
+    """
+    Index of the variants of an event log.
+
+    The activities are interned as integer IDs (the i-th activity of the index has ID i),
+    every variant is a tuple of activity IDs and has an integer ID (assigned by order of first appearance in the log),
+    and every trace of the log is associated to the ID of its variant.
+    """
+
+    def __init__(self, activities, variants, variant_of_trace):
+        self._activities = activities
+        self._variants = variants
+        self._variant_of_trace = variant_of_trace
+        self._counts = np.bincount(variant_of_trace, minlength=len(variants))
+        self._variants_ids = None
+        self._cases = None
+
+    def _get_activities(self):
+        return self._activities
+
+    def _get_variants(self):
+        return self._variants
+
+    def _get_variant_of_trace(self):
+        return self._variant_of_trace
+
+    def _get_counts(self):
+        return self._counts
+
+    activities = property(_get_activities)
+    variants = property(_get_variants)
+    variant_of_trace = property(_get_variant_of_trace)
+    counts = property(_get_counts)
+
+    def __len__(self):
+        return len(self._variants)
+
+    def get_variant(self, variant_id):
+        """
+        Gets the variant with the given ID as a tuple of activities
+        """
+        return tuple(self._activities[x] for x in self._variants[variant_id])
+
+    def get_variant_string(self, variant_id):
+        """
+        Gets the variant with the given ID as a string (activities separated by DEFAULT_VARIANT_SEP)
+        """
+        return DEFAULT_VARIANT_SEP.join(self._activities[x] for x in self._variants[variant_id])
+
+    def get_variant_id(self, variant):
+        """
+        Gets the ID of a variant, expressed as a tuple of activities or as a string
+        (None if the variant is not in the log)
+        """
+        if self._variants_ids is None:
+            self._variants_ids = {}
+            for i in range(len(self._variants)):
+                self._variants_ids[self.get_variant(i)] = i
+                self._variants_ids[self.get_variant_string(i)] = i
+        try:
+            return self._variants_ids.get(variant)
+        except TypeError:
+            # unhashable variant (e.g. a list of activities)
+            return self._variants_ids.get(tuple(variant))
+
+    def get_cases(self, variant_id):
+        """
+        Gets the (sorted) indexes of the traces of the log having the variant with the given ID
+        """
+        if self._cases is None:
+            order = np.argsort(self._variant_of_trace, kind="stable")
+            offsets = np.zeros(len(self._variants) + 1, dtype=np.int64)
+            np.cumsum(self._counts, out=offsets[1:])
+            self._cases = (order, offsets)
+        order, offsets = self._cases
+        return order[offsets[variant_id]:offsets[variant_id + 1]]
+
+    def get_variants_trace_idx(self):
+        """
+        Gets a dictionary associating to every variant (as a string) the list of the indexes of its traces,
+        like get.get_variants_from_log_trace_idx
+        """
+        variants = {}
+        for i in range(len(self._variants)):
+            variant = self.get_variant_string(i)
+            if variant in variants:
+                # different variants having the same string (activities containing the separator)
+                variants[variant] = sorted(variants[variant] + self.get_cases(i).tolist())
+            else:
+                variants[variant] = self.get_cases(i).tolist()
+        return variants
+
+    def get_language(self):
+        """
+        Gets the stochastic language of the log (every variant, as a tuple of activities,
+        associated to its relative frequency)
+        """
+        total = float(len(self._variant_of_trace))
+        return {self.get_variant(i): float(self._counts[i]) / total for i in range(len(self._variants))}
+
+
+def apply(log, parameters=None):
+    """
+    Gets the index of the variants of an event log, in a single pass over the (integer-encoded) activities
+    of the events (the events without the activity are skipped).
+
+    The index is built at every call, unless an index (built beforehand by the caller, for the same log
+    and activity key) is provided through Parameters.VARIANTS_INDEX: this allows to share it between several
+    computations on a log that is not changed in the meanwhile.
+
+    Parameters
+    -------------
+    log
+        Event log (or columnar event log)
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.ACTIVITY_KEY -> Attribute identifying the activity in the log
+            Parameters.VARIANTS_INDEX -> (if provided) variants index of the log, that is returned as it is
+
+    Returns
+    -------------
+    index
+        Variants index
+    """
+    if parameters is None:
+        parameters = {}
+
+    index = exec_utils.get_param_value(Parameters.VARIANTS_INDEX, parameters, None)
+    if index is not None:
+        return index
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+
+    return __build(log, activity_key)
+
+
+def __build(log, activity_key):
+    """
+    Builds the variants index in a single pass over the traces of the log
+    """
+    if isinstance(log, ColumnarEventLog):
+        return __build_from_codes(log, activity_key)
+    variants_ids = {}
+    variant_of_trace = np.array([variants_ids.setdefault(tuple([x[activity_key] for x in trace if activity_key in x]),
+                                                         len(variants_ids)) for trace in log], dtype=np.int64)
+    # interns the activities (only the distinct variants need to be visited)
+    activities_ids = {}
+    variants = [tuple(activities_ids.setdefault(act, len(activities_ids)) for act in variant) for variant in
+                variants_ids]
+    return VariantsIndex(list(activities_ids), variants, variant_of_trace)
+
+
+def __build_from_codes(log, activity_key):
+    """
+    Builds the variants index of a columnar event log from the stored activity codes: the activities of every trace
+    are viewed as a slice of the bytes of the array of the codes, that is used as key of the dictionary of the variants
+    """
+    codes, labels, offsets = arrays.encode_attribute(log, attribute_key=activity_key, allow_missing=True)
+    if len(codes) > 0 and codes.min() < 0:
+        # skips the events without the activity
+        mask = codes >= 0
+        counts = np.bincount(arrays.get_case_index(offsets)[mask], minlength=len(offsets) - 1)
+        codes = codes[mask]
+        offsets = np.zeros(len(offsets), dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+    codes = codes.astype(np.int32)
+    buffer = codes.tobytes()
+    size = codes.itemsize
+    variants_ids = {}
+    starts = (offsets[:-1] * size).tolist()
+    ends = (offsets[1:] * size).tolist()
+    variant_of_trace = np.fromiter((variants_ids.setdefault(buffer[a:b], len(variants_ids)) for a, b in
+                                    zip(starts, ends)), dtype=np.int64, count=len(starts))
+    variants = [tuple(np.frombuffer(key, dtype=np.int32).tolist()) for key in variants_ids]
+    return VariantsIndex(list(labels), variants, variant_of_trace)
@@ -1,10 +1,11 @@
 from enum import Enum
 from pm4py.util import exec_utils
-from pm4py.streaming.algo.conformance.tbr.variants import classic
+from pm4py.streaming.algo.conformance.tbr.variants import classic, sharded
 
 
 class Variants(Enum):
     CLASSIC = classic
+    SHARDED = sharded
 
 
 def apply(net, im, fm, variant=Variants.CLASSIC, parameters=None):
@@ -22,6 +23,7 @@ def apply(net, im, fm, variant=Variants.CLASSIC, parameters=None):
     variant
         Variant of the algorithm to use, possible:
             - Variants.CLASSIC
+            - Variants.SHARDED (cases partitioned among worker processes)
     parameters
         Parameters of the algorithm
 
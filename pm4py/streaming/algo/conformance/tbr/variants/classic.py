@@ -69,7 +69,7 @@ class TbrStreamingConformance(StreamingAlgorithm):
         parameters_case_dict = copy(parameters)
         parameters_case_dict[Parameters.DICT_ID] = case_dict_id
         parameters_missing = copy(parameters)
-        parameters_case_dict[Parameters.DICT_ID] = missing_dict_id
+        parameters_missing[Parameters.DICT_ID] = missing_dict_id
         parameters_remaining = copy(parameters)
         parameters_remaining[Parameters.DICT_ID] = remaining_dict_id
         self.case_dict = generator.apply(variant=dict_variant, parameters=parameters_case_dict)
@@ -0,0 +1,374 @@
+import logging
+import multiprocessing
+import os
+import zlib
+from collections import Counter
+
+from pm4py.objects.petri.petrinet import Marking
+from pm4py.streaming.algo.conformance.tbr.variants import classic
+from pm4py.streaming.algo.interface import StreamingAlgorithm
+from pm4py.util import constants, exec_utils, xes_constants
+
+
+class Parameters:
+    DICT_VARIANT = classic.Parameters.DICT_VARIANT
+    DICT_ID = classic.Parameters.DICT_ID
+    CASE_DICT_ID = classic.Parameters.CASE_DICT_ID
+    MISSING_DICT_ID = classic.Parameters.MISSING_DICT_ID
+    REMAINING_DICT_ID = classic.Parameters.REMAINING_DICT_ID
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    MAXIMUM_ITERATIONS_INVISIBLES = classic.Parameters.MAXIMUM_ITERATIONS_INVISIBLES
+    NUM_WORKERS = "num_workers"
+    BATCH_SIZE = "batch_size"
+
+
+ACTIVITY_NOT_POSSIBLE = "activity_not_possible"
+MISSING_TOKENS = "missing_tokens"
+FINAL_MARKING_NOT_REACHED = "final_marking_not_reached"
+CASE_NOT_IN_DICTIONARY = "case_not_in_dictionary"
+
+# commands sent to the workers
+EVENTS = "events"
+STATUS = "status"
+TERMINATE = "terminate"
+TERMINATE_ALL = "terminate_all"
+DEVIATIONS = "deviations"
+STATE = "state"
+STOP = "stop"
+
+
+class ShardTbrConformance(classic.TbrStreamingConformance):
+    """
+    Token-based replay streaming conformance of the cases of a shard (running in a worker process).
+    The dictionaries are local to the process, so the markings are stored as Marking objects
+    (instead of strings), and the deviations are counted instead of logged
+    """
+
+    def __init__(self, net, im, fm, parameters=None):
+        self.deviations = Counter()
+        classic.TbrStreamingConformance.__init__(self, net, im, fm, parameters=parameters)
+
+    def encode_marking(self, mark):
+        return Marking(mark)
+
+    def decode_marking(self, ems):
+        return Marking(ems)
+
+    def message_activity_not_possible(self, activity, case):
+        self.deviations[ACTIVITY_NOT_POSSIBLE] += 1
+
+    def message_missing_tokens(self, activity, case):
+        self.deviations[MISSING_TOKENS] += 1
+
+    def message_case_not_in_dictionary(self, case):
+        self.deviations[CASE_NOT_IN_DICTIONARY] += 1
+
+    def message_final_marking_not_reached(self, case, marking):
+        self.deviations[FINAL_MARKING_NOT_REACHED] += 1
+
+    def get_statuses(self):
+        """
+        Gets the status of the open cases of the shard
+        """
+        ret = []
+        for case in list(self.case_dict.keys()):
+            missing = self.missing[case]
+            ret.append({"case": case, "is_fit": missing == 0, "missing": missing})
+        return ret
+
+
+def encode_result(result):
+    """
+    Expresses the marking contained in a result of the worker by the names of the places
+    (the place objects of the worker are not the ones of the main process)
+    """
+    if result is not None and "marking" in result:
+        result = dict(result)
+        result["marking"] = {p.name: n for p, n in result["marking"].items()}
+    return result
+
+
+def _shard_worker(net, im, fm, parameters, inbox, outbox, conf=None):
+    """
+    Main loop of a worker process, which owns the markings of the cases of its shard.
+    The Petri net is received once, when the process is started (along with the state of the shard,
+    if the algorithm is restored from a checkpoint)
+    """
+    if conf is None:
+        conf = ShardTbrConformance(net, im, fm, parameters=parameters)
+    while True:
+        command, arg = inbox.get()
+        if command == EVENTS:
+            for case, activity in arg:
+                conf.verify_tbr(case, activity)
+        elif command == STATUS:
+            outbox.put(conf.get_statuses())
+        elif command == TERMINATE:
+            outbox.put(encode_result(conf.terminate(arg)))
+        elif command == TERMINATE_ALL:
+            conf.terminate_all()
+            outbox.put(None)
+        elif command == DEVIATIONS:
+            outbox.put(dict(conf.deviations))
+        elif command == STATE:
+            outbox.put(conf)
+        elif command == STOP:
+            break
+
+
+class ShardedTbrStreamingConformance(StreamingAlgorithm):
+    def __init__(self, net, im, fm, parameters=None):
+        """
+        Initialize the sharded token-based replay streaming conformance.
+
+        The cases are partitioned (by a stable hash of the case identifier) among a set of worker processes,
+        each one owning the markings of its cases. The events are sent to the workers in batches.
+
+        Parameters
+        --------------
+        net
+            Petri net
+        im
+            Initial marking
+        fm
+            Final marking
+        parameters
+            Parameters of the algorithm, including:
+            - Parameters.CASE_ID_KEY => case identifier
+            - Parameters.ACTIVITY_KEY => activity
+            - Parameters.MAXIMUM_ITERATIONS_INVISIBLES => maximum number of iterations to reach a transition
+            through invisibles (default: 10)
+            - Parameters.NUM_WORKERS => number of worker processes (default: the number of CPUs)
+            - Parameters.BATCH_SIZE => number of events buffered for a worker before sending them (default: 1000)
+        """
+        if parameters is None:
+            parameters = {}
+        self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+        self.activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters,
+                                                       xes_constants.DEFAULT_NAME_KEY)
+        self.num_workers = max(1, exec_utils.get_param_value(Parameters.NUM_WORKERS, parameters, os.cpu_count()))
+        self.batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 1000)
+        self.net = net
+        self.im = im
+        self.fm = fm
+        self.places_inv_dict = {x.name: x for x in net.places}
+        self.worker_parameters = {k: v for k, v in parameters.items() if
+                                  k not in [Parameters.NUM_WORKERS, Parameters.BATCH_SIZE]}
+        self.buffers = [[] for i in range(self.num_workers)]
+        self.start_workers()
+        StreamingAlgorithm.__init__(self)
+
+    def start_workers(self, shard_confs=None):
+        """
+        Starts the worker processes
+
+        Parameters
+        ---------------
+        shard_confs
+            (If provided) state of the shards, as stored in a checkpoint
+        """
+        self.inboxes = []
+        self.outboxes = []
+        self.workers = []
+        for i in range(self.num_workers):
+            inbox = multiprocessing.Queue()
+            outbox = multiprocessing.Queue()
+            conf = shard_confs[i] if shard_confs is not None else None
+            worker = multiprocessing.Process(target=_shard_worker,
+                                             args=(self.net, self.im, self.fm, self.worker_parameters, inbox, outbox,
+                                                   conf), daemon=True)
+            worker.start()
+            self.inboxes.append(inbox)
+            self.outboxes.append(outbox)
+            self.workers.append(worker)
+
+    def __getstate__(self):
+        # the state of the shards is collected from the workers, that are started again when restoring
+        shard_confs = self.__ask_all(STATE)
+        state = StreamingAlgorithm.__getstate__(self)
+        del state["inboxes"]
+        del state["outboxes"]
+        del state["workers"]
+        state["shard_confs"] = shard_confs
+        return state
+
+    def __setstate__(self, state):
+        shard_confs = state.pop("shard_confs")
+        StreamingAlgorithm.__setstate__(self, state)
+        self.start_workers(shard_confs=shard_confs)
+
+    def encode_str(self, stru):
+        """
+        Encodes a string for storage in generic dictionaries
+        """
+        return str(stru)
+
+    def get_shard(self, case):
+        """
+        Gets the index of the worker owning the case (stable among different executions)
+        """
+        return zlib.crc32(case.encode("utf-8")) % self.num_workers
+
+    def _process(self, event):
+        """
+        Sends the event to the buffer of the worker owning its case
+
+        Parameters
+        ---------------
+        event
+            Event (dictionary)
+        """
+        case = event[self.case_id_key] if self.case_id_key in event else None
+        activity = event[self.activity_key] if self.activity_key in event else None
+        if case is not None and activity is not None:
+            case = self.encode_str(case)
+            shard = self.get_shard(case)
+            buffer = self.buffers[shard]
+            buffer.append((case, activity))
+            if len(buffer) >= self.batch_size:
+                self.flush(shard)
+        else:
+            self.message_case_or_activity_not_in_event(event)
+
+    def flush(self, shard=None):
+        """
+        Sends the buffered events to the worker(s)
+
+        Parameters
+        ---------------
+        shard
+            Index of the worker (if None, the buffers of all the workers are flushed)
+        """
+        shards = range(self.num_workers) if shard is None else [shard]
+        for i in shards:
+            if self.buffers[i]:
+                self.inboxes[i].put((EVENTS, self.buffers[i]))
+                self.buffers[i] = []
+
+    def __ask_all(self, command, arg=None):
+        """
+        Sends a command to all the workers (after the buffered events) and collects the answers
+        """
+        self.flush()
+        for inbox in self.inboxes:
+            inbox.put((command, arg))
+        return [outbox.get() for outbox in self.outboxes]
+
+    def decode_result(self, result):
+        """
+        Decodes the marking contained in a result of a worker
+        """
+        if result is not None and "marking" in result:
+            marking = Marking()
+            for p, n in result["marking"].items():
+                marking[self.places_inv_dict[p]] = n
+            result["marking"] = marking
+        return result
+
+    def terminate(self, case):
+        """
+        Terminate a case, checking if the final marking is reached
+
+        Parameters
+        ----------------
+        case
+            Case ID
+
+        Returns
+        ---------------
+        dictio
+            Dictionary containing: the marking, the count of missing and remaining tokens
+        """
+        self._lock.acquire()
+        case = self.encode_str(case)
+        shard = self.get_shard(case)
+        self.flush(shard)
+        self.inboxes[shard].put((TERMINATE, case))
+        ret = self.decode_result(self.outboxes[shard].get())
+        self._lock.release()
+        return ret
+
+    def terminate_all(self):
+        """
+        Terminate all open cases
+        """
+        self._lock.acquire()
+        self.__ask_all(TERMINATE_ALL)
+        self._lock.release()
+
+    def get_deviations(self):
+        """
+        Gets the count of the deviations detected by all the workers
+
+        Returns
+        ---------------
+        deviations
+            Dictionary associating to each type of deviation (activity not possible, missing tokens,
+            final marking not reached, case not in dictionary) its count
+        """
+        self._lock.acquire()
+        deviations = Counter()
+        for shard_deviations in self.__ask_all(DEVIATIONS):
+            deviations.update(shard_deviations)
+        self._lock.release()
+        return dict(deviations)
+
+    def stop(self):
+        """
+        Stops the worker processes (after the buffered events are processed)
+        """
+        self._lock.acquire()
+        self.flush()
+        for inbox in self.inboxes:
+            inbox.put((STOP, None))
+        for worker in self.workers:
+            worker.join()
+        self._lock.release()
+
+    def message_case_or_activity_not_in_event(self, event):
+        """
+        Sends a message if the case or the activity are not
+        there in the event
+        """
+        logging.error("case or activities are none! " + str(event))
+
+    def _current_result(self):
+        """
+        Gets a diagnostics dataframe with the status of the cases (merging the statuses of all the workers)
+
+        Returns
+        -------
+        diagn_df
+            Diagnostics dataframe
+        """
+        import pandas as pd
+
+        diagn_stream = []
+        for statuses in self.__ask_all(STATUS):
+            diagn_stream.extend(statuses)
+
+        return pd.DataFrame(diagn_stream)
+
+
+def apply(net, im, fm, parameters=None):
+    """
+    Method that creates the ShardedTbrStreamingConformance object
+
+    Parameters
+    ----------------
+    net
+        Petri net
+    im
+        Initial marking
+    fm
+        Final marking
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    ----------------
+    conf_stream_obj
+        Conformance streaming object
+    """
+    return ShardedTbrStreamingConformance(net, im, fm, parameters=parameters)
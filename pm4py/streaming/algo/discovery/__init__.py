@@ -1 +1,6 @@
-from pm4py.streaming.algo.discovery import dfg
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["dfg"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
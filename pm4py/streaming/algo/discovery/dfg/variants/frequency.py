@@ -1,10 +1,11 @@
-from collections import Counter
+from collections import OrderedDict
+from datetime import datetime
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.streaming.util.dictio import generator
 from pm4py.streaming.algo.interface import StreamingAlgorithm
-from threading import Lock
 from enum import Enum
 from copy import copy
+from time import time
 import logging
 
 
@@ -15,8 +16,14 @@ class Parameters(Enum):
     DFG_DICT_ID = "dfg_dict_id"
     ACT_DICT_ID = "act_dict_id"
     START_ACT_DICT_ID = "start_act_dict_id"
+    END_ACT_DICT_ID = "end_act_dict_id"
+    ACT_INDEX_DICT_ID = "act_index_dict_id"
+    ACT_LABELS_DICT_ID = "act_labels_dict_id"
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    MAX_NO_CASES = "max_no_cases"
+    CASE_TIMEOUT = "case_timeout"
 
 
 class StreamingDfgDiscovery(StreamingAlgorithm):
@@ -29,6 +36,15 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         parameters of the algorithm, including:
          - Parameters.ACTIVITY_KEY: the key of the event to use as activity
          - Parameters.CASE_ID_KEY: the key of the event to use as case identifier
+         - Parameters.TIMESTAMP_KEY: the key of the event to use as timestamp (for the case timeout)
+         - Parameters.MAX_NO_CASES: maximum number of live cases; when exceeded, the least recently
+            updated case is evicted (default: None, no limit)
+         - Parameters.CASE_TIMEOUT: number of seconds after which a case that did not receive any event is evicted
+            (default: None, no timeout). The time is the one of the events (when they have a timestamp),
+            otherwise the time at which they are received.
+
+        An evicted case is considered completed: its last activity stays among the end activities,
+        and an event that arrives later for the same case identifier starts a new case.
         """
         if parameters is None:
             parameters = {}
@@ -38,7 +54,14 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
                                                        xes_constants.DEFAULT_NAME_KEY)
         self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters,
                                                       constants.CASE_CONCEPT_NAME)
+        self.timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                                        xes_constants.DEFAULT_TIMESTAMP_KEY)
+        self.max_no_cases = exec_utils.get_param_value(Parameters.MAX_NO_CASES, parameters, None)
+        self.case_timeout = exec_utils.get_param_value(Parameters.CASE_TIMEOUT, parameters, None)
+        # live cases, in order of last update, with the time of the last event (only when eviction is enabled)
+        self.last_seen = OrderedDict()
         self.build_dictionaries(parameters)
+        self.build_snapshot()
         StreamingAlgorithm.__init__(self)
 
     def build_dictionaries(self, parameters):
@@ -55,12 +78,20 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
              - Parameters.DFG_DICT_ID: identifier of the DFG dictionary (1)
              - Parameters.ACT_ID: identifier of the dictionary hosting the count of the activities (2)
              - Parameters.START_ACT_DICT_ID: identifier of the dictionary hosting the count of the start activities (3)
+             - Parameters.END_ACT_DICT_ID: identifier of the dictionary hosting the count of the end activities (4)
+             - Parameters.ACT_INDEX_DICT_ID: identifier of the dictionary mapping an activity to its integer
+                identifier (5)
+             - Parameters.ACT_LABELS_DICT_ID: identifier of the dictionary mapping an integer identifier to its
+                activity (6)
         """
         dict_variant = exec_utils.get_param_value(Parameters.DICT_VARIANT, parameters, generator.Variants.CLASSIC)
         case_dict_id = exec_utils.get_param_value(Parameters.CASE_DICT_ID, parameters, 0)
         dfg_dict_id = exec_utils.get_param_value(Parameters.DFG_DICT_ID, parameters, 1)
         act_dict_id = exec_utils.get_param_value(Parameters.ACT_DICT_ID, parameters, 2)
         start_act_dict_id = exec_utils.get_param_value(Parameters.START_ACT_DICT_ID, parameters, 3)
+        end_act_dict_id = exec_utils.get_param_value(Parameters.END_ACT_DICT_ID, parameters, 4)
+        act_index_dict_id = exec_utils.get_param_value(Parameters.ACT_INDEX_DICT_ID, parameters, 5)
+        act_labels_dict_id = exec_utils.get_param_value(Parameters.ACT_LABELS_DICT_ID, parameters, 6)
         parameters_case_dict = copy(parameters)
         parameters_case_dict[Parameters.DICT_ID] = case_dict_id
         parameters_dfg = copy(parameters)
@@ -69,10 +100,34 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         parameters_activities[Parameters.DICT_ID] = act_dict_id
         parameters_start_activities = copy(parameters)
         parameters_start_activities[Parameters.DICT_ID] = start_act_dict_id
+        parameters_end_activities = copy(parameters)
+        parameters_end_activities[Parameters.DICT_ID] = end_act_dict_id
+        parameters_activity_index = copy(parameters)
+        parameters_activity_index[Parameters.DICT_ID] = act_index_dict_id
+        parameters_activity_labels = copy(parameters)
+        parameters_activity_labels[Parameters.DICT_ID] = act_labels_dict_id
         self.case_dict = generator.apply(variant=dict_variant, parameters=parameters_case_dict)
         self.dfg = generator.apply(variant=dict_variant, parameters=parameters_dfg)
         self.activities = generator.apply(variant=dict_variant, parameters=parameters_activities)
         self.start_activities = generator.apply(variant=dict_variant, parameters=parameters_start_activities)
+        self.end_activities = generator.apply(variant=dict_variant, parameters=parameters_end_activities)
+        # interning of the activities: the other dictionaries store integer identifiers
+        self.activity_index = generator.apply(variant=dict_variant, parameters=parameters_activity_index)
+        self.activity_labels = generator.apply(variant=dict_variant, parameters=parameters_activity_labels)
+
+    def build_snapshot(self):
+        """
+        Builds the (decoded) snapshot of the DFG returned by get(), along with the sets of keys
+        changed since the last call to get()
+        """
+        self.snapshot_dfg = {}
+        self.snapshot_activities = {}
+        self.snapshot_start_activities = {}
+        self.snapshot_end_activities = {}
+        self.changed_dfg = set()
+        self.changed_activities = set()
+        self.changed_start_activities = set()
+        self.changed_end_activities = set()
 
     def event_without_activity_or_case(self, event):
         """
@@ -92,11 +147,62 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         """
         return str(stru)
 
-    def encode_tuple(self, tup):
+    def encode_activity(self, activity):
+        """
+        Gets the integer identifier of an activity (assigning a new one if the activity was never seen)
+        """
+        activity = self.encode_str(activity)
+        if activity in self.activity_index:
+            return self.activity_index[activity]
+        idx = len(self.activity_labels)
+        self.activity_index[activity] = idx
+        self.activity_labels[idx] = activity
+        return idx
+
+    def get_event_time(self, event):
+        """
+        Gets the time of an event (in seconds), used to decide the expiration of the cases
+        """
+        timestamp = event[self.timestamp_key] if self.timestamp_key in event else None
+        if isinstance(timestamp, datetime):
+            return timestamp.timestamp()
+        return time()
+
+    def evict_cases(self, current_time, case):
+        """
+        Evicts the cases that exceed the timeout and, if the given case would exceed the maximum
+        number of live cases, the least recently updated cases
+
+        Parameters
+        ---------------
+        current_time
+            Current time (in seconds)
+        case
+            Case of the event that is being received
+        """
+        last_seen = self.last_seen
+        if self.case_timeout is not None:
+            while last_seen:
+                evicted_case, case_time = next(iter(last_seen.items()))
+                if current_time - case_time <= self.case_timeout:
+                    break
+                last_seen.popitem(last=False)
+                del self.case_dict[evicted_case]
+        if self.max_no_cases is not None:
+            max_no_cases = self.max_no_cases if case in last_seen else self.max_no_cases - 1
+            while last_seen and len(last_seen) > max_no_cases:
+                evicted_case, case_time = last_seen.popitem(last=False)
+                del self.case_dict[evicted_case]
+
+    def increment(self, dictio, changed, key, value):
         """
-        Encodes a tuple for storage in generic dictionaries
+        Increments the count of a key in a dictionary, keeping track of the change
         """
-        return str(tup)
+        if key not in dictio:
+            dictio[key] = value
+        else:
+            dictio[key] = dictio[key] + value
+        changed.add(key)
 
     def _process(self, event):
         """
@@ -110,29 +216,45 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         """
         if self.case_id_key in event and self.activity_key in event:
             case = self.encode_str(event[self.case_id_key])
-            activity = self.encode_str(event[self.activity_key])
+            activity = self.encode_activity(event[self.activity_key])
+            if self.max_no_cases is not None or self.case_timeout is not None:
+                current_time = self.get_event_time(event)
+                self.evict_cases(current_time, case)
+                self.last_seen[case] = current_time
+                self.last_seen.move_to_end(case)
             if case not in self.case_dict:
-                if activity not in self.start_activities:
-                    self.start_activities[activity] = 1
-                else:
-                    self.start_activities[activity] = self.start_activities[activity] + 1
+                self.increment(self.start_activities, self.changed_start_activities, activity, 1)
             else:
-                df = self.encode_tuple((self.case_dict[case], activity))
-                if df not in self.dfg:
-                    self.dfg[df] = 1
-                else:
-                    self.dfg[df] = self.dfg[df] + 1
-            if activity not in self.activities:
-                self.activities[activity] = 1
-            else:
-                self.activities[activity] = self.activities[activity] + 1
+                previous = self.case_dict[case]
+                self.increment(self.dfg, self.changed_dfg, (previous, activity), 1)
+                self.increment(self.end_activities, self.changed_end_activities, previous, -1)
+            self.increment(self.end_activities, self.changed_end_activities, activity, 1)
+            self.increment(self.activities, self.changed_activities, activity, 1)
             self.case_dict[case] = activity
         else:
             self.event_without_activity_or_case(event)
 
+    def __update_snapshot(self, snapshot, source, changed, decode):
+        """
+        Gets the snapshot updated with the keys that changed since the last call. The snapshot returned by the
+        previous call is not modified (it is held by the caller), so it is copied only if some key changed
+        """
+        if changed:
+            snapshot = dict(snapshot)
+            for key in changed:
+                value = source[key] if key in source else 0
+                if value > 0:
+                    snapshot[decode(key)] = value
+                else:
+                    snapshot.pop(decode(key), None)
+            changed.clear()
+        return snapshot
+
     def _current_result(self):
         """
-        Gets the current state of the DFG
+        Gets the current state of the DFG.
+        Only the entries that changed since the previous call are decoded, and a dictionary is copied only if it
+        changed since the previous call (otherwise, the same dictionary is returned, so it should not be modified).
 
         Returns
         ----------------
@@ -143,13 +265,19 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         start_activities
             Start activities
         end_activities
-            End activities
+            End activities (last activity of the live cases and of the evicted cases)
         """
-        dfg = {eval(x): y for x, y in self.dfg.items()}
-        activities = dict(self.activities)
-        start_activities = dict(self.start_activities)
-        end_activities = dict(Counter(self.case_dict.values()))
-        return dfg, activities, start_activities, end_activities
+        labels = self.activity_labels
+        decode_activity = labels.__getitem__
+        self.snapshot_dfg = self.__update_snapshot(self.snapshot_dfg, self.dfg, self.changed_dfg,
+                                                   lambda x: (labels[x[0]], labels[x[1]]))
+        self.snapshot_activities = self.__update_snapshot(self.snapshot_activities, self.activities,
+                                                          self.changed_activities, decode_activity)
+        self.snapshot_start_activities = self.__update_snapshot(self.snapshot_start_activities, self.start_activities,
+                                                                self.changed_start_activities, decode_activity)
+        self.snapshot_end_activities = self.__update_snapshot(self.snapshot_end_activities, self.end_activities,
+                                                              self.changed_end_activities, decode_activity)
+        return self.snapshot_dfg, self.snapshot_activities, self.snapshot_start_activities, self.snapshot_end_activities
 
 
 def apply(parameters=None):
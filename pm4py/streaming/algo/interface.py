@@ -1,11 +1,22 @@
 import abc
+import os
+import pickle
 from threading import Lock
+from time import time
 #from typing import final
 
+CHECKPOINT_HEADER = "pm4py-streaming-checkpoint"
+CHECKPOINT_VERSION = 1
+
 
 class StreamingAlgorithm(abc.ABC):
     def __init__(self, parameters=None):
         self._lock = Lock()
+        self._checkpoint_path = None
+        self._checkpoint_events = None
+        self._checkpoint_seconds = None
+        self._events_since_checkpoint = 0
+        self._last_checkpoint_time = time()
 
     @abc.abstractmethod
     def _process(self, event):
@@ -21,7 +32,109 @@ class StreamingAlgorithm(abc.ABC):
         self._lock.release()
         return ret
 
+    def _process_batch(self, events):
+        for event in events:
+            self._process(event)
+
     def receive(self, event):
         self._lock.acquire()
         self._process(event)
+        self._after_receive(1)
+        self._lock.release()
+
+    def receive_batch(self, events):
+        """
+        Receives a batch of events, acquiring the lock once for the entire batch
+        (the algorithms can override _process_batch to process the batch in a more efficient way)
+        """
+        self._lock.acquire()
+        self._process_batch(events)
+        self._after_receive(len(events))
         self._lock.release()
+
+    def enable_checkpoints(self, path, every_events=None, every_seconds=None):
+        """
+        Enables the periodic checkpointing of the state of the algorithm
+
+        Parameters
+        ---------------
+        path
+            Path of the checkpoint file (overwritten at every checkpoint)
+        every_events
+            Writes a checkpoint after the given number of events (default: None)
+        every_seconds
+            Writes a checkpoint, upon the reception of an event, if the given number of seconds
+            has passed since the last checkpoint (default: None)
+        """
+        self._lock.acquire()
+        self._checkpoint_path = path
+        self._checkpoint_events = every_events
+        self._checkpoint_seconds = every_seconds
+        self._events_since_checkpoint = 0
+        self._last_checkpoint_time = time()
+        self._lock.release()
+
+    def _after_receive(self, num_events):
+        if self._checkpoint_path is not None:
+            self._events_since_checkpoint += num_events
+            if (self._checkpoint_events is not None and self._events_since_checkpoint >= self._checkpoint_events) or (
+                    self._checkpoint_seconds is not None and time() - self._last_checkpoint_time >=
+                    self._checkpoint_seconds):
+                self._write_checkpoint(self._checkpoint_path)
+
+    def checkpoint(self, path=None):
+        """
+        Writes the state of the algorithm (dictionaries, markings, counters) in a binary file,
+        that can be read by the restore function
+
+        Parameters
+        ---------------
+        path
+            Path of the checkpoint file (default: the one provided to enable_checkpoints)
+        """
+        self._lock.acquire()
+        try:
+            self._write_checkpoint(path if path is not None else self._checkpoint_path)
+        finally:
+            self._lock.release()
+
+    def _write_checkpoint(self, path):
+        # the file is written in a temporary file that is then renamed, so the previous checkpoint
+        # stays valid if the process crashes during the writing
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((CHECKPOINT_HEADER, CHECKPOINT_VERSION, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._events_since_checkpoint = 0
+        self._last_checkpoint_time = time()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+
+def restore(path):
+    """
+    Restores a streaming algorithm from a checkpoint file
+
+    Parameters
+    ---------------
+    path
+        Path of the checkpoint file
+
+    Returns
+    ---------------
+    algo
+        Streaming algorithm, in the state it had when the checkpoint was written
+        (if checkpoints were enabled, they continue on the same file)
+    """
+    with open(path, "rb") as f:
+        header, version, algo = pickle.load(f)
+    if header != CHECKPOINT_HEADER or version > CHECKPOINT_VERSION:
+        raise Exception("the file is not a supported checkpoint of a streaming algorithm: " + str(path))
+    return algo
@@ -1,6 +1,11 @@
 import pkgutil
-from pm4py.streaming.importer import csv
+
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["csv"]
 
 if pkgutil.find_loader("lxml"):
-    from pm4py.streaming.importer import xes
+    __all__.append("xes")
 
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1 +1,6 @@
-from pm4py.streaming.importer.xes.variants import xes_event_stream, xes_trace_stream
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["xes_event_stream", "xes_trace_stream"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
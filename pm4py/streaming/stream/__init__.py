@@ -1 +1,6 @@
-from pm4py.streaming.stream import live_event_stream, live_trace_stream
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["live_event_stream", "live_trace_stream", "async_live_event_stream"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+
+from pm4py.streaming.stream.live_event_stream import StreamState, Parameters
+from pm4py.util import exec_utils
+
+
+class AsyncLiveEventStream:
+
+    def __init__(self, parameters=None):
+        """
+        Live event stream for asyncio applications: the events are appended by coroutines, and are delivered
+        in micro-batches (to the receive_batch method of the observers) by a task running in the event loop
+
+        Parameters
+        --------------
+        parameters
+            Parameters of the stream, including:
+            - Parameters.BATCH_SIZE: maximum number of events delivered at once (default: 1000)
+            - Parameters.MAX_QUEUE_SIZE: maximum number of events waiting in the queue; when the queue is full,
+            append waits until some events are delivered (default: None, unbounded queue)
+        """
+        if parameters is None:
+            parameters = {}
+
+        self._batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 1000)
+        max_queue_size = exec_utils.get_param_value(Parameters.MAX_QUEUE_SIZE, parameters, None)
+        self._queue = asyncio.Queue(maxsize=max_queue_size if max_queue_size is not None else 0)
+        self._state = StreamState.INACTIVE
+        self._observers = set()
+        self._mail_man = None
+
+    async def append(self, event):
+        if self._state != StreamState.FINISHED:
+            await self._queue.put(event)
+
+    def append_nowait(self, event):
+        """
+        Appends an event without waiting (raises asyncio.QueueFull if the queue is full)
+        """
+        if self._state != StreamState.FINISHED:
+            self._queue.put_nowait(event)
+
+    async def _deliver(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for algo in list(self._observers):
+                try:
+                    algo.receive_batch(batch)
+                except Exception:
+                    # a failing observer does not stop the delivery to the other observers (and of the next batches)
+                    logging.exception("observer " + repr(algo) + " failed to receive a batch of events")
+            for i in range(len(batch)):
+                self._queue.task_done()
+
+    def start(self):
+        self._state = StreamState.ACTIVE
+        self._mail_man = asyncio.ensure_future(self._deliver())
+
+    async def stop(self):
+        # waits for the delivery of the events in the queue
+        await self._queue.join()
+        if self._state == StreamState.ACTIVE:
+            self._state = StreamState.FINISHED
+        if self._mail_man is not None:
+            self._mail_man.cancel()
+            await asyncio.gather(self._mail_man, return_exceptions=True)
+
+    def register(self, algo):
+        self._observers.add(algo)
+
+    def deregister(self, algo):
+        self._observers.remove(algo)
+
+    def _get_state(self):
+        return self._state
+
+    state = property(_get_state)
@@ -1,4 +1,5 @@
 import collections
+import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
@@ -13,11 +14,30 @@ class StreamState(Enum):
 
 class Parameters(Enum):
     THREAD_POOL_SIZE = "thread_pool_size"
+    BATCH_SIZE = "batch_size"
+    MAX_QUEUE_SIZE = "max_queue_size"
 
 
 class LiveEventStream:
 
     def __init__(self, parameters=None):
+        """
+        Live event stream, delivering the appended events to the registered streaming algorithms
+
+        Parameters
+        --------------
+        parameters
+            Parameters of the stream, including:
+            - Parameters.THREAD_POOL_SIZE: size of the thread pool delivering the events (default: 6)
+            - Parameters.BATCH_SIZE: if provided, the events are delivered in micro-batches: all the events
+            waiting in the queue (up to the batch size) are handed at once to the receive_batch method of each
+            observer; each observer receives the batches in order (default: None, the events are delivered one by one)
+            - Parameters.MAX_QUEUE_SIZE: maximum number of events waiting in the queue; when the queue is full,
+            append blocks until some events are delivered (default: None, unbounded queue)
+        """
+        if parameters is None:
+            parameters = {}
+
         self._dq = collections.deque()
         self._state = StreamState.INACTIVE
         self._lock = threading.Lock()
@@ -25,19 +45,47 @@ class LiveEventStream:
         self._observers = set()
         self._mail_man = None
         self._tp = ThreadPoolExecutor(exec_utils.get_param_value(Parameters.THREAD_POOL_SIZE, parameters, 6))
+        self._batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, None)
+        self._max_queue_size = exec_utils.get_param_value(Parameters.MAX_QUEUE_SIZE, parameters, None)
 
     def append(self, event):
         self._cond.acquire()
+        if self._max_queue_size is not None:
+            while len(self._dq) >= self._max_queue_size and self._state == StreamState.ACTIVE:
+                self._cond.wait()
         if self._state != StreamState.FINISHED:
             self._dq.append(event)
-            self._cond.notify()
+            self._cond.notify_all()
         self._cond.release()
 
+    def append_all(self, events):
+        """
+        Appends several events to the stream, acquiring the lock once per chunk of events
+        (a chunk is bounded by the free space in the queue, when the maximum size of the queue is set)
+        """
+        events = list(events)
+        i = 0
+        while i < len(events):
+            self._cond.acquire()
+            if self._max_queue_size is not None:
+                while len(self._dq) >= self._max_queue_size and self._state == StreamState.ACTIVE:
+                    self._cond.wait()
+                j = min(len(events), i + max(1, self._max_queue_size - len(self._dq)))
+            else:
+                j = len(events)
+            if self._state != StreamState.FINISHED:
+                self._dq.extend(events[i:j])
+                self._cond.notify_all()
+            self._cond.release()
+            i = j
+
     def _deliver(self):
+        if self._batch_size is not None:
+            return self._deliver_batches()
         while self._state != StreamState.INACTIVE:
             self._cond.acquire()
             while len(self._dq) == 0:
-                self._cond.notify()
+                self._cond.notify_all()
                 if self._state != StreamState.FINISHED:
                     self._cond.wait()
                 else:
@@ -46,8 +94,39 @@ class LiveEventStream:
             event = self._dq.popleft()
             for algo in self._observers:
                 self._tp.submit(algo.receive, event)
+            self._cond.notify_all()
             self._cond.release()
 
+    def _deliver_batches(self):
+        """
+        Delivers the events in micro-batches. A batch is handed to all the observers in parallel, and the
+        next batch is delivered only when the observers have processed the previous one (keeping the order
+        of the events)
+        """
+        futures = []
+        while self._state != StreamState.INACTIVE:
+            self._cond.acquire()
+            while len(self._dq) == 0:
+                if futures:
+                    # the events are not counted as delivered until the observers have processed them
+                    break
+                self._cond.notify_all()
+                if self._state != StreamState.FINISHED:
+                    self._cond.wait()
+                else:
+                    self._cond.release()
+                    return
+            batch = [self._dq.popleft() for i in range(min(self._batch_size, len(self._dq)))]
+            observers = list(self._observers)
+            self._cond.notify_all()
+            self._cond.release()
+            for algo, f in futures:
+                if f.exception() is not None:
+                    # a failing observer does not stop the delivery to the other observers (and of the next batches)
+                    logging.error("observer " + repr(algo) + " failed to receive a batch of events",
+                                  exc_info=f.exception())
+            futures = [(algo, self._tp.submit(algo.receive_batch, batch)) for algo in observers] if batch else []
+
     def start(self):
         self._cond.acquire()
         self._state = StreamState.ACTIVE
@@ -59,11 +138,14 @@ class LiveEventStream:
         self._cond.acquire()
         while len(self._dq) > 0:
             self._cond.wait()
-        self._tp.shutdown()
         if self._state == StreamState.ACTIVE:
             self._state = StreamState.FINISHED
-            self._cond.notify()
+            self._cond.notify_all()
         self._cond.release()
+        # waits for the delivery of the last events
+        if self._mail_man is not None:
+            self._mail_man.join()
+        self._tp.shutdown()
 
     def register(self, algo):
         self._cond.acquire()
@@ -1 +1,6 @@
-from pm4py.streaming.util import dictio, event_stream_printer, trace_stream_printer
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["dictio", "event_stream_printer", "trace_stream_printer"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
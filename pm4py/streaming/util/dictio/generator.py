@@ -1,10 +1,15 @@
-from pm4py.streaming.util.dictio.versions import classic
+from pm4py.streaming.util.dictio.versions import classic, disk
 from enum import Enum
 from pm4py.util import exec_utils
 
 
 class Variants(Enum):
     CLASSIC = classic
+    DISK = disk
+
+    def __reduce_ex__(self, protocol):
+        # pickled by name (the values are modules), so the state of the streaming algorithms can be checkpointed
+        return getattr, (self.__class__, self.name)
 
 
 DEFAULT_VARIANT = Variants.CLASSIC
@@ -0,0 +1,211 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+import uuid
+import weakref
+from collections.abc import MutableMapping
+from enum import Enum
+
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    DICT_ID = "dict_id"
+    DICT_PATH = "dict_path"
+    TABLE_PREFIX = "table_prefix"
+    COMMIT_INTERVAL = "commit_interval"
+
+
+# fixed protocol, so the same key is always encoded to the same bytes
+KEY_PROTOCOL = 4
+
+# the dictionaries stored in the same database share the connection (and so the transaction)
+__connections = {}
+
+
+def get_connection(path):
+    """
+    Gets the connection to the database at the given path (opened once per process)
+    """
+    path = os.path.abspath(path)
+    if path not in __connections:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        __connections[path] = conn
+    return __connections[path]
+
+
+def close_database(path, delete=False):
+    """
+    Commits the pending changes and closes the connection to the database at the given path
+    (all the dictionaries stored in the database become unusable)
+
+    Parameters
+    ----------------
+    path
+        Path of the database
+    delete
+        Removes also the database file (along with its -wal and -shm files)
+    """
+    path = os.path.abspath(path)
+    conn = __connections.pop(path, None)
+    if conn is not None:
+        conn.commit()
+        conn.close()
+    if delete:
+        for file in [path, path + "-wal", path + "-shm"]:
+            if os.path.exists(file):
+                os.remove(file)
+
+
+class DiskDict(MutableMapping):
+    """
+    Dictionary stored in a table of a SQLite database, so its size is not bounded by the memory.
+
+    Keys and values are pickled. The changes are committed when commit() is called (this happens when the
+    state of a streaming algorithm is checkpointed), or every commit_interval writes if provided; after a crash,
+    the dictionary goes back to the last commit.
+    Pickling the dictionary stores only the location of the table (after committing it).
+
+    Restoring a checkpoint requires commit_interval=None: otherwise, the rows committed after the checkpoint
+    are mixed with the restored state.
+
+    A dictionary stored in a temporary database deletes it when closed (or garbage collected), so it cannot
+    be restored from a checkpoint after that (restoring a dictionary whose database or table does not exist
+    anymore raises an exception).
+    """
+
+    def __init__(self, path, table, commit_interval=None, temporary=False):
+        self._path = path
+        self._table = table
+        self._commit_interval = commit_interval
+        self._open()
+        self._finalizer = weakref.finalize(self, close_database, path, True) if temporary else None
+
+    def _open(self):
+        self._conn = get_connection(self._path)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS " + self._table + " (k BLOB PRIMARY KEY, v BLOB)")
+        self._conn.commit()
+        self._writes = 0
+
+    def _written(self):
+        self._writes += 1
+        if self._commit_interval is not None and self._writes >= self._commit_interval:
+            self.commit()
+
+    def commit(self):
+        self._conn.commit()
+        self._writes = 0
+
+    def close(self):
+        """
+        Commits the changes and closes the connection to the database (shared by all the dictionaries stored in
+        the same database); a temporary database is also deleted
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+        else:
+            close_database(self._path)
+
+    def __getitem__(self, key):
+        row = self._conn.execute("SELECT v FROM " + self._table + " WHERE k = ?",
+                                 (pickle.dumps(key, protocol=KEY_PROTOCOL),)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return pickle.loads(row[0])
+
+    def __setitem__(self, key, value):
+        self._conn.execute("INSERT OR REPLACE INTO " + self._table + " (k, v) VALUES (?, ?)",
+                           (pickle.dumps(key, protocol=KEY_PROTOCOL), pickle.dumps(value)))
+        self._written()
+
+    def __delitem__(self, key):
+        cursor = self._conn.execute("DELETE FROM " + self._table + " WHERE k = ?",
+                                    (pickle.dumps(key, protocol=KEY_PROTOCOL),))
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+        self._written()
+
+    def __contains__(self, key):
+        return self._conn.execute("SELECT 1 FROM " + self._table + " WHERE k = ?",
+                                  (pickle.dumps(key, protocol=KEY_PROTOCOL),)).fetchone() is not None
+
+    def __iter__(self):
+        for row in self._conn.execute("SELECT k FROM " + self._table).fetchall():
+            yield pickle.loads(row[0])
+
+    def items(self):
+        return [(pickle.loads(k), pickle.loads(v)) for k, v in
+                self._conn.execute("SELECT k, v FROM " + self._table).fetchall()]
+
+    def values(self):
+        return [pickle.loads(row[0]) for row in self._conn.execute("SELECT v FROM " + self._table).fetchall()]
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM " + self._table).fetchone()[0]
+
+    def __repr__(self):
+        return "DiskDict(" + repr(self._path) + ", " + repr(self._table) + ")"
+
+    def __getstate__(self):
+        self.commit()
+        return {"path": self._path, "table": self._table, "commit_interval": self._commit_interval}
+
+    def __setstate__(self, state):
+        self._path = state["path"]
+        self._table = state["table"]
+        self._commit_interval = state["commit_interval"]
+        # the table is not created again, otherwise a checkpoint of a deleted (e.g. temporary) database
+        # would be silently restored as an empty dictionary
+        if not os.path.exists(os.path.abspath(self._path)) or get_connection(self._path).execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self._table,)).fetchone() is None:
+            raise Exception("the database of the dictionary does not exist anymore: " + str(self._path) + " (table " +
+                            self._table + ")")
+        self._open()
+        # the database is deleted only by the dictionary that created it
+        self._finalizer = None
+
+
+def apply(parameters=None):
+    """
+    Returns a dictionary stored on disk (in a table of a SQLite database)
+
+    Parameters
+    ----------------
+    parameters
+        Parameters, including:
+        - Parameters.DICT_PATH: path of the database (default: a new temporary file, deleted when the dictionary
+        is closed or garbage collected); several dictionaries can share the same database, since each one is
+        stored in its own table
+        - Parameters.DICT_ID: identifier of the dictionary (determines the table, along with the prefix)
+        - Parameters.TABLE_PREFIX: prefix of the name of the table (default: a random identifier, so the
+        dictionaries of different algorithms sharing the same database do not collide)
+        - Parameters.COMMIT_INTERVAL: number of writes after which the changes are committed
+        (default: None, the changes are committed only when the state is checkpointed; it should stay None
+        if the algorithm is restored from a checkpoint)
+
+    Returns
+    ----------------
+    dictio
+        Dictionary
+    """
+    if parameters is None:
+        parameters = {}
+
+    path = exec_utils.get_param_value(Parameters.DICT_PATH, parameters, None)
+    dict_id = exec_utils.get_param_value(Parameters.DICT_ID, parameters, 0)
+    table_prefix = exec_utils.get_param_value(Parameters.TABLE_PREFIX, parameters, None)
+    commit_interval = exec_utils.get_param_value(Parameters.COMMIT_INTERVAL, parameters, None)
+
+    temporary = path is None
+    if temporary:
+        fd, path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(fd)
+    if table_prefix is None:
+        table_prefix = uuid.uuid4().hex
+
+    table = "dict_" + "".join(c if c.isalnum() else "_" for c in str(table_prefix) + "_" + str(dict_id))
+
+    return DiskDict(path, table, commit_interval=commit_interval, temporary=temporary)
@@ -1,2 +1,8 @@
-from pm4py.util import lp, vers_checker, constants, points_subset, business_hours, regex, xes_constants, vis_utils, \
-    dt_parsing, colors, exec_utils, pandas_utils
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["lp", "vers_checker", "constants", "points_subset", "business_hours", "regex", "xes_constants", "vis_utils",
+           "dt_parsing", "colors", "exec_utils", "pandas_utils",
+           "pool_utils"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1,12 +1,18 @@
 import datetime
 
+import numpy as np
+
+EPOCH = datetime.datetime(1970, 1, 1)
+MICROSECOND = datetime.timedelta(microseconds=1)
+
 
 class BusinessHours:
 
     def __init__(self, datetime1, datetime2, worktiming=[7, 17],
-                 weekends=[6, 7]):
+                 weekends=[6, 7], holidays=None):
         self.weekends = weekends
         self.worktiming = worktiming
+        self.holidays = holidays
         self.datetime1 = datetime1
         self.datetime2 = datetime2
         self.day_hours = (self.worktiming[1] - self.worktiming[0])
@@ -25,99 +31,94 @@ class BusinessHours:
         """
         Return the difference in minutes.
         """
-        # Set initial default variables
-        dt_start = self.datetime1  # datetime of start
-        dt_end = self.datetime2  # datetime of end
-        worktime_in_seconds = 0
-
-        if dt_start.date() == dt_end.date():
-            # starts and ends on same workday
-            full_days = 0
-            if self.is_weekend(dt_start):
-                return 0
-            else:
-                if dt_start.hour < self.worktiming[0]:
-                    # set start time to opening hour
-                    dt_start = datetime.datetime(
-                        year=dt_start.year,
-                        month=dt_start.month,
-                        day=dt_start.day,
-                        hour=self.worktiming[0],
-                        minute=0)
-                if dt_start.hour >= self.worktiming[1] or \
-                        dt_end.hour < self.worktiming[0]:
-                    return 0
-                if dt_end.hour >= self.worktiming[1]:
-                    dt_end = datetime.datetime(
-                        year=dt_end.year,
-                        month=dt_end.month,
-                        day=dt_end.day,
-                        hour=self.worktiming[1],
-                        minute=0)
-                worktime_in_seconds = (dt_end - dt_start).total_seconds()
-        elif (dt_end - dt_start).days < 0:
-            # ends before start
-            return 0
-        else:
-            # start and ends on different days
-            current_day = dt_start  # marker for counting workdays
-            while not current_day.date() == dt_end.date():
-                if not self.is_weekend(current_day):
-                    if current_day == dt_start:
-                        # increment hours of first day
-                        if current_day.hour < self.worktiming[0]:
-                            # starts before the work day
-                            worktime_in_seconds += self.day_minutes * 60  # add 1 full work day
-                        elif current_day.hour >= self.worktiming[1]:
-                            pass  # no time on first day
-                        else:
-                            # starts during the working day
-                            if self.worktiming[1] < 24:
-                                # if we have a target that is below 24:00:00 (the next day)
-                                # we can use the existing code
-                                dt_currentday_close = datetime.datetime(
-                                    year=dt_start.year,
-                                    month=dt_start.month,
-                                    day=dt_start.day,
-                                    hour=self.worktiming[1],
-                                    minute=0)
-                            else:
-                                # otherwise, make the stop date as 23:59:59
-                                dt_currentday_close = datetime.datetime(
-                                    year=dt_start.year,
-                                    month=dt_start.month,
-                                    day=dt_start.day,
-                                    hour=23,
-                                    minute=59, second=59)
-                            worktime_in_seconds += (dt_currentday_close
-                                                    - dt_start).total_seconds()
-                    else:
-                        # increment one full day
-                        worktime_in_seconds += self.day_minutes * 60
-                current_day += datetime.timedelta(days=1)  # next day
-            # Time on the last day
-            if not self.is_weekend(dt_end):
-                if dt_end.hour >= self.worktiming[1]:  # finish after close
-                    # Add a full day
-                    worktime_in_seconds += self.day_minutes * 60
-                elif dt_end.hour < self.worktiming[0]:  # close before opening
-                    pass  # no time added
-                else:
-                    # Add time since opening
-                    dt_end_open = datetime.datetime(
-                        year=dt_end.year,
-                        month=dt_end.month,
-                        day=dt_end.day,
-                        hour=self.worktiming[0],
-                        minute=0)
-                    worktime_in_seconds += (dt_end - dt_end_open).total_seconds()
-        return int(worktime_in_seconds / 60)
-
-    def is_weekend(self, datetime):
+        return int(get_seconds([self.datetime1], [self.datetime2], worktiming=self.worktiming,
+                               weekends=self.weekends, holidays=self.holidays)[0]) // 60
+
+    def is_weekend(self, dt):
         """
         Returns True if datetime lands on a weekend.
         """
         for weekend in self.weekends:
-            if datetime.isoweekday() == weekend:
+            if dt.isoweekday() == weekend:
                 return True
-        return False
\ No newline at end of file
+        return False
+
+
+def get_seconds(starts, ends, worktiming=[7, 17], weekends=[6, 7], holidays=None):
+    """
+    Gets the business time between every start timestamp and the corresponding end timestamp, for whole arrays
+    of timestamps at once.
+
+    The business time up to a timestamp is the number of working days (counted through the NumPy business day
+    functions) before its day, multiplied by the working time of a day, plus the working time already elapsed
+    in its day; the business time between two timestamps is the difference between their business times.
+    As in BusinessHours.getseconds, the result is counted in whole minutes, and it is 0 if the end precedes the start.
+
+    Parameters
+    -------------
+    starts
+        Start timestamps (list of datetimes, or array/series of datetime64; the time zone, if any, is dropped
+        keeping the local time)
+    ends
+        End timestamps
+    worktiming
+        Working hours of a day (opening and closing hour)
+    weekends
+        Days of the week without work (ISO weekday numbers: Monday is 1, Sunday is 7)
+    holidays
+        (if provided) days without work (list of dates)
+
+    Returns
+    -------------
+    seconds
+        Array of the business seconds between the timestamps
+    """
+    starts = __to_datetime64(starts)
+    ends = __to_datetime64(ends)
+    weekmask = [0 if day in weekends else 1 for day in range(1, 8)]
+    if not any(weekmask):
+        return np.zeros(len(starts), dtype=np.int64)
+    calendar = np.busdaycalendar(weekmask=weekmask, holidays=__to_dates(holidays))
+    opening = int(round(worktiming[0] * 3600 * 10 ** 6))
+    closing = int(round(worktiming[1] * 3600 * 10 ** 6))
+    diff = __business_time(ends, opening, closing, calendar) - __business_time(starts, opening, closing, calendar)
+    # whole minutes (in seconds)
+    return np.maximum(diff, 0) // (60 * 10 ** 6) * 60
+
+
+def __business_time(timestamps, opening, closing, calendar):
+    """
+    Gets the business time (in microseconds) elapsed from the first day of 1970 to each timestamp
+    """
+    days = timestamps.astype("datetime64[D]")
+    time_of_day = (timestamps - days).astype(np.int64)
+    business_days = np.busday_count(np.datetime64("1970-01-01", "D"), days, busdaycal=calendar)
+    elapsed = np.where(np.is_busday(days, busdaycal=calendar), np.clip(time_of_day, opening, closing) - opening, 0)
+    return business_days * (closing - opening) + elapsed
+
+
+def __to_datetime64(timestamps):
+    """
+    Converts the timestamps to an array of datetime64 (at the microseconds precision), without time zone
+    """
+    if hasattr(timestamps, "dt"):
+        # Pandas series
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+        return timestamps.values.astype("datetime64[us]")
+    if isinstance(timestamps, np.ndarray) and timestamps.dtype != object:
+        return timestamps.astype("datetime64[us]")
+    if isinstance(timestamps, np.ndarray):
+        timestamps = timestamps.tolist()
+    # the microseconds from the epoch are computed in Python (that is faster than letting NumPy parse the datetimes)
+    return np.array([(t.replace(tzinfo=None) - EPOCH) // MICROSECOND for t in timestamps],
+                    dtype=np.int64).view("datetime64[us]")
+
+
+def __to_dates(holidays):
+    """
+    Converts the holidays to an array of datetime64 days
+    """
+    if not holidays:
+        return np.array([], dtype="datetime64[D]")
+    return np.array([np.datetime64(h, "D") for h in holidays], dtype="datetime64[D]")
@@ -0,0 +1,46 @@
+import importlib
+import sys
+
+
+def lazy_getattr(package_name, submodules, attributes=None):
+    """
+    Gets the module-level __getattr__ and __dir__ functions (PEP 562) of a package,
+    that import the submodules of the package (and the attributes of the submodules exposed by the package)
+    when they are accessed for the first time, instead of importing them along with the package
+
+    Parameters
+    -------------
+    package_name
+        Name of the package (__name__)
+    submodules
+        Names of the submodules of the package
+    attributes
+        (if provided) dictionary associating to each attribute exposed by the package
+        the name of the submodule defining it
+
+    Returns
+    -------------
+    __getattr__
+        Function that imports the requested submodule/attribute
+    __dir__
+        Function that lists the attributes of the package, including the ones not imported yet
+    """
+    if attributes is None:
+        attributes = {}
+
+    submodules = set(submodules)
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module(package_name + "." + name)
+        if name in attributes:
+            value = getattr(importlib.import_module(package_name + "." + attributes[name]), name)
+            # caches the attribute in the package, so the next accesses do not pass from here
+            setattr(sys.modules[package_name], name, value)
+            return value
+        raise AttributeError("module {!r} has no attribute {!r}".format(package_name, name))
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])).union(submodules).union(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,47 @@
+import numpy as np
+
+
+def get_rows(A, threshold=0):
+    """
+    Iterates over the rows of a constraint matrix, that can be dense or a SciPy sparse matrix
+    (only the non-zero coefficients are visited)
+
+    Parameters
+    -------------
+    A
+        Constraint matrix
+    threshold
+        The coefficients having absolute value lower or equal than the threshold are skipped
+
+    Returns
+    -------------
+    rows
+        Generator of the rows, each one as a couple (columns, coefficients)
+    """
+    from scipy.sparse import csr_matrix, issparse
+
+    A = A.tocsr() if issparse(A) else csr_matrix(np.asarray(A, dtype=np.float64))
+    A.sort_indices()
+    for i in range(A.shape[0]):
+        cols = A.indices[A.indptr[i]:A.indptr[i + 1]]
+        vals = A.data[A.indptr[i]:A.indptr[i + 1]]
+        mask = np.abs(vals) > threshold
+        yield cols[mask].tolist(), vals[mask].tolist()
+
+
+def get_vector(b):
+    """
+    Gets the values of a column vector (list, array or matrix) as a flat list of floats
+    """
+    if type(b) is list and len(b) == 1:
+        b = b[0]
+    return np.asarray(b, dtype=np.float64).ravel().tolist()
+
+
+def get_num_columns(A):
+    """
+    Gets the number of columns of a constraint matrix (dense or sparse)
+    """
+    from scipy.sparse import issparse
+
+    return A.shape[1] if issparse(A) else np.asmatrix(A).shape[1]
@@ -1,7 +1,14 @@
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = []
+
 if pkgutil.find_loader("pulp"):
-    from pm4py.util.lp.variants import pulp_solver
+    __all__.append("pulp_solver")
 
 if pkgutil.find_loader("ortools"):
-    from pm4py.util.lp.variants import ortools_solver
+    __all__.append("ortools_solver")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
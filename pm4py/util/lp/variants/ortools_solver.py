@@ -4,6 +4,7 @@ import numpy as np
 
 from ortools.linear_solver import pywraplp
 from pm4py.util.lp.parameters import Parameters
+from pm4py.util.lp.util import sparse
 from pm4py.util import exec_utils
 
 
@@ -39,21 +40,13 @@ def apply(c, Aub, bub, Aeq, beq, parameters=None):
 
     require_ilp = exec_utils.get_param_value(Parameters.REQUIRE_ILP, parameters, False)
 
-    Aub = np.asmatrix(Aub)
-    if type(bub) is list and len(bub) == 1:
-        bub = bub[0]
-    if Aeq is not None:
-        Aeq = np.asmatrix(Aeq)
-    if beq is not None and type(beq) is list and len(beq) == 1:
-        beq = beq[0]
-
     solver = pywraplp.Solver('LinearProgrammingExample',
                              pywraplp.Solver.GLOP_LINEAR_PROGRAMMING)
     solver.Clear()
     solver.SuppressOutput()
 
     x_list = []
-    for i in range(Aub.shape[1]):
+    for i in range(sparse.get_num_columns(Aub)):
         if require_ilp:
             x = solver.IntVar(-solver.infinity(), solver.infinity(), "x_" + str(i))
         else:
@@ -65,30 +58,21 @@ def apply(c, Aub, bub, Aeq, beq, parameters=None):
         if abs(c[j]) > MIN_THRESHOLD:
             objective.SetCoefficient(x_list[j], c[j])
 
-    for i in range(Aub.shape[0]):
-        ok = False
-        for j in range(Aub.shape[1]):
-            if abs(Aub[i, j]) > MIN_THRESHOLD:
-                ok = True
-                break
-        if ok:
-            constraint = solver.Constraint(-solver.infinity(), bub[i].reshape(-1, ).tolist()[0][0])
-            for j in range(Aub.shape[1]):
-                if abs(Aub[i, j]) > MIN_THRESHOLD:
-                    constraint.SetCoefficient(x_list[j], Aub[i, j])
+    # the constraints are visited through their non-zero coefficients (the matrices can be also sparse)
+    bub = sparse.get_vector(bub)
+    for i, (cols, vals) in enumerate(sparse.get_rows(Aub, threshold=MIN_THRESHOLD)):
+        if cols:
+            constraint = solver.Constraint(-solver.infinity(), bub[i])
+            for j, v in zip(cols, vals):
+                constraint.SetCoefficient(x_list[j], v)
 
     if Aeq is not None and beq is not None:
-        for i in range(Aeq.shape[0]):
-            ok = False
-            for j in range(Aeq.shape[1]):
-                if abs(Aeq[i, j]) > MIN_THRESHOLD:
-                    ok = True
-                    break
-            if ok:
-                constraint = solver.Constraint(beq[i].reshape(-1,).tolist()[0][0], beq[i].reshape(-1,).tolist()[0][0])
-                for j in range(Aeq.shape[1]):
-                    if abs(Aeq[i, j]) > MIN_THRESHOLD:
-                        constraint.SetCoefficient(x_list[j], Aeq[i, j])
+        beq = sparse.get_vector(beq)
+        for i, (cols, vals) in enumerate(sparse.get_rows(Aeq, threshold=MIN_THRESHOLD)):
+            if cols:
+                constraint = solver.Constraint(beq[i], beq[i])
+                for j, v in zip(cols, vals):
+                    constraint.SetCoefficient(x_list[j], v)
 
     objective.SetMinimization()
 
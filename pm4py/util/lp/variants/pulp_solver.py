@@ -2,8 +2,9 @@ import sys
 import tempfile
 import numpy as np
 
-from pulp import LpProblem, LpMinimize, LpVariable, LpStatus, value, PULP_CBC_CMD
+from pulp import LpProblem, LpMinimize, LpVariable, LpStatus, LpAffineExpression, value, PULP_CBC_CMD
 from pm4py.util.lp.parameters import Parameters
+from pm4py.util.lp.util import sparse
 from pm4py.util import exec_utils
 
 MIN_THRESHOLD = 10 ** -12
@@ -60,65 +61,32 @@ def apply(c, Aub, bub, Aeq, beq, parameters=None):
 
     require_ilp = exec_utils.get_param_value(Parameters.REQUIRE_ILP, parameters, False)
 
-    Aub = np.asmatrix(Aub)
-    if type(bub) is list and len(bub) == 1:
-        bub = bub[0]
-    if Aeq is not None:
-        Aeq = np.asmatrix(Aeq)
-    if beq is not None and type(beq) is list and len(beq) == 1:
-        beq = beq[0]
-
     prob = LpProblem("", LpMinimize)
 
     x_list = []
-    for i in range(Aub.shape[1]):
+    for i in range(sparse.get_num_columns(Aub)):
         if require_ilp:
             x_list.append(LpVariable("x_" + get_terminal_part_name_num(i), cat='Binary'))
         else:
             x_list.append(LpVariable("x_" + get_terminal_part_name_num(i)))
 
-    eval_str = ""
-    expr_count = 0
-    for j in range(len(c)):
-        if abs(c[j]) > MIN_THRESHOLD:
-            if expr_count > 0:
-                eval_str = eval_str + " + "
-            eval_str = eval_str + str(c[j]) + "*x_list[" + str(j) + "]"
-            expr_count = expr_count + 1
-    eval_str = eval_str + ", \"objective\""
-    prob += eval(eval_str)
-
-    for i in range(Aub.shape[0]):
-        expr_count = 0
-        eval_str = 0
-        eval_str = ""
-        for j in range(Aub.shape[1]):
-            if abs(Aub[i, j]) > MIN_THRESHOLD:
-                if expr_count > 0:
-                    eval_str = eval_str + " + "
-                eval_str = eval_str + str(Aub[i, j]) + "*x_list[" + str(j) + "]"
-                expr_count = expr_count + 1
-        eval_str = eval_str + "<=" + str(
-            bub[i].reshape(-1, ).tolist()[0][0]) + ", \"vinc_" + get_terminal_part_name_num(i) + "\""
-
-        prob += eval(eval_str)
+    # the constraints are visited through their non-zero coefficients (the matrices can be also sparse)
+    prob += LpAffineExpression([(x_list[j], float(c[j])) for j in range(len(c)) if abs(c[j]) > MIN_THRESHOLD]), \
+            "objective"
+
+    bub = sparse.get_vector(bub)
+    for i, (cols, vals) in enumerate(sparse.get_rows(Aub, threshold=MIN_THRESHOLD)):
+        if cols:
+            prob += LpAffineExpression([(x_list[j], v) for j, v in zip(cols, vals)]) <= bub[i], \
+                    "vinc_" + get_terminal_part_name_num(i)
 
     if Aeq is not None and beq is not None:
-        for i in range(Aeq.shape[0]):
-            expr_count = 0
-            eval_str = 0
-            eval_str = ""
-            for j in range(Aeq.shape[1]):
-                if abs(Aeq[i, j]) > MIN_THRESHOLD:
-                    if expr_count > 0:
-                        eval_str = eval_str + " + "
-                    eval_str = eval_str + str(Aeq[i, j]) + "*x_list[" + str(j) + "]"
-                    expr_count = expr_count + 1
-            if eval_str:
-                eval_str = eval_str + "==" + str(beq[i].reshape(-1, ).tolist()[0][0]) + ", \"vinceq_" + get_terminal_part_name_num(
-                    i + 1 + Aub.shape[0]) + "\""
-
-                prob += eval(eval_str)
+        num_ub = len(bub)
+        beq = sparse.get_vector(beq)
+        for i, (cols, vals) in enumerate(sparse.get_rows(Aeq, threshold=MIN_THRESHOLD)):
+            if cols:
+                prob += LpAffineExpression([(x_list[j], v) for j, v in zip(cols, vals)]) == beq[i], \
+                        "vinceq_" + get_terminal_part_name_num(i + 1 + num_ub)
 
     filename = tempfile.NamedTemporaryFile(suffix='.lp').name
     prob.writeLP(filename)
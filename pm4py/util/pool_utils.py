@@ -0,0 +1,76 @@
+from concurrent.futures import ProcessPoolExecutor
+
+# state of the worker processes (shipped once per worker, by the initializer of the pool)
+_worker_state = {}
+
+
+def init_worker(state):
+    """
+    Initializes a worker process, storing the state shared by all the tasks it executes
+
+    Parameters
+    -------------
+    state
+        Dictionary containing the state (e.g. the model and the parameters of the algorithm)
+    """
+    _worker_state.clear()
+    _worker_state.update(state)
+
+
+def get_worker_state():
+    """
+    Gets the state stored in the current worker process by init_worker
+
+    Returns
+    -------------
+    state
+        Dictionary containing the state
+    """
+    return _worker_state
+
+
+def get_pool(num_workers, state):
+    """
+    Creates a pool of processes, each one initialized with the given state (so it is sent once per worker,
+    instead of once per task)
+
+    Parameters
+    -------------
+    num_workers
+        Number of worker processes
+    state
+        Dictionary containing the state shared by the tasks (read in the tasks through get_worker_state)
+
+    Returns
+    -------------
+    executor
+        Pool of processes (to be used as context manager)
+    """
+    return ProcessPoolExecutor(max_workers=num_workers, initializer=init_worker, initargs=(state,))
+
+
+def get_guided_batches(items, num_workers):
+    """
+    Splits a list of items in batches that get smaller towards the end (guided scheduling): each batch takes
+    a fraction of the remaining items. If the items are sorted by decreasing cost, the most expensive items are
+    started first and the workers finish at the same time.
+
+    Parameters
+    -------------
+    items
+        List of items
+    num_workers
+        Number of worker processes
+
+    Returns
+    -------------
+    batches
+        List of batches (lists of consecutive items)
+    """
+    batches = []
+    i = 0
+    while i < len(items):
+        size = max(1, (len(items) - i) // (4 * num_workers))
+        batches.append(items[i:i + size])
+        i = i + size
+    return batches
@@ -1,20 +1,27 @@
 import pkgutil
 
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = []
+
 if pkgutil.find_loader("graphviz"):
-    # imports the visualizations only if graphviz is installed
-    from pm4py.visualization import common, dfg, petrinet, process_tree, transition_system, decisiontree, align_table, \
-        footprints, bpmn
+    # the visualizations are available only if graphviz is installed
+    __all__.extend(["common", "dfg", "petrinet", "process_tree", "transition_system", "decisiontree", "align_table",
+                    "footprints", "bpmn"])
     if pkgutil.find_loader("matplotlib") and pkgutil.find_loader("pyvis"):
         # SNA requires both packages matplotlib and pyvis. These are included in the default installation;
         # however, they may lead to problems in some platforms/deployments
-        from pm4py.visualization import sna
+        __all__.append("sna")
     if pkgutil.find_loader("pydotplus"):
         # heuristics net visualization requires pydotplus. This is included in the default installation;
         # however, they may lead to problems in some platforms/deployments
-        from pm4py.visualization import heuristics_net
+        __all__.append("heuristics_net")
 
 
 if pkgutil.find_loader("matplotlib"):
     # graphs require matplotlib. This is included in the default installation;
     # however, they may lead to problems in some platforms/deployments
-    from pm4py.visualization import graphs
+    __all__.append("graphs")
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
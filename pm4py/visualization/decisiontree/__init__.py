@@ -1 +1,6 @@
-from pm4py.visualization.decisiontree import variants, visualizer
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["variants", "visualizer"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
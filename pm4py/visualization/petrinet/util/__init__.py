@@ -1 +1,6 @@
-from pm4py.visualization.petrinet.util import performance_map, vis_trans_shortest_paths, alignments_decoration
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["performance_map", "vis_trans_shortest_paths", "alignments_decoration"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
@@ -1,2 +1,7 @@
-from pm4py.visualization.petrinet.variants import alignments, greedy_decoration_frequency, \
-    greedy_decoration_performance, token_decoration_frequency, token_decoration_performance, wo_decoration
+from pm4py.util.lazy_import import lazy_getattr
+
+# the submodules are imported when they are accessed for the first time
+__all__ = ["alignments", "greedy_decoration_frequency", "greedy_decoration_performance", "token_decoration_frequency",
+           "token_decoration_performance", "wo_decoration"]
+
+__getattr__, __dir__ = lazy_getattr(__name__, __all__)
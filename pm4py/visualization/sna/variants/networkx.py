@@ -48,6 +48,7 @@ def apply(metric_values, parameters=None):
         Name of a temporary file where the visualization is placed
     """
     import networkx as nx
+    from scipy.sparse import issparse
 
     if parameters is None:
         parameters = {}
@@ -59,7 +60,12 @@ def apply(metric_values, parameters=None):
 
     temp_file_name = get_temp_file_name(format)
 
-    rows, cols = np.where(metric_values[0] > weight_threshold)
+    if issparse(metric_values[0]):
+        matrix = metric_values[0].tocoo()
+        mask = matrix.data > weight_threshold
+        rows, cols = matrix.row[mask], matrix.col[mask]
+    else:
+        rows, cols = np.where(metric_values[0] > weight_threshold)
     edges = zip(rows.tolist(), cols.tolist())
 
     if directed:
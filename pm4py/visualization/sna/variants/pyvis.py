@@ -44,6 +44,7 @@ def apply(metric_values, parameters=None):
         Name of a temporary file where the visualization is placed
     """
     from pyvis.network import Network
+    from scipy.sparse import issparse
 
     if parameters is None:
         parameters = {}
@@ -53,11 +54,17 @@ def apply(metric_values, parameters=None):
 
     temp_file_name = get_temp_file_name("html")
 
-    rows, cols = np.where(metric_values[0] > weight_threshold)
-    weights = list()
+    if issparse(metric_values[0]):
+        matrix = metric_values[0].tocoo()
+        mask = matrix.data > weight_threshold
+        rows, cols = matrix.row[mask], matrix.col[mask]
+        weights = list(matrix.data[mask])
+    else:
+        rows, cols = np.where(metric_values[0] > weight_threshold)
+        weights = list()
 
-    for x in range(len(rows)):
-        weights.append(metric_values[0][rows[x]][cols[x]])
+        for x in range(len(rows)):
+            weights.append(metric_values[0][rows[x]][cols[x]])
 
     got_net = Network(height="750px", width="100%", bgcolor="black", font_color="#3de975", directed=directed)
     # set the physics layout of the network
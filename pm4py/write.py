@@ -22,6 +22,25 @@ def write_xes(log, file_path):
     xes_exporter.apply(log, file_path)
 
 
+def write_columnar(log, file_path):
+    """
+    Exports a log in the columnar format (a folder containing a NumPy array per column)
+
+    Parameters
+    --------------
+    log
+        Event log
+    file_path
+        Destination path (folder)
+
+    Returns
+    -------------
+    void
+    """
+    from pm4py.objects.log.exporter.columnar import exporter as columnar_exporter
+    columnar_exporter.apply(log, file_path)
+
+
 @deprecation.deprecated(deprecated_in="2.0.2", removed_in="3.0",
                         current_version=VERSION,
                         details="Use pandas to export CSV files")
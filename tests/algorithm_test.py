@@ -20,6 +20,54 @@ class AlgorithmTest(unittest.TestCase):
         # raise Exception("%d" % (len(log)))
         clust_algorithm.apply(log, "responsible", variant=clust_algorithm.Variants.VARIANT_DMM_VEC)
 
+    def test_hiearch_clustering_distances(self):
+        import numpy as np
+        from pm4py.objects.conversion.log import converter as log_converter
+        from pm4py.algo.clustering.trace_attribute_driven import algorithm as clust_algorithm
+        from pm4py.algo.clustering.trace_attribute_driven.merge_log import merge_log
+        from pm4py.algo.clustering.trace_attribute_driven.util import evaluation
+        from pm4py.algo.clustering.trace_attribute_driven.variants import act_dist_calc, suc_dist_calc
+        from pm4py.algo.clustering.trace_attribute_driven.leven_dist import leven_dist_calc
+        df = dataframe_utils.convert_timestamp_columns_in_df(pd.read_csv(os.path.join("input_data", "receipt.csv")))
+        log = log_converter.apply(df)[:60]
+        values = sorted(set(trace.attributes["responsible"] for trace in log))
+        loglist = [merge_log.log2sublog(log, value, "responsible") for value in values]
+        # the vectorized distances are the same as the ones computed couple by couple
+        y_vec = evaluation.eval_DMM_variant(loglist, 1, 0.5)
+        y_leven = evaluation.eval_avg_leven(loglist, 1, 0.5)
+        k = 0
+        for i in range(len(loglist) - 1):
+            for j in range(i + 1, len(loglist)):
+                dist = act_dist_calc.act_sim_percent(loglist[i], loglist[j], 1, 1) * 0.5 + \
+                       suc_dist_calc.suc_sim_percent(loglist[i], loglist[j], 1, 1) * 0.5
+                self.assertAlmostEqual(y_vec[k], dist)
+                self.assertAlmostEqual(y_leven[k], leven_dist_calc.leven_dist_avg(loglist[i], loglist[j], 1, 1))
+                k = k + 1
+        tree, leafname = clust_algorithm.apply(log, "responsible", variant=clust_algorithm.Variants.VARIANT_DMM_LEVEN)
+        tree_par, leafname_par = clust_algorithm.apply(log, "responsible",
+                                                       variant=clust_algorithm.Variants.VARIANT_DMM_LEVEN,
+                                                       parameters={"enable_parallel": True, "num_workers": 2})
+        self.assertEqual(tree, tree_par)
+        self.assertTrue(np.isfinite(y_vec).all())
+
+    def test_correlation_mining(self):
+        from pm4py.algo.discovery.correlation_mining import algorithm as correlation_miner
+        from pm4py.algo.discovery.correlation_mining import util as cm_util
+        df = dataframe_utils.convert_timestamp_columns_in_df(
+            pd.read_csv(os.path.join("input_data", "correlation_mining.csv")))
+        dfg, performance_dfg = correlation_miner.apply(df)
+        dfg_mcf, performance_dfg_mcf = correlation_miner.apply(df, parameters={"min_cost_flow": True})
+        self.assertEqual(dfg, dfg_mcf)
+        self.assertEqual(performance_dfg, performance_dfg_mcf)
+        dfg_split, performance_dfg_split = correlation_miner.apply(df, variant=correlation_miner.Variants.CLASSIC_SPLIT)
+        # the vectorized greedy matchings are the same as the non-vectorized ones
+        ai = [1.0, 3.0, 4.0, 9.0]
+        aj = [2.0, 2.5, 5.0, 6.0, 10.0]
+        self.assertEqual(sorted(cm_util.get_times_diff_fifo(ai, aj)),
+                         sorted(y - x for x, y in cm_util.calculate_time_match_fifo(ai, aj)))
+        self.assertEqual(sorted(cm_util.get_times_diff_rlifo(ai, aj)),
+                         sorted(y - x for x, y in cm_util.calculate_time_match_rlifo(ai, aj)))
+
     def test_log_skeleton(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.log_skeleton import algorithm as lsk_discovery
@@ -65,6 +113,29 @@ class AlgorithmTest(unittest.TestCase):
         generalization = generalization_evaluation.apply(log, net, im, fm,
                                                          variant=generalization_evaluation.Variants.GENERALIZATION_TOKEN)
 
+    def test_tokenreplay_parallel(self):
+        log = xes_importer.apply(os.path.join("input_data", "reviewing.xes"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        net, im, fm = inductive_miner.apply(log, variant=inductive_miner.Variants.IMf)
+        from pm4py.algo.conformance.tokenreplay.variants import token_replay
+        parameters = {token_replay.Parameters.ENABLE_PLTR_FITNESS: True}
+        sequential = token_replay.apply(log, net, im, fm, parameters=parameters)
+        parameters[token_replay.Parameters.ENABLE_PARALLEL] = True
+        parameters[token_replay.Parameters.NUM_WORKERS] = 2
+        parallel = token_replay.apply(log, net, im, fm, parameters=parameters)
+        self.assertEqual([x["trace_fitness"] for x in sequential[0]], [x["trace_fitness"] for x in parallel[0]])
+        self.assertEqual([x["activated_transitions"] for x in sequential[0]],
+                         [x["activated_transitions"] for x in parallel[0]])
+        for p in net.places:
+            self.assertEqual(sequential[1][p], parallel[1][p])
+        for t in sequential[2]:
+            self.assertEqual(set(sequential[2][t]["underfed_traces"]), set(parallel[2][t]["underfed_traces"]))
+        from pm4py.evaluation.replay_fitness import evaluator as rp_fitness_evaluator
+        fitness = rp_fitness_evaluator.apply(log, net, im, fm, variant=rp_fitness_evaluator.Variants.TOKEN_BASED,
+                                             parameters={"enable_parallel": True, "num_workers": 2})
+        self.assertEqual(fitness, rp_fitness_evaluator.apply(log, net, im, fm,
+                                                             variant=rp_fitness_evaluator.Variants.TOKEN_BASED))
+
     def test_evaluation(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
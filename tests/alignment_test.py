@@ -48,6 +48,47 @@ class AlignmentTest(unittest.TestCase):
             if not is_fit:
                 raise Exception("should be fit")
 
+    def test_alignment_parallel(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "roadtraffic100traces.xes"))
+        net, marking, final_marking = inductive_miner.apply(log)
+        for variant in [align_alg.Variants.VERSION_STATE_EQUATION_A_STAR,
+                        align_alg.Variants.VERSION_DIJKSTRA_LESS_MEMORY]:
+            sequential = align_alg.apply_log(log, net, marking, final_marking, variant=variant)
+            parallel = align_alg.apply_log(log, net, marking, final_marking, variant=variant,
+                                           parameters={align_alg.Parameters.ENABLE_PARALLEL: True,
+                                                       align_alg.Parameters.NUM_WORKERS: 2})
+            self.assertEqual([x["cost"] for x in sequential], [x["cost"] for x in parallel])
+            self.assertEqual([x["fitness"] for x in sequential], [x["fitness"] for x in parallel])
+
+    def test_alignment_prefix_trie(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "roadtraffic100traces.xes"))
+        net, marking, final_marking = inductive_miner.apply(log)
+        expected = align_alg.apply_log(log, net, marking, final_marking,
+                                       variant=align_alg.Variants.VERSION_STATE_EQUATION_A_STAR)
+        # a small maximum size of the trie forces the splitting of the variants in several tries
+        for max_trie_nodes in [100000, 10]:
+            aligned = align_alg.apply_log(log, net, marking, final_marking,
+                                          variant=align_alg.Variants.VERSION_DIJKSTRA_PREFIX_TRIE,
+                                          parameters={align_alg.Parameters.MAX_TRIE_NODES: max_trie_nodes})
+            self.assertEqual([x["cost"] for x in expected], [x["cost"] for x in aligned])
+            for trace, alignment in zip(log, aligned):
+                self.assertEqual([e["concept:name"] for e in trace],
+                                 [move[0] for move in alignment["alignment"] if move[0] != ">>"])
+        # a cost function of the log moves is defined for a single trace, so it is not shared along the prefixes
+        traces = log[:10]
+        parameters = {align_alg.Parameters.PARAM_TRACE_COST_FUNCTION: list(range(1, max(len(t) for t in traces) + 1))}
+        expected = [align_alg.apply_trace(trace, net, marking, final_marking, parameters=parameters,
+                                          variant=align_alg.Variants.VERSION_STATE_EQUATION_A_STAR) for trace in traces]
+        aligned = align_alg.Variants.VERSION_DIJKSTRA_PREFIX_TRIE.value.apply_traces(traces, net, marking,
+                                                                                   final_marking, parameters=parameters)
+        self.assertEqual([x["cost"] for x in expected], [x["cost"] for x in aligned])
+
 
 if __name__ == "__main__":
     unittest.main()
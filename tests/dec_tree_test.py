@@ -1,6 +1,7 @@
 import os
 import unittest
 
+import numpy as np
 from sklearn import tree
 
 from pm4py.objects.log.importer.xes import importer as xes_importer
@@ -38,6 +39,25 @@ class DecisionTreeTest(unittest.TestCase):
                             parameters={dt_vis.Variants.CLASSIC.value.Parameters.FORMAT: "svg"})
         del gviz
 
+    def test_decisiontree_sparse(self):
+        log_path = os.path.join("input_data", "roadtraffic50traces.xes")
+        log = xes_importer.apply(log_path)
+        data, feature_names = get_log_representation.get_representation(log, [], ["concept:name"], [], ["amount"])
+        sparse_data, sparse_feature_names = get_log_representation.get_representation(log, [], ["concept:name"], [],
+                                                                                      ["amount"], sparse=True)
+        self.assertEqual(feature_names, sparse_feature_names)
+        self.assertTrue((sparse_data.toarray() == data).all())
+        chunks = list(get_log_representation.get_representation_chunks(log, [], ["concept:name"], [], ["amount"],
+                                                                         chunk_size=20))
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue((np.vstack([chunk.toarray() for chunk in chunks]) == data).all())
+        target, classes = get_class_representation.get_class_representation_by_trace_duration(log, 2 * 8640000)
+        clf = tree.DecisionTreeClassifier(max_depth=7)
+        clf.fit(sparse_data, target)
+        gviz = dt_vis.apply(clf, sparse_feature_names, classes,
+                            parameters={dt_vis.Variants.CLASSIC.value.Parameters.FORMAT: "svg"})
+        del gviz
+
 
 if __name__ == "__main__":
     unittest.main()
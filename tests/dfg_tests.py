@@ -16,6 +16,47 @@ class DfgTests(unittest.TestCase):
         act_count = pm4py.get_attribute_values(log, "concept:name")
         pm4py.objects.dfg.filtering.dfg_filtering.filter_dfg_on_paths_percentage(dfg, sa, ea, act_count, 0.3)
 
+    def test_dfg_window_once_per_case(self):
+        from pm4py.objects.dfg.retrieval import log as dfg_retrieval
+        log = pm4py.read_xes("input_data/running-example.xes")
+        dfg = dfg_retrieval.native(log, parameters={dfg_retrieval.Parameters.WINDOW: 2})
+        expected = {}
+        for trace in log:
+            for i in range(2, len(trace)):
+                pair = (trace[i - 2]["concept:name"], trace[i]["concept:name"])
+                expected[pair] = expected.get(pair, 0) + 1
+        self.assertEqual(dfg, expected)
+        dfg = dfg_retrieval.native(log, parameters={dfg_retrieval.Parameters.KEEP_ONCE_PER_CASE: True})
+        self.assertEqual(dfg[("register request", "examine casually")],
+                         len([t for t in log if t[1]["concept:name"] == "examine casually"]))
+
+    def test_dfg_performance_aggregations(self):
+        from pm4py.objects.dfg.retrieval import log as dfg_retrieval
+        log = pm4py.read_xes("input_data/running-example.xes")
+        durations = {}
+        for trace in log:
+            for i in range(1, len(trace)):
+                pair = (trace[i - 1]["concept:name"], trace[i]["concept:name"])
+                diff = (trace[i]["time:timestamp"] - trace[i - 1]["time:timestamp"]).total_seconds()
+                durations.setdefault(pair, []).append(max(0, diff))
+        for measure, func in [("min", min), ("max", max), ("sum", sum)]:
+            dfg = dfg_retrieval.performance(log, parameters={dfg_retrieval.Parameters.AGGREGATION_MEASURE: measure})
+            self.assertEqual(dfg, {k: func(v) for k, v in durations.items()})
+
+    def test_dfg_pandas_does_not_modify_dataframe(self):
+        import pandas as pd
+        from pm4py.objects.log.util import dataframe_utils
+        from pm4py.objects.dfg.retrieval import pandas as dfg_retrieval
+        df = pd.read_csv("input_data/running-example.csv")
+        df = dataframe_utils.convert_timestamp_columns_in_df(df)
+        columns = list(df.columns)
+        dfg_frequency, dfg_performance = dfg_retrieval.get_dfg_graph(df, measure="both")
+        self.assertEqual(list(df.columns), columns)
+        log = pm4py.read_xes("input_data/running-example.xes")
+        dfg, sa, ea = pm4py.discover_dfg(log)
+        self.assertEqual(dfg_frequency, dfg)
+        self.assertEqual(set(dfg_performance), set(dfg))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,8 @@ from pm4py.algo.filtering.log.start_activities import start_activities_filter
 from pm4py.algo.filtering.log.variants import variants_filter as variants_module
 from pm4py.objects.log.importer.xes import importer as xes_importer
 from pm4py.statistics.traces.log import case_statistics
+from pm4py.statistics.variants.log import get as variants_get
+from pm4py.statistics.variants.log import index as variants_index
 from pm4py.algo.filtering.log.ltl import ltl_checker
 from tests.constants import INPUT_DATA_DIR
 
@@ -78,6 +80,28 @@ class LogFilteringTest(unittest.TestCase):
         del log1
         del log2
 
+    def test_filtering_variants_tuples(self):
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.xes")
+        log = xes_importer.apply(input_log)
+        index = variants_index.apply(log)
+        # a prebuilt index is reused only when explicitly provided
+        self.assertIsNot(index, variants_index.apply(log))
+        self.assertIs(index, variants_index.apply(log, parameters={variants_index.Parameters.VARIANTS_INDEX: index}))
+        self.assertEqual(index.get_variants_trace_idx(), variants_get.get_variants_from_log_trace_idx(log))
+        self.assertEqual(int(index.counts.sum()), len(log))
+        considered_variant = ("register request", "check ticket", "examine casually", "decide", "pay compensation")
+        log1 = variants_module.apply(log, [considered_variant])
+        log2 = variants_module.apply(log, [",".join(considered_variant)])
+        self.assertEqual(len(log1), len(log2))
+        self.assertEqual(len(log1), int(index.counts[index.get_variant_id(considered_variant)]))
+        log3 = variants_module.apply(log, [considered_variant], parameters={variants_module.Parameters.POSITIVE: False})
+        self.assertEqual(len(log1) + len(log3), len(log))
+        # in-place changes of the log are seen by the next calls
+        for event in log[0]:
+            event["concept:name"] = "X"
+        log4 = variants_module.apply(log, [",".join(["X"] * len(log[0]))])
+        self.assertEqual(len(log4), 1)
+
     def test_obtaining_variants(self):
         # to avoid static method warnings in tests,
         # that by construction of the unittest package have to be expressed in such way
@@ -12,6 +12,17 @@ class Pm4pyImportPackageTest(unittest.TestCase):
             os.path.join("input_data", "running-example.xes"))
         self.assertEqual(len(log), 6)
 
+    def test_import_lazy(self):
+        # importing pm4py (and its simplified interface) should not import the algorithms
+        # and their heavy dependencies, that are loaded when they are used for the first time
+        import subprocess
+        import sys
+        code = "import sys; import pm4py; pm4py.read_xes; pm4py.discover_dfg; " \
+               "print(','.join(m for m in ['pandas', 'scipy', 'matplotlib', 'networkx', 'sympy', 'pulp', 'graphviz'] " \
+               "if m in sys.modules))"
+        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        out = subprocess.check_output([sys.executable, "-c", code], cwd=parent_dir).decode("utf-8")
+        self.assertEqual(out.strip(), "")
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
+import datetime
 import os
 import unittest
 from pm4py.objects.log.importer.xes import importer as xes_importer
+import numpy as np
 import pandas as pd
 from pm4py.objects.log.util import dataframe_utils
 from pm4py.algo.discovery.log_skeleton import algorithm as lsk_alg
@@ -78,6 +80,24 @@ class OtherPartsTests(unittest.TestCase):
         pspectr = df_pspectrum.apply(df, ["T02 Check confirmation of receipt", "T03 Adjust confirmation of receipt"],
                                      1000, {})
 
+    def test_performance_spectrum_binned(self):
+        from pm4py.statistics.performance_spectrum import algorithm as performance_spectrum
+        df = pd.read_csv(os.path.join("input_data", "receipt.csv"))
+        df = dataframe_utils.convert_timestamp_columns_in_df(df)
+        list_activities = ["Confirmation of receipt", "T02 Check confirmation of receipt",
+                           "T04 Determine confirmation of receipt"]
+        pspectr_df = df_pspectrum.apply(df, list_activities, 100000, {})
+        pspectr_log = log_pspectrum.apply(converter.apply(df), list_activities, 100000, {})
+        self.assertEqual(len(pspectr_df), len(pspectr_log))
+        self.assertTrue(np.allclose(sorted(pspectr_df.tolist()), sorted(pspectr_log)))
+        ps = performance_spectrum.apply(df, list_activities,
+                                        parameters={performance_spectrum.Parameters.NUM_BINS: 10,
+                                                    performance_spectrum.Parameters.PARAMETER_SAMPLE_SIZE: 50})
+        self.assertEqual(len(ps["points"]), 50)
+        self.assertTrue(np.array_equal(ps["points"], df_pspectrum.apply(df, list_activities, 50, {})))
+        self.assertEqual(ps["bin_counts"].shape, (10, 2))
+        self.assertEqual(ps["bin_counts"][:, 0].sum(), len(pspectr_df))
+
     def test_alignment(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
@@ -198,6 +218,313 @@ class OtherPartsTests(unittest.TestCase):
         from pm4py.statistics.eventually_follows.pandas import get
         efg = get.apply(dataframe, parameters={get.Parameters.START_TIMESTAMP_KEY: "start_timestamp"})
 
+    def test_columnar_log_xes(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        columnar_log = converter.apply(log, variant=converter.Variants.TO_COLUMNAR)
+        self.assertEqual(len(columnar_log), len(log))
+        self.assertEqual([dict(e) for t in columnar_log for e in t], [dict(e) for t in log for e in t])
+        self.assertEqual(dfg_discovery.apply(columnar_log), dfg_discovery.apply(log))
+        sublog = columnar_log[1:3]
+        self.assertEqual(sublog[0].attributes, log[1].attributes)
+        materialized = converter.apply(columnar_log, variant=converter.Variants.TO_EVENT_LOG,
+                                       parameters={"materialize": True})
+        self.assertEqual(type(materialized[0][0]).__name__, "Event")
+
+    def test_columnar_log_pandas(self):
+        dataframe = pd.read_csv(os.path.join("input_data", "running-example.csv"))
+        dataframe = dataframe_utils.convert_timestamp_columns_in_df(dataframe)
+        columnar_log = converter.apply(dataframe, variant=converter.Variants.TO_COLUMNAR)
+        log = converter.apply(dataframe, variant=converter.Variants.TO_EVENT_LOG)
+        self.assertEqual([dict(e) for t in columnar_log for e in t], [dict(e) for t in log for e in t])
+        df2 = converter.apply(columnar_log, variant=converter.Variants.TO_DATA_FRAME)
+        self.assertEqual(len(df2), len(dataframe))
+
+    def test_compiled_petri_net(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = inductive_miner.apply(log)
+        from pm4py.objects.petri import compiled, semantics
+        compiled_net = compiled.construct(net)
+        m = compiled_net.encode_marking(im)
+        self.assertEqual(compiled_net.decode_marking(m), im)
+        marking = im
+        # fires the same transitions on both the representations
+        for i in range(10):
+            enabled = compiled_net.enabled_transitions(m)
+            self.assertEqual(set(compiled_net.transitions[t] for t in enabled),
+                             semantics.enabled_transitions(net, marking))
+            if not enabled:
+                break
+            m = compiled_net.execute(enabled[0], m)
+            marking = semantics.execute(compiled_net.transitions[enabled[0]], net, marking)
+            self.assertEqual(compiled_net.decode_marking(m), marking)
+        new_log = simulator.apply(net, im, fm, parameters={"noTraces": 10})
+        self.assertEqual(len(new_log), 10)
+        new_log = simulator.apply(net, im, fm, variant=simulator.Variants.EXTENSIVE, parameters={"maxTraceLength": 8})
+        self.assertGreater(len(new_log), 0)
+
+    def test_state_space(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = inductive_miner.apply(log)
+        from pm4py.objects.petri import reachability_graph, state_space
+        space = state_space.explore(net, im)
+        self.assertTrue(space.complete)
+        self.assertEqual(space.get_marking(0), im)
+        incoming, outgoing, eventually_enabled = reachability_graph.marking_flow_petri(net, im)
+        self.assertEqual(set(incoming), set(space.get_marking(i) for i in range(len(space))))
+        self.assertEqual(sum(len(x) for x in outgoing.values()), len(space.sources))
+        ts = reachability_graph.construct_reachability_graph(net, im)
+        self.assertEqual(len(ts.states), len(space))
+        # the stubborn sets reduction preserves the deadlocks (here, the final marking)
+        reduced = state_space.explore(net, im, parameters={state_space.Parameters.STUBBORN_SETS: True})
+        self.assertLessEqual(len(reduced), len(space))
+        self.assertEqual([reduced.get_marking(i) for i in reduced.get_deadlocks()],
+                         [space.get_marking(i) for i in space.get_deadlocks()])
+        self.assertEqual(space.get_marking(space.get_deadlocks()[0]), fm)
+        partial = state_space.explore(net, im, parameters={state_space.Parameters.MAX_STATES: 2})
+        self.assertFalse(partial.complete)
+        self.assertEqual(len(partial), 2)
+        # the exploration and the construction of the transition system are both bounded
+        from pm4py.algo.discovery.heuristics import algorithm as heuristics_miner
+        import time
+        net, im, fm = heuristics_miner.apply(log)
+        start = time.time()
+        ts = reachability_graph.construct_reachability_graph(net, im, parameters={
+            reachability_graph.Parameters.MAX_ELAB_TIME: 2, reachability_graph.Parameters.MAX_CONSTRUCTION_TIME: 2})
+        self.assertLess(time.time() - start, 10)
+        self.assertGreater(len(ts.states), 0)
+
+    def test_ctmc_solvers(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        dfg_perf = dfg_discovery.apply(log, variant=dfg_discovery.Variants.PERFORMANCE)
+        from pm4py.objects.stochastic_petri import ctmc
+        parameters = {"start_activities": start_activities.get_start_activities(log),
+                      "end_activities": end_activities.get_end_activities(log)}
+        reach_graph, tang_reach_graph, stochastic_map, q_matrix = ctmc.get_tangible_reachability_and_q_matrix_from_dfg_performance(
+            dfg_perf, parameters=parameters)
+        parameters[ctmc.Parameters.SPARSE] = True
+        sparse_q_matrix = ctmc.get_q_matrix_from_tangible_exponential(tang_reach_graph, stochastic_map,
+                                                                      parameters=parameters)
+        self.assertTrue(np.allclose(sparse_q_matrix.toarray(), q_matrix))
+        states_vector = np.zeros(q_matrix.shape[0])
+        states_vector[0] = 1.0
+        times = [10.0, 0.1, 1.0]
+        dense_res = ctmc.get_transient_probabilities(q_matrix, states_vector, times)
+        for solver in [ctmc.TransientSolvers.EXPM_MULTIPLY, ctmc.TransientSolvers.UNIFORMIZATION]:
+            res = ctmc.get_transient_probabilities(sparse_q_matrix, states_vector, times,
+                                                   parameters={ctmc.Parameters.TRANSIENT_SOLVER: solver})
+            self.assertTrue(np.allclose(res, dense_res, atol=1e-8))
+        direct = ctmc.perform_steadystate(sparse_q_matrix, tang_reach_graph,
+                                          parameters={ctmc.Parameters.STEADYSTATE_SOLVER: ctmc.SteadyStateSolvers.DIRECT})
+        iterative = ctmc.perform_steadystate(sparse_q_matrix, tang_reach_graph)
+        self.assertAlmostEqual(float(np.sum(direct)), 1.0)
+        self.assertTrue(np.allclose(direct, iterative, atol=1e-6))
+
+    def test_business_hours_vectorized(self):
+        from datetime import datetime, date
+        from pm4py.util import business_hours
+        # Monday to Friday, Friday to Monday (around the weekend), within the weekend, end before start,
+        # before the opening, after the closing, from after the closing to before the opening
+        starts = [datetime(2020, 6, 1, 8, 0), datetime(2020, 6, 5, 16, 30), datetime(2020, 6, 6, 9, 0),
+                  datetime(2020, 6, 1, 12, 0), datetime(2020, 6, 1, 5, 0), datetime(2020, 6, 1, 16, 0),
+                  datetime(2020, 6, 1, 18, 0)]
+        ends = [datetime(2020, 6, 5, 18, 0), datetime(2020, 6, 8, 7, 30), datetime(2020, 6, 7, 18, 0),
+                datetime(2020, 6, 1, 11, 0), datetime(2020, 6, 1, 9, 30), datetime(2020, 6, 1, 22, 0),
+                datetime(2020, 6, 2, 8, 0)]
+        seconds = business_hours.get_seconds(starts, ends).tolist()
+        self.assertEqual(seconds, [176400, 3600, 0, 0, 9000, 3600, 3600])
+        self.assertEqual([business_hours.BusinessHours(st, et).getseconds() for st, et in zip(starts, ends)], seconds)
+        # a holiday on the Wednesday removes a full working day
+        seconds = business_hours.get_seconds(starts[:1], ends[:1], holidays=[date(2020, 6, 3)]).tolist()
+        self.assertEqual(seconds, [176400 - 36000])
+        seconds = business_hours.get_seconds(pd.Series(pd.to_datetime(starts)).dt.tz_localize("UTC"),
+                                             np.array(ends, dtype="datetime64[us]"),
+                                             worktiming=[10, 16], weekends=[5, 6, 7]).tolist()
+        self.assertEqual(seconds[0], 4 * 6 * 3600)
+
+    def test_montecarlo_discrete_event(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = inductive_miner.apply(log)
+        from pm4py.simulation.montecarlo import simulator as montecarlo_simulator
+        from pm4py.simulation.montecarlo.parameters import Parameters
+        from pm4py.simulation.montecarlo.variants import petri_discrete_event
+        parameters = {Parameters.PARAM_NUM_SIMULATIONS: 50, Parameters.PARAM_ENABLE_DIAGNOSTICS: False,
+                      Parameters.PARAM_CASE_ARRIVAL_RATIO: 1000000, Parameters.PARAM_RANDOM_SEED: 42}
+        simulated_log, res = montecarlo_simulator.apply(log, net, im, fm, parameters=parameters,
+                                                        variant=montecarlo_simulator.Variants.PETRI_DISCRETE_EVENT)
+        self.assertEqual(len(simulated_log), 50)
+        self.assertEqual(len(res["cases_ex_time"]), 50)
+        parameters[Parameters.PARAM_NUM_REPLICATIONS] = 2
+        # the seeded replications do not change the state of the global random number generator of NumPy
+        np.random.seed(7)
+        replications = petri_discrete_event.apply_replications(log, net, im, fm, parameters=parameters)
+        self.assertEqual(np.random.rand(), np.random.RandomState(7).rand())
+        parameters[Parameters.ENABLE_PARALLEL] = True
+        parameters[Parameters.NUM_WORKERS] = 2
+        parallel_replications = petri_discrete_event.apply_replications(log, net, im, fm, parameters=parameters)
+        self.assertEqual([r[1]["cases_ex_time"] for r in replications],
+                         [r[1]["cases_ex_time"] for r in parallel_replications])
+
+    def test_streaming_dfg_eviction(self):
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        from pm4py.streaming.algo.discovery.dfg.variants.frequency import Parameters
+        from pm4py.algo.discovery.dfg import algorithm as dfg_discovery
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        stream = converter.apply(log, variant=converter.Variants.TO_EVENT_STREAM)
+        streaming_obj = streaming_dfg.apply()
+        for i, event in enumerate(stream):
+            streaming_obj.receive(event)
+            if i % 5 == 0:
+                streaming_obj.get()
+        dfg, activities, start_activities, end_activities = streaming_obj.get()
+        self.assertEqual(dfg, dict(dfg_discovery.apply(log)))
+        self.assertEqual(end_activities, {"pay compensation": 3, "reject request": 3})
+        # without new events, the result is not copied again (and the previous results are not modified)
+        self.assertIs(streaming_obj.get()[0], dfg)
+        streaming_obj.receive(stream[0])
+        self.assertIsNot(streaming_obj.get()[1], activities)
+        self.assertEqual(sum(activities.values()), len(stream))
+        # interleaved cases: A is evicted when C arrives (with at most 2 live cases), then B and A restart
+        events = [("A", "a"), ("B", "b"), ("A", "c"), ("C", "a"), ("B", "d"), ("A", "e")]
+        streaming_obj = streaming_dfg.apply(parameters={Parameters.MAX_NO_CASES: 2})
+        for case, activity in events:
+            streaming_obj.receive({"case:concept:name": case, "concept:name": activity})
+        dfg, activities, start_activities, end_activities = streaming_obj.get()
+        self.assertEqual(list(streaming_obj.case_dict), ["B", "A"])
+        self.assertEqual(dfg, {("a", "c"): 1})
+        self.assertEqual(start_activities, {"a": 2, "b": 1, "d": 1, "e": 1})
+        self.assertEqual(end_activities, {"a": 1, "b": 1, "c": 1, "d": 1, "e": 1})
+        # timeout of one hour: A expires when C arrives, B and C expire when B receives its last event
+        t0 = datetime.datetime(2020, 1, 1)
+        events = [("A", "a", 0), ("B", "a", 1800), ("B", "b", 3000), ("C", "a", 5000), ("A", "b", 5400),
+                  ("B", "c", 9000)]
+        streaming_obj = streaming_dfg.apply(parameters={Parameters.CASE_TIMEOUT: 3600})
+        for case, activity, seconds in events:
+            streaming_obj.receive({"case:concept:name": case, "concept:name": activity,
+                                   "time:timestamp": t0 + datetime.timedelta(seconds=seconds)})
+        dfg, activities, start_activities, end_activities = streaming_obj.get()
+        self.assertEqual(sorted(streaming_obj.case_dict), ["A", "B"])
+        self.assertEqual(dfg, {("a", "b"): 1})
+        self.assertEqual(start_activities, {"a": 3, "b": 1, "c": 1})
+        self.assertEqual(end_activities, {"a": 2, "b": 2, "c": 1})
+
+    def test_live_event_stream_batches(self):
+        import asyncio
+        from pm4py.streaming.stream.live_event_stream import LiveEventStream, Parameters
+        from pm4py.streaming.stream.async_live_event_stream import AsyncLiveEventStream
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        log = xes_importer.apply(os.path.join("input_data", "reviewing.xes"))
+        stream = converter.apply(log, variant=converter.Variants.TO_EVENT_STREAM)
+        # an observer failing on every batch does not stop the delivery to the other observers
+        failing_obj = streaming_dfg.apply()
+        failing_obj.receive_batch = None
+        live_stream = LiveEventStream(parameters={Parameters.BATCH_SIZE: 100, Parameters.MAX_QUEUE_SIZE: 500})
+        streaming_obj = streaming_dfg.apply()
+        live_stream.register(streaming_obj)
+        live_stream.register(failing_obj)
+        with self.assertLogs(level="ERROR"):
+            live_stream.start()
+            live_stream.append_all(stream)
+            live_stream.stop()
+        self.assertEqual(streaming_obj.get()[0], dict(dfg_discovery.apply(log)))
+
+        async def consume():
+            async_stream = AsyncLiveEventStream(parameters={Parameters.BATCH_SIZE: 100, Parameters.MAX_QUEUE_SIZE: 500})
+            async_streaming_obj = streaming_dfg.apply()
+            async_stream.register(async_streaming_obj)
+            async_stream.register(failing_obj)
+            async_stream.start()
+            for event in stream:
+                await async_stream.append(event)
+            await async_stream.stop()
+            return async_streaming_obj.get()[0]
+
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual(asyncio.run(consume()), dict(dfg_discovery.apply(log)))
+
+    def test_streaming_tbr_sharded(self):
+        from pm4py.streaming.algo.conformance.tbr import algorithm as streaming_tbr
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = inductive_miner.apply(log)
+        stream = converter.apply(log, variant=converter.Variants.TO_EVENT_STREAM)
+        classic_obj = streaming_tbr.apply(net, im, fm)
+        sharded_obj = streaming_tbr.apply(net, im, fm, variant=streaming_tbr.Variants.SHARDED,
+                                          parameters={streaming_tbr.Variants.SHARDED.value.Parameters.NUM_WORKERS: 2,
+                                                      streaming_tbr.Variants.SHARDED.value.Parameters.BATCH_SIZE: 4})
+        for event in stream:
+            classic_obj.receive(event)
+            sharded_obj.receive(event)
+        diagn_classic = classic_obj.get().sort_values("case").reset_index(drop=True)
+        diagn_sharded = sharded_obj.get().sort_values("case").reset_index(drop=True)
+        self.assertTrue(diagn_classic.equals(diagn_sharded))
+        self.assertEqual(classic_obj.terminate("1"), sharded_obj.terminate("1"))
+        sharded_obj.stop()
+
+    def test_streaming_checkpoint(self):
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        from pm4py.streaming.algo.conformance.tbr import algorithm as streaming_tbr
+        from pm4py.streaming.algo.interface import restore
+        from pm4py.streaming.util.dictio import generator
+        from pm4py.streaming.util.dictio.versions import disk
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = inductive_miner.apply(log)
+        stream = list(converter.apply(log, variant=converter.Variants.TO_EVENT_STREAM))
+        checkpoint_path = os.path.join("test_output_data", "streaming.checkpoint")
+        dict_path = os.path.join("test_output_data", "streaming.sqlite")
+        disk.close_database(dict_path, delete=True)
+        dfg_obj = streaming_dfg.apply()
+        disk_dfg_obj = streaming_dfg.apply(parameters={"dict_variant": generator.Variants.DISK, "dict_path": dict_path})
+        # a second algorithm on the same database does not share the tables of the first one
+        other_disk_dfg_obj = streaming_dfg.apply(parameters={"dict_variant": generator.Variants.DISK,
+                                                             "dict_path": dict_path})
+        tbr_obj = streaming_tbr.apply(net, im, fm)
+        sharded_obj = streaming_tbr.apply(net, im, fm, variant=streaming_tbr.Variants.SHARDED,
+                                          parameters={streaming_tbr.Variants.SHARDED.value.Parameters.NUM_WORKERS: 2})
+        restored = []
+        try:
+            for event in stream[:20]:
+                disk_dfg_obj.receive(event)
+                tbr_obj.receive(event)
+                sharded_obj.receive(event)
+            other_disk_dfg_obj.receive(stream[0])
+            # the dictionaries on disk are shared with the restored object, so only the latter continues
+            for obj in [disk_dfg_obj, tbr_obj, sharded_obj]:
+                obj.checkpoint(checkpoint_path)
+                restored.append(restore(checkpoint_path))
+            for event in stream:
+                dfg_obj.receive(event)
+            for event in stream[20:]:
+                for obj in [tbr_obj, sharded_obj] + restored:
+                    obj.receive(event)
+            self.assertEqual(restored[0].get(), dfg_obj.get())
+            # the interning of the activities is stored on disk too
+            self.assertIsInstance(restored[0].activity_index, disk.DiskDict)
+            self.assertTrue(restored[1].get().equals(tbr_obj.get()))
+            self.assertTrue(restored[2].get().sort_values("case").reset_index(drop=True).equals(
+                sharded_obj.get().sort_values("case").reset_index(drop=True)))
+            self.assertEqual(sum(other_disk_dfg_obj.get()[1].values()), 1)
+        finally:
+            sharded_obj.stop()
+            if len(restored) > 2:
+                restored[2].stop()
+            disk.close_database(dict_path, delete=True)
+            if os.path.exists(checkpoint_path):
+                os.remove(checkpoint_path)
+
+    def test_streaming_disk_dict_temporary(self):
+        import pickle
+        from pm4py.streaming.util.dictio.versions import disk
+        dictio = disk.apply()
+        dictio["a"] = 1
+        path = dictio._path
+        self.assertTrue(os.path.exists(path))
+        checkpoint = pickle.dumps(dictio)
+        self.assertEqual(pickle.loads(checkpoint)["a"], 1)
+        dictio.close()
+        self.assertFalse(os.path.exists(path))
+        # the state of a deleted database is not silently lost
+        with self.assertRaises(Exception):
+            pickle.loads(checkpoint)
+        self.assertFalse(os.path.exists(path))
 
 if __name__ == "__main__":
     unittest.main()
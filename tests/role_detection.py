@@ -26,6 +26,20 @@ class RoleDetectionTest(unittest.TestCase):
         log = xes_importer.apply(os.path.join("..", "tests", "input_data", "receipt.xes"))
         roles = role_mining.apply(log)
 
+    def test_role_aggregation_matrix(self):
+        from collections import Counter
+        from pm4py.algo.enhancement.roles.common import algorithm as roles_common
+        df = pd.read_csv(os.path.join("input_data", "receipt.csv"))
+        res_act_couples = Counter(dict(df.groupby(["org:resource", "concept:name"]).size()))
+        for threshold in [0.65, 0.3]:
+            parameters = {roles_common.Parameters.ROLES_THRESHOLD_PARAMETER: threshold}
+            initial_roles = []
+            for act in sorted(set(x[1] for x in res_act_couples)):
+                initial_roles.append([[act], Counter({x[0]: y for x, y in res_act_couples.items() if x[1] == act})])
+            iterative_roles = roles_common.aggregate_roles_algorithm(list(initial_roles), parameters=parameters)
+            matrix_roles = roles_common.aggregate_roles_matrix(list(initial_roles), parameters=parameters)
+            self.assertEqual([(r[0], dict(r[1])) for r in iterative_roles], [(r[0], dict(r[1])) for r in matrix_roles])
+
 
 if __name__ == "__main__":
     unittest.main()
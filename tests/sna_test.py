@@ -1,6 +1,7 @@
 import os
 import unittest
 
+import numpy as np
 from pm4py.algo.enhancement.sna import algorithm as sna_alg
 from pm4py.objects.log.importer.xes import importer as xes_importer
 import pandas as pd
@@ -31,6 +32,29 @@ class SnaTests(unittest.TestCase):
         hw_values = sna_alg.apply(log, variant=sna_alg.Variants.HANDOVER_PANDAS)
         wt_values = sna_alg.apply(log, variant=sna_alg.Variants.WORKING_TOGETHER_PANDAS)
         sub_values = sna_alg.apply(log, variant=sna_alg.Variants.SUBCONTRACTING_PANDAS)
+        ja_values = sna_alg.apply(log, variant=sna_alg.Variants.JOINTACTIVITIES_PANDAS)
+
+    def test_sparse(self):
+        from scipy.sparse import issparse
+        log = xes_importer.apply(os.path.join("..", "tests", "input_data", "running-example.xes"))
+        df = pd.read_csv(os.path.join("..", "tests", "input_data", "running-example.csv"))
+        df = dataframe_utils.convert_timestamp_columns_in_df(df)
+        for log_variant, pd_variant in [(sna_alg.Variants.HANDOVER_LOG, sna_alg.Variants.HANDOVER_PANDAS),
+                                        (sna_alg.Variants.WORKING_TOGETHER_LOG,
+                                         sna_alg.Variants.WORKING_TOGETHER_PANDAS),
+                                        (sna_alg.Variants.SUBCONTRACTING_LOG, sna_alg.Variants.SUBCONTRACTING_PANDAS)]:
+            dense_values = sna_alg.apply(log, variant=log_variant)
+            sparse_values = sna_alg.apply(log, variant=log_variant, parameters={sna_alg.Parameters.SPARSE: True})
+            pd_values = sna_alg.apply(df, variant=pd_variant, parameters={sna_alg.Parameters.SPARSE: True})
+            self.assertTrue(issparse(sparse_values[0]))
+            self.assertEqual(dense_values[1], sparse_values[1])
+            self.assertEqual(dense_values[1], pd_values[1])
+            self.assertTrue(np.allclose(dense_values[0], sparse_values[0].toarray()))
+            self.assertTrue(np.allclose(dense_values[0], pd_values[0].toarray()))
+        # handover of work between the resources of the running example
+        hw_values = sna_alg.apply(log, variant=sna_alg.Variants.HANDOVER_LOG)
+        pete, mike = hw_values[1].index("Pete"), hw_values[1].index("Mike")
+        self.assertAlmostEqual(hw_values[0][pete, mike], 2.0 / 36.0)
 
 
 if __name__ == "__main__":
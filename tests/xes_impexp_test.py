@@ -51,6 +51,56 @@ class XesImportExportTest(unittest.TestCase):
         log = xes_importer.apply(os.path.join(COMPRESSED_INPUT_DATA, "01_running-example.xes.gz"))
         del log
 
+    def test_importXESparallel(self):
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "reviewing.xes"))
+        variant = xes_importer.Variants.ITERPARSE_PARALLEL
+        parameters = {variant.value.Parameters.MIN_CHUNK_SIZE: 1 << 14, variant.value.Parameters.NUM_WORKERS: 2}
+        log_parallel = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "reviewing.xes"), variant=variant,
+                                          parameters=parameters)
+        self.assertEqual(len(log), len(log_parallel))
+        self.assertEqual(log.attributes, log_parallel.attributes)
+        self.assertEqual([dict(e) for t in log for e in t], [dict(e) for t in log_parallel for e in t])
+        parameters[variant.value.Parameters.RETURN_COLUMNAR] = True
+        parameters[variant.value.Parameters.MAX_TRACES] = 10
+        log_columnar = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "reviewing.xes"), variant=variant,
+                                          parameters=parameters)
+        self.assertEqual(len(log_columnar), 10)
+
+    def test_importXESparallelEncoding(self):
+        # every chunk is parsed with the XML declaration of the file (here, a non-UTF-8 encoding)
+        with open(os.path.join(INPUT_DATA_DIR, "running-example.xes"), "r", encoding="utf-8") as f:
+            content = f.read()
+        content = content.replace("encoding='UTF-8'", "encoding='ISO-8859-1'").replace("check ticket", "vérifier")
+        path = os.path.join(OUTPUT_DATA_DIR, "running-example-latin1.xes")
+        with open(path, "w", encoding="iso-8859-1") as f:
+            f.write(content)
+        variant = xes_importer.Variants.ITERPARSE_PARALLEL
+        parameters = {variant.value.Parameters.MIN_CHUNK_SIZE: 1, variant.value.Parameters.NUM_WORKERS: 2}
+        log = xes_importer.apply(path)
+        log_parallel = xes_importer.apply(path, variant=variant, parameters=parameters)
+        os.remove(path)
+        self.assertEqual([dict(e) for t in log for e in t], [dict(e) for t in log_parallel for e in t])
+        self.assertIn("vérifier", [e["concept:name"] for t in log_parallel for e in t])
+
+    def test_importXEScached(self):
+        from pm4py.objects.log.exporter.columnar import exporter as columnar_exporter
+        from pm4py.objects.log.importer.columnar import importer as columnar_importer
+        import shutil
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        columnar_exporter.apply(log, os.path.join(OUTPUT_DATA_DIR, "running-example-columnar"))
+        log_columnar = columnar_importer.apply(os.path.join(OUTPUT_DATA_DIR, "running-example-columnar"))
+        self.assertEqual([dict(e) for t in log for e in t], [dict(e) for t in log_columnar for e in t])
+        self.assertEqual([dict(t.attributes) for t in log], [dict(t.attributes) for t in log_columnar])
+        cache_dir = os.path.join(OUTPUT_DATA_DIR, "log_cache")
+        parameters = {xes_importer.Parameters.ENABLE_CACHE: True, xes_importer.Parameters.CACHE_DIR: cache_dir}
+        log_cached1 = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"), parameters=parameters)
+        log_cached2 = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"), parameters=parameters)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        self.assertEqual([dict(e) for t in log_cached1 for e in t], [dict(e) for t in log_cached2 for e in t])
+        self.assertEqual(len(log), len(log_cached2))
+        xes_importer.clear_cache(parameters=parameters)
+        shutil.rmtree(os.path.join(OUTPUT_DATA_DIR, "running-example-columnar"))
+
 
 if __name__ == "__main__":
     unittest.main()